@@ -0,0 +1,24 @@
+"""add timestamp id index to audit
+
+Revision ID: a3c8e5f1d694
+Revises: d9f3b1c7e482
+Create Date: 2026-10-17 20:27:53.640819
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a3c8e5f1d694"
+down_revision = "d9f3b1c7e482"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keyset pagination of the audits feed, ordered by (timestamp, id)
+    op.create_index("nci_audit_timestamp_id", "audit", ["timestamp", "id"])
+
+
+def downgrade():
+    op.drop_index("nci_audit_timestamp_id", "audit")
@@ -0,0 +1,24 @@
+"""add finding_id index to audit
+
+Revision ID: a5d7e3f9c120
+Revises: f1c84d2b6a3e
+Create Date: 2026-10-17 17:31:44.902517
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a5d7e3f9c120"
+down_revision = "f1c84d2b6a3e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The latest audit of a finding is recomputed over all its audits, whatever their is_latest flag
+    op.create_index("nci_audit_finding_id", "audit", ["finding_id", "id"])
+
+
+def downgrade():
+    op.drop_index("nci_audit_finding_id", "audit")
@@ -0,0 +1,42 @@
+"""add status to ingest_request, reserving the idempotency keys
+
+Revision ID: a8c3f5d1e947
+Revises: f4b2e8c6d031
+Create Date: 2026-10-18 11:27:38.902641
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a8c3f5d1e947"
+down_revision = "f4b2e8c6d031"
+branch_labels = None
+depends_on = None
+
+# Table and column names
+INGEST_REQUEST = "ingest_request"
+STATUS = "status"
+
+
+def upgrade():
+    # The requests recorded so far are done
+    op.add_column(
+        INGEST_REQUEST,
+        sa.Column(
+            STATUS,
+            sa.Enum("IN_PROGRESS", "DONE", name="ingestrequeststatus"),
+            nullable=False,
+            server_default="DONE",
+        ),
+    )
+    # A reservation has no result yet, and no digest while its body is streamed
+    op.alter_column(INGEST_REQUEST, "request_digest", existing_type=sa.String(length=64), nullable=True)
+    op.alter_column(INGEST_REQUEST, "created_findings", existing_type=sa.Integer(), nullable=True)
+
+
+def downgrade():
+    op.execute(f"DELETE FROM {INGEST_REQUEST} WHERE {STATUS} = 'IN_PROGRESS'")
+    op.alter_column(INGEST_REQUEST, "created_findings", existing_type=sa.Integer(), nullable=False)
+    op.alter_column(INGEST_REQUEST, "request_digest", existing_type=sa.String(length=64), nullable=False)
+    op.drop_column(INGEST_REQUEST, STATUS, mssql_drop_default=True)
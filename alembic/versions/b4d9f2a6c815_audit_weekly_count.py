@@ -0,0 +1,84 @@
+"""add audit_weekly_count table
+
+Revision ID: b4d9f2a6c815
+Revises: a3c8e5f1d694
+Create Date: 2026-10-17 21:36:09.517248
+
+"""
+import logging
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import column, select, table
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = "b4d9f2a6c815"
+down_revision = "a3c8e5f1d694"
+branch_labels = None
+depends_on = None
+
+# Logger
+logger = logging.getLogger()
+
+# Table names
+AUDIT = "audit"
+AUDIT_ARCHIVE = "audit_archive"
+AUDIT_WEEKLY_COUNT = "audit_weekly_count"
+
+# Number of past weeks of which the counts are computed from the existing audits
+BACKFILL_WEEKS = 13
+
+
+def upgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if not inspector.has_table(AUDIT_WEEKLY_COUNT):
+        logger.info(f"Creating table {AUDIT_WEEKLY_COUNT}")
+        weekly_count = op.create_table(AUDIT_WEEKLY_COUNT,
+                                       sa.Column("week_start", sa.Date(), nullable=False),
+                                       sa.Column("auditor", sa.String(length=200), nullable=False),
+                                       sa.Column("audit_count", sa.Integer(), nullable=False),
+                                       sa.PrimaryKeyConstraint("week_start", "auditor")
+                                       )
+        # The rank of an auditor counts the auditors of the week with more audits
+        op.create_index("nci_audit_weekly_count_week_start_count", AUDIT_WEEKLY_COUNT, ["week_start", "audit_count"])
+
+        backfill_weekly_counts(weekly_count)
+
+
+def downgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if inspector.has_table(AUDIT_WEEKLY_COUNT):
+        op.drop_index("nci_audit_weekly_count_week_start_count", table_name=AUDIT_WEEKLY_COUNT)
+        op.drop_table(AUDIT_WEEKLY_COUNT)
+
+
+def backfill_weekly_counts(weekly_count: sa.Table):
+    """Count the audits of the last weeks, older weeks can be counted with resc_rebuild_audit_weekly_counts."""
+    conn = op.get_bind()
+
+    today = datetime.now(UTC).date()
+    first_week_start = today - timedelta(days=today.weekday(), weeks=BACKFILL_WEEKS)
+    since = datetime.combine(first_week_start, datetime.min.time())
+
+    weekly_counts = Counter()
+    for table_name in [AUDIT, AUDIT_ARCHIVE]:
+        audit = table(table_name, column("auditor"), column("timestamp", sa.DateTime()))
+        query = select(audit.c.auditor, audit.c.timestamp).where(audit.c.timestamp >= since)
+        for auditor, timestamp in conn.execute(query):
+            week_start = timestamp.date() - timedelta(days=timestamp.weekday())
+            weekly_counts[(week_start, auditor)] += 1
+
+    logger.info(f"Inserting {len(weekly_counts)} weekly counts in {AUDIT_WEEKLY_COUNT}")
+    if weekly_counts:
+        op.bulk_insert(
+            weekly_count,
+            [
+                {"week_start": week_start, "auditor": auditor, "audit_count": audit_count}
+                for (week_start, auditor), audit_count in weekly_counts.items()
+            ],
+        )
@@ -0,0 +1,24 @@
+"""add auditor index to audit
+
+Revision ID: b8e2f4a6d913
+Revises: a5d7e3f9c120
+Create Date: 2026-10-17 18:12:09.335870
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b8e2f4a6d913"
+down_revision = "a5d7e3f9c120"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The audit statistics of an auditor are counted from this index only
+    op.create_index("nci_audit_auditor_status", "audit", ["auditor", "status"])
+
+
+def downgrade():
+    op.drop_index("nci_audit_auditor_status", "audit")
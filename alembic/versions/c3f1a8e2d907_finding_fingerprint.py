@@ -0,0 +1,106 @@
+"""add fingerprint columns to finding
+
+Revision ID: c3f1a8e2d907
+Revises: 2a1def4ac814
+Create Date: 2026-10-17 09:12:31.204117
+
+"""
+import hashlib
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import Table, bindparam, column, select, table, update
+
+
+# revision identifiers, used by Alembic.
+revision = "c3f1a8e2d907"
+down_revision = "2a1def4ac814"
+branch_labels = None
+depends_on = None
+
+TABLE_FINDING = "finding"
+LONG_FINGERPRINT = "long_fingerprint"
+SHORT_FINGERPRINT = "short_fingerprint"
+
+# The fingerprint is computed by the application as well,
+# however it is bad practice to mix migration code and production code
+# for this reason the key format is duplicated here.
+BATCH_SIZE = 1000
+
+
+def _fingerprint(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def upgrade():
+    op.add_column(TABLE_FINDING, sa.Column(LONG_FINGERPRINT, sa.String(length=64), nullable=True))
+    op.add_column(TABLE_FINDING, sa.Column(SHORT_FINGERPRINT, sa.String(length=64), nullable=True))
+
+    backfill_fingerprints()
+
+    op.create_index("nci_finding_long_fingerprint", TABLE_FINDING, ["repository_id", LONG_FINGERPRINT])
+    op.create_index("nci_finding_short_fingerprint", TABLE_FINDING, ["repository_id", SHORT_FINGERPRINT])
+
+
+def downgrade():
+    op.drop_index("nci_finding_short_fingerprint", TABLE_FINDING)
+    op.drop_index("nci_finding_long_fingerprint", TABLE_FINDING)
+    op.drop_column(TABLE_FINDING, SHORT_FINGERPRINT)
+    op.drop_column(TABLE_FINDING, LONG_FINGERPRINT)
+
+
+def backfill_fingerprints():
+    """Compute the fingerprints of the existing findings."""
+    conn = op.get_bind()
+
+    finding: Table = table(
+        TABLE_FINDING,
+        column("id"),
+        column("commit_id"),
+        column("rule_name"),
+        column("file_path"),
+        column("line_number"),
+        column("column_start"),
+        column("column_end"),
+        column(LONG_FINGERPRINT),
+        column(SHORT_FINGERPRINT),
+    )
+
+    update_query = update(finding)
+    update_query = update_query.where(finding.c.id == bindparam("finding_id"))
+    update_query = update_query.values(
+        {LONG_FINGERPRINT: bindparam("long_value"), SHORT_FINGERPRINT: bindparam("short_value")}
+    )
+
+    # Page through the findings by id to keep the memory and the size of a single statement reasonable.
+    last_id = 0
+    while True:
+        query = select(
+            finding.c.id,
+            finding.c.commit_id,
+            finding.c.rule_name,
+            finding.c.file_path,
+            finding.c.line_number,
+            finding.c.column_start,
+            finding.c.column_end,
+        )
+        query = query.where(finding.c.id > last_id)
+        query = query.order_by(finding.c.id)
+        query = query.limit(BATCH_SIZE)
+        rows = conn.execute(query).all()
+        if not rows:
+            break
+
+        parameters = []
+        for row in rows:
+            short_key = f"{row.rule_name}|{row.file_path}|{row.line_number}|{row.column_start}|{row.column_end}"
+            parameters.append(
+                {
+                    "finding_id": row.id,
+                    # A missing commit id is rendered empty, like CONCAT does in SQL
+                    "long_value": _fingerprint(f"{row.commit_id or ''}|{short_key}"),
+                    "short_value": _fingerprint(short_key),
+                }
+            )
+        conn.execute(update_query, parameters)
+        last_id = rows[-1].id
@@ -0,0 +1,53 @@
+"""add finding_weekly_snapshot table
+
+Revision ID: c5b8d1e3f027
+Revises: e7a2c4f8b913
+Create Date: 2026-10-17 23:02:37.915046
+
+"""
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = "c5b8d1e3f027"
+down_revision = "e7a2c4f8b913"
+branch_labels = None
+depends_on = None
+
+# Logger
+logger = logging.getLogger()
+
+# Table names
+FINDING_WEEKLY_SNAPSHOT = "finding_weekly_snapshot"
+
+
+def upgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    # The weeks are stored by the first request of the finding count over time metrics after they are over
+    if not inspector.has_table(FINDING_WEEKLY_SNAPSHOT):
+        logger.info(f"Creating table {FINDING_WEEKLY_SNAPSHOT}")
+        op.create_table(FINDING_WEEKLY_SNAPSHOT,
+                        sa.Column("iso_year", sa.Integer(), nullable=False),
+                        sa.Column("iso_week", sa.Integer(), nullable=False),
+                        sa.Column("provider_type",
+                                  sa.Enum("BITBUCKET", "AZURE_DEVOPS", "GITHUB_PUBLIC", name="provider_type"),
+                                  nullable=False),
+                        sa.Column("status",
+                                  sa.Enum("NOT_ANALYZED", "NOT_ACCESSIBLE", "CLARIFICATION_REQUIRED",
+                                          "FALSE_POSITIVE", "TRUE_POSITIVE", "OUTDATED", name="findingstatus"),
+                                  nullable=False),
+                        sa.Column("finding_count", sa.Integer(), nullable=False),
+                        sa.Column("audit_status_count", sa.Integer(), nullable=False),
+                        sa.PrimaryKeyConstraint("iso_year", "iso_week", "provider_type", "status")
+                        )
+
+
+def downgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if inspector.has_table(FINDING_WEEKLY_SNAPSHOT):
+        op.drop_table(FINDING_WEEKLY_SNAPSHOT)
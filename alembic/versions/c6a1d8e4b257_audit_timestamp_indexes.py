@@ -0,0 +1,27 @@
+"""add timestamp indexes to audit
+
+Revision ID: c6a1d8e4b257
+Revises: b8e2f4a6d913
+Create Date: 2026-10-17 18:54:37.118402
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c6a1d8e4b257"
+down_revision = "b8e2f4a6d913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Personal audit counts, per time period of a single auditor
+    op.create_index("nci_audit_auditor_timestamp", "audit", ["auditor", "timestamp"])
+    # Audit counts of all auditors over the last weeks
+    op.create_index("nci_audit_timestamp", "audit", ["timestamp", "auditor"])
+
+
+def downgrade():
+    op.drop_index("nci_audit_timestamp", "audit")
+    op.drop_index("nci_audit_auditor_timestamp", "audit")
@@ -0,0 +1,57 @@
+"""add ingest_job staging table
+
+Revision ID: d41b7e9c2a65
+Revises: c3f1a8e2d907
+Create Date: 2026-10-17 11:02:47.518930
+
+"""
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = "d41b7e9c2a65"
+down_revision = "c3f1a8e2d907"
+branch_labels = None
+depends_on = None
+
+# Logger
+logger = logging.getLogger()
+
+# Table names
+INGEST_JOB = "ingest_job"
+
+
+def upgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if not inspector.has_table(INGEST_JOB):
+        logger.info(f"Creating table {INGEST_JOB}")
+        op.create_table(INGEST_JOB,
+                        sa.Column("id", sa.Integer(), nullable=False),
+                        sa.Column("scan_id", sa.Integer(), nullable=False),
+                        sa.Column("status",
+                                  sa.Enum("PENDING", "RUNNING", "DONE", "FAILED", name="ingestjobstatus"),
+                                  nullable=False),
+                        sa.Column("payload", sa.Text(), nullable=True),
+                        sa.Column("total_findings", sa.Integer(), nullable=False),
+                        sa.Column("processed_findings", sa.Integer(), nullable=False),
+                        sa.Column("created_findings", sa.Integer(), nullable=True),
+                        sa.Column("error", sa.String(length=255), nullable=True),
+                        sa.Column("created_at", sa.DateTime(), nullable=False),
+                        sa.Column("started_at", sa.DateTime(), nullable=True),
+                        sa.Column("finished_at", sa.DateTime(), nullable=True),
+                        sa.PrimaryKeyConstraint("id")
+                        )
+        # The workers claim the oldest pending job
+        op.create_index("nci_ingest_job_status", INGEST_JOB, ["status", "id"])
+
+
+def downgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if inspector.has_table(INGEST_JOB):
+        op.drop_index("nci_ingest_job_status", table_name=INGEST_JOB)
+        op.drop_table(INGEST_JOB)
@@ -0,0 +1,56 @@
+"""add audit_archive table
+
+Revision ID: d9f3b1c7e482
+Revises: c6a1d8e4b257
+Create Date: 2026-10-17 19:42:18.305736
+
+"""
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = "d9f3b1c7e482"
+down_revision = "c6a1d8e4b257"
+branch_labels = None
+depends_on = None
+
+# Logger
+logger = logging.getLogger()
+
+# Table names
+AUDIT_ARCHIVE = "audit_archive"
+
+
+def upgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if not inspector.has_table(AUDIT_ARCHIVE):
+        logger.info(f"Creating table {AUDIT_ARCHIVE}")
+        # The archived audits keep the id they had in the audit table, it is not an identity column
+        op.create_table(AUDIT_ARCHIVE,
+                        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+                        sa.Column("finding_id", sa.Integer(), nullable=False),
+                        sa.Column("status",
+                                  sa.Enum("NOT_ANALYZED", "NOT_ACCESSIBLE", "CLARIFICATION_REQUIRED",
+                                          "FALSE_POSITIVE", "TRUE_POSITIVE", "OUTDATED", name="findingstatus"),
+                                  nullable=False),
+                        sa.Column("auditor", sa.String(length=200), nullable=True),
+                        sa.Column("comment", sa.String(length=255), nullable=True),
+                        sa.Column("timestamp", sa.DateTime(), nullable=False),
+                        sa.PrimaryKeyConstraint("id")
+                        )
+        # The audit history of a finding, and the audit metrics of an auditor
+        op.create_index("nci_audit_archive_finding_id", AUDIT_ARCHIVE, ["finding_id", "id"])
+        op.create_index("nci_audit_archive_auditor_timestamp", AUDIT_ARCHIVE, ["auditor", "timestamp"])
+
+
+def downgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if inspector.has_table(AUDIT_ARCHIVE):
+        op.drop_index("nci_audit_archive_auditor_timestamp", table_name=AUDIT_ARCHIVE)
+        op.drop_index("nci_audit_archive_finding_id", table_name=AUDIT_ARCHIVE)
+        op.drop_table(AUDIT_ARCHIVE)
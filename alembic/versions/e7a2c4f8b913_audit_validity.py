@@ -0,0 +1,69 @@
+"""add valid_from and valid_to to audit
+
+Revision ID: e7a2c4f8b913
+Revises: b4d9f2a6c815
+Create Date: 2026-10-17 22:14:51.208734
+
+"""
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import column, func, select, table, update
+
+# revision identifiers, used by Alembic.
+revision = "e7a2c4f8b913"
+down_revision = "b4d9f2a6c815"
+branch_labels = None
+depends_on = None
+
+# Logger
+logger = logging.getLogger()
+
+# Table and column names
+AUDIT = "audit"
+VALID_FROM = "valid_from"
+VALID_TO = "valid_to"
+
+
+def upgrade():
+    op.add_column(AUDIT, sa.Column(VALID_FROM, sa.DateTime(), nullable=True))
+    op.add_column(AUDIT, sa.Column(VALID_TO, sa.DateTime(), nullable=True))
+
+    backfill_validity()
+    op.alter_column(AUDIT, VALID_FROM, existing_type=sa.DateTime(), nullable=False)
+
+    # The status of the findings at a date is a range predicate on the validity of their audits
+    op.create_index("nci_audit_validity", AUDIT, [VALID_TO, VALID_FROM, "finding_id", "status"])
+
+
+def downgrade():
+    op.drop_index("nci_audit_validity", AUDIT)
+    op.drop_column(AUDIT, VALID_TO)
+    op.drop_column(AUDIT, VALID_FROM)
+
+
+def backfill_validity():
+    """An audit is valid from its timestamp until the timestamp of the next audit of its finding."""
+    audit = table(
+        AUDIT,
+        column("id"),
+        column("finding_id"),
+        column("timestamp", sa.DateTime()),
+        column(VALID_FROM, sa.DateTime()),
+        column(VALID_TO, sa.DateTime()),
+    )
+
+    logger.info(f"Setting {VALID_FROM} of {AUDIT}")
+    op.execute(update(audit).values({VALID_FROM: audit.c.timestamp}))
+
+    logger.info(f"Setting {VALID_TO} of {AUDIT}")
+    next_audit = select(
+        audit.c.id,
+        func.lead(audit.c.timestamp).over(partition_by=audit.c.finding_id, order_by=audit.c.id).label("timestamp"),
+    )
+    next_audit = next_audit.subquery()
+    query = update(audit).where(audit.c.id == next_audit.c.id)
+    query = query.where(next_audit.c.timestamp != None)  # noqa: E711
+    query = query.values({VALID_TO: next_audit.c.timestamp})
+    op.execute(query)
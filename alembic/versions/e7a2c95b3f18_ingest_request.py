@@ -0,0 +1,51 @@
+"""add ingest_request idempotency table
+
+Revision ID: e7a2c95b3f18
+Revises: d41b7e9c2a65
+Create Date: 2026-10-17 14:21:05.730164
+
+"""
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = "e7a2c95b3f18"
+down_revision = "d41b7e9c2a65"
+branch_labels = None
+depends_on = None
+
+# Logger
+logger = logging.getLogger()
+
+# Table names
+INGEST_REQUEST = "ingest_request"
+
+
+def upgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if not inspector.has_table(INGEST_REQUEST):
+        logger.info(f"Creating table {INGEST_REQUEST}")
+        op.create_table(INGEST_REQUEST,
+                        sa.Column("id", sa.Integer(), nullable=False),
+                        sa.Column("idempotency_key", sa.String(length=255), nullable=False),
+                        sa.Column("scan_id", sa.Integer(), nullable=False),
+                        sa.Column("request_digest", sa.String(length=64), nullable=False),
+                        sa.Column("created_findings", sa.Integer(), nullable=False),
+                        sa.Column("created_at", sa.DateTime(), nullable=False),
+                        sa.PrimaryKeyConstraint("id"),
+                        sa.UniqueConstraint("idempotency_key", name="uc_ingest_request_idempotency_key")
+                        )
+        # The expired requests are deleted by creation time
+        op.create_index("nci_ingest_request_created_at", INGEST_REQUEST, ["created_at"])
+
+
+def downgrade():
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if inspector.has_table(INGEST_REQUEST):
+        op.drop_index("nci_ingest_request_created_at", table_name=INGEST_REQUEST)
+        op.drop_table(INGEST_REQUEST)
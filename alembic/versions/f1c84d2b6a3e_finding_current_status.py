@@ -0,0 +1,66 @@
+"""add current status columns to finding
+
+Revision ID: f1c84d2b6a3e
+Revises: e7a2c95b3f18
+Create Date: 2026-10-17 16:08:12.463981
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import Table, column, select, table, update
+
+
+# revision identifiers, used by Alembic.
+revision = "f1c84d2b6a3e"
+down_revision = "e7a2c95b3f18"
+branch_labels = None
+depends_on = None
+
+TABLE_FINDING = "finding"
+TABLE_AUDIT = "audit"
+CURRENT_STATUS = "current_status"
+CURRENT_AUDIT_ID = "current_audit_id"
+
+
+def upgrade():
+    op.add_column(TABLE_FINDING,
+                  sa.Column(CURRENT_STATUS,
+                            sa.Enum("NOT_ANALYZED", "NOT_ACCESSIBLE", "CLARIFICATION_REQUIRED", "FALSE_POSITIVE",
+                                    "TRUE_POSITIVE", "OUTDATED", name="findingstatus"),
+                            nullable=True))
+    op.add_column(TABLE_FINDING, sa.Column(CURRENT_AUDIT_ID, sa.Integer(), nullable=True))
+
+    backfill_current_status()
+
+    # The status filters and counts are scoped to repositories
+    op.create_index("nci_finding_repository_id_current_status", TABLE_FINDING, ["repository_id", CURRENT_STATUS])
+
+
+def downgrade():
+    op.drop_index("nci_finding_repository_id_current_status", TABLE_FINDING)
+    op.drop_column(TABLE_FINDING, CURRENT_AUDIT_ID)
+    op.drop_column(TABLE_FINDING, CURRENT_STATUS)
+
+
+def backfill_current_status():
+    """Copy the status and id of the latest audit to the existing findings."""
+    conn = op.get_bind()
+
+    audit: Table = table(TABLE_AUDIT, column("id"), column("finding_id"), column("status"), column("is_latest"))
+    finding: Table = table(TABLE_FINDING, column("id"), column(CURRENT_STATUS), column(CURRENT_AUDIT_ID))
+
+    latest_audit = select(audit.c.id, audit.c.status)
+    latest_audit = latest_audit.where(audit.c.finding_id == finding.c.id)
+    latest_audit = latest_audit.where(audit.c.is_latest == True)  # noqa: E712
+    latest_audit = latest_audit.order_by(audit.c.id.desc()).limit(1)
+
+    # Findings without audit are not analyzed, they keep NULL.
+    query = update(finding)
+    query = query.where(finding.c.id.in_(select(audit.c.finding_id).where(audit.c.is_latest == True)))  # noqa: E712
+    query = query.values(
+        {
+            CURRENT_AUDIT_ID: latest_audit.with_only_columns(audit.c.id).scalar_subquery(),
+            CURRENT_STATUS: latest_audit.with_only_columns(audit.c.status).scalar_subquery(),
+        }
+    )
+    conn.execute(query)
@@ -0,0 +1,29 @@
+"""add heartbeat_at to ingest_job
+
+Revision ID: f4b2e8c6d031
+Revises: c5b8d1e3f027
+Create Date: 2026-10-18 09:41:12.507213
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f4b2e8c6d031"
+down_revision = "c5b8d1e3f027"
+branch_labels = None
+depends_on = None
+
+# Table and column names
+INGEST_JOB = "ingest_job"
+HEARTBEAT_AT = "heartbeat_at"
+
+
+def upgrade():
+    op.add_column(INGEST_JOB, sa.Column(HEARTBEAT_AT, sa.DateTime(), nullable=True))
+    # The running jobs claimed before the upgrade are given their start as last heartbeat
+    op.execute(f"UPDATE {INGEST_JOB} SET {HEARTBEAT_AT} = started_at WHERE started_at IS NOT NULL")
+
+
+def downgrade():
+    op.drop_column(INGEST_JOB, HEARTBEAT_AT)
@@ -0,0 +1,66 @@
+# Standard Library
+import logging
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import UTC, datetime, timedelta
+
+# First Party
+from resc_backend.db.connection import Session, engine
+from resc_backend.helpers.environment_wrapper import validate_environment
+from resc_backend.resc_web_service.configuration import (
+    AUDIT_ARCHIVE_ENV_VARS,
+    RESC_AUDIT_ARCHIVE_AFTER_DAYS,
+    RESC_AUDIT_ARCHIVE_BATCH_SIZE,
+)
+from resc_backend.resc_web_service.crud import audit as audit_crud
+
+env_variables = validate_environment(AUDIT_ARCHIVE_ENV_VARS)
+logger = logging.getLogger(__name__)
+
+
+def create_cli_argparser() -> ArgumentParser:
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=int(env_variables[RESC_AUDIT_ARCHIVE_AFTER_DAYS]),
+        help="Audits superseded longer ago than this number of days are archived",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=int(env_variables[RESC_AUDIT_ARCHIVE_BATCH_SIZE]),
+        help="Number of audits moved per transaction, at most 1000",
+    )
+
+    return parser
+
+
+def validate_cli_arguments(args: Namespace):
+    valid_arguments = True
+    if args.older_than_days < 1:
+        logger.error("The number of days needs to be at least 1")
+        valid_arguments = False
+    if not 1 <= args.batch_size <= 1000:
+        logger.error("The batch size needs to be between 1 and 1000")
+        valid_arguments = False
+    if not valid_arguments:
+        return False
+    return args
+
+
+def archive_audits():
+    """
+    This function moves the audits superseded longer ago than the configured number of days to the audit_archive table.
+    """
+    parser: ArgumentParser = create_cli_argparser()
+    args: Namespace = parser.parse_args()
+    args = validate_cli_arguments(args)
+    if not args:
+        logger.error("CLI arguments validation failed while archiving audits")
+        sys.exit(-1)
+
+    older_than = datetime.now(UTC) - timedelta(days=args.older_than_days)
+    with Session(bind=engine) as db_connection:
+        archived_count = audit_crud.archive_audits(db_connection, older_than=older_than, batch_size=args.batch_size)
+    logger.info(f"Archived {archived_count} audits superseded before {older_than}")
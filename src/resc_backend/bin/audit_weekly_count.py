@@ -0,0 +1,51 @@
+# Standard Library
+import logging
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import UTC, datetime, timedelta
+
+# First Party
+from resc_backend.db.connection import Session, engine
+from resc_backend.resc_web_service.crud import audit_weekly_count as audit_weekly_count_crud
+
+logger = logging.getLogger(__name__)
+
+
+def create_cli_argparser() -> ArgumentParser:
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        default=13,
+        help="Number of past weeks of which the counts are rebuilt, in addition to the current week",
+    )
+
+    return parser
+
+
+def validate_cli_arguments(args: Namespace):
+    valid_arguments = True
+    if args.weeks < 0:
+        logger.error("The number of weeks needs to be positive")
+        valid_arguments = False
+    if not valid_arguments:
+        return False
+    return args
+
+
+def rebuild_audit_weekly_counts():
+    """
+    This function recomputes the weekly audit counts of the auditors from the audits and corrects the counters
+    which differ, the differences are logged.
+    """
+    parser: ArgumentParser = create_cli_argparser()
+    args: Namespace = parser.parse_args()
+    args = validate_cli_arguments(args)
+    if not args:
+        logger.error("CLI arguments validation failed while rebuilding the audit weekly counts")
+        sys.exit(-1)
+
+    since = datetime.now(UTC) - timedelta(weeks=args.weeks)
+    with Session(bind=engine) as db_connection:
+        corrected_count = audit_weekly_count_crud.rebuild_audit_weekly_counts(db_connection, since=since)
+    logger.info(f"Corrected {corrected_count} audit weekly counts since {since}")
@@ -33,6 +33,7 @@ from resc_backend.db.model import (
     DBtag,
     DBVcsInstance,
 )
+from resc_backend.resc_web_service.crud import audit_weekly_count as audit_weekly_count_crud
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
 from resc_backend.resc_web_service.schema.scan_type import ScanType
 
@@ -42,6 +43,7 @@ logger = logging.getLogger(__name__)
 TABLE_SCAN = "scan"
 TABLE_RULE_PACK = "rule_pack"
 TABLE_AUDIT = "audit"
+TABLE_FINDING = "finding"
 
 
 class GenerateData:
@@ -336,14 +338,16 @@ class GenerateData:
         for chunk in self.finding_id_chunks:
             audits = []
             for finding_id in chunk:
+                timestamp = GenerateData.get_random_audit_datetime()
                 audits.append(
                     dict(
                         finding_id=finding_id[0],
                         status=random.choice(self.audit_status),
                         auditor=random.choice(self.seco_members),
                         comment="just trust me",
-                        timestamp=GenerateData.get_random_audit_datetime(),
+                        timestamp=timestamp,
                         is_latest=False,
+                        valid_from=timestamp,
                     )
                 )
             self.db_util.bulk_persist_data(DBaudit, audits)
@@ -351,6 +355,8 @@ class GenerateData:
 
     def fix_latests(self):
         self.fix_audits()
+        self.fix_findings_current_status()
+        self.fix_audit_weekly_counts()
         self.fix_scans()
 
     def fix_audits(self):
@@ -379,6 +385,31 @@ class GenerateData:
             query = query.values(is_latest=True)
             conn.execute(query)
 
+    def fix_findings_current_status(self):
+        """Copy the status and id of the latest audit to the findings."""
+        conn = self.db_util.session.get_bind()
+
+        audit: Table = table(TABLE_AUDIT, column("id"), column("status"), column("is_latest"), column("finding_id"))
+        finding: Table = table(TABLE_FINDING, column("id"), column("current_status"), column("current_audit_id"))
+
+        latest_audit = select(audit.c.id, audit.c.status)
+        latest_audit = latest_audit.where(audit.c.finding_id == finding.c.id)
+        latest_audit = latest_audit.where(audit.c.is_latest == True)  # noqa: E712
+        latest_audit = latest_audit.order_by(audit.c.id.desc()).limit(1)
+
+        query = update(finding)
+        query = query.values(
+            current_audit_id=latest_audit.with_only_columns(audit.c.id).scalar_subquery(),
+            current_status=latest_audit.with_only_columns(audit.c.status).scalar_subquery(),
+        )
+        conn.execute(query)
+
+    def fix_audit_weekly_counts(self):
+        """Count the generated audits per week and auditor."""
+        audit_weekly_count_crud.rebuild_audit_weekly_counts(
+            self.db_util.session, since=datetime.now() - timedelta(weeks=2)
+        )
+
     def fix_scans(self):
         """Assign is_latest to true to the latest scans (Base + incremental) per ruleset."""
         conn = self.db_util.session.get_bind()
@@ -0,0 +1,53 @@
+# Standard Library
+import logging
+import sys
+from argparse import ArgumentParser, Namespace
+
+# First Party
+from resc_backend.constants import FINDING_WEEKLY_SNAPSHOT_WEEKS
+from resc_backend.db.connection import Session, engine
+from resc_backend.resc_web_service.crud import finding_weekly_snapshot as finding_weekly_snapshot_crud
+
+logger = logging.getLogger(__name__)
+
+
+def create_cli_argparser() -> ArgumentParser:
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        default=FINDING_WEEKLY_SNAPSHOT_WEEKS - 1,
+        help="Number of past weeks of which the finding counts are stored, if not stored yet",
+    )
+
+    return parser
+
+
+def validate_cli_arguments(args: Namespace):
+    valid_arguments = True
+    if args.weeks < 0:
+        logger.error("The number of weeks needs to be positive")
+        valid_arguments = False
+    if not valid_arguments:
+        return False
+    return args
+
+
+def finalize_finding_weekly_snapshots():
+    """
+    This function stores the finding counts of the past weeks which are not stored yet, the metrics over time
+    read them from the finding_weekly_snapshot table.
+    """
+    parser: ArgumentParser = create_cli_argparser()
+    args: Namespace = parser.parse_args()
+    args = validate_cli_arguments(args)
+    if not args:
+        logger.error("CLI arguments validation failed while storing the finding weekly snapshots")
+        sys.exit(-1)
+
+    with Session(bind=engine) as db_connection:
+        # The current week is included in the weeks of the crud function, it is never stored
+        stored_weeks = finding_weekly_snapshot_crud.finalize_finding_weekly_snapshots(
+            db_connection, weeks=args.weeks + 1
+        )
+    logger.info(f"Stored the finding counts of {stored_weeks} weeks")
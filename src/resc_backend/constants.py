@@ -20,11 +20,15 @@ RWS_ROUTE_METRICS = "/metrics"
 RWS_ROUTE_DETAILED_FINDINGS = "/detailed-findings"
 RWS_ROUTE_TOTAL_COUNT_BY_RULE = "/total-count-by-rule"
 RWS_ROUTE_BY_RULE = "/by-rule"
+RWS_ROUTE_BY_FILTER = "/by-filter"
 RWS_ROUTE_DETECTED_RULES = "/detected-rules"
 RWS_ROUTE_FINDINGS_METADATA = "/findings-metadata"
 RWS_ROUTE_FINDING_STATUS_COUNT = "/finding-status-count"
 RWS_ROUTE_RULE_PACKS = "/rule-packs"
 RWS_ROUTE_VCS = "/vcs-instances"
+RWS_ROUTE_STREAM = "/stream"
+RWS_ROUTE_INGEST_JOBS = "/ingest-jobs"
+RWS_ROUTE_DELTA = "/delta"
 
 
 RWS_ROUTE_PERSONAL_AUDITS = "/personal-audits"
@@ -50,6 +54,8 @@ RWS_ROUTE_VERSIONS = "/versions"
 RWS_ROUTE_MARK_AS_OUTDATED = "/mark-as-outdated"
 RWS_ROUTE_MARK_AS_ACTIVE = "/active"
 RWS_ROUTE_TOGGLE_DELETED = "/toggle-deleted"
+RWS_ROUTE_ARCHIVE = "/archive"
+RWS_ROUTE_FEED = "/feed"
 
 REPOSITORIES_TAG = "resc-repositories"
 SCANS_TAG = "resc-scans"
@@ -63,6 +69,34 @@ METRICS_TAG = "resc-metrics"
 DEFAULT_RECORDS_PER_PAGE_LIMIT = 100
 MAX_RECORDS_PER_PAGE_LIMIT = 1000
 
+# Ingestion of scan findings
+INGEST_CHUNK_SIZE = 1000
+INGEST_MAX_CHUNK_SIZE = 10000
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_MAX_LINE_SIZE = 1024 * 1024
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = [MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"]
+CONTENT_ENCODING_GZIP = "gzip"
+CONTENT_ENCODING_ZSTD = "zstd"
+CONTENT_ENCODING_IDENTITY = "identity"
+INGEST_MAX_DECOMPRESSED_SIZE = 512 * 1024 * 1024  # bytes, compressed bodies decoding to more are rejected with 413
+INGEST_JOB_POLL_INTERVAL = 5  # seconds between checks for jobs queued by other instances
+INGEST_JOB_TIMEOUT = 60 * 60  # running jobs without heartbeat for this long are considered abandoned and queued again
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60  # seconds during which a retried request returns the recorded result
+IDEMPOTENCY_KEY_RESERVATION_TIMEOUT = 60 * 60  # requests in progress for longer are considered abandoned
+IDEMPOTENCY_RETRY_AFTER = 5  # seconds a retry waits for the request in progress with the same key
+INGEST_REQUEST_CLEANUP_INTERVAL = 60 * 60  # seconds between deletions of the expired idempotency keys
+FINDING_WEEKLY_SNAPSHOT_INTERVAL = 60 * 60  # seconds between stores of the finding counts of the closed weeks
+FINDING_WEEKLY_SNAPSHOT_WEEKS = 53  # number of weeks, the current one included, of which the counts are stored
+
+# Archival of superseded audits
+AUDIT_ARCHIVE_AFTER_DAYS = 180  # audits superseded longer ago than this are moved to the audit_archive table
+AUDIT_ARCHIVE_BATCH_SIZE = 1000
+AUDIT_ARCHIVE_MAX_BATCHES_PER_REQUEST = 100  # longer runs are left to the resc_archive_audits command
+
 BASE_SCAN = "BASE"
 INCREMENTAL_SCAN = "INCREMENTAL"
 
@@ -74,6 +108,12 @@ CACHE_NAMESPACE_VCS_INSTANCE = "namespace-vcs-instance"
 CACHE_NAMESPACE_RULE_PACK = "namespace-rule-pack"
 CACHE_NAMESPACE_RULE = "namespace-rule"
 CACHE_NAMESPACE_FINDING_STATUS = "namespace-finding-status"
+CACHE_TAG_GLOBAL = "global"
+CACHE_TAG_PROJECT = "project"
+CACHE_TAG_REPOSITORY = "repository"
+CACHE_TAG_RULE_PACK = "rule-pack"
+CACHE_TAG_VCS_INSTANCE = "vcs-instance"
+CACHE_TAG_VCS_PROVIDER = "vcs-provider"
 
 TOML_CUSTOM_DELIMITER = "#custom-delimiter#"
 TEMP_RULE_FILE = "/tmp/temp_resc_rule.toml"
@@ -96,6 +136,24 @@ ERROR_MESSAGE_503 = "Unable to communicate with DataBase, Please contact your sy
 # Redis Cache
 REDIS_CACHE_EXPIRE = 60 * 60 * 24  # set to 24 hours
 
+# Cache generations
+CACHE_GENERATION_PREFIX = "resc-cache-generation"
+CACHE_GENERATION_MEMO_TTL = 1  # seconds a namespace generation is reused before being read from Redis again
+
+# Local cache, in front of the Redis cache
+LOCAL_CACHE_MAX_ENTRIES = 1000  # cache entries kept in memory per process, the least recently used are evicted
+LOCAL_CACHE_MAX_VALUE_SIZE = 16 * 1024  # bytes, larger values are read from Redis only
+LOCAL_CACHE_TTL = 30  # seconds, bounds the staleness when an invalidation message is missed
+CACHE_INVALIDATION_CHANNEL = "resc-cache-invalidation"
+CACHE_INVALIDATION_RETRY_DELAY = 1  # seconds before subscribing again to the invalidation channel
+
+# Cache warmer
+CACHE_WARMER_DEBOUNCE = 5  # seconds without invalidation of a namespace before its hot keys are recomputed
+CACHE_WARMER_CONCURRENCY = 2  # cache entries recomputed at the same time
+CACHE_WARMER_MIN_HITS = 3  # requests after which a cache key is considered hot
+CACHE_WARMER_MAX_KEYS = 50  # hot keys recomputed per namespace
+CACHE_WARMER_TRACKED_KEYS = 1000  # cache keys of which the requests are counted
+
 # HTTP Security Response Headers
 STRICT_TRANSPORT_SECURITY = "max-age=31536000; includeSubDomains; preload"
 CACHE_CONTROL = "no-cache, no-store"
@@ -13,7 +13,12 @@ logger = logging.getLogger(__name__)
 
 # First Party
 from resc_backend.db.model.audit import DBaudit
+from resc_backend.db.model.audit_archive import DBauditArchive
+from resc_backend.db.model.audit_weekly_count import DBauditWeeklyCount
 from resc_backend.db.model.finding import DBfinding
+from resc_backend.db.model.finding_weekly_snapshot import DBfindingWeeklySnapshot
+from resc_backend.db.model.ingest_job import DBingestJob
+from resc_backend.db.model.ingest_request import DBingestRequest
 from resc_backend.db.model.repository import DBrepository
 from resc_backend.db.model.rule import DBrule
 from resc_backend.db.model.rule_allow_list import DBruleAllowList
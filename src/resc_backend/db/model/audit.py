@@ -34,6 +34,10 @@ class DBaudit(Base):
     comment = Column(String(255), nullable=True)
     timestamp = Column(DateTime, nullable=False, default=datetime.now(UTC))
     is_latest = Column(Boolean, nullable=False, default=False, server_default=text("0"))
+    # The audit is the status of its finding from valid_from, its timestamp, until valid_to, the timestamp of the
+    # next audit of the finding. valid_to is NULL for the latest audit.
+    valid_from = Column(DateTime, nullable=False)
+    valid_to = Column(DateTime, nullable=True)
 
     def __init__(
         self, finding_id: int, status: str, auditor: str, comment: str | None, timestamp: datetime, is_latest: bool
@@ -45,18 +49,20 @@ class DBaudit(Base):
         self.comment = sanitized_comment
         self.timestamp = timestamp
         self.is_latest = is_latest
+        self.valid_from = timestamp
 
     @staticmethod
     def create_automated(
         finding_id: int,
         status: str,
+        timestamp: datetime | None = None,
     ):
         db_audit = DBaudit(
             finding_id=finding_id,
             status=status,
             comment=AUDIT_AUTOMATED_COMMENT,
             auditor=AUDIT_AUTOMATED_AUDITOR,
-            timestamp=datetime.now(UTC),
+            timestamp=timestamp or datetime.now(UTC),
             is_latest=True,
         )
         return db_audit
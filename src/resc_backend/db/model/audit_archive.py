@@ -0,0 +1,21 @@
+# Third Party
+from sqlalchemy import Column, DateTime, Enum, Integer, String
+
+# First Party
+from resc_backend.db.model import Base
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+
+
+class DBauditArchive(Base):
+    """
+    Superseded audits moved out of the audit table, they keep the id they had in the audit table.
+    Only the audits that are not the latest audit of their finding are archived.
+    """
+
+    __tablename__ = "audit_archive"
+    id_ = Column("id", Integer, primary_key=True, autoincrement=False)
+    finding_id = Column(Integer, nullable=False)
+    status = Column(Enum(FindingStatus), nullable=False)
+    auditor = Column(String(200))
+    comment = Column(String(255), nullable=True)
+    timestamp = Column(DateTime, nullable=False)
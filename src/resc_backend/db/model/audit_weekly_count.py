@@ -0,0 +1,17 @@
+# Third Party
+from sqlalchemy import Column, Date, Integer, String
+
+# First Party
+from resc_backend.db.model import Base
+
+
+class DBauditWeeklyCount(Base):
+    """
+    Number of audits of an auditor per week, maintained together with the audits.
+    The weeks start on Monday, week_start is the date of this Monday.
+    """
+
+    __tablename__ = "audit_weekly_count"
+    week_start = Column(Date, primary_key=True)
+    auditor = Column(String(200), primary_key=True)
+    audit_count = Column(Integer, nullable=False)
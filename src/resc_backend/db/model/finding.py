@@ -1,11 +1,49 @@
 # Standard Library
+import hashlib
 from datetime import UTC, datetime
 
 # Third Party
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, UniqueConstraint
 
 # First Party
 from resc_backend.db.model import Base
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+
+
+def finding_long_key(finding) -> str:
+    """Key identifying a finding within a repository, mirrors the uc_finding_per_repository constraint"""
+    # A missing commit id is rendered empty, like CONCAT does in SQL
+    return (
+        f"{finding.commit_id or ''}|{finding.rule_name}|{finding.file_path}"
+        + f"|{finding.line_number}|{finding.column_start}|{finding.column_end}"
+    )
+
+
+def finding_short_key(finding) -> str:
+    """Key identifying a finding within a repository regardless of the commit, used for scan as directory rules"""
+    return f"{finding.rule_name}|{finding.file_path}|{finding.line_number}|{finding.column_start}|{finding.column_end}"
+
+
+def fingerprint(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class _FindingParameters:
+    """Attribute access over the parameters of an INSERT statement, used by the column defaults"""
+
+    def __init__(self, parameters: dict):
+        self._parameters = parameters
+
+    def __getattr__(self, item):
+        return self._parameters.get(item)
+
+
+def _default_long_fingerprint(context) -> str:
+    return fingerprint(finding_long_key(_FindingParameters(context.get_current_parameters())))
+
+
+def _default_short_fingerprint(context) -> str:
+    return fingerprint(finding_short_key(_FindingParameters(context.get_current_parameters())))
 
 
 class DBfinding(Base):
@@ -24,6 +62,11 @@ class DBfinding(Base):
     email = Column(String(100))
     event_sent_on = Column(DateTime, nullable=True)
     is_dir_scan = Column(Boolean, nullable=False, default=False)
+    long_fingerprint = Column(String(64), nullable=True, default=_default_long_fingerprint)
+    short_fingerprint = Column(String(64), nullable=True, default=_default_short_fingerprint)
+    # Copy of the status and id of the latest audit, maintained by the audit crud. NULL when not audited yet.
+    current_status = Column(Enum(FindingStatus), nullable=True)
+    current_audit_id = Column(Integer, nullable=True)
 
     __table_args__ = (
         UniqueConstraint(
@@ -67,6 +110,12 @@ class DBfinding(Base):
         self.column_start = column_start
         self.column_end = column_end
         self.is_dir_scan = is_dir_scan
+        self.update_fingerprints()
+
+    def update_fingerprints(self):
+        """Recompute the persisted fingerprints, needs to be called whenever a key attribute changes"""
+        self.long_fingerprint = fingerprint(finding_long_key(self))
+        self.short_fingerprint = fingerprint(finding_short_key(self))
 
     @staticmethod
     def create_from_finding(finding, is_dir_scan: bool = False):
@@ -0,0 +1,25 @@
+# Third Party
+from sqlalchemy import Column, Enum, Integer
+
+# First Party
+from resc_backend.constants import AZURE_DEVOPS, BITBUCKET, GITHUB_PUBLIC
+from resc_backend.db.model import Base
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+
+
+class DBfindingWeeklySnapshot(Base):
+    """
+    Finding counts per provider type and status at the end of an ISO week, stored once the week is over.
+    A finalized week has a row for every provider type and status.
+    finding_count counts the findings of the scans since the last base scan of their repository, by the status of
+    their audit at the end of the week, NOT_ANALYZED when not audited.
+    audit_status_count counts the findings of which the audit at the end of the week has the status, scanned or not.
+    """
+
+    __tablename__ = "finding_weekly_snapshot"
+    iso_year = Column(Integer, primary_key=True)
+    iso_week = Column(Integer, primary_key=True)
+    provider_type = Column(Enum(BITBUCKET, AZURE_DEVOPS, GITHUB_PUBLIC, name="provider_type"), primary_key=True)
+    status = Column(Enum(FindingStatus), primary_key=True)
+    finding_count = Column(Integer, nullable=False)
+    audit_status_count = Column(Integer, nullable=False)
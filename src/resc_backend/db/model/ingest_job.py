@@ -0,0 +1,35 @@
+# Standard Library
+from datetime import UTC, datetime
+
+# Third Party
+from sqlalchemy import Column, DateTime, Enum, Integer, String, Text
+
+# First Party
+from resc_backend.db.model import Base
+from resc_backend.resc_web_service.schema.ingest_job_status import IngestJobStatus
+
+
+class DBingestJob(Base):
+    __tablename__ = "ingest_job"
+    id_ = Column("id", Integer, primary_key=True)
+    # No foreign key, the staged findings must not prevent the deletion of the scan
+    scan_id = Column(Integer, nullable=False)
+    status = Column(Enum(IngestJobStatus), nullable=False, default=IngestJobStatus.PENDING)
+    payload = Column(Text, nullable=True)
+    total_findings = Column(Integer, nullable=False)
+    processed_findings = Column(Integer, nullable=False, default=0)
+    created_findings = Column(Integer, nullable=True)
+    error = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    # Refreshed by the worker while the job runs, a job without recent heartbeat is queued again
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __init__(self, scan_id: int, payload: str, total_findings: int):
+        self.scan_id = scan_id
+        self.status = IngestJobStatus.PENDING
+        self.payload = payload
+        self.total_findings = total_findings
+        self.processed_findings = 0
+        self.created_at = datetime.now(UTC)
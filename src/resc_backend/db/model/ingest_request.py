@@ -0,0 +1,40 @@
+# Standard Library
+from datetime import UTC, datetime
+
+# Third Party
+from sqlalchemy import Column, DateTime, Enum, Integer, String, UniqueConstraint
+
+# First Party
+from resc_backend.db.model import Base
+from resc_backend.resc_web_service.schema.ingest_request_status import IngestRequestStatus
+
+
+class DBingestRequest(Base):
+    __tablename__ = "ingest_request"
+    id_ = Column("id", Integer, primary_key=True)
+    idempotency_key = Column(String(255), nullable=False)
+    # No foreign key, the recorded requests must not prevent the deletion of the scan
+    scan_id = Column(Integer, nullable=False)
+    status = Column(Enum(IngestRequestStatus), nullable=False, default=IngestRequestStatus.IN_PROGRESS)
+    # Unknown while a streamed body is being read
+    request_digest = Column(String(64), nullable=True)
+    # The result of the request, set once it is done
+    created_findings = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (UniqueConstraint("idempotency_key", name="uc_ingest_request_idempotency_key"),)
+
+    def __init__(
+        self,
+        idempotency_key: str,
+        scan_id: int,
+        request_digest: str | None,
+        status: IngestRequestStatus = IngestRequestStatus.IN_PROGRESS,
+        created_findings: int | None = None,
+    ):
+        self.idempotency_key = idempotency_key
+        self.scan_id = scan_id
+        self.status = status
+        self.request_digest = request_digest
+        self.created_findings = created_findings
+        self.created_at = datetime.now(UTC)
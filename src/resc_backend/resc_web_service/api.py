@@ -1,4 +1,5 @@
 # Standard Library
+import asyncio
 import logging.config
 from contextlib import asynccontextmanager
 from os import path
@@ -16,11 +17,14 @@ from resc_backend.constants import RWS_VERSION_PREFIX
 from resc_backend.db.connection import Session, engine
 from resc_backend.helpers.environment_wrapper import validate_environment
 from resc_backend.resc_web_service.cache_manager import CacheManager
+from resc_backend.resc_web_service.cache_warmer import cache_warmer
 from resc_backend.resc_web_service.configuration import (
     AUTHENTICATION_REQUIRED,
     CORS_ALLOWED_DOMAINS,
     DEBUG_MODE,
     ENABLE_CORS,
+    RESC_INGEST_MAX_DECOMPRESSED_SIZE,
+    RESC_INGEST_WORKERS,
     WEB_SERVICE_ENV_VARS,
 )
 from resc_backend.resc_web_service.dependencies import (
@@ -46,6 +50,8 @@ from resc_backend.resc_web_service.endpoints import (
 from resc_backend.resc_web_service.helpers.exception_handler import (
     add_exception_handlers,
 )
+from resc_backend.resc_web_service.helpers.request_body import DecodedBodyRequest
+from resc_backend.resc_web_service.ingest_worker import ingest_worker_pool
 
 # Check and load environment variables
 env_variables = validate_environment(WEB_SERVICE_ENV_VARS)
@@ -116,11 +122,25 @@ tags_metadata = [
 auth_disabled = env_variables[AUTHENTICATION_REQUIRED].lower() in ["false"]
 AUTH = [Depends(requires_no_auth)] if auth_disabled else [Depends(requires_auth)]
 
+# Protect the workers from the compressed bodies decoding to huge documents
+DecodedBodyRequest.max_decompressed_size = int(env_variables[RESC_INGEST_MAX_DECOMPRESSED_SIZE])
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     app_startup()
+    ingest_worker_pool.start(
+        workers=int(env_variables[RESC_INGEST_WORKERS]),
+        session_factory=lambda: Session(bind=engine),
+        loop=asyncio.get_running_loop(),
+    )
+    await CacheManager.start_invalidations()
+    cache_warmer.start(session_factory=lambda: Session(bind=engine))
     yield
+    await cache_warmer.stop()
+    await CacheManager.stop_invalidations()
+    # The workers may be waiting on the event loop to clear the cache, do not block it
+    await asyncio.to_thread(ingest_worker_pool.stop)
     await app_shutdown()
 
 
@@ -0,0 +1,118 @@
+# Standard Library
+import time
+from typing import Any
+
+# Third Party
+from redis import asyncio as aioredis
+
+# First Party
+from resc_backend.constants import CACHE_GENERATION_MEMO_TTL, CACHE_GENERATION_PREFIX
+from resc_backend.resc_web_service.cache_invalidation import InvalidationChannel
+
+
+def get_versioned_key(namespace: str, cache_key: str, generation: int) -> str:
+    """
+        Embed the generation of its namespace in a cache key
+    :param namespace:
+        namespace of the cache key, prefix included
+    :param cache_key:
+        cache key starting with the namespace
+    :param generation:
+        generation of the namespace
+    :return: str
+        the cache key with the generation following the namespace
+    """
+    return f"{namespace}:{generation}{cache_key.removeprefix(namespace)}"
+
+
+def get_unversioned_key(namespace: str, versioned_key: str) -> str:
+    """
+        Remove the generation of its namespace from a cache key, the reverse of get_versioned_key
+    :param namespace:
+        namespace of the cache key, prefix included
+    :param versioned_key:
+        cache key with the generation following the namespace
+    :return: str
+        the cache key without generation
+    """
+    _, _, cache_key = versioned_key.removeprefix(f"{namespace}:").partition(":")
+    return f"{namespace}:{cache_key}"
+
+
+class NamespaceGenerations:
+    """
+    Generation numbers of the cache namespaces, embedded in the cache keys by the key builders.
+    Clearing a namespace increments its generation, the keys of the previous generations are not read anymore
+    and expire by themselves. The generations are kept in Redis, out of the cache prefix so clearing the whole
+    cache does not reset them, and memoized for a short time. Without Redis they are kept in memory only.
+    With an invalidation channel, the other processes forget their memo of a generation once incremented.
+    """
+
+    def __init__(self, memo_ttl: float = CACHE_GENERATION_MEMO_TTL):
+        self._memo_ttl = memo_ttl
+        self._redis: aioredis.Redis | None = None
+        self._invalidation_channel: InvalidationChannel | None = None
+        self._memo: dict[str, tuple[int, float]] = {}
+
+    def start(self, redis: aioredis.Redis | None, invalidation_channel: InvalidationChannel | None = None) -> None:
+        """
+            Keep the generations in Redis
+        :param redis:
+            Redis client of the cache backend
+        :param invalidation_channel:
+            optional channel notifying the other processes of the incremented generations
+        """
+        self._redis = redis
+        self._invalidation_channel = invalidation_channel
+        self._memo.clear()
+        if invalidation_channel is not None:
+            invalidation_channel.subscribe(self.handle_invalidation)
+
+    def handle_invalidation(self, message: dict[str, Any]) -> None:
+        """
+            Forget the memo of the generation incremented by another process
+        :param message:
+            invalidation message, see InvalidationChannel
+        """
+        if self._redis is not None and "namespace" in message:
+            self._memo.pop(message["namespace"], None)
+
+    @staticmethod
+    def _get_redis_key(namespace: str) -> str:
+        return f"{CACHE_GENERATION_PREFIX}:{namespace}"
+
+    async def get(self, namespace: str) -> int:
+        """
+            Retrieve the current generation of a namespace
+        :param namespace:
+            namespace of the cache keys, prefix included
+        :return: int
+            the generation, 0 for a namespace never cleared
+        """
+        generation, read_at = self._memo.get(namespace, (0, None))
+        if self._redis is None or (read_at is not None and time.monotonic() - read_at < self._memo_ttl):
+            return generation
+
+        generation = int(await self._redis.get(self._get_redis_key(namespace)) or 0)
+        self._memo[namespace] = (generation, time.monotonic())
+        return generation
+
+    async def increment(self, namespace: str) -> int:
+        """
+            Start a new generation of a namespace, invalidating all its keys
+        :param namespace:
+            namespace of the cache keys, prefix included
+        :return: int
+            the new generation
+        """
+        if self._redis is None:
+            generation = self._memo.get(namespace, (0, None))[0] + 1
+        else:
+            generation = await self._redis.incr(self._get_redis_key(namespace))
+        self._memo[namespace] = (generation, time.monotonic())
+        if self._invalidation_channel is not None:
+            await self._invalidation_channel.publish({"namespace": namespace})
+        return generation
+
+
+namespace_generations = NamespaceGenerations()
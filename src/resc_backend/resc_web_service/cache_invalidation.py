@@ -0,0 +1,103 @@
+# Standard Library
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+# Third Party
+from redis import asyncio as aioredis
+
+# First Party
+from resc_backend.constants import CACHE_INVALIDATION_CHANNEL, CACHE_INVALIDATION_RETRY_DELAY
+
+logger = logging.getLogger(__name__)
+
+# Message sent when invalidations may have been missed, every local cache entry is dropped
+INVALIDATE_ALL = {"prefix": ""}
+
+
+class InvalidationChannel:
+    """
+    Invalidation messages between the processes of the web service, keeping their local caches coherent.
+    The messages are dicts with either the cleared "keys", the "prefix" of the cleared keys
+    or the "namespace" of which the generation was incremented.
+    This channel delivers them to the subscribers of the current process only, it stands in for the
+    Redis channel when running a single process, like in the tests.
+    """
+
+    def __init__(self):
+        self._subscribers: list[Callable[[dict[str, Any]], None]] = []
+
+    def subscribe(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """
+            Receive the invalidation messages
+        :param callback:
+            function called with every message, ignoring the messages it does not handle
+        """
+        self._subscribers.append(callback)
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        """
+            Send an invalidation message to the subscribers
+        :param message:
+            invalidation message
+        """
+        self._dispatch(message)
+
+    async def start(self) -> None:
+        """
+        Start receiving the messages of the other processes
+        """
+
+    async def stop(self) -> None:
+        """
+        Stop receiving the messages of the other processes
+        """
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        for callback in self._subscribers:
+            try:
+                callback(message)
+            except Exception as error:
+                logger.warning(f"Unable to handle the cache invalidation {message}: {error}")
+
+
+class RedisInvalidationChannel(InvalidationChannel):
+    """
+    Invalidation messages published on a Redis pub/sub channel, received by every process including the sender.
+    The pub/sub delivery is at most once, the local caches are dropped when the subscription is interrupted.
+    """
+
+    def __init__(self, redis: aioredis.Redis, channel: str = CACHE_INVALIDATION_CHANNEL):
+        super().__init__()
+        self._redis = redis
+        self._channel = channel
+        self._task: asyncio.Task | None = None
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        await self._redis.publish(self._channel, json.dumps(message))
+
+    async def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._dispatch(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning(f"Cache invalidation channel interrupted, retrying: {error}")
+            self._dispatch(INVALIDATE_ALL)
+            await asyncio.sleep(CACHE_INVALIDATION_RETRY_DELAY)
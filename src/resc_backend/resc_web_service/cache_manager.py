@@ -1,6 +1,8 @@
 # Standard Library
 import logging
-from collections.abc import Callable
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from typing import Any
 
 # Third Party
@@ -11,11 +13,30 @@ from redis import asyncio as aioredis
 
 # First Party
 from resc_backend.common import initialise_logs
-from resc_backend.constants import CACHE_PREFIX, LOG_FILE_CACHING
+from resc_backend.constants import (
+    CACHE_PREFIX,
+    LOCAL_CACHE_MAX_ENTRIES,
+    LOCAL_CACHE_MAX_VALUE_SIZE,
+    LOCAL_CACHE_TTL,
+    LOG_FILE_CACHING,
+)
 from resc_backend.helpers.environment_wrapper import validate_environment
+from resc_backend.resc_web_service.cache_generations import (
+    get_unversioned_key,
+    get_versioned_key,
+    namespace_generations,
+)
+from resc_backend.resc_web_service.cache_invalidation import InvalidationChannel, RedisInvalidationChannel
+from resc_backend.resc_web_service.cache_tags import (
+    current_cache_tag_keys,
+    get_cache_tag_key,
+    get_request_cache_tags,
+)
+from resc_backend.resc_web_service.cache_warmer import cache_warmer
 from resc_backend.resc_web_service.configuration import (
     CONDITIONAL_REDIS_ENV_VARS,
     REDIS_PASSWORD,
+    RESC_LOCAL_CACHE_ENABLE,
     RESC_REDIS_CACHE_ENABLE,
     RESC_REDIS_SERVICE_HOST,
     RESC_REDIS_SERVICE_PORT,
@@ -24,6 +45,179 @@ from resc_backend.resc_web_service.configuration import (
 logger_config = initialise_logs(LOG_FILE_CACHING, False)
 logger = logging.getLogger(__name__)
 
+# Delete the keys of the tag sets and the sets themselves, returning the deleted keys
+CLEAR_TAGS_SCRIPT = """
+local cleared = {}
+for _, tag_key in ipairs(KEYS) do
+    for _, key in ipairs(redis.call('SMEMBERS', tag_key)) do
+        if redis.call('DEL', key) == 1 then
+            table.insert(cleared, key)
+        end
+    end
+    redis.call('DEL', tag_key)
+end
+return cleared
+"""
+
+
+class LocalCache:
+    """
+    In-process LRU cache in front of Redis, sparing the round trip for the small and most requested values.
+    The entries are bounded in number, size and time to live. They are evicted on the invalidation messages,
+    the time to live bounds their staleness when a message is missed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = LOCAL_CACHE_MAX_ENTRIES,
+        max_value_size: int = LOCAL_CACHE_MAX_VALUE_SIZE,
+        ttl: float = LOCAL_CACHE_TTL,
+    ):
+        self._max_entries = max_entries
+        self._max_value_size = max_value_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        """
+            Retrieve a value and the seconds it is still valid for, counting the hits and misses
+        :param key:
+            cache key
+        :return: tuple[int, bytes | None]
+            the remaining time to live and the value, 0 and None if the key is missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            ttl = expires_at - time.monotonic()
+            if ttl > 0:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return int(ttl), value
+            del self._entries[key]
+        self.misses += 1
+        return 0, None
+
+    def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        """
+            Keep a value, unless it is too large, evicting the least recently used values above the maximum
+        :param key:
+            cache key
+        :param value:
+            encoded value
+        :param expire:
+            optional seconds the value is valid for in Redis, the local time to live does not exceed it
+        """
+        if len(value) > self._max_value_size:
+            self._entries.pop(key, None)
+            return
+        ttl = min(self._ttl, expire) if expire else self._ttl
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        self.invalidations += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        self.invalidations += 1
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def handle_invalidation(self, message: dict[str, Any]) -> None:
+        """
+            Evict the values cleared by this or another process
+        :param message:
+            invalidation message, see InvalidationChannel
+        """
+        if "keys" in message:
+            self.delete(message["keys"])
+        elif "prefix" in message:
+            self.delete_prefix(message["prefix"])
+
+
+class TaggedRedisBackend(RedisBackend):
+    """
+    Redis backend adding every cached key to the sets of its tags, given by the key builder.
+    A tag set expires along with the last key added to it.
+    With a local cache, the small values are kept in memory as well. The cleared keys are sent on the
+    invalidation channel, evicting them from the local caches of all the processes.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        local_cache: LocalCache | None = None,
+        invalidation_channel: InvalidationChannel | None = None,
+    ):
+        super().__init__(redis)
+        self.local_cache = local_cache
+        self.invalidation_channel = invalidation_channel
+        if local_cache is not None and invalidation_channel is not None:
+            invalidation_channel.subscribe(local_cache.handle_invalidation)
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        if self.local_cache is None:
+            return await super().get_with_ttl(key)
+        ttl, value = self.local_cache.get_with_ttl(key)
+        if value is not None:
+            return ttl, value
+
+        invalidations = self.local_cache.invalidations
+        ttl, value = await super().get_with_ttl(key)
+        # A value read before an invalidation received meanwhile is not kept, it may be the cleared one
+        if value is not None and self.local_cache.invalidations == invalidations:
+            self.local_cache.set(key, value, ttl)
+        return ttl, value
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        async with self.redis.pipeline(transaction=not self.is_cluster) as pipe:
+            pipe.set(key, value, ex=expire)
+            for tag_key in current_cache_tag_keys.get():
+                pipe.sadd(tag_key, key)
+                if expire:
+                    pipe.expire(tag_key, expire)
+            await pipe.execute()
+        if self.local_cache is not None:
+            self.local_cache.set(key, value, expire)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        cleared = await super().clear(namespace=namespace, key=key)
+        if namespace:
+            await self._invalidate({"prefix": f"{namespace}:"})
+        elif key:
+            await self._invalidate({"keys": [key]})
+        return cleared
+
+    async def _invalidate(self, message: dict[str, Any]) -> None:
+        if self.local_cache is not None:
+            self.local_cache.handle_invalidation(message)
+        if self.invalidation_channel is not None:
+            await self.invalidation_channel.publish(message)
+
+    async def clear_tags(self, tag_keys: list[str]) -> list[str]:
+        """
+            Delete the keys of the tag sets, atomically so no key is added to a set being cleared
+        :param tag_keys:
+            keys of the tag sets
+        :return: list[str]
+            the deleted cache keys
+        """
+        cleared_keys = await self.redis.eval(CLEAR_TAGS_SCRIPT, len(tag_keys), *tag_keys)
+        cleared_keys = [key.decode() if isinstance(key, bytes) else key for key in cleared_keys]
+        if cleared_keys:
+            await self._invalidate({"keys": cleared_keys})
+        return cleared_keys
+
 
 class CacheManager:
     @classmethod
@@ -35,8 +229,14 @@ class CacheManager:
             redis_port = f"{env_variables[RESC_REDIS_SERVICE_PORT]}"
             redis_password = f"{env_variables[REDIS_PASSWORD]}"
             redis_backend = cls.get_cache_client(host=redis_host, port=int(redis_port), password=redis_password)
+            local_cache = None
+            invalidation_channel = None
+            if env_variables.get(RESC_LOCAL_CACHE_ENABLE, "").lower() in ["true"]:
+                local_cache = LocalCache()
+                invalidation_channel = RedisInvalidationChannel(redis_backend)
+            namespace_generations.start(redis_backend, invalidation_channel=invalidation_channel)
             FastAPICache.init(
-                RedisBackend(redis_backend),
+                TaggedRedisBackend(redis_backend, local_cache=local_cache, invalidation_channel=invalidation_channel),
                 prefix=CACHE_PREFIX,
                 key_builder=cls.request_key_builder,
                 enable=cache_enabled,
@@ -44,13 +244,33 @@ class CacheManager:
         else:
             FastAPICache.init(backend=RedisBackend(None), enable=cache_enabled)
 
+    @staticmethod
+    async def start_invalidations():
+        """
+        Start receiving the invalidations of the other processes, when the local cache is enabled
+        """
+        backend = FastAPICache.get_backend() if FastAPICache.get_enable() else None
+        if isinstance(backend, TaggedRedisBackend) and backend.invalidation_channel is not None:
+            await backend.invalidation_channel.start()
+
+    @staticmethod
+    async def stop_invalidations():
+        """
+        Stop receiving the invalidations of the other processes and log the hits of the local cache
+        """
+        backend = FastAPICache.get_backend() if FastAPICache.get_enable() else None
+        if isinstance(backend, TaggedRedisBackend) and backend.invalidation_channel is not None:
+            await backend.invalidation_channel.stop()
+            local_cache = backend.local_cache
+            logger.info(f"Local cache: {local_cache.hits} hits, {local_cache.misses} misses")
+
     @staticmethod
     def get_cache_client(host: str, port: int, password: str):
         cache_client = aioredis.from_url(f"redis://{host}:{port}", password=password)
         return cache_client
 
     @staticmethod
-    def request_key_builder(
+    async def request_key_builder(
         func: Callable[..., Any],
         namespace: str = "",
         *,
@@ -62,6 +282,9 @@ class CacheManager:
         """
         Build a unique key for caching based on the provided function, namespace, request, response,
         arguments (args), and keyword arguments (kwargs).
+        The key embeds the generation of the namespace, clearing the namespace starts a new generation.
+        The tags of the entry are derived from the request, the key is added to their sets when stored.
+        The request is counted by the cache warmer, which recomputes the most requested keys once cleared.
 
         Args:
             func (Callable): The function for which the key is being built.
@@ -83,11 +306,15 @@ class CacheManager:
                 repr(sorted(request.query_params.items())),
             ]
         )
+        tag_keys = tuple(get_cache_tag_key(namespace, tag) for tag in get_request_cache_tags(request))
+        current_cache_tag_keys.set(tag_keys)
+        cache_warmer.record(namespace, cache_key, func, kwargs, tag_keys)
+        cache_key = get_versioned_key(namespace, cache_key, await namespace_generations.get(namespace))
         logger.debug(f"Cache created with key: {cache_key}")
         return cache_key
 
     @staticmethod
-    def personalized_key_builder(
+    async def personalized_key_builder(
         func: Callable[..., Any],
         namespace: str = "",
         *,
@@ -121,15 +348,63 @@ class CacheManager:
                 repr(sorted(request.query_params.items())),
             ]
         )
+        current_cache_tag_keys.set(tuple(get_cache_tag_key(namespace, tag) for tag in get_request_cache_tags(request)))
+        cache_key = get_versioned_key(namespace, cache_key, await namespace_generations.get(namespace))
         logger.debug(f"Cache created with key: {cache_key}")
         return cache_key
 
     @staticmethod
     async def clear_cache_by_namespace(namespace):
+        """
+        Clear the cache entries of a namespace by starting a new generation of it,
+        the keys of the previous generation expire by themselves.
+
+        Args:
+            namespace (str): The namespace of the cache entries, without prefix.
+        """
         cache_enabled = FastAPICache.get_enable()
         if cache_enabled:
-            await FastAPICache.clear(namespace=namespace)
+            cache_namespace = f"{CACHE_PREFIX}:{namespace}"
+            cache_warmer.cancel(cache_namespace)
+            await namespace_generations.increment(cache_namespace)
             logger.debug(f"Cache cleared for namespaces: {namespace}")
+            cache_warmer.schedule(cache_namespace)
+
+    @staticmethod
+    async def clear_cache_by_tags(namespaces: list[str], tags: list[str]):
+        """
+        Clear the cache entries of the namespaces having at least one of the tags.
+        The namespaces are cleared entirely when the backend does not keep track of the tags.
+
+        Args:
+            namespaces (list[str]): The namespaces of the cache entries, without prefix.
+            tags (list[str]): The tags of the cache entries.
+        """
+        cache_enabled = FastAPICache.get_enable()
+        if not cache_enabled:
+            return
+        backend = FastAPICache.get_backend()
+        if not isinstance(backend, TaggedRedisBackend):
+            for namespace in namespaces:
+                await CacheManager.clear_cache_by_namespace(namespace=namespace)
+            return
+
+        cache_namespaces = [f"{CACHE_PREFIX}:{namespace}" for namespace in namespaces]
+        for cache_namespace in cache_namespaces:
+            cache_warmer.cancel(cache_namespace)
+        cleared_keys = await backend.clear_tags(
+            [get_cache_tag_key(cache_namespace, tag) for cache_namespace in cache_namespaces for tag in tags]
+        )
+        logger.debug(f"Cache cleared for tags: {', '.join(tags)}, {len(cleared_keys)} keys")
+        for cache_namespace in cache_namespaces:
+            cache_warmer.schedule(
+                cache_namespace,
+                cache_keys=[
+                    get_unversioned_key(cache_namespace, key)
+                    for key in cleared_keys
+                    if key.startswith(f"{cache_namespace}:")
+                ],
+            )
 
     @staticmethod
     async def clear_all_cache():
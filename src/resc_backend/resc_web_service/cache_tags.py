@@ -0,0 +1,111 @@
+# Standard Library
+import json
+import urllib.parse
+from contextvars import ContextVar
+
+# Third Party
+from fastapi import Request
+
+# First Party
+from resc_backend.constants import (
+    CACHE_TAG_GLOBAL,
+    CACHE_TAG_PROJECT,
+    CACHE_TAG_REPOSITORY,
+    CACHE_TAG_RULE_PACK,
+    CACHE_TAG_VCS_INSTANCE,
+    CACHE_TAG_VCS_PROVIDER,
+)
+
+# Request parameters, from the path, the query or the query_string of the detailed findings, scoping a cache entry
+# Every parameter restricts the findings an entry is computed from, a write outside of its scope leaves it untouched.
+TAGGED_PARAMETERS = {
+    "project_name": CACHE_TAG_PROJECT,
+    "project_filter": CACHE_TAG_PROJECT,
+    "repository_name": CACHE_TAG_REPOSITORY,
+    "repository_filter": CACHE_TAG_REPOSITORY,
+    "rule_pack_version": CACHE_TAG_RULE_PACK,
+    "rule_pack_versions": CACHE_TAG_RULE_PACK,
+    "version": CACHE_TAG_RULE_PACK,
+    "vcs_instance_id": CACHE_TAG_VCS_INSTANCE,
+    "vcs_provider": CACHE_TAG_VCS_PROVIDER,
+    "vcs_providers": CACHE_TAG_VCS_PROVIDER,
+}
+
+# Tag keys of the cache entry being computed, set by the key builder and read by the backend storing the entry
+current_cache_tag_keys: ContextVar[tuple[str, ...]] = ContextVar("current_cache_tag_keys", default=())
+
+
+def get_cache_tag(tag_type: str, value: str | int) -> str:
+    return f"{tag_type}:{value}"
+
+
+def get_cache_tag_key(namespace: str, tag: str) -> str:
+    """
+        Build the key of the set of cache keys of a tag within a namespace
+    :param namespace:
+        namespace of the cache keys, prefix included
+    :param tag:
+        tag of the cache keys
+    :return: str
+        key of the set, cleared along with the namespace
+    """
+    return f"{namespace}:tag:{tag}"
+
+
+def _parse_values(value: str) -> list[str]:
+    # The list parameters of the query_string are JSON encoded, possibly with single quotes
+    if value.startswith("["):
+        try:
+            return [str(item) for item in json.loads(value.replace("'", '"'))]
+        except ValueError:
+            pass
+    return [value]
+
+
+def get_request_cache_tags(request: Request) -> list[str]:
+    """
+        Derive the tags of a cache entry from the path and query parameters of its request
+    :param request:
+        request of the cache entry
+    :return: list[str]
+        tags of the entry, the global tag when the request is not scoped to
+        a project, repository, rule pack, vcs instance or vcs provider
+    """
+    parameters = list(request.path_params.items()) + list(request.query_params.multi_items())
+    for name, value in list(parameters):
+        if name == "query_string":
+            parameters.extend(urllib.parse.parse_qsl(value))
+
+    tags = set()
+    for name, value in parameters:
+        if name in TAGGED_PARAMETERS and value:
+            tags.update(get_cache_tag(TAGGED_PARAMETERS[name], item) for item in _parse_values(str(value)))
+    return sorted(tags) or [CACHE_TAG_GLOBAL]
+
+
+def get_scope_cache_tags(
+    project_key: str, repository_name: str, rule_pack: str, vcs_instance_id: int, provider_type: str
+) -> list[str]:
+    """
+        Tags of the cache entries possibly affected by a change to the findings of a repository for a rule pack
+    :param project_key:
+        project key of the repository
+    :param repository_name:
+        name of the repository
+    :param rule_pack:
+        version of the rule pack
+    :param vcs_instance_id:
+        id of the vcs instance of the repository
+    :param provider_type:
+        provider type of the vcs instance
+    :return: list[str]
+        tags to invalidate, the global tag included
+    """
+    return [
+        get_cache_tag(CACHE_TAG_PROJECT, project_key),
+        get_cache_tag(CACHE_TAG_REPOSITORY, repository_name),
+        get_cache_tag(CACHE_TAG_RULE_PACK, rule_pack),
+        get_cache_tag(CACHE_TAG_VCS_INSTANCE, vcs_instance_id),
+        get_cache_tag(CACHE_TAG_VCS_PROVIDER, provider_type),
+        CACHE_TAG_GLOBAL,
+    ]
@@ -0,0 +1,223 @@
+# Standard Library
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterable
+from inspect import iscoroutinefunction
+from typing import Any
+
+# Third Party
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi_cache import FastAPICache
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.constants import (
+    CACHE_WARMER_CONCURRENCY,
+    CACHE_WARMER_DEBOUNCE,
+    CACHE_WARMER_MAX_KEYS,
+    CACHE_WARMER_MIN_HITS,
+    CACHE_WARMER_TRACKED_KEYS,
+    REDIS_CACHE_EXPIRE,
+)
+from resc_backend.resc_web_service.cache_generations import get_versioned_key, namespace_generations
+from resc_backend.resc_web_service.cache_tags import current_cache_tag_keys
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """
+    Recompute the most requested cache entries in the background once their namespace is cleared
+    The requests are counted per cache key by the key builder, which also records the endpoint call to replay.
+    The cache keys are counted without the generation of their namespace, the values are recomputed for the
+    current generation.
+    The invalidations of a namespace are debounced, a burst of invalidations triggers a single recomputation
+    of the keys cleared by any of them.
+    """
+
+    def __init__(
+        self,
+        debounce: float = CACHE_WARMER_DEBOUNCE,
+        concurrency: int = CACHE_WARMER_CONCURRENCY,
+        min_hits: int = CACHE_WARMER_MIN_HITS,
+        max_keys: int = CACHE_WARMER_MAX_KEYS,
+    ):
+        self._debounce = debounce
+        self._concurrency = concurrency
+        self._min_hits = min_hits
+        self._max_keys = max_keys
+        self._session_factory: Callable[[], Session] | None = None
+        self._hits: Counter[str] = Counter()
+        self._calls: dict[str, tuple[str, Callable[..., Any], dict[str, Any], tuple[str, ...]]] = {}
+        self._generations: Counter[str] = Counter()
+        self._pending: dict[str, set[str] | None] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """
+            Start recording the requests and recomputing the hot cache keys
+        :param session_factory:
+            callable returning a new database session, the endpoints are replayed with it
+        """
+        self._session_factory = session_factory
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+
+    async def stop(self) -> None:
+        """
+        Stop recording the requests and cancel the pending recomputations
+        """
+        self._session_factory = None
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def record(
+        self,
+        namespace: str,
+        cache_key: str,
+        func: Callable[..., Any],
+        kwargs: dict[str, Any],
+        tag_keys: tuple[str, ...] = (),
+    ) -> None:
+        """
+            Count a request of a cache key and record the endpoint call computing its value
+        :param namespace:
+            namespace of the cache key, prefix included
+        :param cache_key:
+            cache key of the request
+        :param func:
+            endpoint function
+        :param kwargs:
+            keyword arguments of the endpoint, the database sessions are replaced when replaying the call
+        :param tag_keys:
+            keys of the tag sets the cache key is added to when stored
+        """
+        if self._session_factory is None:
+            return
+        # Calls depending on the request itself, like the personalized ones, cannot be replayed
+        if any(isinstance(value, Request) for value in kwargs.values()):
+            return
+
+        self._hits[cache_key] += 1
+        if cache_key not in self._calls:
+            self._calls[cache_key] = (namespace, func, kwargs, tag_keys)
+
+        if len(self._hits) > CACHE_WARMER_TRACKED_KEYS:
+            # Forget the least requested keys and halve the counts, the recent requests weigh more
+            self._hits = Counter(
+                {key: hits // 2 for key, hits in self._hits.most_common(CACHE_WARMER_TRACKED_KEYS // 2) if hits > 1}
+            )
+            self._calls = {key: call for key, call in self._calls.items() if key in self._hits}
+
+    def hot_keys(self, namespace: str, cache_keys: set[str] | None = None) -> list[str]:
+        """
+            Retrieve the hot cache keys of a namespace, the most requested first
+        :param namespace:
+            namespace of the cache keys, prefix included
+        :param cache_keys:
+            optional cache keys to choose from, all the keys of the namespace by default
+        :return: list[str]
+            at most max_keys cache keys requested at least min_hits times
+        """
+        hot_keys = [
+            key
+            for key, hits in self._hits.most_common()
+            if hits >= self._min_hits and self._calls[key][0] == namespace and (cache_keys is None or key in cache_keys)
+        ]
+        return hot_keys[: self._max_keys]
+
+    def cancel(self, namespace: str) -> None:
+        """
+            Cancel the recomputation of a namespace, called before clearing it.
+            The values being recomputed are not written to the cache anymore.
+        :param namespace:
+            namespace of the cache keys, prefix included
+        """
+        self._generations[namespace] += 1
+        task = self._tasks.pop(namespace, None)
+        if task is not None:
+            task.cancel()
+
+    def schedule(self, namespace: str, cache_keys: Iterable[str] | None = None) -> None:
+        """
+            Recompute the hot cache keys of a namespace once it has not been cleared for the debounce delay,
+            called after clearing it
+        :param namespace:
+            namespace of the cache keys, prefix included
+        :param cache_keys:
+            optional cleared cache keys, all the keys of the namespace by default.
+            The keys of the cancelled recomputations are recomputed as well.
+        """
+        if self._session_factory is None:
+            return
+        self.cancel(namespace)
+        pending = self._pending.get(namespace, set())
+        self._pending[namespace] = None if cache_keys is None or pending is None else pending | set(cache_keys)
+        self._tasks[namespace] = asyncio.get_running_loop().create_task(
+            self._warm(namespace, self._generations[namespace])
+        )
+
+    async def _warm(self, namespace: str, generation: int) -> None:
+        await asyncio.sleep(self._debounce)
+        calls = {
+            cache_key: self._calls[cache_key]
+            for cache_key in self.hot_keys(namespace, cache_keys=self._pending.get(namespace))
+        }
+        await asyncio.gather(
+            *(
+                self._warm_key(namespace, generation, cache_key, func, kwargs, tag_keys)
+                for cache_key, (_, func, kwargs, tag_keys) in calls.items()
+            )
+        )
+        if self._generations[namespace] == generation:
+            self._tasks.pop(namespace, None)
+            self._pending.pop(namespace, None)
+            logger.info(f"Recomputed {len(calls)} cache entries of {namespace}")
+
+    async def _warm_key(
+        self,
+        namespace: str,
+        generation: int,
+        cache_key: str,
+        func: Callable[..., Any],
+        kwargs: dict[str, Any],
+        tag_keys: tuple[str, ...],
+    ) -> None:
+        async with self._semaphore:
+            if self._generations[namespace] != generation:
+                return
+            # The generation is read first, a value computed while the namespace is cleared is not read anymore
+            versioned_key = get_versioned_key(namespace, cache_key, await namespace_generations.get(namespace))
+            try:
+                value = await self._replay(func, kwargs)
+            except Exception as error:
+                logger.warning(f"Unable to recompute cache entry {cache_key}: {error}")
+                return
+            if self._generations[namespace] != generation:
+                return
+
+            backend = FastAPICache.get_backend()
+            current_cache_tag_keys.set(tag_keys)
+            await backend.set(versioned_key, FastAPICache.get_coder().encode(value), REDIS_CACHE_EXPIRE)
+            # The namespace may have been cleared while the value was written
+            if self._generations[namespace] != generation:
+                await backend.clear(key=versioned_key)
+
+    async def _replay(self, func: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+        db_connection = self._session_factory()
+        try:
+            kwargs = {name: db_connection if isinstance(value, Session) else value for name, value in kwargs.items()}
+            if iscoroutinefunction(func):
+                return await func(**kwargs)
+            return await run_in_threadpool(func, **kwargs)
+        finally:
+            db_connection.close()
+
+
+cache_warmer = CacheWarmer()
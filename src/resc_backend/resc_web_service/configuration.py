@@ -1,4 +1,5 @@
 # First Party
+from resc_backend.constants import AUDIT_ARCHIVE_AFTER_DAYS, AUDIT_ARCHIVE_BATCH_SIZE, INGEST_MAX_DECOMPRESSED_SIZE
 from resc_backend.helpers.environment_wrapper import EnvironmentVariable
 
 ENABLE_CORS = "ENABLE_CORS"
@@ -15,12 +16,19 @@ SSO_JWT_CLAIM_KEY_AUTHORIZATION = "SSO_JWT_CLAIM_KEY_AUTHORIZATION"
 SSO_JWT_CLAIM_VALUE_AUTHORIZATION = "SSO_JWT_CLAIM_VALUE_AUTHORIZATION"
 
 RESC_REDIS_CACHE_ENABLE = "RESC_REDIS_CACHE_ENABLE"
+RESC_LOCAL_CACHE_ENABLE = "RESC_LOCAL_CACHE_ENABLE"
 RESC_REDIS_SERVICE_HOST = "RESC_REDIS_SERVICE_HOST"
 RESC_REDIS_SERVICE_PORT = "RESC_REDIS_SERVICE_PORT"
 REDIS_PASSWORD = "REDIS_PASSWORD"
 
 DEBUG_MODE = "DEBUG_MODE"
 
+RESC_INGEST_WORKERS = "RESC_INGEST_WORKERS"
+RESC_INGEST_MAX_DECOMPRESSED_SIZE = "RESC_INGEST_MAX_DECOMPRESSED_SIZE"
+
+RESC_AUDIT_ARCHIVE_AFTER_DAYS = "RESC_AUDIT_ARCHIVE_AFTER_DAYS"
+RESC_AUDIT_ARCHIVE_BATCH_SIZE = "RESC_AUDIT_ARCHIVE_BATCH_SIZE"
+
 WEB_SERVICE_ENV_VARS = [
     EnvironmentVariable(
         ENABLE_CORS,
@@ -46,12 +54,47 @@ WEB_SERVICE_ENV_VARS = [
         required=False,
         default="False",
     ),
+    EnvironmentVariable(
+        RESC_LOCAL_CACHE_ENABLE,
+        "Set to true to keep the small cached responses in memory as well, in front of the redis cache",
+        required=False,
+        default="False",
+    ),
     EnvironmentVariable(
         DEBUG_MODE,
         "Set to true/1 to enable debug mode",
         required=False,
         default="0",
     ),
+    EnvironmentVariable(
+        RESC_INGEST_WORKERS,
+        "Number of ingest jobs applied concurrently by this instance, set to 0 to disable the ingest workers "
+        "and their periodic maintenance: the deletion of the expired idempotency keys and the storage of the "
+        "finding counts of the closed weeks",
+        required=False,
+        default="2",
+    ),
+    EnvironmentVariable(
+        RESC_INGEST_MAX_DECOMPRESSED_SIZE,
+        "Maximum size in bytes of a compressed request body once decompressed, larger bodies are rejected",
+        required=False,
+        default=str(INGEST_MAX_DECOMPRESSED_SIZE),
+    ),
+]
+
+AUDIT_ARCHIVE_ENV_VARS = [
+    EnvironmentVariable(
+        RESC_AUDIT_ARCHIVE_AFTER_DAYS,
+        "Superseded audits older than this number of days are moved to the audit_archive table",
+        required=False,
+        default=str(AUDIT_ARCHIVE_AFTER_DAYS),
+    ),
+    EnvironmentVariable(
+        RESC_AUDIT_ARCHIVE_BATCH_SIZE,
+        "Number of audits moved to the audit_archive table per transaction, at most 1000",
+        required=False,
+        default=str(AUDIT_ARCHIVE_BATCH_SIZE),
+    ),
 ]
 
 CONDITIONAL_SSO_ENV_VARS = [
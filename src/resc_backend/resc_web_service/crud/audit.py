@@ -1,21 +1,37 @@
 # Standard Library
+import html
 import logging
 from datetime import UTC, datetime, timedelta
 from itertools import islice
 
 # Third Party
-from sqlalchemy import extract, func, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    Subquery,
+    case,
+    delete,
+    extract,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.engine import Row
 from sqlalchemy.orm import Query, Session
 
 # First Party
 from resc_backend.constants import (
+    AUDIT_ARCHIVE_BATCH_SIZE,
     AUDIT_AUTOMATED_AUDITOR,
     AUDIT_AUTOMATED_COMMENT,
     DEFAULT_RECORDS_PER_PAGE_LIMIT,
     MAX_RECORDS_PER_PAGE_LIMIT,
 )
-from resc_backend.db.model import DBaudit, DBfinding, DBrepository, DBVcsInstance
+from resc_backend.db.model import DBaudit, DBauditArchive, DBfinding, DBrepository, DBVcsInstance
+from resc_backend.resc_web_service.crud import audit_weekly_count as audit_weekly_count_crud
 from resc_backend.resc_web_service.schema.audit import AuditFinding
 from resc_backend.resc_web_service.schema.auditor_metric import AuditorMetric
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
@@ -24,9 +40,7 @@ from resc_backend.resc_web_service.schema.time_period import TimePeriod
 logger = logging.getLogger(__name__)
 
 YEAR = "year"
-MONTH = "month"
 WEEK = "week"
-DAY = "day"
 
 
 def create_audits(
@@ -57,7 +71,10 @@ def create_audits(
     iterator = iter(finding_ids)
     db_audits = []
     while chunk := list(islice(iterator, 1000)):
-        db_connection.execute(update(DBaudit).where(DBaudit.finding_id.in_(chunk)).values(is_latest=False))
+        timestamp = datetime.now(UTC)
+        db_connection.execute(
+            update(DBaudit).where(DBaudit.finding_id.in_(chunk)).values(**_superseded_audit_values(timestamp))
+        )
         db_audits_created = []
 
         # Loop around the findings and audit one by one.
@@ -67,13 +84,16 @@ def create_audits(
                 auditor=auditor,
                 status=status,
                 comment=comment,
-                timestamp=datetime.now(UTC),
+                timestamp=timestamp,
                 is_latest=True,
             )
             db_audits_created.append(db_audit)
 
         # Insert new Audits by chunk.
         db_connection.add_all(db_audits_created)
+        db_connection.flush()
+        update_current_status(db_connection, DBfinding.id_.in_(chunk))
+        audit_weekly_count_crud.add_audit_count(db_connection, auditor, timestamp, len(db_audits_created))
 
         db_audits.extend(db_audits_created)
 
@@ -86,6 +106,7 @@ def create_audits(
 def create_automated_audits(db_connection: Session, findings_ids: list[int], status: FindingStatus) -> list[DBaudit]:
     """
         Create automated audit for a list of findings.
+        The audits are flushed, committing them is up to the caller.
 
     Args:
         db_connection (Session): Session of the database connection
@@ -102,18 +123,167 @@ def create_automated_audits(db_connection: Session, findings_ids: list[int], sta
     iterator = iter(findings_ids)
     db_audits = []
     while chunk := list(islice(iterator, 1000)):
-        db_connection.execute(update(DBaudit).where(DBaudit.finding_id.in_(chunk)).values(is_latest=False))
-        db_audits_created = [DBaudit.create_automated(finding_id, status) for finding_id in chunk]
+        timestamp = datetime.now(UTC)
+        db_connection.execute(
+            update(DBaudit).where(DBaudit.finding_id.in_(chunk)).values(**_superseded_audit_values(timestamp))
+        )
+        db_audits_created = [DBaudit.create_automated(finding_id, status, timestamp) for finding_id in chunk]
         db_connection.add_all(db_audits_created)
+        db_connection.flush()
+        update_current_status(db_connection, DBfinding.id_.in_(chunk))
+        audit_weekly_count_crud.add_audit_count(
+            db_connection, AUDIT_AUTOMATED_AUDITOR, timestamp, len(db_audits_created)
+        )
         db_audits.extend(db_audits_created)
 
-    db_connection.commit()
-
     logger.debug(f"Automated audit of {len(db_audits)} findings.")
 
     return db_audits
 
 
+def create_automated_audits_from_query(db_connection: Session, findings_query: Select, status: FindingStatus) -> int:
+    """
+        Create automated audit for the findings selected by a query, inside the database.
+        No finding id is transferred, the is_latest flag is updated and the audits are inserted from the query.
+        The changes are not committed, this is up to the caller.
+
+    Args:
+        db_connection (Session): Session of the database connection
+        findings_query (Select): query selecting the ids of the findings to audit, in its first column.
+            It is evaluated once per statement, its result must not change when the latest audits of the selected
+            findings are replaced. Filtering on the current_status of the finding satisfies this, the column is
+            updated by the last statement.
+        status (FindingStatus): status to apply
+
+    Returns:
+        int: number of audits created
+    """
+    audit_count = _create_audits_from_query(
+        db_connection, findings_query, AUDIT_AUTOMATED_AUDITOR, status, AUDIT_AUTOMATED_COMMENT
+    )
+
+    logger.debug(f"Automated audit of {audit_count} findings.")
+
+    return audit_count
+
+
+def create_audits_from_query(
+    db_connection: Session,
+    findings_query: Select,
+    auditor: str,
+    status: FindingStatus,
+    comment: str = "",
+    batch_size: int = 1000,
+) -> int:
+    """
+        Audit the findings selected by a query, inside the database, in batches of at most batch_size findings.
+        The batches are ranges of finding ids, the upper bound of the next range is the only value read back from the
+        database. Every batch is committed on its own.
+
+    Args:
+        db_connection (Session): Session of the database connection
+        findings_query (Select): query selecting the ids of the findings to audit, in its first column.
+            The same constraints as for create_automated_audits_from_query apply.
+        auditor (str): identifier of the person performing the audit action
+        status (FindingStatus): audit status to set
+        comment (str): audit comment to set
+        batch_size (int): maximum number of findings audited per batch
+
+    Returns:
+        int: number of audits created
+    """
+    sanitized_comment = html.escape(comment) if comment else comment
+    finding_id = findings_query.selected_columns[0]
+    audit_count = 0
+    lower_bound = None
+    while True:
+        batch_query = findings_query if lower_bound is None else findings_query.where(finding_id > lower_bound)
+        batch = batch_query.order_by(finding_id).limit(batch_size).subquery()
+        upper_bound = db_connection.execute(select(func.max(batch.c[0]))).scalar()
+        if upper_bound is None:
+            break
+
+        batch_query = batch_query.where(finding_id <= upper_bound)
+        audit_count += _create_audits_from_query(db_connection, batch_query, auditor, status, sanitized_comment)
+        db_connection.commit()
+        lower_bound = upper_bound
+
+    return audit_count
+
+
+def _create_audits_from_query(
+    db_connection: Session, findings_query: Select, auditor: str, status: FindingStatus, comment: str
+) -> int:
+    # The query may select from the audit table itself, it must not be correlated to the updated table.
+    findings_query = findings_query.correlate(None)
+    timestamp = datetime.now(UTC)
+
+    db_connection.execute(
+        update(DBaudit)
+        .where(DBaudit.finding_id.in_(findings_query))
+        .where(DBaudit.is_latest == True)  # noqa: E712
+        .values(**_superseded_audit_values(timestamp))
+    )
+
+    findings = findings_query.subquery()
+    audits_query = select(
+        findings.c[0],
+        literal(status, DBaudit.status.type),
+        literal(auditor, DBaudit.auditor.type),
+        literal(comment, DBaudit.comment.type),
+        literal(timestamp, DBaudit.timestamp.type),
+        literal(True, DBaudit.is_latest.type),
+        literal(timestamp, DBaudit.valid_from.type),
+    )
+    result = db_connection.execute(
+        insert(DBaudit).from_select(
+            [
+                DBaudit.finding_id,
+                DBaudit.status,
+                DBaudit.auditor,
+                DBaudit.comment,
+                DBaudit.timestamp,
+                DBaudit.is_latest,
+                DBaudit.valid_from,
+            ],
+            audits_query,
+        )
+    )
+
+    update_current_status(db_connection, DBfinding.id_.in_(findings_query))
+    audit_weekly_count_crud.add_audit_count(db_connection, auditor, timestamp, result.rowcount)
+
+    return result.rowcount
+
+
+def _superseded_audit_values(timestamp: datetime) -> dict:
+    # The latest audit of the finding is valid until the new audit, the older audits keep their valid_to.
+    return {"is_latest": False, "valid_to": func.coalesce(DBaudit.valid_to, timestamp)}
+
+
+def update_current_status(db_connection: Session, findings_condition: ColumnElement[bool]) -> None:
+    """
+        Copy the status and id of the latest audit to the findings matching the condition.
+        Findings without latest audit are reset to NULL, not analyzed.
+        The changes are not committed, this is up to the caller.
+
+    Args:
+        db_connection (Session): Session of the database connection
+        findings_condition (ColumnElement[bool]): condition on DBfinding selecting the findings to update
+    """
+    latest_audit: Query = select(DBaudit.id_, DBaudit.status)
+    latest_audit = latest_audit.where(DBaudit.finding_id == DBfinding.id_)
+    latest_audit = latest_audit.where(DBaudit.is_latest == True)  # noqa: E712
+    latest_audit = latest_audit.order_by(DBaudit.id_.desc()).limit(1)
+
+    query = update(DBfinding).where(findings_condition)
+    query = query.values(
+        current_audit_id=latest_audit.with_only_columns(DBaudit.id_).scalar_subquery(),
+        current_status=latest_audit.with_only_columns(DBaudit.status).scalar_subquery(),
+    )
+    db_connection.execute(query, execution_options={"synchronize_session": False})
+
+
 def clear_outdated_no_longer_outdated(db_connection: Session, findings_ids: list[int]) -> None:
     """
         Remove outdated status from findings which have been automatically added
@@ -124,23 +294,51 @@ def clear_outdated_no_longer_outdated(db_connection: Session, findings_ids: list
     """
     iterator = iter(findings_ids)
     while chunk := list(islice(iterator, 1000)):
-        query = db_connection.query(DBaudit)
-        query = query.where(DBaudit.finding_id.in_(chunk))
-        query = query.where(DBaudit.auditor == AUDIT_AUTOMATED_AUDITOR)
-        query = query.where(DBaudit.comment == AUDIT_AUTOMATED_COMMENT)
-        query.delete(synchronize_session=False)
+        # The automated audits are deleted from the archive as well, archiving does not change the cleared status
+        for model in [DBaudit, DBauditArchive]:
+            query = db_connection.query(model)
+            query = query.where(model.finding_id.in_(chunk))
+            query = query.where(model.auditor == AUDIT_AUTOMATED_AUDITOR)
+            query = query.where(model.comment == AUDIT_AUTOMATED_COMMENT)
+            audit_weekly_count_crud.remove_audit_counts(
+                db_connection, query.with_entities(model.auditor, model.timestamp).all()
+            )
+            query.delete(synchronize_session=False)
+        # The audit superseded by the automated audits may have been archived meanwhile
+        _restore_archived_audits(db_connection, chunk)
 
     fix_last_audit(db_connection, findings_ids)
 
 
+def _audit_history(finding_id: int | None = None, auditor: str | None = None) -> Subquery:
+    """
+        Audits of both the audit and the audit_archive tables, the filters are applied to each table
+    :param finding_id:
+        optional, id of the finding of the audits
+    :param auditor:
+        optional, id of the auditor of the audits
+    :return: Subquery
+        union of the audits, with the columns id_, finding_id, status, auditor, comment and timestamp
+    """
+    queries = []
+    for model in [DBaudit, DBauditArchive]:
+        query = select(model.id_, model.finding_id, model.status, model.auditor, model.comment, model.timestamp)
+        if finding_id is not None:
+            query = query.where(model.finding_id == finding_id)
+        if auditor is not None:
+            query = query.where(model.auditor == auditor)
+        queries.append(query)
+    return union_all(*queries).subquery()
+
+
 def get_finding_audits(
     db_connection: Session,
     finding_id: int,
     skip: int = 0,
     limit: int = DEFAULT_RECORDS_PER_PAGE_LIMIT,
-) -> list[DBaudit]:
+) -> list[Row]:
     """
-        Get Audit entries for finding
+        Get Audit entries for finding, including its archived audits
     :param db_connection:
         Session of the database connection
     :param finding_id:
@@ -149,19 +347,26 @@ def get_finding_audits(
         integer amount of records to skip to support pagination
     :param limit:
         integer amount of records to return, to support pagination
-    :return: [DBaudit]
+    :return: [Row]
         The output will contain the list of audit items for the given finding
     """
     limit_val = MAX_RECORDS_PER_PAGE_LIMIT if limit > MAX_RECORDS_PER_PAGE_LIMIT else limit
-    query = select(DBaudit).where(DBaudit.finding_id == finding_id)
-    query = query.order_by(DBaudit.id_.desc()).offset(skip).limit(limit_val)
-    finding_audits = db_connection.execute(query).scalars().all()
+    audits = _audit_history(finding_id=finding_id)
+    query = select(
+        audits.c.id_,
+        audits.c.status,
+        audits.c.auditor,
+        audits.c.comment,
+        audits.c.timestamp,
+    )
+    query = query.order_by(audits.c.id_.desc()).offset(skip).limit(limit_val)
+    finding_audits = db_connection.execute(query).all()
     return finding_audits
 
 
 def get_finding_audits_count(db_connection: Session, finding_id: int) -> int:
     """
-        Get count of Audit entries for finding
+        Get count of Audit entries for finding, including its archived audits
     :param db_connection:
         Session of the database connection
     :param finding_id:
@@ -169,11 +374,49 @@ def get_finding_audits_count(db_connection: Session, finding_id: int) -> int:
     :return: total_count
         count of audit entries
     """
-    query = select(func.count(DBaudit.id_)).where(DBaudit.finding_id == finding_id)
+    audits = _audit_history(finding_id=finding_id)
+    query = select(func.count(audits.c.id_))
     total_count = db_connection.execute(query).scalars().one()
     return total_count
 
 
+def _time_period_range(time_period: TimePeriod, now: datetime) -> tuple[datetime | None, datetime | None]:
+    """
+        Half-open range [start, end) of the time period containing now, weeks start on Monday
+    :param time_period:
+        period for which to compute the range
+    :param now:
+        current date time
+    :return: start, end
+        bounds of the range, both None for TimePeriod.FOREVER
+    """
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_start = today - timedelta(days=today.weekday())
+    if time_period == TimePeriod.DAY:
+        return today, today + timedelta(days=1)
+    if time_period == TimePeriod.WEEK:
+        return week_start, week_start + timedelta(weeks=1)
+    if time_period == TimePeriod.LAST_WEEK:
+        return week_start - timedelta(weeks=1), week_start
+    if time_period == TimePeriod.MONTH:
+        month_start = today.replace(day=1)
+        return month_start, (month_start + timedelta(days=31)).replace(day=1)
+    if time_period == TimePeriod.YEAR:
+        year_start = today.replace(month=1, day=1)
+        return year_start, year_start.replace(year=year_start.year + 1)
+    return None, None
+
+
+def _time_period_condition(
+    time_period: TimePeriod, now: datetime, timestamp: ColumnElement[datetime] = DBaudit.timestamp
+) -> ColumnElement[bool] | None:
+    # Range predicates on the timestamp itself, unlike extract() they can be resolved by an index
+    start, end = _time_period_range(time_period, now)
+    if start is None:
+        return None
+    return (timestamp >= start) & (timestamp < end)
+
+
 def get_audit_count_by_auditor_over_time(db_connection: Session, weeks: int = 13) -> list[Row]:
     """
         Retrieve count audits by auditor over time for given weeks
@@ -185,6 +428,7 @@ def get_audit_count_by_auditor_over_time(db_connection: Session, weeks: int = 13
         list of rows containing audit count over time per week
     """
     last_nth_week_date_time = datetime.now(UTC) - timedelta(weeks=weeks)
+    first_week_start, _ = _time_period_range(TimePeriod.WEEK, last_nth_week_date_time)
 
     query = (
         db_connection.query(
@@ -193,13 +437,7 @@ def get_audit_count_by_auditor_over_time(db_connection: Session, weeks: int = 13
             DBaudit.auditor,
             func.count(DBaudit.id_).label("audit_count"),
         )
-        .filter(
-            (extract(YEAR, DBaudit.timestamp) > extract(YEAR, last_nth_week_date_time))
-            | (
-                (extract(YEAR, DBaudit.timestamp) == extract(YEAR, last_nth_week_date_time))
-                & (extract(WEEK, DBaudit.timestamp) >= extract(WEEK, last_nth_week_date_time))
-            )
-        )
+        .filter(DBaudit.timestamp >= first_week_start)
         .group_by(
             extract(YEAR, DBaudit.timestamp).label(YEAR),
             extract(WEEK, DBaudit.timestamp).label(WEEK),
@@ -228,31 +466,49 @@ def get_personal_audit_count(db_connection: Session, auditor: str, time_period:
     :return: total_count
         count of audit entries
     """
-    date_today = datetime.now(UTC)
+    audits = _audit_history(auditor=auditor)
+    query = select(func.count(audits.c.id_))
 
-    total_count = db_connection.query(func.count(DBaudit.id_))
+    condition = _time_period_condition(time_period, datetime.now(UTC), audits.c.timestamp)
+    if condition is not None:
+        query = query.where(condition)
 
-    if time_period in (time_period.DAY, time_period.MONTH, time_period.YEAR):
-        total_count = total_count.filter(extract(YEAR, DBaudit.timestamp) == extract(YEAR, date_today))
+    total_count = db_connection.execute(query).scalars().one()
+    return total_count
 
-        if time_period in (time_period.DAY, time_period.MONTH):
-            total_count = total_count.filter(extract(MONTH, DBaudit.timestamp) == extract(MONTH, date_today))
 
-            if time_period == time_period.DAY:
-                total_count = total_count.filter(extract(DAY, DBaudit.timestamp) == extract(DAY, date_today))
+def get_personal_audit_counts(db_connection: Session, auditor: str) -> Row:
+    """
+        Get the count of audits of an auditor for every time period, in a single query, archived audits included
+    :param db_connection:
+        Session of the database connection
+    :param auditor:
+        id of the auditor
+    :return: Row
+        counts labelled today, current_week, last_week, current_month, current_year and forever
+    """
+    now = datetime.now(UTC)
+    audits = _audit_history(auditor=auditor)
 
-    if time_period in (time_period.WEEK, time_period.LAST_WEEK):
-        date_last_week = datetime.now(UTC) - timedelta(weeks=1)
-        date_week = date_last_week if time_period == time_period.LAST_WEEK else date_today
-        total_count = total_count.filter(extract(YEAR, DBaudit.timestamp) == extract(YEAR, date_week))
-        total_count = total_count.filter(extract(WEEK, DBaudit.timestamp) == extract(WEEK, date_week))
+    def period_count(time_period: TimePeriod) -> ColumnElement[int]:
+        return func.count(case((_time_period_condition(time_period, now, audits.c.timestamp), audits.c.id_)))
 
-    total_count = total_count.filter(DBaudit.auditor == auditor).scalar()
-    return total_count
+    query = select(
+        period_count(TimePeriod.DAY).label("today"),
+        period_count(TimePeriod.WEEK).label("current_week"),
+        period_count(TimePeriod.LAST_WEEK).label("last_week"),
+        period_count(TimePeriod.MONTH).label("current_month"),
+        period_count(TimePeriod.YEAR).label("current_year"),
+        func.count(audits.c.id_).label("forever"),
+    )
+
+    return db_connection.execute(query).one()
 
 
 def get_audit_stats_count(db_connection: Session, auditor: str | None) -> list[AuditorMetric]:
     """Retrieve the stats True Positive, False Positive etc... per auditor
+    The counts are computed by a single grouped scan of the audits, archived audits included, for a single
+    auditor the scan is limited to its audits by the nci_audit_auditor_status index.
 
     Args:
         db_connection (Session): Session of the database connection
@@ -261,86 +517,62 @@ def get_audit_stats_count(db_connection: Session, auditor: str | None) -> list[A
     Returns:
         list: List of AuditorMetrics
     """
-    true_positive: Query = select(DBaudit.auditor, func.count(DBaudit.auditor).label("true_positive"))
-    true_positive = true_positive.where(DBaudit.status == FindingStatus.TRUE_POSITIVE)
-    true_positive = true_positive.group_by(DBaudit.auditor)
-    true_positive = true_positive.subquery()
-
-    false_positive: Query = select(DBaudit.auditor, func.count(DBaudit.auditor).label("false_positive"))
-    false_positive = false_positive.where(DBaudit.status == FindingStatus.FALSE_POSITIVE)
-    false_positive = false_positive.group_by(DBaudit.auditor)
-    false_positive = false_positive.subquery()
-
-    clarification_required: Query = select(DBaudit.auditor, func.count(DBaudit.auditor).label("clarification_required"))
-    clarification_required = clarification_required.where(DBaudit.status == FindingStatus.CLARIFICATION_REQUIRED)
-    clarification_required = clarification_required.group_by(DBaudit.auditor)
-    clarification_required = clarification_required.subquery()
 
-    not_accessible: Query = select(DBaudit.auditor, func.count(DBaudit.auditor).label("not_accessible"))
-    not_accessible = not_accessible.where(DBaudit.status == FindingStatus.NOT_ACCESSIBLE)
-    not_accessible = not_accessible.group_by(DBaudit.auditor)
-    not_accessible = not_accessible.subquery()
+    audits = _audit_history(auditor=auditor)
 
-    outdated: Query = select(DBaudit.auditor, func.count(DBaudit.auditor).label("outdated"))
-    outdated = outdated.where(DBaudit.status == FindingStatus.OUTDATED)
-    outdated = outdated.group_by(DBaudit.auditor)
-    outdated = outdated.subquery()
-
-    not_analyzed: Query = select(DBaudit.auditor, func.count(DBaudit.auditor).label("not_analyzed"))
-    not_analyzed = not_analyzed.where(DBaudit.status == FindingStatus.NOT_ANALYZED)
-    not_analyzed = not_analyzed.group_by(DBaudit.auditor)
-    not_analyzed = not_analyzed.subquery()
-
-    total: Query = select(DBaudit.auditor, func.count(DBaudit.auditor).label("total"))
-    total = total.group_by(DBaudit.auditor)
-    total = total.subquery()
+    def status_count(status: FindingStatus) -> ColumnElement[int]:
+        return func.count(case((audits.c.status == status, audits.c.auditor)))
 
     query = select(
-        DBaudit.auditor,
-        func.coalesce(true_positive.c.true_positive, 0).label("true_positive"),
-        func.coalesce(false_positive.c.false_positive, 0).label("false_positive"),
-        func.coalesce(clarification_required.c.clarification_required, 0).label("clarification_required"),
-        func.coalesce(not_accessible.c.not_accessible, 0).label("not_accessible"),
-        func.coalesce(outdated.c.outdated, 0).label("outdated"),
-        func.coalesce(not_analyzed.c.not_analyzed, 0).label("not_analyzed"),
-        func.coalesce(total.c.total, 0).label("total"),
+        audits.c.auditor,
+        status_count(FindingStatus.TRUE_POSITIVE).label("true_positive"),
+        status_count(FindingStatus.FALSE_POSITIVE).label("false_positive"),
+        status_count(FindingStatus.CLARIFICATION_REQUIRED).label("clarification_required"),
+        status_count(FindingStatus.NOT_ACCESSIBLE).label("not_accessible"),
+        status_count(FindingStatus.OUTDATED).label("outdated"),
+        status_count(FindingStatus.NOT_ANALYZED).label("not_analyzed"),
+        func.count(audits.c.auditor).label("total"),
     )
-    query = query.join(true_positive, true_positive.c.auditor == DBaudit.auditor, isouter=True)
-    query = query.join(false_positive, false_positive.c.auditor == DBaudit.auditor, isouter=True)
-    query = query.join(clarification_required, clarification_required.c.auditor == DBaudit.auditor, isouter=True)
-    query = query.join(not_accessible, not_accessible.c.auditor == DBaudit.auditor, isouter=True)
-    query = query.join(outdated, outdated.c.auditor == DBaudit.auditor, isouter=True)
-    query = query.join(not_analyzed, not_analyzed.c.auditor == DBaudit.auditor, isouter=True)
-    query = query.join(total, total.c.auditor == DBaudit.auditor, isouter=True)
-
-    if auditor is not None:
-        query = query.where(DBaudit.auditor == auditor)
-
-    query = query.distinct()
+    query = query.group_by(audits.c.auditor)
 
     return db_connection.execute(query).all()
 
 
 def fix_last_audit(db_connection: Session, finding_ids: list[int]) -> None:
+    """
+        Flag the most recent audit of the findings as latest, and only this one, and set the end of the validity of
+        every audit to the timestamp of the next audit of its finding.
+        The latest and next audits are found by window functions and the audits are updated in a single statement per
+        chunk, no audit id is transferred. The changes are not committed, this is up to the caller.
+
+    Args:
+        db_connection (Session): Session of the database connection
+        finding_ids (list[int]): list of id of the findings to fix
+    """
     # Iterate over those ids by chunk.
     # This is necessary because SQL tends to crash when you do IN with more than 1000 values.
     # source: trust me bro.
     finding_ids_iterator = iter(finding_ids)
     while chunk := list(islice(finding_ids_iterator, 1000)):
-        # Create a sub query with group by on finding.
-        max_audit_subquery: Query = select(DBaudit.finding_id, func.max(DBaudit.id_).label("audit_id"))
-        max_audit_subquery = max_audit_subquery.where(DBaudit.finding_id.in_(chunk))
-        max_audit_subquery = max_audit_subquery.group_by(DBaudit.finding_id)
-        max_audit_subquery = max_audit_subquery.subquery()
-
-        # Select the id from previously selected tupples.
-        latest_audits_query = select(DBaudit.id_)
-        latest_audits_query = latest_audits_query.join(max_audit_subquery, max_audit_subquery.c.audit_id == DBaudit.id_)
-        latest_audits = db_connection.execute(latest_audits_query).scalars().all()
-        query = update(DBaudit).where(DBaudit.id_.in_(latest_audits)).values(is_latest=True)
-        db_connection.execute(query)
-
-    db_connection.commit()
+        ranked_audits: Query = select(
+            DBaudit.id_.label("audit_id"),
+            func.max(DBaudit.id_).over(partition_by=DBaudit.finding_id).label("latest_audit_id"),
+            func.lead(DBaudit.timestamp)
+            .over(partition_by=DBaudit.finding_id, order_by=DBaudit.id_)
+            .label("next_audit_timestamp"),
+        )
+        ranked_audits = ranked_audits.where(DBaudit.finding_id.in_(chunk))
+        ranked_audits = ranked_audits.subquery()
+
+        is_latest = case((ranked_audits.c.audit_id == ranked_audits.c.latest_audit_id, True), else_=False)
+        query = update(DBaudit).where(DBaudit.id_ == ranked_audits.c.audit_id)
+        # Only the audits of which the flag or the validity changes are written.
+        query = query.where(
+            (DBaudit.is_latest != is_latest) | DBaudit.valid_to.is_distinct_from(ranked_audits.c.next_audit_timestamp)
+        )
+        query = query.values(is_latest=is_latest, valid_to=ranked_audits.c.next_audit_timestamp)
+        db_connection.execute(query, execution_options={"synchronize_session": False})
+        update_current_status(db_connection, DBfinding.id_.in_(chunk))
 
 
 def revert_last_audit(db_connection: Session, finding_ids: list[int], status: FindingStatus | None) -> None:
@@ -359,11 +591,91 @@ def revert_last_audit(db_connection: Session, finding_ids: list[int], status: Fi
         query = query.where(DBaudit.is_latest == True)  # noqa: E712
         if status is not None:
             query = query.where(DBaudit.status == status)
+        audit_weekly_count_crud.remove_audit_counts(
+            db_connection, query.with_entities(DBaudit.auditor, DBaudit.timestamp).all()
+        )
         query.delete(synchronize_session=False)
+        _restore_archived_audits(db_connection, chunk)
 
     fix_last_audit(db_connection, finding_ids)
 
 
+def _restore_archived_audits(db_connection: Session, finding_ids: list[int]) -> None:
+    """
+        Move the most recent archived audit of the findings left without audit back to the audit table.
+        Archived audits are older than the audits left in the audit table, only a finding of which all the
+        audits were reverted needs its previous audit back. The restored audit gets a new id in the audit table.
+    :param db_connection:
+        Session of the database connection
+    :param finding_ids:
+        list of id of the findings, at most 1000
+    """
+    audited_findings = select(DBaudit.finding_id).where(DBaudit.finding_id.in_(finding_ids))
+    query = select(func.max(DBauditArchive.id_))
+    query = query.where(DBauditArchive.finding_id.in_(finding_ids))
+    query = query.where(DBauditArchive.finding_id.not_in(audited_findings))
+    query = query.group_by(DBauditArchive.finding_id)
+    archived_audit_ids = db_connection.execute(query).scalars().all()
+    if not archived_audit_ids:
+        return
+
+    columns = ["finding_id", "status", "auditor", "comment", "timestamp"]
+    restored_audits = select(
+        *(getattr(DBauditArchive, column) for column in columns), literal(False), DBauditArchive.timestamp
+    )
+    restored_audits = restored_audits.where(DBauditArchive.id_.in_(archived_audit_ids))
+    db_connection.execute(insert(DBaudit).from_select([*columns, "is_latest", "valid_from"], restored_audits))
+    db_connection.execute(delete(DBauditArchive).where(DBauditArchive.id_.in_(archived_audit_ids)))
+
+
+def archive_audits(
+    db_connection: Session,
+    older_than: datetime,
+    batch_size: int = AUDIT_ARCHIVE_BATCH_SIZE,
+    max_batches: int | None = None,
+) -> int:
+    """
+        Move the audits superseded before the given date to the audit_archive table.
+        The latest audit of a finding is never archived, nor an audit still valid after the given date, the status
+        of a finding at any date after it is found in the audit table. The audits are moved in batches of at most
+        batch_size audits, every batch is committed on its own so that the audit table is not locked for the whole run.
+    :param db_connection:
+        Session of the database connection
+    :param older_than:
+        audits superseded before this date are archived
+    :param batch_size:
+        number of audits moved per batch, at most 1000
+    :param max_batches:
+        optional, number of batches after which the run stops, the remaining audits are left for a next run
+    :return: archived_count
+        number of audits archived
+    """
+    batch_size = min(batch_size, 1000)
+    columns = ["id_", "finding_id", "status", "auditor", "comment", "timestamp"]
+    archived_count = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        query = select(DBaudit.id_)
+        query = query.where(DBaudit.is_latest == False)  # noqa: E712
+        query = query.where(DBaudit.valid_to < older_than)
+        query = query.order_by(DBaudit.id_).limit(batch_size)
+        audit_ids = db_connection.execute(query).scalars().all()
+        if not audit_ids:
+            break
+
+        archived_audits = select(*(getattr(DBaudit, column) for column in columns))
+        archived_audits = archived_audits.where(DBaudit.id_.in_(audit_ids))
+        db_connection.execute(
+            insert(DBauditArchive).from_select([getattr(DBauditArchive, column) for column in columns], archived_audits)
+        )
+        db_connection.execute(delete(DBaudit).where(DBaudit.id_.in_(audit_ids)))
+        db_connection.commit()
+        archived_count += len(audit_ids)
+        batches += 1
+        logger.info(f"Archived {archived_count} audits superseded before {older_than}")
+    return archived_count
+
+
 def _audit_list_filtering(
     query: Query,
     auditor: str | None,
@@ -398,32 +710,7 @@ def _audit_list_filtering(
     return query
 
 
-def get_audits(
-    db_connection: Session,
-    skip: int,
-    limit: int,
-    auditor: str | None,
-    from_date: datetime | None,
-    to_date: datetime | None,
-    status: list[FindingStatus] | None,
-    is_latest: bool | None,
-):
-    """
-    Fetch the recent audits given some conditions
-
-    Args:
-        db_connection (Session): Database session
-        skip (int): skip in the data query
-        limit (int): limit in the data query
-        auditor (str | None) : optional restriction on the auditor
-        from_date (datetime | None): optional restriciton on the dates
-        to_date (datetime | None): optional restriciton on the dates
-        status (list[FindingStatus] | None): optional restrictions on the statuses
-        is_latest (bool | None): only consider latest.
-    """
-
-    limit_val = MAX_RECORDS_PER_PAGE_LIMIT if limit > MAX_RECORDS_PER_PAGE_LIMIT else limit
-
+def _audit_list_query(db_connection: Session) -> Query:
     query = db_connection.query(
         DBaudit.id_.label("audit_id"),
         DBaudit.status,
@@ -452,15 +739,95 @@ def get_audits(
     query = query.join(DBfinding, DBfinding.id_ == DBaudit.finding_id)
     query = query.join(DBrepository, DBfinding.repository_id == DBrepository.id_)
     query = query.join(DBVcsInstance, DBrepository.vcs_instance == DBVcsInstance.id_)
+    return query
+
+
+def get_audits(
+    db_connection: Session,
+    skip: int,
+    limit: int,
+    auditor: str | None,
+    from_date: datetime | None,
+    to_date: datetime | None,
+    status: list[FindingStatus] | None,
+    is_latest: bool | None,
+):
+    """
+    Fetch the recent audits given some conditions
+
+    Args:
+        db_connection (Session): Database session
+        skip (int): skip in the data query
+        limit (int): limit in the data query
+        auditor (str | None) : optional restriction on the auditor
+        from_date (datetime | None): optional restriciton on the dates
+        to_date (datetime | None): optional restriciton on the dates
+        status (list[FindingStatus] | None): optional restrictions on the statuses
+        is_latest (bool | None): only consider latest.
+    """
+
+    limit_val = MAX_RECORDS_PER_PAGE_LIMIT if limit > MAX_RECORDS_PER_PAGE_LIMIT else limit
+
+    query = _audit_list_query(db_connection)
     query = _audit_list_filtering(query, auditor, from_date, to_date, status, is_latest)
 
-    query = query.order_by(DBaudit.timestamp.desc())
+    query = query.order_by(DBaudit.timestamp.desc(), DBaudit.id_.desc())
     query = query.offset(skip).limit(limit_val)
     findings: list[AuditFinding] = query.all()
 
     return findings
 
 
+def get_audits_after(
+    db_connection: Session,
+    after: tuple[datetime, int] | None,
+    limit: int,
+    auditor: str | None,
+    from_date: datetime | None,
+    to_date: datetime | None,
+    status: list[FindingStatus] | None,
+    is_latest: bool | None,
+) -> tuple[list[Row], tuple[datetime, int] | None]:
+    """
+    Fetch a page of the recent audits given some conditions, using keyset pagination.
+    The audits are ordered by (timestamp, id) descending, a page starts right after the sort key of the last audit
+    of the previous page. Unlike an offset, the key is resolved by the nci_audit_timestamp_id index, the cost of a
+    page does not depend on its depth.
+
+    Args:
+        db_connection (Session): Database session
+        after (tuple[datetime, int] | None): sort key of the last audit of the previous page, None for the first page
+        limit (int): limit in the data query
+        auditor (str | None) : optional restriction on the auditor
+        from_date (datetime | None): optional restriciton on the dates
+        to_date (datetime | None): optional restriciton on the dates
+        status (list[FindingStatus] | None): optional restrictions on the statuses
+        is_latest (bool | None): only consider latest.
+
+    Returns:
+        tuple: the audits of the page, and the sort key of its last audit if more audits follow, None otherwise
+    """
+    limit_val = MAX_RECORDS_PER_PAGE_LIMIT if limit > MAX_RECORDS_PER_PAGE_LIMIT else limit
+
+    query = _audit_list_query(db_connection)
+    query = _audit_list_filtering(query, auditor, from_date, to_date, status, is_latest)
+    if after is not None:
+        timestamp, audit_id = after
+        # Row value comparisons are not supported by every database, the tuple comparison is spelled out
+        query = query.where(
+            (DBaudit.timestamp < timestamp) | ((DBaudit.timestamp == timestamp) & (DBaudit.id_ < audit_id))
+        )
+
+    # One more audit is fetched to know whether a next page exists
+    query = query.order_by(DBaudit.timestamp.desc(), DBaudit.id_.desc())
+    audits = query.limit(limit_val + 1).all()
+
+    if len(audits) <= limit_val:
+        return audits, None
+    audits = audits[:limit_val]
+    return audits, (audits[-1].timestamp, audits[-1].audit_id)
+
+
 def get_total_audits_count(
     db_connection: Session,
     auditor: str | None,
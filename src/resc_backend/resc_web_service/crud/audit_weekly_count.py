@@ -0,0 +1,169 @@
+# Standard Library
+import logging
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+# Third Party
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import DBaudit, DBauditArchive, DBauditWeeklyCount
+
+logger = logging.getLogger(__name__)
+
+
+def get_week_start(timestamp: datetime) -> date:
+    """
+        Date of the Monday starting the week of the timestamp
+    :param timestamp:
+        date time within the week
+    :return: date
+        start of the week
+    """
+    return timestamp.date() - timedelta(days=timestamp.weekday())
+
+
+def add_audit_count(db_connection: Session, auditor: str, timestamp: datetime, audit_count: int) -> None:
+    """
+        Add audits to the weekly count of an auditor, the changes are not committed
+        A concurrent creation of the same counter fails on the primary key, the count is then added to the counter
+        created first.
+    :param db_connection:
+        Session of the database connection
+    :param auditor:
+        id of the auditor
+    :param timestamp:
+        timestamp of the audits
+    :param audit_count:
+        number of audits to add, negative for deleted audits
+    """
+    if audit_count == 0:
+        return
+    week_start = get_week_start(timestamp)
+    query = update(DBauditWeeklyCount)
+    query = query.where(DBauditWeeklyCount.week_start == week_start)
+    query = query.where(DBauditWeeklyCount.auditor == auditor)
+    query = query.values(audit_count=DBauditWeeklyCount.audit_count + audit_count)
+    if db_connection.execute(query).rowcount > 0:
+        return
+
+    try:
+        with db_connection.begin_nested():
+            db_connection.execute(
+                insert(DBauditWeeklyCount).values(week_start=week_start, auditor=auditor, audit_count=audit_count)
+            )
+    except IntegrityError:
+        db_connection.execute(query)
+
+
+def remove_audit_counts(db_connection: Session, audits: list[tuple[str, datetime]]) -> None:
+    """
+        Remove deleted audits from the weekly counts, the changes are not committed
+    :param db_connection:
+        Session of the database connection
+    :param audits:
+        auditor and timestamp of the deleted audits
+    """
+    weekly_counts = Counter((auditor, get_week_start(timestamp)) for auditor, timestamp in audits)
+    for (auditor, week_start), audit_count in weekly_counts.items():
+        query = update(DBauditWeeklyCount)
+        query = query.where(DBauditWeeklyCount.week_start == week_start)
+        query = query.where(DBauditWeeklyCount.auditor == auditor)
+        query = query.values(audit_count=DBauditWeeklyCount.audit_count - audit_count)
+        db_connection.execute(query)
+
+
+def get_weekly_audit_count(db_connection: Session, auditor: str, week_start: date) -> int:
+    """
+        Retrieve the number of audits of an auditor during a week
+    :param db_connection:
+        Session of the database connection
+    :param auditor:
+        id of the auditor
+    :param week_start:
+        date of the Monday starting the week
+    :return: int
+        number of audits, 0 if the auditor did not audit during the week
+    """
+    query = select(DBauditWeeklyCount.audit_count)
+    query = query.where(DBauditWeeklyCount.week_start == week_start)
+    query = query.where(DBauditWeeklyCount.auditor == auditor)
+    return db_connection.execute(query).scalar() or 0
+
+
+def get_weekly_audit_rank(db_connection: Session, auditor: str, week_start: date) -> int:
+    """
+        Retrieve the rank of an auditor by number of audits during a week, ties are ranked by auditor
+    :param db_connection:
+        Session of the database connection
+    :param auditor:
+        id of the auditor
+    :param week_start:
+        date of the Monday starting the week
+    :return: int
+        rank of the auditor starting at 1, 0 if the auditor did not audit during the week
+    """
+    audit_count = get_weekly_audit_count(db_connection, auditor=auditor, week_start=week_start)
+    if audit_count <= 0:
+        return 0
+
+    # Seek on the nci_audit_weekly_count_week_start_count index
+    query = select(func.count())
+    query = query.where(DBauditWeeklyCount.week_start == week_start)
+    query = query.where(
+        (DBauditWeeklyCount.audit_count > audit_count)
+        | ((DBauditWeeklyCount.audit_count == audit_count) & (DBauditWeeklyCount.auditor < auditor))
+    )
+    return db_connection.execute(query).scalar() + 1
+
+
+def rebuild_audit_weekly_counts(db_connection: Session, since: datetime) -> int:
+    """
+        Recompute the weekly counts from the audits, the archived audits included, starting with the week of since.
+        The counters which differ are corrected and logged. The changes are committed.
+    :param db_connection:
+        Session of the database connection
+    :param since:
+        the counts of the week of this date time and of the following weeks are rebuilt
+    :return: int
+        number of counters corrected
+    """
+    first_week_start = get_week_start(since)
+    first_week_start_time = datetime.combine(first_week_start, datetime.min.time())
+
+    expected_counts = Counter()
+    for model in [DBaudit, DBauditArchive]:
+        query = select(model.auditor, model.timestamp).where(model.timestamp >= first_week_start_time)
+        for auditor, timestamp in db_connection.execute(query.execution_options(yield_per=10000)):
+            expected_counts[(get_week_start(timestamp), auditor)] += 1
+
+    query = select(DBauditWeeklyCount).where(DBauditWeeklyCount.week_start >= first_week_start)
+    current_counts = {
+        (counter.week_start, counter.auditor): counter.audit_count for counter in db_connection.execute(query).scalars()
+    }
+
+    corrected_count = 0
+    for week_start, auditor in sorted(expected_counts.keys() | current_counts.keys()):
+        expected_count = expected_counts.get((week_start, auditor), 0)
+        current_count = current_counts.get((week_start, auditor))
+        if current_count == expected_count:
+            continue
+        logger.warning(
+            f"Audit count of {auditor} for the week of {week_start} is {current_count}, {expected_count} expected"
+        )
+        corrected_count += 1
+
+        condition = (DBauditWeeklyCount.week_start == week_start) & (DBauditWeeklyCount.auditor == auditor)
+        if expected_count == 0:
+            db_connection.execute(delete(DBauditWeeklyCount).where(condition))
+        elif current_count is None:
+            db_connection.execute(
+                insert(DBauditWeeklyCount).values(week_start=week_start, auditor=auditor, audit_count=expected_count)
+            )
+        else:
+            db_connection.execute(update(DBauditWeeklyCount).where(condition).values(audit_count=expected_count))
+
+    db_connection.commit()
+    return corrected_count
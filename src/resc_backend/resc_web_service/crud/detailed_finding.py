@@ -1,7 +1,7 @@
 # Standard Library
 
 # Third Party
-from sqlalchemy import func
+from sqlalchemy import Select, func
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.query import Query
 
@@ -168,10 +168,10 @@ def _query_apply_findings_filters(query: Query, findings_filter: FindingsFilter)
     if findings_filter.finding_statuses:
         if FindingStatus.NOT_ANALYZED.value in findings_filter.finding_statuses:
             query = query.where(
-                (DBaudit.status.in_(findings_filter.finding_statuses)) | (DBaudit.status == None)  # noqa: E711
+                (DBfinding.current_status.in_(findings_filter.finding_statuses)) | (DBfinding.current_status == None)  # noqa: E711
             )
         else:
-            query = query.where(DBaudit.status.in_(findings_filter.finding_statuses))
+            query = query.where(DBfinding.current_status.in_(findings_filter.finding_statuses))
     return query
 
 
@@ -211,7 +211,7 @@ def get_detailed_findings(
         DBfinding.author,
         DBfinding.email,
         DBfinding.is_dir_scan,
-        DBaudit.status,
+        DBfinding.current_status.label("status"),
         DBaudit.comment,
         DBfinding.rule_name,
         DBscan.rule_pack,
@@ -234,11 +234,7 @@ def get_detailed_findings(
     query = query.join(DBscan, DBscanFinding.scan_id == DBscan.id_)
     query = _query_join_if_multiple_rule_pack(query, findings_filter.rule_pack_versions)
     query = _query_join_if_rule_tag(query, findings_filter.rule_tags)
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
+    query = query.join(DBaudit, DBaudit.id_ == DBfinding.current_audit_id, isouter=True)
     query = _query_apply_findings_filters(query, findings_filter)
     query = query.order_by(DBfinding.id_)
     query = query.offset(skip).limit(limit_val)
@@ -270,16 +266,33 @@ def get_detailed_findings_count(db_connection: Session, findings_filter: Finding
     query = query.join(DBscan, DBscanFinding.scan_id == DBscan.id_)
     query = _query_join_if_multiple_rule_pack(query, findings_filter.rule_pack_versions)
     query = _query_join_if_rule_tag(query, findings_filter.rule_tags)
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
     query = _query_apply_findings_filters(query, findings_filter)
     findings_count = query.scalar()
     return findings_count
 
 
+def query_detailed_findings_ids(db_connection: Session, findings_filter: FindingsFilter) -> Select:
+    """
+    Query selecting the distinct ids of the findings matching the provided FindingsFilter,
+    the findings listed by get_detailed_findings
+    :param db_connection:
+        Session of the database connection
+    :param findings_filter:
+        Object of type FindingsFilter, only the ids of findings matching the attributes in this filter are selected
+    :return: Select
+        query selecting the ids of the findings
+    """
+    query = db_connection.query(DBfinding.id_)
+    query = query.join(DBscanFinding, DBfinding.id_ == DBscanFinding.finding_id)
+    query = query.join(DBrepository, DBfinding.repository_id == DBrepository.id_)
+    query = query.join(DBVcsInstance, DBrepository.vcs_instance == DBVcsInstance.id_)
+    query = query.join(DBscan, DBscanFinding.scan_id == DBscan.id_)
+    query = _query_join_if_multiple_rule_pack(query, findings_filter.rule_pack_versions)
+    query = _query_join_if_rule_tag(query, findings_filter.rule_tags)
+    query = _query_apply_findings_filters(query, findings_filter)
+    return query.distinct().statement
+
+
 def get_detailed_finding(db_connection: Session, finding_id: int) -> detailed_finding_schema.DetailedFindingRead:
     """
     Retrieve a detailed finding objects matching the provided finding_id
@@ -304,7 +317,7 @@ def get_detailed_finding(db_connection: Session, finding_id: int) -> detailed_fi
             DBfinding.author,
             DBfinding.email,
             DBfinding.is_dir_scan,
-            DBaudit.status,
+            DBfinding.current_status.label("status"),
             DBaudit.comment,
             DBfinding.rule_name,
             DBscan.rule_pack,
@@ -323,11 +336,7 @@ def get_detailed_finding(db_connection: Session, finding_id: int) -> detailed_fi
         )
         .join(DBrepository, DBrepository.id_ == DBscan.repository_id)
         .join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
-        .join(
-            DBaudit,
-            (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-            isouter=True,
-        )
+        .join(DBaudit, DBaudit.id_ == DBfinding.current_audit_id, isouter=True)
         .where(DBfinding.id_ == finding_id)
         .order_by(DBscan.id_.desc())
     )
@@ -1,14 +1,13 @@
 # Standard Library
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 from itertools import islice
 
 # Third Party
-from sqlalchemy import Column, extract, func, select, union
+from sqlalchemy import Column, Select, extract, func, select
 from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.query import Query
-from sqlalchemy.sql.expression import literal_column
 
 # First Party
 from resc_backend.constants import (
@@ -16,7 +15,6 @@ from resc_backend.constants import (
     MAX_RECORDS_PER_PAGE_LIMIT,
 )
 from resc_backend.db.model import (
-    DBaudit,
     DBfinding,
     DBrepository,
     DBrule,
@@ -27,7 +25,9 @@ from resc_backend.db.model import (
     DBtag,
     DBVcsInstance,
 )
+from resc_backend.db.model.finding import finding_long_key, finding_short_key, fingerprint
 from resc_backend.helpers.list_mapper import dict_of_list
+from resc_backend.resc_web_service.crud import finding_weekly_snapshot as finding_weekly_snapshot_crud
 from resc_backend.resc_web_service.crud import scan_finding as scan_finding_crud
 from resc_backend.resc_web_service.filters import FindingsFilter
 from resc_backend.resc_web_service.schema import finding as finding_schema
@@ -52,11 +52,41 @@ def patch_finding(db_connection: Session, finding_id: int, finding_update: findi
 
 
 def _long_key(finding: DBfinding | finding_schema.FindingCreate) -> str:
-    key = (
-        f"{finding.commit_id}|{finding.rule_name}|{finding.file_path}"
-        + f"|{finding.line_number}|{finding.column_start}|{finding.column_end}"
-    )
-    return key
+    return finding_long_key(finding)
+
+
+def _short_key(finding: DBfinding | finding_schema.FindingCreate) -> str:
+    return finding_short_key(finding)
+
+
+def _get_repository_findings_by_fingerprint(
+    db_connection: Session, repository_id: int, fingerprint_column: Column[str], fingerprints: set[str]
+) -> list[DBfinding]:
+    """
+        Retrieve the findings of a repository matching the given fingerprints, using the fingerprint indexes
+    :param db_connection:
+        Session of the database connection
+    :param repository_id:
+        id of the repository of the findings
+    :param fingerprint_column:
+        DBfinding.long_fingerprint or DBfinding.short_fingerprint
+    :param fingerprints:
+        fingerprints of the incoming findings
+    :return: [DBfinding]
+        The known findings of the repository matching one of the fingerprints, ordered by id
+    """
+    # Iterate over those fingerprints by chunk.
+    # This is necessary because SQL tends to crash when you do IN with more than 1000 values.
+    iterator = iter(fingerprints)
+    db_findings = []
+    while chunk := list(islice(iterator, 1000)):
+        query = select(DBfinding)
+        query = query.where(DBfinding.repository_id == repository_id)
+        query = query.where(fingerprint_column.in_(chunk))
+        db_findings.extend(db_connection.execute(query).scalars().all())
+
+    db_findings.sort(key=lambda db_finding: db_finding.id_)
+    return db_findings
 
 
 def create_findings(db_connection: Session, findings: list[finding_schema.FindingCreate]) -> list[DBfinding]:
@@ -66,13 +96,16 @@ def create_findings(db_connection: Session, findings: list[finding_schema.Findin
 
     repository_id = findings[0].repository_id
 
-    # get a list of known / registered findings for this repository
-    query = db_connection.query(DBfinding)
-    query = query.where(DBfinding.repository_id == repository_id)
-    db_repository_findings = query.all()
+    map_findings: dict[str, finding_schema.FindingCreate] = dict_of_list(_long_key, findings)
 
+    # get the known / registered findings of this repository that are part of the request
+    db_repository_findings = _get_repository_findings_by_fingerprint(
+        db_connection,
+        repository_id=repository_id,
+        fingerprint_column=DBfinding.long_fingerprint,
+        fingerprints={fingerprint(key) for key in map_findings},
+    )
     map_repository_finding: dict[str, DBfinding] = dict_of_list(_long_key, db_repository_findings)
-    map_findings: dict[str, finding_schema.FindingCreate] = dict_of_list(_long_key, findings)
 
     intersection = map_findings.keys() & map_repository_finding.keys()
 
@@ -94,22 +127,19 @@ def create_findings(db_connection: Session, findings: list[finding_schema.Findin
         db_create_findings.append(db_create_finding)
     # Store all the to be created findings in the database
     if len(db_create_findings) >= 1:
+        # Flush only, committing is up to the caller
         db_connection.add_all(db_create_findings)
         db_connection.flush()
-        db_connection.commit()
         db_findings.extend(db_create_findings)
     # Return the known findings that are part of the request and the newly created findings
     return db_findings
 
 
-def _short_key(finding: DBfinding | finding_schema.FindingCreate) -> str:
-    return f"{finding.rule_name}|{finding.file_path}|{finding.line_number}|{finding.column_start}|{finding.column_end}"
-
-
 def create_or_update_findings(db_connection: Session, findings: list[finding_schema.FindingCreate]) -> list[DBfinding]:
     """
     Create or update findings.
     This is used in the case of rules which are applied to directories.
+    The changes are flushed, committing them is up to the caller.
 
     Args:
         db_connection (Session): connection to DB
@@ -125,13 +155,16 @@ def create_or_update_findings(db_connection: Session, findings: list[finding_sch
 
     repository_id = findings[0].repository_id
 
-    # get a list of known / registered findings for this repository
-    query = db_connection.query(DBfinding)
-    query = query.where(DBfinding.repository_id == repository_id)
-    db_repository_findings = query.all()
+    map_findings: dict[str, finding_schema.FindingCreate] = dict_of_list(_short_key, findings)
 
+    # get the known / registered findings of this repository that are part of the request
+    db_repository_findings = _get_repository_findings_by_fingerprint(
+        db_connection,
+        repository_id=repository_id,
+        fingerprint_column=DBfinding.short_fingerprint,
+        fingerprints={fingerprint(key) for key in map_findings},
+    )
     map_repository_finding: dict[str, DBfinding] = dict_of_list(_short_key, db_repository_findings)
-    map_findings: dict[str, finding_schema.FindingCreate] = dict_of_list(_short_key, findings)
 
     intersection = map_findings.keys() & map_repository_finding.keys()
 
@@ -144,6 +177,7 @@ def create_or_update_findings(db_connection: Session, findings: list[finding_sch
         repository_finding.commit_timestamp = finding.commit_timestamp
         repository_finding.author = finding.author
         repository_finding.is_dir_scan = True
+        repository_finding.update_fingerprints()
         db_findings.append(repository_finding)
         del map_findings[key]
 
@@ -166,7 +200,6 @@ def create_or_update_findings(db_connection: Session, findings: list[finding_sch
 
     if len(db_findings) > 0 or len(db_create_findings) > 0:
         db_connection.flush()
-        db_connection.commit()
 
     db_findings.extend(db_create_findings)
 
@@ -228,18 +261,12 @@ def get_scans_findings(
     query = query.join(DBscanFinding, DBscanFinding.finding_id == DBfinding.id_)
 
     if statuses_filter:
-        query = query.join(
-            DBaudit,
-            (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-            isouter=True,
-        )
-
         if FindingStatus.NOT_ANALYZED.value in statuses_filter:
             query = query.where(
-                DBaudit.status.in_(statuses_filter) | (DBaudit.status == None)  # noqa: E711
+                DBfinding.current_status.in_(statuses_filter) | (DBfinding.current_status == None)  # noqa: E711
             )
         else:
-            query = query.where(DBaudit.status.in_(statuses_filter))
+            query = query.where(DBfinding.current_status.in_(statuses_filter))
 
     query = query.where(DBscanFinding.scan_id.in_(scan_ids))
 
@@ -252,33 +279,27 @@ def get_scans_findings(
     return findings
 
 
-def get_findings_from_repo_of_scan_as_dir(db_connection: Session, scan: DBscan) -> list[int]:
+def query_findings_from_repo_of_scan_as_dir(scan: DBscan) -> Select:
     """
-    Retrieve all the findings which are:
+    Query selecting the ids of the findings which are:
      - tied to the repository of the scan
      - for the rule pack of the scan
      - which are not tied to the scan (in other words out-dated)
 
     Args:
-        db_connection (Session): session
         scan (DBscan): scan to restrict with
 
     Returns:
-        list[int]: list of ids of findings which are to be audited
+        Select: query selecting the ids of findings which are to be audited
     """
 
     query = select(DBfinding.id_)
     query = query.join(DBrule, DBrule.rule_name == DBfinding.rule_name)
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
     query = query.where(DBrule.rule_pack == scan.rule_pack)
     query = query.where(DBfinding.repository_id == scan.repository_id)
     query = query.where(DBfinding.is_dir_scan == True)  # noqa: E712
     query = query.where(
-        (DBaudit.status != FindingStatus.OUTDATED) | (DBaudit.status == None)  # noqa: E711
+        (DBfinding.current_status != FindingStatus.OUTDATED) | (DBfinding.current_status == None)  # noqa: E711
     )
 
     sub_query: Query = select(DBscanFinding.finding_id)
@@ -286,22 +307,35 @@ def get_findings_from_repo_of_scan_as_dir(db_connection: Session, scan: DBscan)
     sub_query = sub_query.subquery()
     query = query.where(DBfinding.id_.not_in(sub_query))
 
-    return db_connection.execute(query).scalars().all()
+    return query
 
 
-def get_untriaged_finding_outdated_for_current_scan(db_connection: Session, scan: DBscan) -> list[int]:
+def get_findings_from_repo_of_scan_as_dir(db_connection: Session, scan: DBscan) -> list[int]:
     """
-    Retrieve all the findings which are:
+    Retrieve all the findings selected by query_findings_from_repo_of_scan_as_dir
+
+    Args:
+        db_connection (Session): session
+        scan (DBscan): scan to restrict with
+
+    Returns:
+        list[int]: list of ids of findings which are to be audited
+    """
+    return db_connection.execute(query_findings_from_repo_of_scan_as_dir(scan)).scalars().all()
+
+
+def query_untriaged_finding_outdated_for_current_scan(scan: DBscan) -> Select:
+    """
+    Query selecting the ids of the findings which are:
      - tied to the repository of the scan
      - where the rule is not in the rule pack of the scan
      - which are not analyzed
 
     Args:
-        db_connection (Session): session
         scan (DBscan): scan to restrict with
 
     Returns:
-        list[int]: list of ids of findings which are to be audited
+        Select: query selecting the ids of findings which are to be audited
     """
 
     sub_query_rule_name: Query = select(DBrule.rule_name)
@@ -311,16 +345,25 @@ def get_untriaged_finding_outdated_for_current_scan(db_connection: Session, scan
     query = select(DBfinding.id_)
     query = query.where(DBfinding.repository_id == scan.repository_id)
     query = query.where(DBfinding.rule_name.not_in(sub_query_rule_name))
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
     query = query.where(
-        (DBaudit.status == FindingStatus.NOT_ANALYZED) | (DBaudit.status == None)  # noqa: E711
+        (DBfinding.current_status == FindingStatus.NOT_ANALYZED) | (DBfinding.current_status == None)  # noqa: E711
     )
 
-    return db_connection.execute(query).scalars().all()
+    return query
+
+
+def get_untriaged_finding_outdated_for_current_scan(db_connection: Session, scan: DBscan) -> list[int]:
+    """
+    Retrieve all the findings selected by query_untriaged_finding_outdated_for_current_scan
+
+    Args:
+        db_connection (Session): session
+        scan (DBscan): scan to restrict with
+
+    Returns:
+        list[int]: list of ids of findings which are to be audited
+    """
+    return db_connection.execute(query_untriaged_finding_outdated_for_current_scan(scan)).scalars().all()
 
 
 def get_finding_for_repository(
@@ -345,25 +388,23 @@ def get_finding_for_repository(
         query = select(DBfinding.id_)
         query = query.where(DBfinding.repository_id.in_(chunk))
 
-        # Set up the join for filtering
-        if status is not None or not_status is not None:
-            query = query.join(
-                DBaudit,
-                (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-                isouter=True,
-            )
-
         # filter by status
         if status == FindingStatus.NOT_ANALYZED:
-            query = query.where((DBaudit.status == FindingStatus.NOT_ANALYZED) | (DBaudit.status == None))  # noqa: E711
+            query = query.where(
+                (DBfinding.current_status == FindingStatus.NOT_ANALYZED) | (DBfinding.current_status == None)  # noqa: E711
+            )
         elif status is not None:
-            query = query.where(DBaudit.status == status)
+            query = query.where(DBfinding.current_status == status)
 
         # filter by status negation.
         if not_status == FindingStatus.NOT_ANALYZED:
-            query = query.where((DBaudit.status != FindingStatus.NOT_ANALYZED) & (DBaudit.status != None))  # noqa: E711
+            query = query.where(
+                (DBfinding.current_status != FindingStatus.NOT_ANALYZED) & (DBfinding.current_status != None)  # noqa: E711
+            )
         elif not_status is not None:
-            query = query.where((DBaudit.status != not_status) | (DBaudit.status == None))  # noqa: E711
+            query = query.where(
+                (DBfinding.current_status != not_status) | (DBfinding.current_status == None)  # noqa: E711
+            )
         db_audits.extend(db_connection.execute(query).scalars().all())
 
     return db_audits
@@ -382,13 +423,6 @@ def get_total_findings_count(db_connection: Session, findings_filter: FindingsFi
     query = db_connection.query(func.count(DBfinding.id_))
 
     if findings_filter:
-        if findings_filter.finding_statuses:
-            query = query.join(
-                DBaudit,
-                (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-                isouter=True,
-            )
-
         if findings_filter.start_date_time or findings_filter.end_date_time:
             query = query.join(DBscanFinding, DBscanFinding.finding_id == DBfinding.id_)
             query = query.join(DBscan, DBscan.id_ == DBscanFinding.scan_id)
@@ -428,10 +462,10 @@ def get_total_findings_count(db_connection: Session, findings_filter: FindingsFi
         if findings_filter.finding_statuses:
             if FindingStatus.NOT_ANALYZED.value in findings_filter.finding_statuses:
                 query = query.where(
-                    DBaudit.status.in_(findings_filter.finding_statuses) | (DBaudit.status == None)  # noqa: E711
+                    DBfinding.current_status.in_(findings_filter.finding_statuses) | (DBfinding.current_status == None)  # noqa: E711
                 )
             else:
-                query = query.where(DBaudit.status.in_(findings_filter.finding_statuses))
+                query = query.where(DBfinding.current_status.in_(findings_filter.finding_statuses))
         if findings_filter.scan_ids and len(findings_filter.scan_ids) == 1:
             query = query.join(DBscanFinding, DBscanFinding.finding_id == DBfinding.id_)
             query = query.where(DBscanFinding.scan_id == findings_filter.scan_ids[0])
@@ -507,13 +541,6 @@ def get_distinct_rule_names_from_findings(
         query = query.join(DBrepository, DBrepository.id_ == DBfinding.repository_id)
         query = query.join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
 
-    if finding_statuses:
-        query = query.join(
-            DBaudit,
-            (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-            isouter=True,
-        )
-
     if scan_id > 0:
         query = query.join(DBscanFinding, DBscanFinding.finding_id == DBfinding.id_)
         query = query.where(DBscanFinding.scan_id == scan_id)
@@ -521,10 +548,10 @@ def get_distinct_rule_names_from_findings(
         if finding_statuses:
             if FindingStatus.NOT_ANALYZED.value in finding_statuses:
                 query = query.where(
-                    DBaudit.status.in_(finding_statuses) | (DBaudit.status == None)  # noqa: E711
+                    DBfinding.current_status.in_(finding_statuses) | (DBfinding.current_status == None)  # noqa: E711
                 )
             else:
-                query = query.where(DBaudit.status.in_(finding_statuses))
+                query = query.where(DBfinding.current_status.in_(finding_statuses))
 
         if vcs_providers:
             query = query.where(DBVcsInstance.provider_type.in_(vcs_providers))
@@ -579,12 +606,7 @@ def get_findings_count_by_status(
     :return: findings_count
         count of findings
     """
-    query = db_connection.query(func.count(DBfinding.id_).label("status_count"), DBaudit.status)
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
+    query = db_connection.query(func.count(DBfinding.id_).label("status_count"), DBfinding.current_status)
 
     if not include_deleted_repositories:
         query = query.join(DBrepository, DBrepository.id_ == DBfinding.repository_id)
@@ -598,14 +620,14 @@ def get_findings_count_by_status(
     if finding_statuses:
         if FindingStatus.NOT_ANALYZED.value in finding_statuses:
             query = query.where(
-                DBaudit.status.in_(finding_statuses) | (DBaudit.status == None)  # noqa: E711
+                DBfinding.current_status.in_(finding_statuses) | (DBfinding.current_status == None)  # noqa: E711
             )
         else:
-            query = query.where(DBaudit.status.in_(finding_statuses))
+            query = query.where(DBfinding.current_status.in_(finding_statuses))
     if rule_name:
         query = query.where(DBfinding.rule_name == rule_name)
 
-    findings_count_by_status = query.group_by(DBaudit.status).all()
+    findings_count_by_status = query.group_by(DBfinding.current_status).all()
 
     return findings_count_by_status
 
@@ -627,7 +649,7 @@ def get_rule_findings_count_by_status(
     :return: findings_count
         per rulename and status the count of findings
     """
-    query = db_connection.query(DBfinding.rule_name, DBaudit.status, func.count(DBfinding.id_))
+    query = db_connection.query(DBfinding.rule_name, DBfinding.current_status, func.count(DBfinding.id_))
 
     if not include_deleted_repositories:
         query = query.join(DBrepository, DBrepository.id_ == DBfinding.repository_id)
@@ -667,13 +689,8 @@ def get_rule_findings_count_by_status(
     if rule_pack_versions:
         query = query.where(DBscan.rule_pack.in_(rule_pack_versions))
 
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
-    query = query.group_by(DBfinding.rule_name, DBaudit.status)
-    query = query.order_by(DBfinding.rule_name, DBaudit.status)
+    query = query.group_by(DBfinding.rule_name, DBfinding.current_status)
+    query = query.order_by(DBfinding.rule_name, DBfinding.current_status)
     status_counts = query.all()
 
     rule_count_dict = {}
@@ -891,64 +908,6 @@ def delete_findings_by_vcs_instance_id(db_connection: Session, vcs_instance_id:
     db_connection.commit()
 
 
-def _get_iso_date_now_diff_week(week: int) -> datetime:
-    """
-        Taking now() computes the timestamp associated to the
-        ISO calendar year.
-
-    Args:
-        week (int): Number of weeks to substract to the timestamp.
-
-    Returns:
-        datetime: shifted iso time stamp for easier computations.
-    """
-    current_utc_time = datetime.now(UTC)
-    current_iso = current_utc_time.isocalendar()
-    current_iso_year = current_iso[0]
-    current_iso_week = current_iso[1]
-    # We use 6 (Saturday) to include the current week when 0
-    # rather than doing a shift from current day.
-    last_nth_week_date_time = datetime.fromisocalendar(current_iso_year, current_iso_week, 6) - timedelta(weeks=week)
-    return last_nth_week_date_time
-
-
-def _max_base_scan_subequery(db_connection: Session, last_nth_week_date_time: datetime) -> Query:
-    """
-        Creates a subquery given a cut-off date to have the max base scan
-        per repository
-
-    Args:
-        db_connection (Session): Session to generate the subquery
-        last_nth_week_date_time (datetime): max cut-off date
-
-    Returns:
-        Query: subquery to have the max base scan under a cut-off date
-    """
-    subquery: Query = db_connection.query(func.max(DBscan.id_).label("scan_id"), DBscan.repository_id)
-    subquery = subquery.where(DBscan.timestamp <= last_nth_week_date_time)
-    subquery = subquery.where(DBscan.scan_type == ScanType.BASE)
-    subquery = subquery.group_by(DBscan.repository_id)
-    return subquery.subquery()
-
-
-def _max_audit_subequery(db_connection: Session, last_nth_week_date_time: datetime) -> Query:
-    """
-        Creates a subquery given a cut-off date to have the last audit
-        per finding
-
-    Args:
-        db_connection (Session): Session to generate the subquery
-        last_nth_week_date_time (datetime): max cut-off date
-
-    Returns:
-        Query: subquery to have the last audit under a cut-off date
-    """
-    subquery: Query = db_connection.query(func.max(DBaudit.id_).label("audit_id"), DBaudit.finding_id)
-    subquery = subquery.where(DBaudit.timestamp < last_nth_week_date_time)
-    subquery = subquery.group_by(DBaudit.finding_id)
-    return subquery.subquery()
-
-
 def get_finding_audit_status_count_over_time(db_connection: Session, status: FindingStatus, weeks: int = 13) -> dict:
     """
         Retrieve count of true positive findings over time for given weeks
@@ -961,33 +920,18 @@ def get_finding_audit_status_count_over_time(db_connection: Session, status: Fin
     :return: true_positive_count_over_time
         list of rows containing finding statuses count over time per week
     """
-    all_tables = []
-    for week in range(0, weeks):
-        last_nth_week_date_time = _get_iso_date_now_diff_week(week)
-        max_audit_subquery = _max_audit_subequery(db_connection, last_nth_week_date_time)
-
-        query = db_connection.query(
-            literal_column(str(last_nth_week_date_time.isocalendar()[0])).label("year"),
-            literal_column(str(last_nth_week_date_time.isocalendar()[1])).label("week"),
-            DBVcsInstance.provider_type.label("provider_type"),
-            func.count(DBaudit.id_).label("finding_count"),
-        )
-        query = query.join(max_audit_subquery, max_audit_subquery.c.audit_id == DBaudit.id_)
-        query = query.join(DBfinding, DBfinding.id_ == DBaudit.finding_id)
-        query = query.join(DBrepository, DBrepository.id_ == DBfinding.repository_id)
-        query = query.join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
-        query = query.where(DBaudit.status == status)
-        query = query.where(
-            (DBrepository.deleted_at == None)  # noqa: E711
-            | (DBrepository.deleted_at > last_nth_week_date_time)
-        )
-        query = query.group_by(DBVcsInstance.provider_type)
+    snapshots = finding_weekly_snapshot_crud.get_finding_weekly_snapshots(db_connection, weeks)
 
-        all_tables.append(query)
+    query = select(
+        snapshots.c.year,
+        snapshots.c.week,
+        snapshots.c.provider_type,
+        func.sum(snapshots.c.audit_status_count).label("finding_count"),
+    )
+    query = query.where(snapshots.c.status == status)
+    query = query.group_by(snapshots.c.year, snapshots.c.week, snapshots.c.provider_type)
 
-    # union
-    unioned_query = union(*all_tables)
-    status_count_over_time = db_connection.execute(unioned_query).all()
+    status_count_over_time = db_connection.execute(query).all()
     return status_count_over_time
 
 
@@ -1001,36 +945,17 @@ def get_finding_count_by_vcs_provider_over_time(db_connection: Session, weeks: i
     :return: count_over_time
         list of rows containing finding count over time per week
     """
-    all_tables = []
-    for week in range(0, weeks):
-        last_nth_week_date_time = _get_iso_date_now_diff_week(week)
-
-        max_base_scan = _max_base_scan_subequery(db_connection, last_nth_week_date_time)
+    snapshots = finding_weekly_snapshot_crud.get_finding_weekly_snapshots(db_connection, weeks)
 
-        query = db_connection.query(
-            literal_column(str(last_nth_week_date_time.isocalendar()[0])).label("year"),
-            literal_column(str(last_nth_week_date_time.isocalendar()[1])).label("week"),
-            DBVcsInstance.provider_type.label("provider_type"),
-            func.count(DBfinding.id_).label("finding_count"),
-        )
-        query = query.join(DBscanFinding, DBfinding.id_ == DBscanFinding.finding_id)
-        query = query.join(DBscan, DBscan.id_ == DBscanFinding.scan_id)
-        query = query.join(max_base_scan, max_base_scan.c.repository_id == DBscan.repository_id)
-        query = query.where(DBscan.id_ >= max_base_scan.c.scan_id)
-        query = query.where(DBscan.timestamp <= last_nth_week_date_time)
-        query = query.join(DBrepository, DBrepository.id_ == DBscan.repository_id)
-        query = query.join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
-        query = query.where(
-            (DBrepository.deleted_at == None)  # noqa: E711
-            | (DBrepository.deleted_at > last_nth_week_date_time)
-        )
-        query = query.group_by(DBVcsInstance.provider_type)
-
-        all_tables.append(query)
+    query = select(
+        snapshots.c.year,
+        snapshots.c.week,
+        snapshots.c.provider_type,
+        func.sum(snapshots.c.finding_count).label("finding_count"),
+    )
+    query = query.group_by(snapshots.c.year, snapshots.c.week, snapshots.c.provider_type)
 
-    # union
-    unioned_query = union(*all_tables)
-    count_over_time = db_connection.execute(unioned_query).all()
+    count_over_time = db_connection.execute(query).all()
     return count_over_time
 
 
@@ -1044,48 +969,18 @@ def get_untriaged_finding_count_by_vcs_provider_over_time(db_connection: Session
     :return: count_over_time
         list of rows containing un triaged findings count over time per week
     """
-    all_tables = []
-    for week in range(0, weeks):
-        last_nth_week_date_time = _get_iso_date_now_diff_week(week)
-        max_base_scan = _max_base_scan_subequery(db_connection, last_nth_week_date_time)
-        max_audit_subquery = _max_audit_subequery(db_connection, last_nth_week_date_time)
+    snapshots = finding_weekly_snapshot_crud.get_finding_weekly_snapshots(db_connection, weeks)
 
-        query = db_connection.query(
-            literal_column(str(last_nth_week_date_time.isocalendar()[0])).label("year"),
-            literal_column(str(last_nth_week_date_time.isocalendar()[1])).label("week"),
-            DBVcsInstance.provider_type.label("provider_type"),
-            func.count(DBfinding.id_).label("finding_count"),
-        )
-        query = query.join(DBscanFinding, DBfinding.id_ == DBscanFinding.finding_id)
-        query = query.join(DBscan, DBscan.id_ == DBscanFinding.scan_id)
-        query = query.join(DBrepository, DBrepository.id_ == DBscan.repository_id)
-        query = query.join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
-        query = query.join(max_base_scan, max_base_scan.c.repository_id == DBscan.repository_id)
-        query = query.where(DBscan.id_ >= max_base_scan.c.scan_id)
-        query = query.where(DBscan.timestamp <= last_nth_week_date_time)
-        query = query.where(
-            (DBrepository.deleted_at == None)  # noqa: E711
-            | (DBrepository.deleted_at > last_nth_week_date_time)
-        )
-        query = query.join(
-            max_audit_subquery,
-            max_audit_subquery.c.finding_id == DBfinding.id_,
-            isouter=True,
-        )
-        query = query.join(
-            DBaudit,
-            (DBaudit.finding_id == DBfinding.id_) & (DBaudit.id_ == max_audit_subquery.c.audit_id),
-            isouter=True,
-        )
-        query = query.where(
-            (DBaudit.id_ == None) | (DBaudit.status == FindingStatus.NOT_ANALYZED.value)  # noqa: E711
-        )
-        query = query.group_by(DBVcsInstance.provider_type)
-        all_tables.append(query)
+    query = select(
+        snapshots.c.year,
+        snapshots.c.week,
+        snapshots.c.provider_type,
+        func.sum(snapshots.c.finding_count).label("finding_count"),
+    )
+    query = query.where(snapshots.c.status == FindingStatus.NOT_ANALYZED)
+    query = query.group_by(snapshots.c.year, snapshots.c.week, snapshots.c.provider_type)
 
-    # union
-    unioned_query = union(*all_tables)
-    count_over_time = db_connection.execute(unioned_query).all()
+    count_over_time = db_connection.execute(query).all()
     return count_over_time
 
 
@@ -1093,14 +988,11 @@ def query_untriaged_findings_for_rule_pack(query: Query, version: str | Column[s
     query = query.join(DBfinding, DBfinding.id_ == DBscanFinding.finding_id)
     query = query.join(DBscan, DBscan.id_ == DBscanFinding.scan_id)
     query = query.join(DBrule, DBrule.rule_name == DBfinding.rule_name)
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
     query = query.where(DBrule.rule_pack == version)
     query = query.where(DBscan.rule_pack == version)
-    query = query.where((DBaudit.status == FindingStatus.NOT_ANALYZED) | (DBaudit.status == None))  # noqa: E711
+    query = query.where(
+        (DBfinding.current_status == FindingStatus.NOT_ANALYZED) | (DBfinding.current_status == None)  # noqa: E711
+    )
     return query
 
 
@@ -1118,12 +1010,9 @@ def get_untriaged_finding_for_old_rulepacks(db_connection: Session, version: str
     do_not_touch_finding_query = do_not_touch_finding_query.scalar_subquery()
 
     query: Query = select(DBfinding.id_)
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
+    query = query.where(
+        (DBfinding.current_status == None) | (DBfinding.current_status == FindingStatus.NOT_ANALYZED)  # noqa: E711
     )
-    query = query.where((DBaudit.status == None) | (DBaudit.status == FindingStatus.NOT_ANALYZED))  # noqa: E711
     query = query.where(DBfinding.id_.not_in(do_not_touch_finding_query))
     # We limit to 100 000 because otherwise it crashes because too many data
     query = query.limit(100_000)
@@ -0,0 +1,262 @@
+# Standard Library
+import logging
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+
+# Third Party
+from sqlalchemy import ColumnElement, DateTime, Select, Subquery, func, insert, literal, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import literal_column
+
+# First Party
+from resc_backend.db.model import (
+    DBaudit,
+    DBfinding,
+    DBfindingWeeklySnapshot,
+    DBrepository,
+    DBscan,
+    DBscanFinding,
+    DBVcsInstance,
+)
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+from resc_backend.resc_web_service.schema.scan_type import ScanType
+from resc_backend.resc_web_service.schema.vcs_provider import VCSProviders
+
+logger = logging.getLogger(__name__)
+
+
+def get_iso_date_now_diff_week(week: int) -> datetime:
+    """
+        Taking now() computes the timestamp associated to the
+        ISO calendar year.
+
+    Args:
+        week (int): Number of weeks to substract to the timestamp.
+
+    Returns:
+        datetime: shifted iso time stamp for easier computations.
+    """
+    current_utc_time = datetime.now(UTC)
+    current_iso = current_utc_time.isocalendar()
+    current_iso_year = current_iso[0]
+    current_iso_week = current_iso[1]
+    # We use 6 (Saturday) to include the current week when 0
+    # rather than doing a shift from current day.
+    last_nth_week_date_time = datetime.fromisocalendar(current_iso_year, current_iso_week, 6) - timedelta(weeks=week)
+    return last_nth_week_date_time
+
+
+def _weeks_subquery(weeks: list[int]) -> Subquery:
+    """
+        Creates a subquery with one row per week, holding the cut-off date of the week
+        and its ISO year and week number
+
+    Args:
+        weeks (list[int]): number of weeks before the current one of every week, 0 for the current one
+
+    Returns:
+        Subquery: subquery with the cutoff, year and week columns
+    """
+    all_weeks = []
+    for week in weeks:
+        last_nth_week_date_time = get_iso_date_now_diff_week(week)
+        all_weeks.append(
+            select(
+                literal(last_nth_week_date_time, DateTime()).label("cutoff"),
+                literal(last_nth_week_date_time.isocalendar()[0]).label("year"),
+                literal(last_nth_week_date_time.isocalendar()[1]).label("week"),
+            )
+        )
+    return union_all(*all_weeks).subquery()
+
+
+def _audit_valid_at(cutoff: ColumnElement[datetime]) -> ColumnElement[bool]:
+    """
+        Creates the condition selecting the last audit of every finding before a cut-off date,
+        the audit that was created before the cut-off date and superseded after it if at all.
+        The archived audits are not searched, an audit is only archived once superseded before the archive date,
+        it is not valid at a cut-off date after the archive date.
+
+    Args:
+        cutoff (ColumnElement[datetime]): cut-off date
+
+    Returns:
+        ColumnElement[bool]: condition on DBaudit
+    """
+    return (DBaudit.valid_from < cutoff) & (
+        (DBaudit.valid_to == None) | (DBaudit.valid_to >= cutoff)  # noqa: E711
+    )
+
+
+def _weekly_counts_queries(weeks: list[int]) -> list[Select]:
+    """
+        Creates the queries computing the finding counts of the weeks, as stored in finding_weekly_snapshot.
+        The scanned findings and the audited findings are counted by two grouped queries to union, a week,
+        provider type and status can have a row in both.
+
+    Args:
+        weeks (list[int]): number of weeks before the current one of every week, 0 for the current one
+
+    Returns:
+        list[Select]: queries with the year, week, provider_type, status, finding_count and audit_status_count columns
+    """
+    all_weeks = _weeks_subquery(weeks)
+
+    # max base scan per repository under the cut-off date of every week
+    max_base_scan = select(
+        all_weeks.c.cutoff,
+        all_weeks.c.year,
+        all_weeks.c.week,
+        DBscan.repository_id,
+        func.max(DBscan.id_).label("scan_id"),
+    )
+    max_base_scan = max_base_scan.select_from(all_weeks)
+    max_base_scan = max_base_scan.join(DBscan, DBscan.timestamp <= all_weeks.c.cutoff)
+    max_base_scan = max_base_scan.where(DBscan.scan_type == ScanType.BASE)
+    max_base_scan = max_base_scan.group_by(all_weeks.c.cutoff, all_weeks.c.year, all_weeks.c.week, DBscan.repository_id)
+    max_base_scan = max_base_scan.subquery()
+
+    # findings of the scans since the max base scan, by the status of their audit
+    # The default status is inlined, the GROUP BY expression would not match the selected one with a bind parameter
+    status = func.coalesce(DBaudit.status, literal_column(f"'{FindingStatus.NOT_ANALYZED.value}'", DBaudit.status.type))
+    scanned_query = select(
+        max_base_scan.c.year,
+        max_base_scan.c.week,
+        DBVcsInstance.provider_type.label("provider_type"),
+        status.label("status"),
+        func.count(DBfinding.id_).label("finding_count"),
+        literal_column("0").label("audit_status_count"),
+    )
+    scanned_query = scanned_query.select_from(DBfinding)
+    scanned_query = scanned_query.join(DBscanFinding, DBfinding.id_ == DBscanFinding.finding_id)
+    scanned_query = scanned_query.join(DBscan, DBscan.id_ == DBscanFinding.scan_id)
+    scanned_query = scanned_query.join(DBrepository, DBrepository.id_ == DBscan.repository_id)
+    scanned_query = scanned_query.join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
+    scanned_query = scanned_query.join(max_base_scan, max_base_scan.c.repository_id == DBscan.repository_id)
+    scanned_query = scanned_query.where(DBscan.id_ >= max_base_scan.c.scan_id)
+    scanned_query = scanned_query.where(DBscan.timestamp <= max_base_scan.c.cutoff)
+    scanned_query = scanned_query.where(
+        (DBrepository.deleted_at == None)  # noqa: E711
+        | (DBrepository.deleted_at > max_base_scan.c.cutoff)
+    )
+    scanned_query = scanned_query.join(
+        DBaudit,
+        (DBaudit.finding_id == DBfinding.id_) & _audit_valid_at(max_base_scan.c.cutoff),
+        isouter=True,
+    )
+    scanned_query = scanned_query.group_by(
+        max_base_scan.c.year, max_base_scan.c.week, DBVcsInstance.provider_type, status
+    )
+
+    # findings by the status of their audit, whether they are scanned or not
+    audited_query = select(
+        all_weeks.c.year,
+        all_weeks.c.week,
+        DBVcsInstance.provider_type.label("provider_type"),
+        DBaudit.status.label("status"),
+        literal_column("0").label("finding_count"),
+        func.count(DBaudit.id_).label("audit_status_count"),
+    )
+    audited_query = audited_query.select_from(all_weeks)
+    audited_query = audited_query.join(DBaudit, _audit_valid_at(all_weeks.c.cutoff))
+    audited_query = audited_query.join(DBfinding, DBfinding.id_ == DBaudit.finding_id)
+    audited_query = audited_query.join(DBrepository, DBrepository.id_ == DBfinding.repository_id)
+    audited_query = audited_query.join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
+    audited_query = audited_query.where(
+        (DBrepository.deleted_at == None)  # noqa: E711
+        | (DBrepository.deleted_at > all_weeks.c.cutoff)
+    )
+    audited_query = audited_query.group_by(
+        all_weeks.c.year, all_weeks.c.week, DBVcsInstance.provider_type, DBaudit.status
+    )
+
+    return [scanned_query, audited_query]
+
+
+def finalize_finding_weekly_snapshots(db_connection: Session, weeks: int) -> int:
+    """
+        Store the finding counts of the weeks which are over among the last weeks, if not stored yet.
+        The counts of the stored weeks are not computed again. The changes are committed.
+        When another connection stores the same weeks concurrently, its counts are kept.
+    :param db_connection:
+        Session of the database connection
+    :param weeks:
+        number of weeks, the current one included
+    :return: int
+        number of weeks stored
+    """
+    closed_weeks = {tuple(get_iso_date_now_diff_week(week).isocalendar()[:2]): week for week in range(1, weeks)}
+    if not closed_weeks:
+        return 0
+
+    query = select(DBfindingWeeklySnapshot.iso_year, DBfindingWeeklySnapshot.iso_week).distinct()
+    query = query.where(DBfindingWeeklySnapshot.iso_year >= min(year for year, _ in closed_weeks))
+    stored_weeks = {tuple(row) for row in db_connection.execute(query)}
+    missing_weeks = sorted(week for iso_week, week in closed_weeks.items() if iso_week not in stored_weeks)
+    if not missing_weeks:
+        return 0
+
+    counts = defaultdict(lambda: [0, 0])
+    for row in db_connection.execute(union_all(*_weekly_counts_queries(missing_weeks))):
+        weekly_counts = counts[(row.year, row.week, row.provider_type, row.status)]
+        weekly_counts[0] += row.finding_count
+        weekly_counts[1] += row.audit_status_count
+
+    snapshots = []
+    for week in missing_weeks:
+        year, iso_week = get_iso_date_now_diff_week(week).isocalendar()[:2]
+        for provider_type in VCSProviders:
+            for status in FindingStatus:
+                finding_count, audit_status_count = counts[(year, iso_week, provider_type.value, status)]
+                snapshots.append(
+                    {
+                        "iso_year": year,
+                        "iso_week": iso_week,
+                        "provider_type": provider_type.value,
+                        "status": status,
+                        "finding_count": finding_count,
+                        "audit_status_count": audit_status_count,
+                    }
+                )
+
+    try:
+        db_connection.execute(insert(DBfindingWeeklySnapshot), snapshots)
+        db_connection.commit()
+    except IntegrityError:
+        db_connection.rollback()
+        logger.info("Finding weekly snapshots already stored by another connection")
+        return 0
+
+    logger.info(f"Stored the finding weekly snapshots of {len(missing_weeks)} weeks")
+    return len(missing_weeks)
+
+
+def get_finding_weekly_snapshots(db_connection: Session, weeks: int) -> Subquery:
+    """
+        Finding counts per week, provider type and status of the last weeks, nothing is written.
+        The weeks which are over are read from finding_weekly_snapshot, only the current week is computed.
+        A week over is missing until stored by finalize_finding_weekly_snapshots, which the ingest workers run
+        periodically, see also the resc_finalize_finding_weekly_snapshots command.
+    :param db_connection:
+        Session of the database connection
+    :param weeks:
+        number of weeks, the current one included
+    :return: Subquery
+        subquery with the year, week, provider_type, status, finding_count and audit_status_count columns,
+        a week, provider type and status can have several rows of which the counts add up
+    """
+    first_year, first_week = get_iso_date_now_diff_week(weeks - 1).isocalendar()[:2]
+    stored_query = select(
+        DBfindingWeeklySnapshot.iso_year.label("year"),
+        DBfindingWeeklySnapshot.iso_week.label("week"),
+        DBfindingWeeklySnapshot.provider_type,
+        DBfindingWeeklySnapshot.status,
+        DBfindingWeeklySnapshot.finding_count,
+        DBfindingWeeklySnapshot.audit_status_count,
+    )
+    stored_query = stored_query.where(
+        DBfindingWeeklySnapshot.iso_year * 100 + DBfindingWeeklySnapshot.iso_week >= first_year * 100 + first_week
+    )
+
+    return union_all(stored_query, *_weekly_counts_queries([0])).subquery()
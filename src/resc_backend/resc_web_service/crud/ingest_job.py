@@ -0,0 +1,170 @@
+# Standard Library
+import logging
+from datetime import UTC, datetime
+
+# Third Party
+from sqlalchemy import Update, select, update
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import DBingestJob
+from resc_backend.resc_web_service.schema.ingest_job_status import IngestJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def create_ingest_job(db_connection: Session, scan_id: int, payload: str, total_findings: int) -> DBingestJob:
+    """
+        Stage the findings of a scan to be ingested by the ingest workers
+    :param db_connection:
+        Session of the database connection
+    :param scan_id:
+        id of the scan the findings belong to
+    :param payload:
+        JSON encoded list of FindingCreate objects
+    :param total_findings:
+        number of findings in the payload
+    :return: DBingestJob
+        The created, pending, ingest job
+    """
+    db_ingest_job = DBingestJob(scan_id=scan_id, payload=payload, total_findings=total_findings)
+    db_connection.add(db_ingest_job)
+    db_connection.commit()
+    db_connection.refresh(db_ingest_job)
+    return db_ingest_job
+
+
+def get_ingest_job(db_connection: Session, ingest_job_id: int) -> DBingestJob:
+    query = select(DBingestJob).where(DBingestJob.id_ == ingest_job_id)
+    return db_connection.execute(query).scalars().first()
+
+
+def claim_ingest_job(db_connection: Session) -> DBingestJob | None:
+    """
+        Claim the oldest pending ingest job
+        The claim is a conditional update, a job is claimed by a single worker even across instances.
+    :param db_connection:
+        Session of the database connection
+    :return: DBingestJob | None
+        The claimed, running, ingest job or None if no job is pending
+    """
+    query = select(DBingestJob.id_).where(DBingestJob.status == IngestJobStatus.PENDING)
+    query = query.order_by(DBingestJob.id_).limit(10)
+    for ingest_job_id in db_connection.execute(query).scalars().all():
+        claim = update(DBingestJob)
+        claim = claim.where(DBingestJob.id_ == ingest_job_id)
+        claim = claim.where(DBingestJob.status == IngestJobStatus.PENDING)
+        now = datetime.now(UTC)
+        claim = claim.values(status=IngestJobStatus.RUNNING, started_at=now, heartbeat_at=now)
+        claimed = db_connection.execute(claim).rowcount == 1
+        db_connection.commit()
+        if claimed:
+            return get_ingest_job(db_connection, ingest_job_id=ingest_job_id)
+    return None
+
+
+def requeue_abandoned_ingest_jobs(db_connection: Session, heartbeat_before: datetime) -> int:
+    """
+        Queue again the running ingest jobs without heartbeat since the given time, their worker is presumed gone
+        The ingestion runs in a single transaction, an abandoned job left no partial data behind.
+        A job running for long keeps its claim as long as its worker reports progress.
+    :param db_connection:
+        Session of the database connection
+    :param heartbeat_before:
+        running jobs of which the last heartbeat is older than this moment are queued again
+    :return: int
+        The number of jobs queued again
+    """
+    query = update(DBingestJob)
+    query = query.where(DBingestJob.status == IngestJobStatus.RUNNING)
+    query = query.where(DBingestJob.heartbeat_at < heartbeat_before)
+    query = query.values(status=IngestJobStatus.PENDING, started_at=None, heartbeat_at=None, processed_findings=0)
+    requeued = db_connection.execute(query, execution_options={"synchronize_session": "fetch"}).rowcount
+    db_connection.commit()
+    if requeued:
+        logger.warning(f"Queued {requeued} abandoned ingest job(s) again")
+    return requeued
+
+
+def _claimed_ingest_job(ingest_job_id: int, started_at: datetime) -> Update:
+    # The start of a claim identifies it, a job queued again and claimed anew has another start
+    query = update(DBingestJob).where(DBingestJob.id_ == ingest_job_id)
+    query = query.where(DBingestJob.status == IngestJobStatus.RUNNING)
+    return query.where(DBingestJob.started_at == started_at)
+
+
+def update_ingest_job_progress(
+    db_connection: Session, ingest_job_id: int, started_at: datetime, processed_findings: int
+) -> bool:
+    """
+        Record the progress of a running ingest job, refreshing its heartbeat
+    :param db_connection:
+        Session of the database connection
+    :param ingest_job_id:
+        id of the ingest job
+    :param started_at:
+        start of the claim of the worker, as returned by claim_ingest_job
+    :param processed_findings:
+        number of findings of the payload ingested so far
+    :return: bool
+        False if the worker lost its claim, the job was queued again
+    """
+    query = _claimed_ingest_job(ingest_job_id, started_at=started_at)
+    query = query.values(processed_findings=processed_findings, heartbeat_at=datetime.now(UTC))
+    updated = db_connection.execute(query, execution_options={"synchronize_session": "fetch"}).rowcount == 1
+    db_connection.commit()
+    if not updated:
+        logger.warning(f"Ingest job {ingest_job_id} was queued again, its claim is lost")
+    return updated
+
+
+def finish_ingest_job(db_connection: Session, ingest_job_id: int, started_at: datetime, created_findings: int) -> bool:
+    """
+        Mark an ingest job as done and drop its staged payload
+    :param db_connection:
+        Session of the database connection
+    :param ingest_job_id:
+        id of the ingest job
+    :param started_at:
+        start of the claim of the worker, as returned by claim_ingest_job
+    :param created_findings:
+        number of findings linked to the scan
+    :return: bool
+        False if the worker lost its claim, the job was queued again and is left to its new worker
+    """
+    query = _claimed_ingest_job(ingest_job_id, started_at=started_at)
+    query = query.values(
+        status=IngestJobStatus.DONE,
+        payload=None,
+        processed_findings=DBingestJob.total_findings,
+        created_findings=created_findings,
+        finished_at=datetime.now(UTC),
+    )
+    updated = db_connection.execute(query, execution_options={"synchronize_session": "fetch"}).rowcount == 1
+    db_connection.commit()
+    if not updated:
+        logger.warning(f"Ingest job {ingest_job_id} was queued again, not marked as done")
+    return updated
+
+
+def fail_ingest_job(db_connection: Session, ingest_job_id: int, started_at: datetime, error: str) -> bool:
+    """
+        Mark an ingest job as failed, its staged payload is kept for investigation
+    :param db_connection:
+        Session of the database connection
+    :param ingest_job_id:
+        id of the ingest job
+    :param started_at:
+        start of the claim of the worker, as returned by claim_ingest_job
+    :param error:
+        reason of the failure, truncated to the size of the column
+    :return: bool
+        False if the worker lost its claim, the job was queued again and is left to its new worker
+    """
+    query = _claimed_ingest_job(ingest_job_id, started_at=started_at)
+    query = query.values(status=IngestJobStatus.FAILED, error=error[:255], finished_at=datetime.now(UTC))
+    updated = db_connection.execute(query, execution_options={"synchronize_session": "fetch"}).rowcount == 1
+    db_connection.commit()
+    if not updated:
+        logger.warning(f"Ingest job {ingest_job_id} was queued again, not marked as failed")
+    return updated
@@ -0,0 +1,138 @@
+# Standard Library
+import logging
+from datetime import datetime
+
+# Third Party
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import DBingestRequest
+from resc_backend.resc_web_service.schema.ingest_request_status import IngestRequestStatus
+
+logger = logging.getLogger(__name__)
+
+
+def get_ingest_request(db_connection: Session, idempotency_key: str, created_after: datetime) -> DBingestRequest:
+    """
+        Retrieve the ingestion request recorded for an idempotency key
+    :param db_connection:
+        Session of the database connection
+    :param idempotency_key:
+        Idempotency-Key header of the request
+    :param created_after:
+        requests recorded before this moment are expired and ignored
+    :return: DBingestRequest
+        The recorded request or None if the key is unknown or expired
+    """
+    query = select(DBingestRequest).where(DBingestRequest.idempotency_key == idempotency_key)
+    query = query.where(DBingestRequest.created_at >= created_after)
+    return db_connection.execute(query).scalars().first()
+
+
+def reserve_ingest_request(
+    db_connection: Session,
+    idempotency_key: str,
+    scan_id: int,
+    request_digest: str | None,
+    expired_before: datetime,
+    abandoned_before: datetime,
+) -> DBingestRequest | None:
+    """
+        Reserve an idempotency key for an ingestion request about to start, the reservation is committed at once
+        so that a concurrent request with the same key sees it. An expired key, or a reservation abandoned by its
+        request, is freed first.
+    :param db_connection:
+        Session of the database connection
+    :param idempotency_key:
+        Idempotency-Key header of the request
+    :param scan_id:
+        id of the scan the findings belong to
+    :param request_digest:
+        digest of the scan id and the body of the request, None if not known yet
+    :param expired_before:
+        requests recorded before this moment are expired
+    :param abandoned_before:
+        requests still in progress since before this moment are abandoned
+    :return: DBingestRequest | None
+        The reservation, in progress, or None if the key is already reserved or recorded
+    """
+    query = delete(DBingestRequest).where(DBingestRequest.idempotency_key == idempotency_key)
+    query = query.where(
+        or_(
+            DBingestRequest.created_at < expired_before,
+            and_(
+                DBingestRequest.status == IngestRequestStatus.IN_PROGRESS,
+                DBingestRequest.created_at < abandoned_before,
+            ),
+        )
+    )
+    db_connection.execute(query, execution_options={"synchronize_session": "fetch"})
+
+    db_ingest_request = DBingestRequest(idempotency_key=idempotency_key, scan_id=scan_id, request_digest=request_digest)
+    db_connection.add(db_ingest_request)
+    try:
+        db_connection.commit()
+    except IntegrityError:
+        db_connection.rollback()
+        return None
+    db_connection.refresh(db_ingest_request)
+    return db_ingest_request
+
+
+def complete_ingest_request(
+    db_connection: Session, ingest_request_id: int, request_digest: str, created_findings: int
+) -> bool:
+    """
+        Record the result of a reserved ingestion request, the changes are flushed and not committed
+        The result is committed together with the ingested findings.
+    :param db_connection:
+        Session of the database connection
+    :param ingest_request_id:
+        id of the reservation
+    :param request_digest:
+        digest of the scan id and the body of the request
+    :param created_findings:
+        number of findings linked to the scan, the response of the request
+    :return: bool
+        False if the reservation does not exist anymore, it was considered abandoned
+    """
+    query = update(DBingestRequest).where(DBingestRequest.id_ == ingest_request_id)
+    query = query.where(DBingestRequest.status == IngestRequestStatus.IN_PROGRESS)
+    query = query.values(
+        status=IngestRequestStatus.DONE, request_digest=request_digest, created_findings=created_findings
+    )
+    return db_connection.execute(query, execution_options={"synchronize_session": "fetch"}).rowcount == 1
+
+
+def release_ingest_request(db_connection: Session, ingest_request_id: int) -> None:
+    """
+        Free the idempotency key of a failed ingestion request, the request can be retried with the same key
+    :param db_connection:
+        Session of the database connection
+    :param ingest_request_id:
+        id of the reservation
+    """
+    query = delete(DBingestRequest).where(DBingestRequest.id_ == ingest_request_id)
+    query = query.where(DBingestRequest.status == IngestRequestStatus.IN_PROGRESS)
+    db_connection.execute(query, execution_options={"synchronize_session": "fetch"})
+    db_connection.commit()
+
+
+def delete_expired_ingest_requests(db_connection: Session, created_before: datetime) -> int:
+    """
+        Delete the ingestion requests recorded before the given moment
+    :param db_connection:
+        Session of the database connection
+    :param created_before:
+        requests recorded before this moment are deleted
+    :return: int
+        The number of deleted requests
+    """
+    query = delete(DBingestRequest).where(DBingestRequest.created_at < created_before)
+    deleted = db_connection.execute(query).rowcount
+    db_connection.commit()
+    if deleted:
+        logger.debug(f"Deleted {deleted} expired ingest request(s)")
+    return deleted
@@ -15,7 +15,6 @@ from resc_backend.constants import (
     MAX_RECORDS_PER_PAGE_LIMIT,
 )
 from resc_backend.db.model import (
-    DBaudit,
     DBfinding,
     DBrepository,
     DBscan,
@@ -43,14 +42,9 @@ def _get_max_base_scan(db_connection: Session) -> Query:
 
 def _only_if_has_untriaged_findings_condition(db_connection: Session) -> Query:
     has_untriaged_sub_query: Query = db_connection.query(DBfinding.repository_id)
-    has_untriaged_sub_query = has_untriaged_sub_query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBfinding.id_) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
     has_untriaged_sub_query = has_untriaged_sub_query.where(
-        (DBaudit.status == None) | (DBaudit.status == FindingStatus.NOT_ANALYZED)  # noqa: E711
-    )  # noqa: E711
+        (DBfinding.current_status == None) | (DBfinding.current_status == FindingStatus.NOT_ANALYZED)  # noqa: E711
+    )
     return has_untriaged_sub_query.distinct()
 
 
@@ -361,7 +355,7 @@ def get_findings_metadata_by_repository_id(db_connection: Session, repository_id
     :return: findings_metadata
         findings_metadata containing the count for each status
     """
-    query: Query = db_connection.query(DBrepository.id_, DBaudit.status, func.count(DBscanFinding.finding_id))
+    query: Query = db_connection.query(DBrepository.id_, DBfinding.current_status, func.count(DBscanFinding.finding_id))
 
     last_scan_sub_query = _get_max_base_scan(db_connection)
     query = query.join(
@@ -374,15 +368,11 @@ def get_findings_metadata_by_repository_id(db_connection: Session, repository_id
     )
     query = query.where(DBscan.id_ >= last_scan_sub_query.c.latest_base_scan_id)
     query = query.join(DBscanFinding, DBscan.id_ == DBscanFinding.scan_id)
-    query = query.join(
-        DBaudit,
-        (DBaudit.finding_id == DBscanFinding.finding_id) & (DBaudit.is_latest == True),  # noqa: E712
-        isouter=True,
-    )
+    query = query.join(DBfinding, DBfinding.id_ == DBscanFinding.finding_id)
     query = query.where(DBrepository.id_.in_(repository_ids))
     query = query.group_by(
         DBrepository.id_,
-        DBaudit.status,
+        DBfinding.current_status,
     )
     status_counts = query.all()
     repo_count_dict = {}
@@ -2,7 +2,7 @@
 from datetime import datetime
 
 # Third Party
-from sqlalchemy import func, update
+from sqlalchemy import Row, func, select, update
 from sqlalchemy.orm import Session
 
 # First Party
@@ -29,6 +29,30 @@ def get_scan(db_connection: Session, scan_id: int) -> DBscan:
     return scan
 
 
+def get_scan_scope(db_connection: Session, scan_id: int) -> Row | None:
+    """
+        Retrieve the rule pack, repository and vcs instance of a scan
+    :param db_connection:
+        Session of the database connection
+    :param scan_id:
+        id of the scan
+    :return: Row
+        row with the rule_pack, project_key, repository_name, vcs_instance_id and provider_type columns,
+        None if the scan does not exist
+    """
+    query = select(
+        DBscan.rule_pack,
+        DBrepository.project_key,
+        DBrepository.repository_name,
+        DBVcsInstance.id_.label("vcs_instance_id"),
+        DBVcsInstance.provider_type,
+    )
+    query = query.join(DBrepository, DBrepository.id_ == DBscan.repository_id)
+    query = query.join(DBVcsInstance, DBVcsInstance.id_ == DBrepository.vcs_instance)
+    query = query.where(DBscan.id_ == scan_id)
+    return db_connection.execute(query).first()
+
+
 def get_latest_scan_for_repository(db_connection: Session, repository_id: int) -> DBscan:
     """
         Retrieve the most recent scan of a given repository object
@@ -1,6 +1,9 @@
 # Standard Library
+import logging
+from itertools import islice
 
 # Third Party
+from sqlalchemy import delete, insert, literal, select
 from sqlalchemy.orm import Session
 
 # First Party
@@ -12,23 +15,126 @@ from resc_backend.db.model import (
     DBVcsInstance,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def create_scan_findings(db_connection: Session, scan_findings: list[DBscanFinding]) -> int:
+    """
+        Link findings to scans, links which already exist are skipped
+        The links are not committed, this is up to the caller.
+    :param db_connection:
+        Session of the database connection
+    :param scan_findings:
+        links between a finding and a scan to create
+    :return: int
+        The number of links inserted
+    """
     if len(scan_findings) < 1:
         # Function is called with an empty list of findings
         return 0
 
-    # load existing scan findings for this scan into the session
-    scan_id = scan_findings[0].scan_id
-    _ = db_connection.query(DBscanFinding).where(DBscanFinding.scan_id == scan_id).all()
-
-    # merge the new scan findings into the session, ignoring duplicates
+    # deduplicate the requested links, grouped per scan
+    findings_ids_per_scan: dict[int, dict[int, None]] = {}
     for scan_finding in scan_findings:
-        db_connection.merge(scan_finding)
-
-    db_connection.commit()
-
-    return len(scan_findings)
+        findings_ids_per_scan.setdefault(scan_finding.scan_id, {})[scan_finding.finding_id] = None
+
+    inserted = 0
+    for scan_id, findings_ids in findings_ids_per_scan.items():
+        # Iterate over those finding ids by chunk.
+        # This is necessary because SQL tends to crash when you do IN with more than 1000 values.
+        iterator = iter(findings_ids)
+        while chunk := list(islice(iterator, 1000)):
+            # Links are inserted with a single INSERT ... SELECT, the existing links are skipped by the database
+            existing_link = select(DBscanFinding.finding_id)
+            existing_link = existing_link.where(DBscanFinding.scan_id == scan_id)
+            existing_link = existing_link.where(DBscanFinding.finding_id == DBfinding.id_)
+            query = select(DBfinding.id_, literal(scan_id, DBscanFinding.scan_id.type))
+            query = query.where(DBfinding.id_.in_(chunk))
+            query = query.where(~existing_link.exists())
+            result = db_connection.execute(
+                insert(DBscanFinding).from_select([DBscanFinding.finding_id, DBscanFinding.scan_id], query)
+            )
+            inserted += result.rowcount
+
+    logger.info(
+        f"create_scan_findings scan(s) {', '.join(map(str, findings_ids_per_scan))}, Requested: {len(scan_findings)}. "
+        f"Inserted: {inserted}. Skipped: {len(scan_findings) - inserted}"
+    )
+    return inserted
+
+
+def copy_scan_findings(db_connection: Session, source_scan_id: int, target_scan_id: int) -> int:
+    """
+        Link the findings of a scan to another scan, inside the database with a single INSERT ... SELECT
+        Links which already exist are skipped, the links are not committed, this is up to the caller.
+    :param db_connection:
+        Session of the database connection
+    :param source_scan_id:
+        id of the scan to copy the links from
+    :param target_scan_id:
+        id of the scan to link the findings to
+    :return: int
+        The number of links inserted
+    """
+    existing_query = select(DBscanFinding.finding_id).where(DBscanFinding.scan_id == target_scan_id)
+    query = select(DBscanFinding.finding_id, literal(target_scan_id, DBscanFinding.scan_id.type))
+    query = query.where(DBscanFinding.scan_id == source_scan_id)
+    query = query.where(DBscanFinding.finding_id.not_in(existing_query))
+    result = db_connection.execute(
+        insert(DBscanFinding).from_select([DBscanFinding.finding_id, DBscanFinding.scan_id], query)
+    )
+    logger.info(f"copy_scan_findings scan {source_scan_id} to scan {target_scan_id}, Inserted: {result.rowcount}")
+    return result.rowcount
+
+
+def delete_scan_findings_by_fingerprint(
+    db_connection: Session, scan_id: int, repository_id: int, long_fingerprints: list[str]
+) -> int:
+    """
+        Unlink the findings matching the given fingerprints from a scan
+        The links are not committed, this is up to the caller.
+    :param db_connection:
+        Session of the database connection
+    :param scan_id:
+        id of the scan
+    :param repository_id:
+        id of the repository of the scan
+    :param long_fingerprints:
+        long fingerprints of the findings to unlink
+    :return: int
+        The number of links deleted
+    """
+    deleted = 0
+    # Iterate over those fingerprints by chunk.
+    # This is necessary because SQL tends to crash when you do IN with more than 1000 values.
+    iterator = iter(set(long_fingerprints))
+    while chunk := list(islice(iterator, 1000)):
+        findings_query = select(DBfinding.id_)
+        findings_query = findings_query.where(DBfinding.repository_id == repository_id)
+        findings_query = findings_query.where(DBfinding.long_fingerprint.in_(chunk))
+        query = delete(DBscanFinding)
+        query = query.where(DBscanFinding.scan_id == scan_id)
+        query = query.where(DBscanFinding.finding_id.in_(findings_query))
+        deleted += db_connection.execute(query).rowcount
+
+    logger.info(
+        f"delete_scan_findings_by_fingerprint scan {scan_id}, Requested: {len(long_fingerprints)}. Deleted: {deleted}"
+    )
+    return deleted
+
+
+def get_scan_findings_ids(db_connection: Session, scan_id: int) -> list[int]:
+    """
+        Retrieve the ids of the findings linked to a scan
+    :param db_connection:
+        Session of the database connection
+    :param scan_id:
+        id of the scan
+    :return: [int]
+        The ids of the findings linked to the scan
+    """
+    query = select(DBscanFinding.finding_id).where(DBscanFinding.scan_id == scan_id)
+    return list(db_connection.execute(query).scalars())
 
 
 def get_scan_findings(db_connection: Session, finding_id: int) -> list[DBscanFinding]:
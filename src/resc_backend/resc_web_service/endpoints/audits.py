@@ -1,26 +1,38 @@
 # Standard Library
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 
 # Third Party
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
 
 # First Party
 from resc_backend.constants import (
+    AUDIT_ARCHIVE_AFTER_DAYS,
+    AUDIT_ARCHIVE_BATCH_SIZE,
+    AUDIT_ARCHIVE_MAX_BATCHES_PER_REQUEST,
     CACHE_NAMESPACE_FINDING,
     DEFAULT_RECORDS_PER_PAGE_LIMIT,
     ERROR_MESSAGE_500,
     ERROR_MESSAGE_503,
     FINDINGS_TAG,
     REDIS_CACHE_EXPIRE,
+    RWS_ROUTE_ARCHIVE,
     RWS_ROUTE_AUDITS,
+    RWS_ROUTE_FEED,
 )
+from resc_backend.resc_web_service.cache_manager import CacheManager
 from resc_backend.resc_web_service.crud import audit as audit_crud
 from resc_backend.resc_web_service.dependencies import get_db_connection
 from resc_backend.resc_web_service.schema.audit import AuditFinding
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
-from resc_backend.resc_web_service.schema.pagination_model import PaginationModel
+from resc_backend.resc_web_service.schema.pagination_model import (
+    CursorPaginationModel,
+    PaginationModel,
+    decode_cursor,
+    encode_cursor,
+)
 
 router = APIRouter(prefix=f"{RWS_ROUTE_AUDITS}", tags=[FINDINGS_TAG])
 
@@ -78,3 +90,111 @@ def get_all_audits(
     )
 
     return PaginationModel[AuditFinding](data=audits, total=total_audits, limit=limit, skip=skip)
+
+
+@router.get(
+    f"{RWS_ROUTE_FEED}",
+    response_model=CursorPaginationModel[AuditFinding],
+    summary="Get audits feed",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Retrieve the past audits, page by page"},
+        400: {"description": "Invalid cursor"},
+        500: {"description": ERROR_MESSAGE_500},
+        503: {"description": ERROR_MESSAGE_503},
+    },
+)
+@cache(namespace=CACHE_NAMESPACE_FINDING, expire=REDIS_CACHE_EXPIRE)
+def get_audits_feed(
+    cursor: str | None = Query(None),
+    limit: int = Query(default=DEFAULT_RECORDS_PER_PAGE_LIMIT, ge=1),
+    include_total: bool = Query(default=False),
+    auditor: str | None = Query(None),
+    from_date: datetime | None = Query(None),
+    to_date: datetime | None = Query(None),
+    status: list[FindingStatus] | None = Query(None),
+    is_latest: bool | None = Query(None),
+    db_connection: Session = Depends(get_db_connection),
+) -> CursorPaginationModel[AuditFinding]:
+    """
+        Retrieve audits objects page by page, the most recent first
+
+    - **db_connection**: Session of the database connection
+    - **cursor**: next_cursor of the previous page, omitted for the first page
+    - **limit**: Integer amount of records to return
+    - **include_total**: Whether to count all the audits matching the filters, omitted by default
+    - **auditor**: String to filter which auditor to audit.
+    - **from_date**: DateTime to filter from which we look at (oldest)
+    - **to_date**: DateTime to filter to which we look at (youngest)
+    - **status**: Finding status to filter on
+    - **is_latest**: Whether to only consider latest audits.
+    - **return**: [AuditFinding]
+        The output will contain a CursorPaginationModel containing the list of AuditFinding type objects and the
+        cursor of the next page, which is null on the last page
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as err:
+        raise HTTPException(status_code=400, detail=str(err)) from err
+
+    audits, last_key = audit_crud.get_audits_after(
+        db_connection,
+        after=after,
+        limit=limit,
+        auditor=auditor,
+        from_date=from_date,
+        to_date=to_date,
+        status=status,
+        is_latest=is_latest,
+    )
+
+    total_audits = None
+    if include_total:
+        total_audits = audit_crud.get_total_audits_count(
+            db_connection, auditor=auditor, from_date=from_date, to_date=to_date, status=status, is_latest=is_latest
+        )
+
+    next_cursor = encode_cursor(*last_key) if last_key else None
+    return CursorPaginationModel[AuditFinding](data=audits, limit=limit, next_cursor=next_cursor, total=total_audits)
+
+
+@router.post(
+    f"{RWS_ROUTE_ARCHIVE}",
+    response_model=int,
+    summary="Archive superseded audits",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Superseded audits successfully archived"},
+        500: {"description": ERROR_MESSAGE_500},
+        503: {"description": ERROR_MESSAGE_503},
+    },
+)
+async def archive_audits(
+    older_than_days: int = Query(default=AUDIT_ARCHIVE_AFTER_DAYS, ge=1),
+    batch_size: int = Query(default=AUDIT_ARCHIVE_BATCH_SIZE, ge=1, le=1000),
+    db_connection: Session = Depends(get_db_connection),
+) -> int:
+    """
+        Move the audits superseded longer ago than the given number of days to the audit archive
+        A request moves at most AUDIT_ARCHIVE_MAX_BATCHES_PER_REQUEST batches, send it again until it returns 0
+        or use the resc_archive_audits command for a long run.
+
+    - **db_connection**: Session of the database connection
+    - **older_than_days**: Integer amount of days since an audit was superseded after which it is archived
+    - **batch_size**: Integer amount of audits moved per transaction
+    - **return**: int
+        The output will contain the number of archived audits
+    """
+    older_than = datetime.now(UTC) - timedelta(days=older_than_days)
+    # The batches are committed one after the other, they are run outside of the event loop
+    archived_count = await run_in_threadpool(
+        audit_crud.archive_audits,
+        db_connection,
+        older_than=older_than,
+        batch_size=batch_size,
+        max_batches=AUDIT_ARCHIVE_MAX_BATCHES_PER_REQUEST,
+    )
+
+    # Clear cache related to findings
+    await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_FINDING)
+    return archived_count
@@ -3,6 +3,7 @@ from datetime import datetime
 
 # Third Party
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
 
@@ -17,6 +18,7 @@ from resc_backend.constants import (
     FINDINGS_TAG,
     REDIS_CACHE_EXPIRE,
     RWS_ROUTE_AUDIT,
+    RWS_ROUTE_BY_FILTER,
     RWS_ROUTE_BY_RULE,
     RWS_ROUTE_COUNT_BY_TIME,
     RWS_ROUTE_FINDINGS,
@@ -25,10 +27,12 @@ from resc_backend.constants import (
 )
 from resc_backend.resc_web_service.cache_manager import CacheManager
 from resc_backend.resc_web_service.crud import audit as audit_crud
+from resc_backend.resc_web_service.crud import detailed_finding as detailed_finding_crud
 from resc_backend.resc_web_service.crud import finding as finding_crud
 from resc_backend.resc_web_service.crud import scan_finding as scan_finding_crud
 from resc_backend.resc_web_service.dependencies import get_db_connection
 from resc_backend.resc_web_service.filters import FindingsFilter
+from resc_backend.resc_web_service.helpers.request_body import DecodedBodyRoute
 from resc_backend.resc_web_service.helpers.resc_swagger_models import Model400, Model404
 from resc_backend.resc_web_service.schema import audit as audit_schema
 from resc_backend.resc_web_service.schema import finding as finding_schema
@@ -38,7 +42,7 @@ from resc_backend.resc_web_service.schema.finding import FindingRead
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
 from resc_backend.resc_web_service.schema.pagination_model import PaginationModel
 
-router = APIRouter(prefix=f"{RWS_ROUTE_FINDINGS}", tags=[FINDINGS_TAG])
+router = APIRouter(prefix=f"{RWS_ROUTE_FINDINGS}", tags=[FINDINGS_TAG], route_class=DecodedBodyRoute)
 
 
 @router.get(
@@ -110,6 +114,7 @@ async def create_findings(
     """
     try:
         created_findings = finding_crud.create_findings(db_connection=db_connection, findings=findings)
+        db_connection.commit()
 
         # Clear cache related to findings
         await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_FINDING)
@@ -333,6 +338,50 @@ async def audit_findings(
     return len(audits)
 
 
+@router.post(
+    f"{RWS_ROUTE_AUDIT}{RWS_ROUTE_BY_FILTER}",
+    response_model=int,
+    summary="audit all the findings matching a filter",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"description": "Audit(s) successfully saved"},
+        500: {"description": ERROR_MESSAGE_500},
+        503: {"description": ERROR_MESSAGE_503},
+    },
+)
+async def audit_findings_by_filter(
+    request: Request,
+    audit: audit_schema.AuditByFilter,
+    db_connection: Session = Depends(get_db_connection),
+) -> int:
+    """
+        Audit all the findings matching a filter, updating the status and comment.
+        The findings are selected and audited inside the database, in batches.
+
+    - **db_connection**: Session of the database connection
+    - **findings_filter**: Filter selecting the findings to audit, as for the detailed findings
+    - **status**: Status of the finding, Valid values are NOT_ANALYZED, NOT_ACCESSIBLE,
+                  CLARIFICATION_REQUIRED, FALSE_POSITIVE, TRUE_POSITIVE, OUTDATED
+    - **comment**: Comment
+    - **return**: int
+        The output will contain count of successful saved audits
+    """
+    findings_query = detailed_finding_crud.query_detailed_findings_ids(db_connection, audit.findings_filter)
+    # A filter can match many findings, the batches are run outside of the event loop
+    audit_count = await run_in_threadpool(
+        audit_crud.create_audits_from_query,
+        db_connection,
+        findings_query,
+        auditor=request.user,
+        status=audit.status,
+        comment=audit.comment,
+    )
+
+    # Clear cache related to findings
+    await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_FINDING)
+    return audit_count
+
+
 @router.get(
     f"/{{finding_id}}{RWS_ROUTE_AUDIT}",
     response_model=PaginationModel[audit_schema.AuditRead],
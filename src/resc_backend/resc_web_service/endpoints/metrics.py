@@ -23,6 +23,7 @@ from resc_backend.constants import (
 )
 from resc_backend.resc_web_service.cache_manager import CacheManager
 from resc_backend.resc_web_service.crud import audit as audit_crud
+from resc_backend.resc_web_service.crud import audit_weekly_count as audit_weekly_count_crud
 from resc_backend.resc_web_service.crud import finding as finding_crud
 from resc_backend.resc_web_service.dependencies import get_db_connection
 from resc_backend.resc_web_service.schema.audit_count_over_time import (
@@ -36,7 +37,6 @@ from resc_backend.resc_web_service.schema.finding_status import FindingStatus
 from resc_backend.resc_web_service.schema.personal_audit_metrics import (
     PersonalAuditMetrics,
 )
-from resc_backend.resc_web_service.schema.time_period import TimePeriod
 from resc_backend.resc_web_service.schema.vcs_provider import VCSProviders
 
 router = APIRouter(prefix=f"{RWS_ROUTE_METRICS}", tags=[METRICS_TAG])
@@ -255,28 +255,14 @@ def get_personal_audit_metrics(
     - **return**: [DateCountModel]
         The output will contain a PersonalAuditMetrics type objects
     """
-    audit_counts = PersonalAuditMetrics()
-    audit_counts.today = audit_crud.get_personal_audit_count(
-        db_connection=db_connection, auditor=request.user, time_period=TimePeriod.DAY
-    )
-    audit_counts.current_week = audit_crud.get_personal_audit_count(
-        db_connection=db_connection, auditor=request.user, time_period=TimePeriod.WEEK
-    )
-    audit_counts.last_week = audit_crud.get_personal_audit_count(
-        db_connection=db_connection,
-        auditor=request.user,
-        time_period=TimePeriod.LAST_WEEK,
-    )
-    audit_counts.current_month = audit_crud.get_personal_audit_count(
-        db_connection=db_connection, auditor=request.user, time_period=TimePeriod.MONTH
-    )
-    audit_counts.current_year = audit_crud.get_personal_audit_count(
-        db_connection=db_connection, auditor=request.user, time_period=TimePeriod.YEAR
-    )
-    audit_counts.forever = audit_crud.get_personal_audit_count(
-        db_connection=db_connection,
-        auditor=request.user,
-        time_period=TimePeriod.FOREVER,
+    personal_counts = audit_crud.get_personal_audit_counts(db_connection=db_connection, auditor=request.user)
+    audit_counts = PersonalAuditMetrics(
+        today=personal_counts.today,
+        current_week=personal_counts.current_week,
+        last_week=personal_counts.last_week,
+        current_month=personal_counts.current_month,
+        current_year=personal_counts.current_year,
+        forever=personal_counts.forever,
     )
 
     ret = audit_crud.get_audit_stats_count(db_connection=db_connection, auditor=request.user)
@@ -312,16 +298,5 @@ def determine_audit_rank_current_week(auditor: str, db_connection: Session) -> i
     - **return**: int
         The output will be an integer nr of the ranking this week, defaulting to 0 if no audit was done by the auditor
     """
-    audit_rank = 0
-    audit_counts_db = audit_crud.get_audit_count_by_auditor_over_time(db_connection=db_connection, weeks=0)
-
-    auditor_counts = {}
-    for audit in audit_counts_db:
-        auditor_counts[getattr(audit, "auditor")] = getattr(audit, "audit_count")
-
-    sorted_auditor_counts = sorted(auditor_counts.items(), key=lambda x: x[1], reverse=True)
-    for auditor_count in dict(sorted_auditor_counts):
-        audit_rank += 1
-        if auditor_count == auditor:
-            return audit_rank
-    return 0
+    week_start = audit_weekly_count_crud.get_week_start(datetime.now(UTC))
+    return audit_weekly_count_crud.get_weekly_audit_rank(db_connection, auditor=auditor, week_start=week_start)
@@ -563,6 +563,7 @@ async def toggle_deleted_at_for_repository(
             db_connection, repository_ids=[repository_id], status=FindingStatus.NOT_ACCESSIBLE, not_status=None
         )
         audit_crud.revert_last_audit(db_connection, finding_ids=finding_ids, status=FindingStatus.NOT_ACCESSIBLE)
+        db_connection.commit()
 
     # Clear cache related to repository
     await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_REPOSITORY)
@@ -630,6 +631,7 @@ async def get_active_repositories_mark_rest_as_deleted(
     audit_crud.create_automated_audits(
         db_connection=db_connection, findings_ids=finding_ids, status=FindingStatus.NOT_ACCESSIBLE
     )
+    db_connection.commit()
 
     # Clear cache related to repository
     await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_REPOSITORY)
@@ -501,6 +501,7 @@ async def mark_rule_pack_as_outdated(
     audits = audit_crud.create_automated_audits(
         db_connection=db_connection, findings_ids=findings, status=FindingStatus.OUTDATED
     )
+    db_connection.commit()
 
     return {"audited": len(audits)}
 
@@ -3,42 +3,56 @@ import logging
 from typing import Annotated
 
 # Third Party
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from pydantic import StringConstraints
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # First Party
 from resc_backend.constants import (
-    CACHE_NAMESPACE_FINDING,
-    CACHE_NAMESPACE_RULE,
-    CACHE_NAMESPACE_RULE_PACK,
     DEFAULT_RECORDS_PER_PAGE_LIMIT,
     ERROR_MESSAGE_500,
     ERROR_MESSAGE_503,
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENCY_RETRY_AFTER,
+    IDEMPOTENT_REPLAYED_HEADER,
+    INGEST_CHUNK_SIZE,
+    INGEST_MAX_CHUNK_SIZE,
+    NDJSON_MEDIA_TYPE,
+    RWS_ROUTE_DELTA,
     RWS_ROUTE_DETECTED_RULES,
     RWS_ROUTE_FINDINGS,
+    RWS_ROUTE_INGEST_JOBS,
     RWS_ROUTE_SCANS,
+    RWS_ROUTE_STREAM,
+    RWS_VERSION_PREFIX,
     SCANS_TAG,
 )
-from resc_backend.db.model import DBfinding, DBscan, DBscanFinding
-from resc_backend.resc_web_service.cache_manager import CacheManager
+from resc_backend.db.model import DBingestRequest, DBscan
+from resc_backend.resc_web_service import ingestion
 from resc_backend.resc_web_service.crud import audit as audit_crud
 from resc_backend.resc_web_service.crud import finding as finding_crud
+from resc_backend.resc_web_service.crud import ingest_job as ingest_job_crud
 from resc_backend.resc_web_service.crud import repository as repository_crud
-from resc_backend.resc_web_service.crud import rule as rule_crud
 from resc_backend.resc_web_service.crud import scan as scan_crud
 from resc_backend.resc_web_service.crud import scan_finding as scan_finding_crud
 from resc_backend.resc_web_service.dependencies import get_db_connection
 from resc_backend.resc_web_service.filters import FindingsFilter
+from resc_backend.resc_web_service.helpers.ndjson import iterate_ndjson_chunks
+from resc_backend.resc_web_service.helpers.request_body import DecodedBodyRoute
 from resc_backend.resc_web_service.helpers.resc_swagger_models import Model400, Model404
+from resc_backend.resc_web_service.helpers.stage_timer import SERVER_TIMING_HEADER, StageTimer
+from resc_backend.resc_web_service.ingest_worker import FINDINGS_ADAPTER, ingest_worker_pool
 from resc_backend.resc_web_service.schema import finding as finding_schema
+from resc_backend.resc_web_service.schema import findings_delta as findings_delta_schema
+from resc_backend.resc_web_service.schema import ingest_job as ingest_job_schema
 from resc_backend.resc_web_service.schema import scan as scan_schema
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+from resc_backend.resc_web_service.schema.ingest_request_status import IngestRequestStatus
 from resc_backend.resc_web_service.schema.pagination_model import PaginationModel
 from resc_backend.resc_web_service.schema.scan_type import ScanType
 
-router = APIRouter(prefix=f"{RWS_ROUTE_SCANS}", tags=[SCANS_TAG])
+router = APIRouter(prefix=f"{RWS_ROUTE_SCANS}", tags=[SCANS_TAG], route_class=DecodedBodyRoute)
 logger = logging.getLogger(__name__)
 
 
@@ -114,6 +128,7 @@ def create_scan(scan: scan_schema.ScanCreate, db_connection: Session = Depends(g
             db_connection, repository_ids=[repository.id_], status=FindingStatus.NOT_ACCESSIBLE, not_status=None
         )
         audit_crud.revert_last_audit(db_connection, finding_ids=finding_ids, status=FindingStatus.NOT_ACCESSIBLE)
+        db_connection.commit()
 
     # Determine the increment number if needed and not supplied
     if scan.scan_type == ScanType.INCREMENTAL and (not scan.increment_number or scan.increment_number <= 0):
@@ -222,6 +237,77 @@ def delete_scan(scan_id: int, db_connection: Session = Depends(get_db_connection
     return {"ok": True}
 
 
+def _replay_ingest_request(
+    db_ingest_request: DBingestRequest, scan_id: int, request_digest: str, response: Response
+) -> int:
+    if db_ingest_request.scan_id != scan_id or db_ingest_request.request_digest != request_digest:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{IDEMPOTENCY_KEY_HEADER} was already used for another request",
+        )
+    logger.info(f"Replaying ingestion of scan {scan_id} for idempotency key {db_ingest_request.idempotency_key}")
+    response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
+    return db_ingest_request.created_findings
+
+
+def _reserve_ingest_request(
+    db_connection: Session, idempotency_key: str, scan_id: int, request_digest: str | None
+) -> DBingestRequest:
+    """
+        Reserve the idempotency key of a request before ingesting its findings
+        A retry of a request still in progress is answered with 409, it is expected to be sent again later.
+    :return: DBingestRequest
+        The reservation of this request, in progress, or the request recorded earlier with the same key, done
+    """
+    db_ingest_request = ingestion.reserve_ingest_request(
+        db_connection, idempotency_key=idempotency_key, scan_id=scan_id, request_digest=request_digest
+    )
+    if db_ingest_request is not None:
+        return db_ingest_request
+
+    db_ingest_request = ingestion.get_ingest_request(db_connection, idempotency_key=idempotency_key)
+    # The key may have been freed meanwhile by a failed request, it can be reserved by a retry
+    if db_ingest_request is None or db_ingest_request.status == IngestRequestStatus.IN_PROGRESS:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A request with the same {IDEMPOTENCY_KEY_HEADER} is in progress",
+            headers={"Retry-After": str(IDEMPOTENCY_RETRY_AFTER)},
+        )
+    return db_ingest_request
+
+
+def _commit_ingest_request(
+    db_connection: Session,
+    ingest_request_id: int | None,
+    request_digest: str,
+    created_findings: int,
+    timer: StageTimer,
+    response: Response,
+) -> int:
+    """
+        Record the result for the reserved idempotency key, if any, and commit the ingestion
+    :return: int
+        The number of findings linked to the scan
+    """
+    if ingest_request_id is not None and not ingestion.record_ingest_request(
+        db_connection=db_connection,
+        ingest_request_id=ingest_request_id,
+        request_digest=request_digest,
+        created_findings=created_findings,
+        timer=timer,
+    ):
+        # The reservation was considered abandoned and the key reserved by a retry, which ingests the findings
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A request with the same {IDEMPOTENCY_KEY_HEADER} is in progress",
+            headers={"Retry-After": str(IDEMPOTENCY_RETRY_AFTER)},
+        )
+
+    ingestion.commit_scan_findings(db_connection=db_connection, timer=timer)
+    response.headers[SERVER_TIMING_HEADER] = timer.server_timing()
+    return created_findings
+
+
 @router.post(
     f"/{{scan_id}}{RWS_ROUTE_FINDINGS}",
     response_model=int,
@@ -229,6 +315,8 @@ def delete_scan(scan_id: int, db_connection: Session = Depends(get_db_connection
     status_code=status.HTTP_201_CREATED,
     responses={
         201: {"description": "Create findings and their associated scan_findings for scan <scan_id>"},
+        409: {"description": f"A request with the same {IDEMPOTENCY_KEY_HEADER} is in progress, retry later"},
+        422: {"description": f"The {IDEMPOTENCY_KEY_HEADER} was already used for another request"},
         500: {"description": ERROR_MESSAGE_500},
         503: {"description": ERROR_MESSAGE_503},
     },
@@ -236,13 +324,21 @@ def delete_scan(scan_id: int, db_connection: Session = Depends(get_db_connection
 async def create_scan_findings(
     scan_id: int,
     findings: list[finding_schema.FindingCreate],
+    request: Request,
+    response: Response,
+    idempotency_key: Annotated[str | None, Header(alias=IDEMPOTENCY_KEY_HEADER, max_length=255)] = None,
     db_connection: Session = Depends(get_db_connection),
 ) -> int:
     """
         Creates findings and their associated scan_findings for a given scan
+        All the changes are committed at once, the time spent per stage is returned in the Server-Timing header.
+        A request retried with the same Idempotency-Key header returns the recorded result without ingesting
+        the findings again, the Idempotent-Replayed header is then set.
+        A retry sent while the first request is still in progress is answered with 409 and a Retry-After header.
 
     - **db_connection**: Session of the database connection
     - **scan_id**:  Id of the scan for which findings need to be inserted
+    - **idempotency_key**: Optional key, unique per upload, identifying the retries of a request
     - **file_path**: file path
     - **line_number**: Line number
     - **column_start**: Column start
@@ -263,69 +359,368 @@ async def create_scan_findings(
         or an empty list if no scan was found
     """
 
-    db_scan: DBscan = scan_crud.get_scan(db_connection, scan_id=scan_id)
-    if db_scan is None:
-        raise HTTPException(status_code=404, detail="Scan not found")
+    request_digest = ingestion.RequestDigest(scan_id=scan_id)
+    ingest_request_id = None
+    if idempotency_key:
+        request_digest.update(await request.body())
+        db_ingest_request = _reserve_ingest_request(
+            db_connection, idempotency_key=idempotency_key, scan_id=scan_id, request_digest=request_digest.hexdigest()
+        )
+        if db_ingest_request.status == IngestRequestStatus.DONE:
+            return _replay_ingest_request(
+                db_ingest_request, scan_id=scan_id, request_digest=request_digest.hexdigest(), response=response
+            )
+        ingest_request_id = db_ingest_request.id_
+
+    with ingestion.release_ingest_request_on_failure(db_connection, ingest_request_id=ingest_request_id):
+        db_scan: DBscan = scan_crud.get_scan(db_connection, scan_id=scan_id)
+        if db_scan is None:
+            raise HTTPException(status_code=404, detail="Scan not found")
+
+        timer = StageTimer(f"create_scan_findings scan {scan_id}")
+
+        # 1. Fetch rules with scan_as_dir
+        rules_scan_as_dir = ingestion.get_rules_scan_as_dir(db_connection=db_connection, scan_id=scan_id, timer=timer)
+
+        # 2. - 6. Create the findings and link them to the scan.
+        created_findings = ingestion.create_and_link_findings(
+            db_connection=db_connection,
+            scan_id=scan_id,
+            rules_scan_as_dir=rules_scan_as_dir,
+            findings=findings,
+            timer=timer,
+        )
 
-    # 1. Fetch rules with scan_as_dir
-    rules_scan_as_dir: list[str] = rule_crud.get_scan_as_dir_rules_by_scan_id(
-        db_connection=db_connection, scan_id=scan_id
-    )
-    logger.debug(f"rules as directory: {', '.join(rules_scan_as_dir)}")
-
-    # 2. split findings into 2 category: scan_as_dir and normal.
-    findings_as_repo = []
-    findings_as_dir = []
-    for finding in findings:
-        (findings_as_dir if finding.rule_name in rules_scan_as_dir else findings_as_repo).append(finding)
-    logger.debug(f"number of findings scan as directory: {len(findings_as_dir)}")
-    logger.debug(f"number of findings scan as repo: {len(findings_as_repo)}")
-
-    # 3. Process normal as previously done.
-    created_findings: list[DBfinding] = finding_crud.create_findings(
-        db_connection=db_connection, findings=findings_as_repo
-    )
-    # 4. Process scan_as_dir with updates.
-    created_dir_findings: list[DBfinding] = finding_crud.create_or_update_findings(
-        db_connection=db_connection, findings=findings_as_dir
+        # 7. - 9. Update the outdated status of the findings of the repository.
+        ingestion.mark_outdated_findings(
+            db_connection=db_connection,
+            db_scan=db_scan,
+            created_findings_ids=[finding.id_ for finding in created_findings],
+            timer=timer,
+        )
+
+        created_findings_count = _commit_ingest_request(
+            db_connection=db_connection,
+            ingest_request_id=ingest_request_id,
+            request_digest=request_digest.hexdigest(),
+            created_findings=len(created_findings),
+            timer=timer,
+            response=response,
+        )
+
+    await ingestion.clear_scan_findings_cache(
+        cache_tags=ingestion.get_scan_cache_tags(db_connection=db_connection, scan_id=scan_id)
     )
 
-    created_findings.extend(created_dir_findings)
-    # 5. Add link between findings and scan
-    scan_findings: list[DBscanFinding] = []
-    for finding in created_findings:
-        scan_finding = DBscanFinding(finding_id=finding.id_, scan_id=scan_id)
-        scan_findings.append(scan_finding)
+    return created_findings_count
+
 
-    # 6. merge.
-    _ = scan_finding_crud.create_scan_findings(db_connection=db_connection, scan_findings=scan_findings)
+@router.post(
+    f"/{{scan_id}}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}",
+    response_model=int,
+    summary="Create scan findings from a NDJSON stream",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"description": "Create findings and their associated scan_findings for scan <scan_id>"},
+        404: {"model": Model404, "description": "Scan <scan_id> not found"},
+        413: {"description": "A line of the body exceeds the maximum line size"},
+        415: {"description": f"The body is not of type {NDJSON_MEDIA_TYPE}"},
+        409: {"description": f"A request with the same {IDEMPOTENCY_KEY_HEADER} is in progress, retry later"},
+        422: {"description": f"The {IDEMPOTENCY_KEY_HEADER} was already used for another request"},
+        500: {"description": ERROR_MESSAGE_500},
+        503: {"description": ERROR_MESSAGE_503},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {
+                        "type": "string",
+                        "description": "One JSON encoded FindingCreate object per line",
+                    }
+                }
+            },
+        }
+    },
+)
+async def create_scan_findings_stream(
+    scan_id: int,
+    request: Request,
+    response: Response,
+    chunk_size: int = Query(default=INGEST_CHUNK_SIZE, ge=1, le=INGEST_MAX_CHUNK_SIZE),
+    idempotency_key: Annotated[str | None, Header(alias=IDEMPOTENCY_KEY_HEADER, max_length=255)] = None,
+    db_connection: Session = Depends(get_db_connection),
+) -> int:
+    """
+        Creates findings and their associated scan_findings for a given scan from a newline delimited JSON body
+        The body is parsed, validated and stored in chunks, the memory used is bound by the chunk size.
+        All the changes are committed at once, an invalid line discards the whole body.
+        The time spent per stage is returned in the Server-Timing header.
+        A request retried with the same Idempotency-Key header returns the recorded result, its body is only
+        read to verify the digest. A retry sent while the first request is still in progress is answered with 409.
 
-    # 7. Mark old scan_as_dir findings as outdated.
-    findings_to_audit: list[int] = finding_crud.get_findings_from_repo_of_scan_as_dir(
-        db_connection=db_connection, scan=db_scan
+    - **db_connection**: Session of the database connection
+    - **scan_id**:  Id of the scan for which findings need to be inserted
+    - **chunk_size**: Amount of findings validated and stored at once
+    - **idempotency_key**: Optional key, unique per upload, identifying the retries of a request
+    - **body**: One FindingCreate object per line, see POST /scans/{scan_id}/findings for the fields
+    - **return**: int
+        The output will contain the number of findings linked to the scan
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type != NDJSON_MEDIA_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=f"Expected content type {NDJSON_MEDIA_TYPE}"
+        )
+
+    request_digest = ingestion.RequestDigest(scan_id=scan_id)
+    ingest_request_id = None
+    if idempotency_key:
+        # The digest of the body is only known once read, it is recorded with the result
+        db_ingest_request = _reserve_ingest_request(
+            db_connection, idempotency_key=idempotency_key, scan_id=scan_id, request_digest=None
+        )
+        if db_ingest_request.status == IngestRequestStatus.DONE:
+            async for _ in request_digest.digest_stream(request.stream()):
+                pass
+            return _replay_ingest_request(
+                db_ingest_request, scan_id=scan_id, request_digest=request_digest.hexdigest(), response=response
+            )
+        ingest_request_id = db_ingest_request.id_
+
+    with ingestion.release_ingest_request_on_failure(db_connection, ingest_request_id=ingest_request_id):
+        db_scan: DBscan = scan_crud.get_scan(db_connection, scan_id=scan_id)
+        if db_scan is None:
+            raise HTTPException(status_code=404, detail="Scan not found")
+
+        timer = StageTimer(f"create_scan_findings_stream scan {scan_id}")
+
+        rules_scan_as_dir = ingestion.get_rules_scan_as_dir(db_connection=db_connection, scan_id=scan_id, timer=timer)
+
+        # Only the ids are kept between the chunks, they are needed to clear the outdated status.
+        # A finding repeated in several chunks is counted once.
+        created_findings_ids: dict[int, None] = {}
+        byte_stream = request_digest.digest_stream(request.stream())
+        async for findings in iterate_ndjson_chunks(byte_stream, finding_schema.FindingCreate, chunk_size):
+            created_findings = ingestion.create_and_link_findings(
+                db_connection=db_connection,
+                scan_id=scan_id,
+                rules_scan_as_dir=rules_scan_as_dir,
+                findings=findings,
+                timer=timer,
+            )
+            created_findings_ids.update(dict.fromkeys(finding.id_ for finding in created_findings))
+            # Release the ORM objects of the chunk, their changes are flushed already.
+            db_connection.expunge_all()
+
+        ingestion.mark_outdated_findings(
+            db_connection=db_connection,
+            db_scan=db_scan,
+            created_findings_ids=list(created_findings_ids),
+            timer=timer,
+        )
+
+        created_findings_count = _commit_ingest_request(
+            db_connection=db_connection,
+            ingest_request_id=ingest_request_id,
+            request_digest=request_digest.hexdigest(),
+            created_findings=len(created_findings_ids),
+            timer=timer,
+            response=response,
+        )
+
+    await ingestion.clear_scan_findings_cache(
+        cache_tags=ingestion.get_scan_cache_tags(db_connection=db_connection, scan_id=scan_id)
     )
-    audit_crud.create_automated_audits(
-        db_connection=db_connection, findings_ids=findings_to_audit, status=FindingStatus.OUTDATED
+
+    return created_findings_count
+
+
+@router.post(
+    f"/{{scan_id}}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}",
+    response_model=int,
+    summary="Create scan findings from the findings of its parent scan",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"description": "Link the findings of the parent scan, updated by the delta, to scan <scan_id>"},
+        400: {"model": Model400, "description": "The scan is not incremental or the parent scan is invalid"},
+        404: {"model": Model404, "description": "Scan <scan_id> not found"},
+        409: {"description": f"A request with the same {IDEMPOTENCY_KEY_HEADER} is in progress, retry later"},
+        422: {"description": f"The {IDEMPOTENCY_KEY_HEADER} was already used for another request"},
+        500: {"description": ERROR_MESSAGE_500},
+        503: {"description": ERROR_MESSAGE_503},
+    },
+)
+async def create_scan_findings_delta(
+    scan_id: int,
+    delta: findings_delta_schema.FindingsDelta,
+    request: Request,
+    response: Response,
+    idempotency_key: Annotated[str | None, Header(alias=IDEMPOTENCY_KEY_HEADER, max_length=255)] = None,
+    db_connection: Session = Depends(get_db_connection),
+) -> int:
+    """
+        Links the findings of an incremental scan as a delta of the findings of its parent scan
+        The links of the parent scan are copied inside the database, the removed findings are unlinked
+        and the added findings are created and linked like in POST /scans/{scan_id}/findings.
+        All the changes are committed at once, the time spent per stage is returned in the Server-Timing header.
+
+    - **db_connection**: Session of the database connection
+    - **scan_id**:  Id of the incremental scan for which findings need to be linked
+    - **parent_scan_id**: Id of the previous scan of the same repository the delta is relative to
+    - **added**: FindingCreate objects reported by the scan and not by the parent scan
+    - **removed**: Long fingerprints of the findings of the parent scan no longer reported
+    - **idempotency_key**: Optional key, unique per upload, identifying the retries of a request
+    - **return**: int
+        The output will contain the number of findings linked to the scan
+    """
+    request_digest = ingestion.RequestDigest(scan_id=scan_id)
+    ingest_request_id = None
+    if idempotency_key:
+        request_digest.update(await request.body())
+        db_ingest_request = _reserve_ingest_request(
+            db_connection, idempotency_key=idempotency_key, scan_id=scan_id, request_digest=request_digest.hexdigest()
+        )
+        if db_ingest_request.status == IngestRequestStatus.DONE:
+            return _replay_ingest_request(
+                db_ingest_request, scan_id=scan_id, request_digest=request_digest.hexdigest(), response=response
+            )
+        ingest_request_id = db_ingest_request.id_
+
+    with ingestion.release_ingest_request_on_failure(db_connection, ingest_request_id=ingest_request_id):
+        db_scan: DBscan = scan_crud.get_scan(db_connection, scan_id=scan_id)
+        if db_scan is None:
+            raise HTTPException(status_code=404, detail="Scan not found")
+        if db_scan.scan_type != ScanType.INCREMENTAL:
+            raise HTTPException(status_code=400, detail="Delta ingestion is only supported for incremental scans")
+        db_parent_scan: DBscan = scan_crud.get_scan(db_connection, scan_id=delta.parent_scan_id)
+        if (
+            db_parent_scan is None
+            or db_parent_scan.id_ == db_scan.id_
+            or db_parent_scan.repository_id != db_scan.repository_id
+        ):
+            raise HTTPException(status_code=400, detail="Parent scan must be another scan of the same repository")
+
+        timer = StageTimer(f"create_scan_findings_delta scan {scan_id} parent {delta.parent_scan_id}")
+
+        rules_scan_as_dir = ingestion.get_rules_scan_as_dir(db_connection=db_connection, scan_id=scan_id, timer=timer)
+
+        # The removed findings are unlinked before linking the added ones, a finding reported again stays linked.
+        ingestion.copy_parent_scan_findings(
+            db_connection=db_connection,
+            db_scan=db_scan,
+            parent_scan_id=delta.parent_scan_id,
+            removed_fingerprints=delta.removed,
+            timer=timer,
+        )
+        ingestion.create_and_link_findings(
+            db_connection=db_connection,
+            scan_id=scan_id,
+            rules_scan_as_dir=rules_scan_as_dir,
+            findings=delta.added,
+            timer=timer,
+        )
+
+        # The copied findings may have been marked outdated since the parent scan, all the linked findings are cleared.
+        linked_findings_ids = scan_finding_crud.get_scan_findings_ids(db_connection, scan_id=scan_id)
+        ingestion.mark_outdated_findings(
+            db_connection=db_connection,
+            db_scan=db_scan,
+            created_findings_ids=linked_findings_ids,
+            timer=timer,
+        )
+
+        created_findings_count = _commit_ingest_request(
+            db_connection=db_connection,
+            ingest_request_id=ingest_request_id,
+            request_digest=request_digest.hexdigest(),
+            created_findings=len(linked_findings_ids),
+            timer=timer,
+            response=response,
+        )
+
+    await ingestion.clear_scan_findings_cache(
+        cache_tags=ingestion.get_scan_cache_tags(db_connection=db_connection, scan_id=scan_id)
     )
 
-    # 8. Mark findings which are no longer in rule pack (i.e. rule name not in current rule pack) as outdated
-    old_findings_to_audit: list[int] = finding_crud.get_untriaged_finding_outdated_for_current_scan(
-        db_connection=db_connection, scan=db_scan
+    return created_findings_count
+
+
+@router.post(
+    f"/{{scan_id}}{RWS_ROUTE_INGEST_JOBS}",
+    response_model=ingest_job_schema.IngestJobRead,
+    summary="Queue scan findings for asynchronous ingestion",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        202: {"description": "The findings of scan <scan_id> are queued, the ingest job is returned"},
+        404: {"model": Model404, "description": "Scan <scan_id> not found"},
+        500: {"description": ERROR_MESSAGE_500},
+        503: {"description": ERROR_MESSAGE_503},
+    },
+)
+def create_scan_ingest_job(
+    scan_id: int,
+    findings: list[finding_schema.FindingCreate],
+    response: Response,
+    db_connection: Session = Depends(get_db_connection),
+) -> ingest_job_schema.IngestJobRead:
+    """
+        Stages findings for a given scan, they are created and linked to the scan by the ingest workers
+        The request returns as soon as the findings are stored, the ingest job reports the progress.
+
+    - **db_connection**: Session of the database connection
+    - **scan_id**:  Id of the scan for which findings need to be inserted
+    - **findings**: FindingCreate objects, see POST /scans/{scan_id}/findings for the fields
+    - **return**: IngestJobRead
+        The output will contain the queued ingest job, its location is returned in the Location header
+    """
+    db_scan: DBscan = scan_crud.get_scan(db_connection, scan_id=scan_id)
+    if db_scan is None:
+        raise HTTPException(status_code=404, detail="Scan not found")
+
+    db_ingest_job = ingest_job_crud.create_ingest_job(
+        db_connection,
+        scan_id=scan_id,
+        payload=FINDINGS_ADAPTER.dump_json(findings).decode(),
+        total_findings=len(findings),
     )
-    audit_crud.create_automated_audits(
-        db_connection=db_connection, findings_ids=old_findings_to_audit, status=FindingStatus.OUTDATED
+    ingest_worker_pool.notify()
+
+    response.headers["Location"] = (
+        f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_INGEST_JOBS}/{db_ingest_job.id_}"
     )
+    return db_ingest_job
 
-    created_findings_ids = [finding.id_ for finding in created_findings]
-    # 9. Mark active findings as no longer outdated
-    audit_crud.clear_outdated_no_longer_outdated(db_connection=db_connection, findings_ids=created_findings_ids)
 
-    # Clear cache related to findings
-    await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_FINDING)
-    await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_RULE)
-    await CacheManager.clear_cache_by_namespace(namespace=CACHE_NAMESPACE_RULE_PACK)
+@router.get(
+    f"/{{scan_id}}{RWS_ROUTE_INGEST_JOBS}/{{ingest_job_id}}",
+    response_model=ingest_job_schema.IngestJobRead,
+    summary="Fetch an ingest job of a scan",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Retrieve the ingest job <ingest_job_id> of scan <scan_id>"},
+        404: {"model": Model404, "description": "Ingest job <ingest_job_id> of scan <scan_id> not found"},
+        500: {"description": ERROR_MESSAGE_500},
+        503: {"description": ERROR_MESSAGE_503},
+    },
+)
+def read_scan_ingest_job(
+    scan_id: int, ingest_job_id: int, db_connection: Session = Depends(get_db_connection)
+) -> ingest_job_schema.IngestJobRead:
+    """
+        Retrieve the status and progress of an ingest job
 
-    return len(created_findings)
+    - **db_connection**: Session of the database connection
+    - **scan_id**: Id of the scan of the ingest job
+    - **ingest_job_id**: Id of the ingest job
+    - **return**: IngestJobRead
+        The output will contain the ingest job, processed_findings reports the progress of a RUNNING job
+    """
+    db_ingest_job = ingest_job_crud.get_ingest_job(db_connection, ingest_job_id=ingest_job_id)
+    if db_ingest_job is None or db_ingest_job.scan_id != scan_id:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return db_ingest_job
 
 
 @router.get(
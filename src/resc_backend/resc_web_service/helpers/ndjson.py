@@ -0,0 +1,79 @@
+# Standard Library
+from collections.abc import AsyncIterator
+from typing import TypeVar
+
+# Third Party
+from fastapi import HTTPException, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+# First Party
+from resc_backend.constants import NDJSON_MAX_LINE_SIZE
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def _parse_line(model: type[Model], line: bytes, line_number: int) -> Model | None:
+    """
+        Validate a single NDJSON line into the given model
+    :param model:
+        pydantic model to validate the line with
+    :param line:
+        raw line, without the line separator
+    :param line_number:
+        1-based position of the line in the body, used to report validation errors
+    :return: Model | None
+        The validated object, or None for a blank line
+    """
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return model.model_validate_json(line)
+    except ValidationError as err:
+        errors = [{**error, "loc": ("body", line_number, *error["loc"])} for error in err.errors()]
+        raise RequestValidationError(errors) from err
+
+
+async def iterate_ndjson_chunks(
+    byte_stream: AsyncIterator[bytes], model: type[Model], chunk_size: int
+) -> AsyncIterator[list[Model]]:
+    """
+        Incrementally parse and validate a newline delimited JSON body
+        Only the current chunk of validated objects and the last incomplete line are held in memory.
+    :param byte_stream:
+        asynchronous iterator over the raw body, for example Request.stream()
+    :param model:
+        pydantic model every line is validated with
+    :param chunk_size:
+        maximum amount of objects yielded at once
+    :return: AsyncIterator[list[Model]]
+        Lists of at most chunk_size validated objects, in the order of the body
+    """
+    buffer = b""
+    line_number = 0
+    chunk: list[Model] = []
+    async for data in byte_stream:
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            item = _parse_line(model, line, line_number)
+            if item is None:
+                continue
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if len(buffer) > NDJSON_MAX_LINE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Line {line_number + 1} exceeds the maximum size of {NDJSON_MAX_LINE_SIZE} bytes",
+            )
+
+    # The last line is not required to be terminated by a line separator
+    item = _parse_line(model, buffer, line_number + 1)
+    if item is not None:
+        chunk.append(item)
+    if chunk:
+        yield chunk
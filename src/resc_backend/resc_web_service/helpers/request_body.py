@@ -0,0 +1,167 @@
+# Standard Library
+import zlib
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+# Third Party
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers
+
+# First Party
+from resc_backend.constants import (
+    CONTENT_ENCODING_GZIP,
+    CONTENT_ENCODING_IDENTITY,
+    CONTENT_ENCODING_ZSTD,
+    INGEST_MAX_DECOMPRESSED_SIZE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPES,
+)
+
+# Optional dependencies, the related encodings are rejected with 415 when they are not installed
+try:
+    # Third Party
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    # Third Party
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+# zstandard does not bound the output of a single call, the input is fed in slices small enough
+# for the output of a slice to stay reasonable even for a maliciously crafted body
+ZSTD_INPUT_SLICE_SIZE = 1024
+
+
+def supported_content_encodings() -> list[str]:
+    encodings = [CONTENT_ENCODING_GZIP]
+    if zstandard is not None:
+        encodings.append(CONTENT_ENCODING_ZSTD)
+    return encodings
+
+
+def _create_decompressor(content_encoding: str) -> Any:
+    if content_encoding == CONTENT_ENCODING_GZIP:
+        return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    if content_encoding == CONTENT_ENCODING_ZSTD and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail=f"Unsupported content encoding {content_encoding}, "
+        f"supported are: {', '.join(supported_content_encodings())}",
+    )
+
+
+def _decompress(decompressor: Any, data: bytes, max_length: int) -> bytes:
+    """
+        Decompress a chunk of a body, without producing more than the given length
+    :param decompressor:
+        decompressor of the content encoding, see _create_decompressor
+    :param data:
+        compressed chunk
+    :param max_length:
+        number of bytes the chunk may decompress to
+    :return: bytes
+        The decompressed chunk
+    """
+    if hasattr(decompressor, "unconsumed_tail"):
+        # zlib stops at max_length + 1 bytes, the input left is not needed as the body is rejected anyway
+        chunk = decompressor.decompress(data, max_length + 1)
+    else:
+        parts, length = [], 0
+        for start in range(0, len(data), ZSTD_INPUT_SLICE_SIZE):
+            parts.append(decompressor.decompress(data[start : start + ZSTD_INPUT_SLICE_SIZE]))
+            length += len(parts[-1])
+            if length > max_length:
+                break
+        chunk = b"".join(parts)
+    if len(chunk) > max_length:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="The decompressed body is too large"
+        )
+    return chunk
+
+
+class DecodedBodyRequest(Request):
+    """
+    Request decoding its body according to the Content-Encoding header: gzip, and zstd when installed.
+    A MessagePack body is exposed as the JSON body of the request, its objects are validated without
+    an intermediate JSON document.
+    A body decompressing to more than max_decompressed_size bytes is rejected with 413.
+    """
+
+    max_decompressed_size = INGEST_MAX_DECOMPRESSED_SIZE
+
+    def __init__(self, scope, receive):
+        super().__init__(scope, receive)
+        content_encodings = [
+            encoding.strip().lower() for encoding in self.headers.get("content-encoding", "").split(",")
+        ]
+        self._content_encodings = [
+            encoding for encoding in content_encodings if encoding and encoding != CONTENT_ENCODING_IDENTITY
+        ]
+
+        content_type = self.headers.get("content-type", "").split(";")[0].strip().lower()
+        self._is_msgpack = content_type in MSGPACK_MEDIA_TYPES
+        if self._is_msgpack:
+            if msgpack is None:
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail=f"Content type {content_type} is not supported by this instance",
+                )
+            # The request handler only decodes a JSON body, json() returns the MessagePack content instead
+            raw_headers = [(key, value) for key, value in self.headers.raw if key != b"content-type"]
+            self._headers = Headers(raw=[*raw_headers, (b"content-type", JSON_MEDIA_TYPE.encode())])
+
+    async def stream(self) -> AsyncGenerator[bytes, None]:
+        if hasattr(self, "_body") or not self._content_encodings:
+            async for chunk in super().stream():
+                yield chunk
+            return
+
+        # Content codings are listed in the order they were applied
+        decompressors = [_create_decompressor(encoding) for encoding in reversed(self._content_encodings)]
+        # Bytes produced so far by each decompressor
+        sizes = [0] * len(decompressors)
+        try:
+            async for chunk in super().stream():
+                for index, decompressor in enumerate(decompressors):
+                    chunk = _decompress(decompressor, chunk, self.max_decompressed_size - sizes[index])
+                    sizes[index] += len(chunk)
+                if chunk:
+                    yield chunk
+            chunk = b""
+            for index, decompressor in enumerate(decompressors):
+                chunk = _decompress(decompressor, chunk, self.max_decompressed_size - sizes[index])
+                if hasattr(decompressor, "flush"):
+                    chunk += decompressor.flush()
+                if not getattr(decompressor, "eof", True):
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Truncated compressed body")
+            if chunk:
+                yield chunk
+        except (zlib.error, getattr(zstandard, "ZstdError", zlib.error)) as err:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid compressed body") from err
+
+    async def json(self) -> Any:
+        if not self._is_msgpack:
+            return await super().json()
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+class DecodedBodyRoute(APIRoute):
+    """
+    Route handling compressed and MessagePack request bodies, see DecodedBodyRequest
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def decoded_body_route_handler(request: Request) -> Response:
+            return await original_route_handler(DecodedBodyRequest(request.scope, request.receive))
+
+        return decoded_body_route_handler
@@ -0,0 +1,60 @@
+# Standard Library
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+@dataclass
+class Stage:
+    name: str
+    duration: float = 0.0
+    rows: int = 0
+
+
+class StageTimer:
+    """
+    Record the wall time and the number of rows handled by the stages of a request
+    A stage entered multiple times, for example once per chunk, accumulates its duration and rows.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: dict[str, Stage] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """
+            Time the enclosed block as the given stage
+        :param name:
+            name of the stage, reported as metric name in the Server-Timing header
+        :return: Iterator[Stage]
+            The stage, its rows attribute is to be increased by the enclosed block
+        """
+        stage = self.stages.setdefault(name, Stage(name=name))
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.duration += time.perf_counter() - start
+
+    def server_timing(self) -> str:
+        """
+            Format the stages as a Server-Timing header value, durations are in milliseconds
+        :return: str
+            For example: create_findings;dur=12.3;desc="rows=100", link_findings;dur=4.5;desc="rows=100"
+        """
+        return ", ".join(
+            f'{stage.name};dur={stage.duration * 1000:.1f};desc="rows={stage.rows}"' for stage in self.stages.values()
+        )
+
+    def log(self) -> None:
+        stages = " | ".join(
+            f"{stage.name}: {stage.duration * 1000:.2f}ms {stage.rows} rows" for stage in self.stages.values()
+        )
+        logger.info(f"{self.name} stages => {stages}")
@@ -0,0 +1,275 @@
+# Standard Library
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+# Third Party
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.constants import (
+    FINDING_WEEKLY_SNAPSHOT_INTERVAL,
+    FINDING_WEEKLY_SNAPSHOT_WEEKS,
+    INGEST_CHUNK_SIZE,
+    INGEST_JOB_POLL_INTERVAL,
+    INGEST_JOB_TIMEOUT,
+    INGEST_REQUEST_CLEANUP_INTERVAL,
+)
+from resc_backend.resc_web_service import ingestion
+from resc_backend.resc_web_service.crud import finding_weekly_snapshot as finding_weekly_snapshot_crud
+from resc_backend.resc_web_service.crud import ingest_job as ingest_job_crud
+from resc_backend.resc_web_service.crud import scan as scan_crud
+from resc_backend.resc_web_service.helpers.stage_timer import StageTimer
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+
+logger = logging.getLogger(__name__)
+
+FINDINGS_ADAPTER = TypeAdapter(list[FindingCreate])
+
+
+class IngestJobClaimLostError(Exception):
+    """
+    The ingest job was queued again while its worker applied it, the ingestion is rolled back
+    """
+
+
+class IngestWorkerPool:
+    """
+    Bounded pool of in-process workers applying the staged ingest jobs
+    The jobs are claimed from the database, multiple instances of the web service can share the queue.
+    The workers run the periodic maintenance as well, apart from the requests: they delete the expired idempotency
+    keys and store the finding counts of the closed weeks.
+    """
+
+    def __init__(self):
+        self._executor: ThreadPoolExecutor | None = None
+        self._session_factory: Callable[[], Session] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake_up = threading.Event()
+        self._stopping = threading.Event()
+        self._periodic_lock = threading.Lock()
+        self._next_periodic_runs: dict[str, float] = {}
+
+    def start(
+        self, workers: int, session_factory: Callable[[], Session], loop: asyncio.AbstractEventLoop | None = None
+    ) -> None:
+        """
+            Start the workers
+        :param workers:
+            number of jobs applied concurrently, 0 disables the workers of this instance
+        :param session_factory:
+            callable returning a new database session
+        :param loop:
+            event loop of the web service, used to clear the cache once a job is done
+        """
+        self._session_factory = session_factory
+        self._loop = loop
+        if workers < 1:
+            logger.info("Ingest workers are disabled")
+            return
+        self._stopping.clear()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resc-ingest")
+        for _ in range(workers):
+            self._executor.submit(self._run)
+        logger.info(f"Started {workers} ingest worker(s)")
+
+    def notify(self) -> None:
+        """
+        Wake up an idle worker, called after queueing a job
+        """
+        self._wake_up.set()
+
+    def stop(self) -> None:
+        """
+        Stop the workers, waiting for the jobs being applied
+        """
+        if self._executor is None:
+            return
+        self._stopping.set()
+        self._wake_up.set()
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.delete_expired_ingest_requests()
+            self.finalize_finding_weekly_snapshots()
+            try:
+                processed = self.process_next_job()
+            except Exception as err:
+                logger.error(f"Ingest worker failed to process a job: {err}")
+                processed = False
+            if not processed:
+                self._wake_up.wait(timeout=INGEST_JOB_POLL_INTERVAL)
+                self._wake_up.clear()
+
+    def delete_expired_ingest_requests(self) -> None:
+        """
+        Delete the expired idempotency keys, at most once per INGEST_REQUEST_CLEANUP_INTERVAL per instance
+        """
+        self._run_periodically(
+            "delete the expired ingest requests",
+            interval=INGEST_REQUEST_CLEANUP_INTERVAL,
+            task=ingestion.delete_expired_ingest_requests,
+        )
+
+    def finalize_finding_weekly_snapshots(self) -> None:
+        """
+        Store the finding counts of the closed weeks, at most once per FINDING_WEEKLY_SNAPSHOT_INTERVAL per instance
+        """
+        self._run_periodically(
+            "store the finding weekly snapshots",
+            interval=FINDING_WEEKLY_SNAPSHOT_INTERVAL,
+            task=lambda db_connection: finding_weekly_snapshot_crud.finalize_finding_weekly_snapshots(
+                db_connection, weeks=FINDING_WEEKLY_SNAPSHOT_WEEKS
+            ),
+        )
+
+    def _run_periodically(self, name: str, interval: float, task: Callable[[Session], object]) -> None:
+        """
+            Run a maintenance task in its own session, unless it ran less than interval seconds ago
+        :param name:
+            description of the task, in the log
+        :param interval:
+            minimum number of seconds between two runs of the task by this instance
+        :param task:
+            callable given a new database session
+        """
+        with self._periodic_lock:
+            if time.monotonic() < self._next_periodic_runs.get(name, 0.0):
+                return
+            self._next_periodic_runs[name] = time.monotonic() + interval
+        try:
+            with self._session_factory() as db_connection:
+                task(db_connection)
+        except Exception as err:
+            logger.warning(f"Unable to {name}: {err}")
+
+    def process_next_job(self) -> bool:
+        """
+            Claim and apply the oldest pending ingest job
+        :return: bool
+            True if a job was processed, False if no job is pending
+        """
+        with self._session_factory() as job_session:
+            ingest_job_crud.requeue_abandoned_ingest_jobs(
+                job_session, heartbeat_before=datetime.now(UTC) - timedelta(seconds=INGEST_JOB_TIMEOUT)
+            )
+            db_ingest_job = ingest_job_crud.claim_ingest_job(job_session)
+            if db_ingest_job is None:
+                return False
+            ingest_job_id = db_ingest_job.id_
+            started_at = db_ingest_job.started_at
+            scan_id = db_ingest_job.scan_id
+            payload = db_ingest_job.payload
+
+        try:
+            created_findings = self._ingest(ingest_job_id, started_at=started_at, scan_id=scan_id, payload=payload)
+        except IngestJobClaimLostError:
+            logger.warning(f"Ingest job {ingest_job_id} for scan {scan_id} was queued again, ingestion rolled back")
+            return True
+        except Exception as err:
+            logger.error(f"Ingest job {ingest_job_id} for scan {scan_id} failed: {err}")
+            with self._session_factory() as job_session:
+                ingest_job_crud.fail_ingest_job(
+                    job_session, ingest_job_id=ingest_job_id, started_at=started_at, error=str(err)
+                )
+            return True
+
+        with self._session_factory() as job_session:
+            ingest_job_crud.finish_ingest_job(
+                job_session, ingest_job_id=ingest_job_id, started_at=started_at, created_findings=created_findings
+            )
+        self._clear_cache(scan_id)
+        return True
+
+    def _ingest(self, ingest_job_id: int, started_at: datetime, scan_id: int, payload: str) -> int:
+        """
+            Apply the ingestion pipeline of POST /scans/{scan_id}/findings to the staged findings
+            A heartbeat is sent after each chunk and before the last stages, the ingestion is aborted once the job
+            was queued again.
+        :param ingest_job_id:
+            id of the ingest job
+        :param started_at:
+            start of the claim of the worker
+        :param scan_id:
+            id of the scan the findings belong to
+        :param payload:
+            JSON encoded list of FindingCreate objects
+        :return: int
+            The number of findings linked to the scan
+        """
+        findings = FINDINGS_ADAPTER.validate_json(payload)
+        timer = StageTimer(f"ingest job {ingest_job_id} scan {scan_id}")
+
+        with self._session_factory() as db_connection:
+            db_scan = scan_crud.get_scan(db_connection, scan_id=scan_id)
+            if db_scan is None:
+                raise ValueError(f"Scan {scan_id} not found")
+
+            rules_scan_as_dir = ingestion.get_rules_scan_as_dir(
+                db_connection=db_connection, scan_id=scan_id, timer=timer
+            )
+
+            # A finding repeated in several chunks is counted once
+            created_findings_ids: dict[int, None] = {}
+            for start in range(0, len(findings), INGEST_CHUNK_SIZE):
+                chunk = findings[start : start + INGEST_CHUNK_SIZE]
+                created_findings = ingestion.create_and_link_findings(
+                    db_connection=db_connection,
+                    scan_id=scan_id,
+                    rules_scan_as_dir=rules_scan_as_dir,
+                    findings=chunk,
+                    timer=timer,
+                )
+                created_findings_ids.update(dict.fromkeys(finding.id_ for finding in created_findings))
+                db_connection.expunge_all()
+                self._report_progress(ingest_job_id, started_at, processed_findings=start + len(chunk))
+
+            self._report_progress(ingest_job_id, started_at, processed_findings=len(findings))
+            ingestion.mark_outdated_findings(
+                db_connection=db_connection,
+                db_scan=db_scan,
+                created_findings_ids=list(created_findings_ids),
+                timer=timer,
+            )
+            self._report_progress(ingest_job_id, started_at, processed_findings=len(findings))
+            ingestion.commit_scan_findings(db_connection=db_connection, timer=timer)
+
+        return len(created_findings_ids)
+
+    def _report_progress(self, ingest_job_id: int, started_at: datetime, processed_findings: int) -> None:
+        # The progress is committed apart from the ingestion, it is the heartbeat keeping the claim of the job
+        try:
+            with self._session_factory() as job_session:
+                claimed = ingest_job_crud.update_ingest_job_progress(
+                    job_session,
+                    ingest_job_id=ingest_job_id,
+                    started_at=started_at,
+                    processed_findings=processed_findings,
+                )
+        except Exception as err:
+            logger.warning(f"Unable to report the progress of ingest job {ingest_job_id}: {err}")
+            return
+        if not claimed:
+            raise IngestJobClaimLostError(f"Ingest job {ingest_job_id} was queued again")
+
+    def _clear_cache(self, scan_id: int) -> None:
+        # The cache backend belongs to the event loop of the web service
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            with self._session_factory() as db_connection:
+                cache_tags = ingestion.get_scan_cache_tags(db_connection=db_connection, scan_id=scan_id)
+            future = asyncio.run_coroutine_threadsafe(ingestion.clear_scan_findings_cache(cache_tags), self._loop)
+            future.result(timeout=INGEST_JOB_POLL_INTERVAL)
+        except Exception as err:
+            logger.warning(f"Unable to clear the cache after an ingest job: {err}")
+
+
+ingest_worker_pool = IngestWorkerPool()
@@ -0,0 +1,364 @@
+# Standard Library
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+# Third Party
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.constants import (
+    CACHE_NAMESPACE_FINDING,
+    CACHE_NAMESPACE_RULE,
+    CACHE_NAMESPACE_RULE_PACK,
+    IDEMPOTENCY_KEY_RESERVATION_TIMEOUT,
+    IDEMPOTENCY_KEY_TTL,
+)
+from resc_backend.db.model import DBfinding, DBingestRequest, DBscan, DBscanFinding
+from resc_backend.resc_web_service.cache_manager import CacheManager
+from resc_backend.resc_web_service.cache_tags import get_scope_cache_tags
+from resc_backend.resc_web_service.crud import audit as audit_crud
+from resc_backend.resc_web_service.crud import finding as finding_crud
+from resc_backend.resc_web_service.crud import ingest_request as ingest_request_crud
+from resc_backend.resc_web_service.crud import rule as rule_crud
+from resc_backend.resc_web_service.crud import scan as scan_crud
+from resc_backend.resc_web_service.crud import scan_finding as scan_finding_crud
+from resc_backend.resc_web_service.helpers.stage_timer import StageTimer
+from resc_backend.resc_web_service.schema import finding as finding_schema
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+
+logger = logging.getLogger(__name__)
+
+
+def get_rules_scan_as_dir(db_connection: Session, scan_id: int, timer: StageTimer) -> list[str]:
+    """
+        Fetch the names of the rules of the rule pack of the scan which are applied to directories
+    :param db_connection:
+        Session of the database connection
+    :param scan_id:
+        id of the scan the findings belong to
+    :param timer:
+        timer recording the stages of the ingestion
+    :return: [str]
+        The names of the scan_as_dir rules
+    """
+    with timer.stage("scan_as_dir_rules") as stage:
+        rules_scan_as_dir: list[str] = rule_crud.get_scan_as_dir_rules_by_scan_id(
+            db_connection=db_connection, scan_id=scan_id
+        )
+        stage.rows += len(rules_scan_as_dir)
+    logger.debug(f"rules as directory: {', '.join(rules_scan_as_dir)}")
+    return rules_scan_as_dir
+
+
+def create_and_link_findings(
+    db_connection: Session,
+    scan_id: int,
+    rules_scan_as_dir: list[str],
+    findings: list[finding_schema.FindingCreate],
+    timer: StageTimer,
+) -> list[DBfinding]:
+    """
+        Create the findings which are not known yet and link all of them to the scan
+    :param db_connection:
+        Session of the database connection
+    :param scan_id:
+        id of the scan the findings belong to
+    :param rules_scan_as_dir:
+        names of the rules of the rule pack of the scan which are applied to directories
+    :param findings:
+        findings to create
+    :param timer:
+        timer recording the stages of the ingestion
+    :return: [DBfinding]
+        The created and already known findings of the request
+    """
+    # 2. split findings into 2 category: scan_as_dir and normal.
+    findings_as_repo = []
+    findings_as_dir = []
+    for finding in findings:
+        (findings_as_dir if finding.rule_name in rules_scan_as_dir else findings_as_repo).append(finding)
+    logger.debug(f"number of findings scan as directory: {len(findings_as_dir)}")
+    logger.debug(f"number of findings scan as repo: {len(findings_as_repo)}")
+
+    # 3. Process normal as previously done.
+    with timer.stage("create_findings") as stage:
+        created_findings: list[DBfinding] = finding_crud.create_findings(
+            db_connection=db_connection, findings=findings_as_repo
+        )
+        stage.rows += len(created_findings)
+    # 4. Process scan_as_dir with updates.
+    with timer.stage("create_or_update_findings") as stage:
+        created_dir_findings: list[DBfinding] = finding_crud.create_or_update_findings(
+            db_connection=db_connection, findings=findings_as_dir
+        )
+        stage.rows += len(created_dir_findings)
+
+    created_findings.extend(created_dir_findings)
+    # 5. Add link between findings and scan
+    scan_findings: list[DBscanFinding] = []
+    for finding in created_findings:
+        scan_finding = DBscanFinding(finding_id=finding.id_, scan_id=scan_id)
+        scan_findings.append(scan_finding)
+
+    # 6. merge.
+    with timer.stage("link_findings") as stage:
+        stage.rows += scan_finding_crud.create_scan_findings(db_connection=db_connection, scan_findings=scan_findings)
+
+    return created_findings
+
+
+def copy_parent_scan_findings(
+    db_connection: Session, db_scan: DBscan, parent_scan_id: int, removed_fingerprints: list[str], timer: StageTimer
+) -> None:
+    """
+        Link the findings of the parent scan to the scan, except the removed ones, inside the database
+    :param db_connection:
+        Session of the database connection
+    :param db_scan:
+        scan the findings are linked to
+    :param parent_scan_id:
+        id of the scan the delta is relative to
+    :param removed_fingerprints:
+        long fingerprints of the findings of the parent scan which are no longer reported
+    :param timer:
+        timer recording the stages of the ingestion
+    """
+    with timer.stage("copy_parent_links") as stage:
+        stage.rows += scan_finding_crud.copy_scan_findings(
+            db_connection=db_connection, source_scan_id=parent_scan_id, target_scan_id=db_scan.id_
+        )
+    with timer.stage("unlink_removed") as stage:
+        stage.rows += scan_finding_crud.delete_scan_findings_by_fingerprint(
+            db_connection=db_connection,
+            scan_id=db_scan.id_,
+            repository_id=db_scan.repository_id,
+            long_fingerprints=removed_fingerprints,
+        )
+
+
+def mark_outdated_findings(
+    db_connection: Session, db_scan: DBscan, created_findings_ids: list[int], timer: StageTimer
+) -> None:
+    """
+        Update the outdated status of the findings of the repository of the scan
+    :param db_connection:
+        Session of the database connection
+    :param db_scan:
+        scan the findings were created for
+    :param created_findings_ids:
+        ids of all the findings linked to the scan by the request
+    :param timer:
+        timer recording the stages of the ingestion
+    """
+    # 7. Mark old scan_as_dir findings as outdated.
+    # The findings are selected and audited inside the database, no id list is transferred.
+    with timer.stage("outdated_scan_as_dir") as stage:
+        stage.rows += audit_crud.create_automated_audits_from_query(
+            db_connection=db_connection,
+            findings_query=finding_crud.query_findings_from_repo_of_scan_as_dir(scan=db_scan),
+            status=FindingStatus.OUTDATED,
+        )
+
+    # 8. Mark findings which are no longer in rule pack (i.e. rule name not in current rule pack) as outdated
+    with timer.stage("outdated_rule_pack") as stage:
+        stage.rows += audit_crud.create_automated_audits_from_query(
+            db_connection=db_connection,
+            findings_query=finding_crud.query_untriaged_finding_outdated_for_current_scan(scan=db_scan),
+            status=FindingStatus.OUTDATED,
+        )
+
+    # 9. Mark active findings as no longer outdated
+    with timer.stage("clear_outdated") as stage:
+        audit_crud.clear_outdated_no_longer_outdated(db_connection=db_connection, findings_ids=created_findings_ids)
+        stage.rows += len(created_findings_ids)
+
+
+class RequestDigest:
+    """
+    SHA-256 digest of an ingestion request: the scan id and the decoded body
+    A retried request is recognised by its Idempotency-Key, the digest ensures the key is not reused for other data.
+    """
+
+    def __init__(self, scan_id: int):
+        self._digest = hashlib.sha256(f"{scan_id}\n".encode())
+
+    def update(self, body: bytes) -> None:
+        self._digest.update(body)
+
+    async def digest_stream(self, byte_stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """
+            Pass through a body stream, adding its chunks to the digest
+        :param byte_stream:
+            body of the request
+        :return: AsyncIterator[bytes]
+            The unchanged chunks of the body
+        """
+        async for chunk in byte_stream:
+            self._digest.update(chunk)
+            yield chunk
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def get_ingest_request(db_connection: Session, idempotency_key: str) -> DBingestRequest | None:
+    """
+        Retrieve the ingestion request recorded for an idempotency key, if not expired
+    :param db_connection:
+        Session of the database connection
+    :param idempotency_key:
+        Idempotency-Key header of the request
+    :return: DBingestRequest
+        The recorded request or None
+    """
+    return ingest_request_crud.get_ingest_request(
+        db_connection,
+        idempotency_key=idempotency_key,
+        created_after=datetime.now(UTC) - timedelta(seconds=IDEMPOTENCY_KEY_TTL),
+    )
+
+
+def reserve_ingest_request(
+    db_connection: Session, idempotency_key: str, scan_id: int, request_digest: str | None
+) -> DBingestRequest | None:
+    """
+        Reserve an idempotency key before ingesting the findings, in its own committed transaction
+    :param db_connection:
+        Session of the database connection
+    :param idempotency_key:
+        Idempotency-Key header of the request
+    :param scan_id:
+        id of the scan the findings belong to
+    :param request_digest:
+        digest of the request, see RequestDigest, None if not known yet
+    :return: DBingestRequest | None
+        The reservation, or None if the key is already reserved or recorded
+    """
+    now = datetime.now(UTC)
+    return ingest_request_crud.reserve_ingest_request(
+        db_connection,
+        idempotency_key=idempotency_key,
+        scan_id=scan_id,
+        request_digest=request_digest,
+        expired_before=now - timedelta(seconds=IDEMPOTENCY_KEY_TTL),
+        abandoned_before=now - timedelta(seconds=IDEMPOTENCY_KEY_RESERVATION_TIMEOUT),
+    )
+
+
+@contextmanager
+def release_ingest_request_on_failure(db_connection: Session, ingest_request_id: int | None) -> Iterator[None]:
+    """
+        Free the reserved idempotency key if the ingestion fails, the request can then be retried with the same key
+    :param db_connection:
+        Session of the database connection
+    :param ingest_request_id:
+        id of the reservation, None if the request has no idempotency key
+    """
+    try:
+        yield
+    except BaseException:
+        if ingest_request_id is not None:
+            db_connection.rollback()
+            ingest_request_crud.release_ingest_request(db_connection, ingest_request_id=ingest_request_id)
+        raise
+
+
+def record_ingest_request(
+    db_connection: Session,
+    ingest_request_id: int,
+    request_digest: str,
+    created_findings: int,
+    timer: StageTimer,
+) -> bool:
+    """
+        Record the result of the ingestion for its reserved idempotency key, in the transaction of the ingestion
+    :param db_connection:
+        Session of the database connection
+    :param ingest_request_id:
+        id of the reservation, see reserve_ingest_request
+    :param request_digest:
+        digest of the request, see RequestDigest
+    :param created_findings:
+        number of findings linked to the scan
+    :param timer:
+        timer recording the stages of the ingestion
+    :return: bool
+        False if the reservation was considered abandoned and freed meanwhile
+    """
+    with timer.stage("idempotency_key") as stage:
+        recorded = ingest_request_crud.complete_ingest_request(
+            db_connection,
+            ingest_request_id=ingest_request_id,
+            request_digest=request_digest,
+            created_findings=created_findings,
+        )
+        stage.rows += int(recorded)
+    return recorded
+
+
+def delete_expired_ingest_requests(db_connection: Session) -> int:
+    """
+        Delete the expired idempotency keys, run periodically apart from the ingestion requests
+    :param db_connection:
+        Session of the database connection
+    :return: int
+        The number of deleted keys
+    """
+    return ingest_request_crud.delete_expired_ingest_requests(
+        db_connection, created_before=datetime.now(UTC) - timedelta(seconds=IDEMPOTENCY_KEY_TTL)
+    )
+
+
+def commit_scan_findings(db_connection: Session, timer: StageTimer) -> None:
+    """
+        Commit the changes of all the stages at once and log the time spent per stage
+        Nothing is committed by the stages themselves, a failing stage leaves the database untouched.
+    :param db_connection:
+        Session of the database connection
+    :param timer:
+        timer recording the stages of the ingestion
+    """
+    with timer.stage("commit"):
+        db_connection.commit()
+    timer.log()
+
+
+def get_scan_cache_tags(db_connection: Session, scan_id: int) -> list[str] | None:
+    """
+        Tags of the cache entries affected by the ingestion of the findings of a scan
+    :param db_connection:
+        Session of the database connection
+    :param scan_id:
+        id of the scan the findings belong to
+    :return: [str]
+        The tags of the repository, vcs instance and rule pack of the scan, and the global tag,
+        None if the scan does not exist anymore
+    """
+    scan_scope = scan_crud.get_scan_scope(db_connection, scan_id=scan_id)
+    if scan_scope is None:
+        return None
+    return get_scope_cache_tags(
+        project_key=scan_scope.project_key,
+        repository_name=scan_scope.repository_name,
+        rule_pack=scan_scope.rule_pack,
+        vcs_instance_id=scan_scope.vcs_instance_id,
+        provider_type=scan_scope.provider_type,
+    )
+
+
+async def clear_scan_findings_cache(cache_tags: list[str] | None) -> None:
+    """
+        Clear the cached findings, rules and rule packs affected by the ingestion of the findings of a scan
+        The entries scoped to other repositories, vcs instances or rule packs are kept.
+    :param cache_tags:
+        tags of the cache entries affected, see get_scan_cache_tags, all the entries are cleared when None
+    """
+    namespaces = [CACHE_NAMESPACE_FINDING, CACHE_NAMESPACE_RULE, CACHE_NAMESPACE_RULE_PACK]
+    if cache_tags is None:
+        for namespace in namespaces:
+            await CacheManager.clear_cache_by_namespace(namespace=namespace)
+        return
+    await CacheManager.clear_cache_by_tags(namespaces=namespaces, tags=cache_tags)
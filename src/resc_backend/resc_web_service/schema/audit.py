@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field, HttpUrl, StringConstraints, m
 
 # First Party
 from resc_backend.constants import MAX_RECORDS_PER_PAGE_LIMIT
+from resc_backend.resc_web_service.filters import FindingsFilter
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
 from resc_backend.resc_web_service.schema.vcs_provider import VCSProviders
 
@@ -19,6 +20,12 @@ class AuditMultiple(BaseModel):
     comment: Annotated[str, StringConstraints(max_length=255)]
 
 
+class AuditByFilter(BaseModel):
+    findings_filter: FindingsFilter
+    status: FindingStatus
+    comment: Annotated[str, StringConstraints(max_length=255)]
+
+
 class AuditRead(BaseModel):
     id_: Annotated[int, Field(gt=0)]
     status: FindingStatus
@@ -0,0 +1,22 @@
+# Standard Library
+from typing import Annotated
+
+# Third Party
+from pydantic import BaseModel, Field, StringConstraints
+
+# First Party
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+
+Fingerprint = Annotated[str, StringConstraints(pattern=r"^[0-9a-f]{64}$")]
+
+
+class FindingsDelta(BaseModel):
+    """
+    Findings of an incremental scan expressed as a change of the findings of its parent scan.
+    The removed findings are identified by their long fingerprint, the sha256 of their long key,
+    see resc_backend.db.model.finding.finding_long_key.
+    """
+
+    parent_scan_id: Annotated[int, Field(gt=0)]
+    added: list[FindingCreate] = []
+    removed: list[Fingerprint] = []
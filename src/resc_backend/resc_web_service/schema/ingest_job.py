@@ -0,0 +1,24 @@
+# Standard Library
+import datetime
+from typing import Annotated
+
+# Third Party
+from pydantic import BaseModel, ConfigDict, Field
+
+# First Party
+from resc_backend.resc_web_service.schema.ingest_job_status import IngestJobStatus
+
+
+class IngestJobRead(BaseModel):
+    id_: Annotated[int, Field(gt=0)]
+    scan_id: Annotated[int, Field(gt=0)]
+    status: IngestJobStatus
+    total_findings: Annotated[int, Field(ge=0)]
+    processed_findings: Annotated[int, Field(ge=0)]
+    created_findings: int | None = None
+    error: str | None = None
+    created_at: datetime.datetime
+    started_at: datetime.datetime | None = None
+    heartbeat_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,9 @@
+# Standard Library
+from enum import Enum
+
+
+class IngestJobStatus(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
@@ -0,0 +1,7 @@
+# Standard Library
+from enum import Enum
+
+
+class IngestRequestStatus(str, Enum):
+    IN_PROGRESS = "IN_PROGRESS"
+    DONE = "DONE"
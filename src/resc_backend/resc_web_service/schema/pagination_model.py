@@ -1,4 +1,7 @@
 # Standard Library
+import base64
+import json
+from datetime import datetime
 from typing import Annotated, Generic, TypeVar
 
 # Third Party
@@ -25,3 +28,51 @@ class PaginationModel(BaseModel, Generic[Model]):
     limit: Annotated[int, Field(gt=-1)]
     skip: Annotated[int, Field(gt=-1)]
     model_config = ConfigDict(from_attributes=True)
+
+
+class CursorPaginationModel(BaseModel, Generic[Model]):
+    """
+        Generic encapsulation class for cursor paginated endpoints
+        example creation, CursorPaginationModel[AuditFinding](data=audits, limit=limit, next_cursor=next_cursor)
+    :param Generic[Model]:
+        Type of the object in the data list
+    """
+
+    data: Annotated[list[Model], Field(min_length=None, max_length=MAX_RECORDS_PER_PAGE_LIMIT)]
+    limit: Annotated[int, Field(gt=-1)]
+    next_cursor: str | None = None
+    total: Annotated[int, Field(gt=-1)] | None = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+def encode_cursor(timestamp: datetime, id_: int) -> str:
+    """
+        Opaque cursor pointing after the record with the given sort key
+    :param timestamp:
+        timestamp of the last record of the page
+    :param id_:
+        id of the last record of the page
+    :return: str
+        url safe cursor
+    """
+    key = json.dumps([timestamp.isoformat(), id_], separators=(",", ":"))
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+        Sort key of a cursor created by encode_cursor
+    :param cursor:
+        cursor returned with the previous page
+    :return: timestamp, id_
+        sort key of the last record of the previous page
+    :raises ValueError: if the cursor is not valid
+    """
+    try:
+        key = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, id_ = json.loads(key)
+        if not isinstance(id_, int):
+            raise TypeError(f"Invalid id {id_!r}")
+        return datetime.fromisoformat(timestamp), id_
+    except (TypeError, ValueError) as err:
+        raise ValueError(f"Invalid cursor {cursor}") from err
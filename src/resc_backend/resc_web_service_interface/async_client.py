@@ -0,0 +1,237 @@
+# Standard Library
+import asyncio
+import gzip
+import logging
+import uuid
+
+# Third Party
+import httpx
+
+# First Party
+from resc_backend.constants import (
+    CONTENT_ENCODING_GZIP,
+    IDEMPOTENCY_KEY_HEADER,
+    INGEST_CHUNK_SIZE,
+    JSON_MEDIA_TYPE,
+    RWS_ROUTE_DELTA,
+    RWS_ROUTE_FINDINGS,
+    RWS_ROUTE_INGEST_JOBS,
+    RWS_ROUTE_LAST_SCAN,
+    RWS_ROUTE_REPOSITORIES,
+    RWS_ROUTE_SCANS,
+    RWS_ROUTE_STREAM,
+    RWS_ROUTE_VCS,
+    RWS_VERSION_PREFIX,
+)
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service.schema.findings_delta import FindingsDelta
+from resc_backend.resc_web_service.schema.repository import Repository
+from resc_backend.resc_web_service.schema.scan import ScanCreate
+from resc_backend.resc_web_service.schema.vcs_instance import VCSInstanceCreate
+from resc_backend.resc_web_service_interface.findings import encode_findings_ndjson
+from resc_backend.resc_web_service_interface.retry import DEFAULT_TIMEOUT, CallRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRescWebServiceClient:
+    """
+    asyncio client of the RESC web service, the asyncio counterpart of RescWebServiceClient
+    All the calls share the connection pool of a single httpx.AsyncClient, at most max_concurrency requests are
+    in flight at once, the other calls wait for a slot. The batch helpers run their calls concurrently within
+    this limit, a single process can keep the web service busy without a thread per request.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_concurrency: int = 10,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        findings_batch_size: int = INGEST_CHUNK_SIZE,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        :param url:
+            base url of the RESC web service, for example https://resc.example.com
+        :param max_concurrency:
+            maximum number of requests in flight, also the size of the connection pool
+        :param timeout:
+            timeout in seconds of a single attempt
+        :param retries:
+            number of retries of an idempotent call
+        :param backoff_factor:
+            the n-th retry waits backoff_factor * 2^(n-1) seconds
+        :param findings_batch_size:
+            number of findings validated and stored at once by the web service
+        :param transport:
+            optional transport replacing the default connection pool
+        """
+        self.findings_batch_size = findings_batch_size
+        self._calls = CallRecorder(retries=retries, backoff_factor=backoff_factor)
+        self.statistics = self._calls.statistics
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        if transport is None:
+            # The retries are done by _request, the transport sends every attempt once
+            transport = httpx.AsyncHTTPTransport(
+                retries=0,
+                limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            )
+        # trust_env is disabled, the proxies of the environment are ignored like by the requests based interface
+        self._client = httpx.AsyncClient(
+            base_url=f"{url}{RWS_VERSION_PREFIX}", timeout=timeout, transport=transport, trust_env=False
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _request(self, name: str, method: str, path: str, idempotent: bool, **kwargs) -> httpx.Response:
+        """
+            Send a request once a concurrency slot is free, retrying it if idempotent, and record its duration
+        :param name:
+            name of the call the statistics are aggregated by
+        :param method:
+            HTTP method
+        :param path:
+            path of the endpoint, relative to the url of the web service
+        :param idempotent:
+            True if the request can be sent again after a timeout or a retryable status
+        :return: httpx.Response
+            The response of the last attempt
+        """
+        call = self._calls.call(name, idempotent=idempotent)
+        try:
+            for attempt in call.attempts():
+                if attempt > 1:
+                    await asyncio.sleep(call.backoff(attempt))
+                try:
+                    # The slot is released while waiting for a retry
+                    async with self._semaphore:
+                        response = await self._client.request(method, path, **kwargs)
+                except httpx.TransportError as err:
+                    if call.retry_after_error(attempt, err):
+                        continue
+                    raise
+                if call.retry_after_status(attempt, response.status_code):
+                    continue
+                return response
+        finally:
+            call.finish(method, path)
+
+    def log_statistics(self) -> None:
+        self._calls.log_statistics()
+
+    async def create_repository(self, repository: Repository) -> httpx.Response:
+        # The repository is only created if it does not exist yet, sending it again has no further effect
+        return await self._request(
+            "create_repository",
+            "POST",
+            RWS_ROUTE_REPOSITORIES,
+            idempotent=True,
+            content=repository.model_dump_json(),
+        )
+
+    async def get_last_scan_for_repository(self, repository_id: int) -> httpx.Response:
+        return await self._request(
+            "get_last_scan_for_repository",
+            "GET",
+            f"{RWS_ROUTE_REPOSITORIES}/{repository_id}{RWS_ROUTE_LAST_SCAN}",
+            idempotent=True,
+        )
+
+    async def create_vcs_instance(self, vcs_instance: VCSInstanceCreate) -> httpx.Response:
+        # The vcs instance is only created if it does not exist yet
+        return await self._request(
+            "create_vcs_instance", "POST", RWS_ROUTE_VCS, idempotent=True, content=vcs_instance.model_dump_json()
+        )
+
+    async def create_scan(self, scan: ScanCreate) -> httpx.Response:
+        return await self._request(
+            "create_scan", "POST", RWS_ROUTE_SCANS, idempotent=False, content=scan.model_dump_json()
+        )
+
+    async def create_findings_with_scan_id(self, findings: list[FindingCreate], scan_id: int) -> httpx.Response:
+        """
+        Create the findings of a scan in a single request, as newline delimited JSON
+        The web service stores the findings in chunks of findings_batch_size findings and updates the outdated
+        status of the findings of the repository once, see RescWebServiceClient.create_findings_with_scan_id.
+        """
+        body, headers = encode_findings_ndjson(findings)
+        # The key identifies the upload, a retry returns the result of the first attempt
+        headers[IDEMPOTENCY_KEY_HEADER] = str(uuid.uuid4())
+        return await self._request(
+            "create_findings_with_scan_id",
+            "POST",
+            f"{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}",
+            idempotent=True,
+            content=body,
+            headers=headers,
+            params={"chunk_size": self.findings_batch_size},
+        )
+
+    async def create_findings_delta_with_scan_id(
+        self, scan_id: int, parent_scan_id: int, added: list[FindingCreate], removed: list[str]
+    ) -> httpx.Response:
+        delta = FindingsDelta(parent_scan_id=parent_scan_id, added=added, removed=removed)
+        headers = {
+            "Content-Type": JSON_MEDIA_TYPE,
+            "Content-Encoding": CONTENT_ENCODING_GZIP,
+            IDEMPOTENCY_KEY_HEADER: str(uuid.uuid4()),
+        }
+        return await self._request(
+            "create_findings_delta_with_scan_id",
+            "POST",
+            f"{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}",
+            idempotent=True,
+            content=gzip.compress(delta.model_dump_json().encode(), compresslevel=6),
+            headers=headers,
+        )
+
+    async def get_ingest_job(self, scan_id: int, ingest_job_id: int) -> httpx.Response:
+        return await self._request(
+            "get_ingest_job",
+            "GET",
+            f"{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_INGEST_JOBS}/{ingest_job_id}",
+            idempotent=True,
+        )
+
+    async def create_repositories(self, repositories: list[Repository]) -> list[httpx.Response | Exception]:
+        """
+            Register many repositories concurrently
+        :return: list[httpx.Response | Exception]
+            The response, or the exception raised, for every repository in the given order
+        """
+        return await asyncio.gather(
+            *(self.create_repository(repository) for repository in repositories), return_exceptions=True
+        )
+
+    async def create_scans(self, scans: list[ScanCreate]) -> list[httpx.Response | Exception]:
+        """
+            Create many scans concurrently
+        :return: list[httpx.Response | Exception]
+            The response, or the exception raised, for every scan in the given order
+        """
+        return await asyncio.gather(*(self.create_scan(scan) for scan in scans), return_exceptions=True)
+
+    async def create_findings_for_scans(
+        self, findings_per_scan: dict[int, list[FindingCreate]]
+    ) -> dict[int, httpx.Response | Exception]:
+        """
+            Create the findings of many scans, the scans are uploaded concurrently
+        :param findings_per_scan:
+            findings to create per scan id
+        :return: dict[int, httpx.Response | Exception]
+            The response, or the exception raised, per scan id
+        """
+        results = await asyncio.gather(
+            *(self.create_findings_with_scan_id(findings, scan_id) for scan_id, findings in findings_per_scan.items()),
+            return_exceptions=True,
+        )
+        return dict(zip(findings_per_scan, results, strict=True))
@@ -0,0 +1,265 @@
+# Standard Library
+import gzip
+import logging
+import time
+import uuid
+
+# Third Party
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# First Party
+from resc_backend.constants import (
+    CONTENT_ENCODING_GZIP,
+    DEFAULT_RECORDS_PER_PAGE_LIMIT,
+    IDEMPOTENCY_KEY_HEADER,
+    INGEST_CHUNK_SIZE,
+    JSON_MEDIA_TYPE,
+    RWS_ROUTE_DELTA,
+    RWS_ROUTE_FINDINGS,
+    RWS_ROUTE_INGEST_JOBS,
+    RWS_ROUTE_LAST_SCAN,
+    RWS_ROUTE_REPOSITORIES,
+    RWS_ROUTE_RULE_PACKS,
+    RWS_ROUTE_SCANS,
+    RWS_ROUTE_STREAM,
+    RWS_ROUTE_VCS,
+    RWS_VERSION_PREFIX,
+)
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service.schema.findings_delta import FindingsDelta
+from resc_backend.resc_web_service.schema.repository import Repository
+from resc_backend.resc_web_service.schema.scan import ScanCreate
+from resc_backend.resc_web_service.schema.vcs_instance import VCSInstanceCreate
+from resc_backend.resc_web_service_interface.findings import encode_findings, encode_findings_ndjson
+from resc_backend.resc_web_service_interface.retry import DEFAULT_TIMEOUT, CallRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class RescWebServiceClient:
+    """
+    Client of the RESC web service, reusing its connections through a pooled requests.Session
+    Idempotent calls are retried with an exponential backoff, the findings of a scan are uploaded in a single
+    request carrying an Idempotency-Key so that it is retried as well. The retries are only done by the client,
+    the connection pool does not retry on its own.
+    The duration of the calls is aggregated per call, see statistics.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        findings_batch_size: int = INGEST_CHUNK_SIZE,
+    ):
+        """
+        :param url:
+            base url of the RESC web service, for example https://resc.example.com
+        :param timeout:
+            timeout in seconds of a single attempt
+        :param pool_connections:
+            number of connection pools kept, one per host
+        :param pool_maxsize:
+            number of connections kept per host, the number of threads sharing the client
+        :param retries:
+            number of retries of an idempotent call
+        :param backoff_factor:
+            the n-th retry waits backoff_factor * 2^(n-1) seconds
+        :param findings_batch_size:
+            maximum number of findings sent per request, or validated and stored at once by the web service when
+            the findings of a scan are uploaded in a single request
+        """
+        self.url = url
+        self.timeout = timeout
+        self.findings_batch_size = findings_batch_size
+        self._calls = CallRecorder(retries=retries, backoff_factor=backoff_factor)
+        self.statistics = self._calls.statistics
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            # The retries are done by _request, the adapter sends every attempt once
+            max_retries=Retry(total=0),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _request(self, name: str, method: str, path: str, idempotent: bool, **kwargs) -> requests.Response:
+        """
+            Send a request, retrying it if idempotent, and record its duration
+        :param name:
+            name of the call the statistics are aggregated by
+        :param method:
+            HTTP method
+        :param path:
+            path of the endpoint, appended to the url of the web service
+        :param idempotent:
+            True if the request can be sent again after a timeout or a retryable status
+        :return: requests.Response
+            The response of the last attempt
+        """
+        call = self._calls.call(name, idempotent=idempotent)
+        try:
+            for attempt in call.attempts():
+                if attempt > 1:
+                    time.sleep(call.backoff(attempt))
+                try:
+                    response = self.session.request(
+                        method,
+                        f"{self.url}{RWS_VERSION_PREFIX}{path}",
+                        proxies={"http": "", "https": ""},
+                        timeout=self.timeout,
+                        **kwargs,
+                    )
+                except (requests.ConnectionError, requests.Timeout) as err:
+                    if call.retry_after_error(attempt, err):
+                        continue
+                    raise
+                if call.retry_after_status(attempt, response.status_code):
+                    continue
+                return response
+        finally:
+            call.finish(method, path)
+
+    def _batches(self, findings: list[FindingCreate]) -> list[list[FindingCreate]]:
+        return [
+            findings[start : start + self.findings_batch_size]
+            for start in range(0, len(findings), self.findings_batch_size)
+        ]
+
+    def log_statistics(self) -> None:
+        self._calls.log_statistics()
+
+    def create_findings(self, findings: list[FindingCreate]) -> list[requests.Response]:
+        return [
+            self._request("create_findings", "POST", RWS_ROUTE_FINDINGS, idempotent=False, data=body, headers=headers)
+            for body, headers in map(encode_findings, self._batches(findings))
+        ]
+
+    def create_findings_with_scan_id(self, findings: list[FindingCreate], scan_id: int) -> requests.Response:
+        """
+        Create the findings of a scan in a single request, as newline delimited JSON
+        The web service stores the findings in chunks of findings_batch_size findings and updates the outdated
+        status of the findings of the repository once, the response holds the number of findings linked to the scan.
+        """
+        body, headers = encode_findings_ndjson(findings)
+        # The key identifies the upload, a retry returns the result of the first attempt
+        headers[IDEMPOTENCY_KEY_HEADER] = str(uuid.uuid4())
+        return self._request(
+            "create_findings_with_scan_id",
+            "POST",
+            f"{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}",
+            idempotent=True,
+            data=body,
+            headers=headers,
+            params={"chunk_size": self.findings_batch_size},
+        )
+
+    def create_findings_with_scan_id_async(
+        self, findings: list[FindingCreate], scan_id: int
+    ) -> list[requests.Response]:
+        """
+        Queue the findings of a scan for asynchronous ingestion, one ingest job per batch
+        """
+        return [
+            self._request(
+                "create_findings_with_scan_id_async",
+                "POST",
+                f"{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_INGEST_JOBS}",
+                idempotent=False,
+                data=body,
+                headers=headers,
+            )
+            for body, headers in map(encode_findings, self._batches(findings))
+        ]
+
+    def create_findings_delta_with_scan_id(
+        self, scan_id: int, parent_scan_id: int, added: list[FindingCreate], removed: list[str]
+    ) -> requests.Response:
+        delta = FindingsDelta(parent_scan_id=parent_scan_id, added=added, removed=removed)
+        headers = {
+            "Content-Type": JSON_MEDIA_TYPE,
+            "Content-Encoding": CONTENT_ENCODING_GZIP,
+            IDEMPOTENCY_KEY_HEADER: str(uuid.uuid4()),
+        }
+        return self._request(
+            "create_findings_delta_with_scan_id",
+            "POST",
+            f"{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}",
+            idempotent=True,
+            data=gzip.compress(delta.model_dump_json().encode(), compresslevel=6),
+            headers=headers,
+        )
+
+    def get_ingest_job(self, scan_id: int, ingest_job_id: int) -> requests.Response:
+        return self._request(
+            "get_ingest_job",
+            "GET",
+            f"{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_INGEST_JOBS}/{ingest_job_id}",
+            idempotent=True,
+        )
+
+    def create_scan(self, scan: ScanCreate) -> requests.Response:
+        return self._request("create_scan", "POST", RWS_ROUTE_SCANS, idempotent=False, data=scan.model_dump_json())
+
+    def create_repository(self, repository: Repository) -> requests.Response:
+        # The repository is only created if it does not exist yet, sending it again has no further effect
+        return self._request(
+            "create_repository", "POST", RWS_ROUTE_REPOSITORIES, idempotent=True, data=repository.model_dump_json()
+        )
+
+    def get_last_scan_for_repository(self, repository_id: int) -> requests.Response:
+        return self._request(
+            "get_last_scan_for_repository",
+            "GET",
+            f"{RWS_ROUTE_REPOSITORIES}/{repository_id}{RWS_ROUTE_LAST_SCAN}",
+            idempotent=True,
+        )
+
+    def create_vcs_instance(self, vcs_instance: VCSInstanceCreate) -> requests.Response:
+        # The vcs instance is only created if it does not exist yet
+        return self._request(
+            "create_vcs_instance", "POST", RWS_ROUTE_VCS, idempotent=True, data=vcs_instance.model_dump_json()
+        )
+
+    def upload_rule_pack_toml_file(self, rule_file_path: str) -> requests.Response:
+        with open(rule_file_path, "rb") as toml_file:
+            files = {"rule_file": ("RESC-SECRETS-RULE.toml", toml_file, "application/octet-stream")}
+            return self._request(
+                "upload_rule_pack_toml_file", "POST", RWS_ROUTE_RULE_PACKS, idempotent=False, files=files
+            )
+
+    def download_rule_pack_toml_file(self, rule_pack_version: str | None = "") -> requests.Response:
+        params = {"rule_pack_version": rule_pack_version} if rule_pack_version else {}
+        return self._request(
+            "download_rule_pack_toml_file", "GET", RWS_ROUTE_RULE_PACKS, idempotent=True, params=params
+        )
+
+    def get_rule_packs(
+        self,
+        version: str | None = None,
+        active: bool | None = None,
+        skip: int | None = 0,
+        limit: int | None = DEFAULT_RECORDS_PER_PAGE_LIMIT,
+    ) -> requests.Response:
+        params = {"active": active, "skip": skip, "limit": limit}
+        if version:
+            params["version"] = version
+        return self._request(
+            "get_rule_packs", "GET", f"{RWS_ROUTE_RULE_PACKS}/versions", idempotent=True, params=params
+        )
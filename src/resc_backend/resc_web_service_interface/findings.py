@@ -1,38 +1,185 @@
 # Standard Library
-import json
+import gzip
 import logging
 
 # Third Party
 import requests
+from pydantic import TypeAdapter
 
 # First Party
 from resc_backend.constants import (
+    CONTENT_ENCODING_GZIP,
+    CONTENT_ENCODING_IDENTITY,
+    CONTENT_ENCODING_ZSTD,
+    IDEMPOTENCY_KEY_HEADER,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    RWS_ROUTE_DELTA,
     RWS_ROUTE_FINDINGS,
+    RWS_ROUTE_INGEST_JOBS,
     RWS_ROUTE_SCANS,
     RWS_VERSION_PREFIX,
 )
 from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service.schema.findings_delta import FindingsDelta
+
+# Optional dependencies, see the ingestion extra
+try:
+    # Third Party
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    # Third Party
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+FINDING_ADAPTER = TypeAdapter(FindingCreate)
+FINDINGS_ADAPTER = TypeAdapter(list[FindingCreate])
+
+
+def encode_findings(
+    findings: list[FindingCreate],
+    media_type: str = JSON_MEDIA_TYPE,
+    content_encoding: str = CONTENT_ENCODING_IDENTITY,
+) -> tuple[bytes, dict[str, str]]:
+    """
+        Serialize the findings in a single pass and compress them
+    :param findings:
+        findings to send
+    :param media_type:
+        application/json or application/msgpack, the latter requires msgpack to be installed
+    :param content_encoding:
+        identity, gzip or zstd, zstd requires zstandard to be installed.
+        Compress only when the web service accepts compressed bodies, older instances do not.
+    :return: tuple[bytes, dict[str, str]]
+        The request body and its Content-Type and Content-Encoding headers
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        if msgpack is None:
+            raise ValueError("msgpack is required to send findings as MessagePack")
+        body = msgpack.packb(FINDINGS_ADAPTER.dump_python(findings, mode="json"))
+    elif media_type == JSON_MEDIA_TYPE:
+        body = FINDINGS_ADAPTER.dump_json(findings)
+    else:
+        raise ValueError(f"Unsupported media type {media_type}")
+
+    return _compress(body, media_type=media_type, content_encoding=content_encoding)
 
-def create_findings(url: str, findings: list[FindingCreate]) -> requests.Response:
-    api_url = f"{url}{RWS_VERSION_PREFIX}{RWS_ROUTE_FINDINGS}"
 
-    findings_json = []
-    for finding in findings:
-        findings_json.append(json.loads(finding.model_dump_json()))
+def encode_findings_ndjson(
+    findings: list[FindingCreate], content_encoding: str = CONTENT_ENCODING_IDENTITY
+) -> tuple[bytes, dict[str, str]]:
+    """
+        Serialize the findings as newline delimited JSON, one finding per line, and compress them
+    :param findings:
+        findings to send
+    :param content_encoding:
+        identity, gzip or zstd, see encode_findings
+    :return: tuple[bytes, dict[str, str]]
+        The request body and its Content-Type and Content-Encoding headers
+    """
+    body = b"".join(FINDING_ADAPTER.dump_json(finding) + b"\n" for finding in findings)
+    return _compress(body, media_type=NDJSON_MEDIA_TYPE, content_encoding=content_encoding)
+
+
+def _compress(body: bytes, media_type: str, content_encoding: str) -> tuple[bytes, dict[str, str]]:
+    headers = {"Content-Type": media_type}
+    if content_encoding == CONTENT_ENCODING_GZIP:
+        body = gzip.compress(body, compresslevel=6)
+    elif content_encoding == CONTENT_ENCODING_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstandard is required to send zstd compressed findings")
+        body = zstandard.ZstdCompressor().compress(body)
+    elif content_encoding != CONTENT_ENCODING_IDENTITY:
+        raise ValueError(f"Unsupported content encoding {content_encoding}")
+    if content_encoding != CONTENT_ENCODING_IDENTITY:
+        headers["Content-Encoding"] = content_encoding
+    return body, headers
+
+
+def create_findings(
+    url: str,
+    findings: list[FindingCreate],
+    media_type: str = JSON_MEDIA_TYPE,
+    content_encoding: str = CONTENT_ENCODING_IDENTITY,
+) -> requests.Response:
+    api_url = f"{url}{RWS_VERSION_PREFIX}{RWS_ROUTE_FINDINGS}"
 
-    response = requests.post(api_url, json=findings_json, proxies={"http": "", "https": ""}, timeout=10)
+    body, headers = encode_findings(findings, media_type=media_type, content_encoding=content_encoding)
+    response = requests.post(api_url, data=body, headers=headers, proxies={"http": "", "https": ""}, timeout=10)
     return response
 
 
-def create_findings_with_scan_id(url: str, findings: list[FindingCreate], scan_id: int) -> requests.Response:
+def create_findings_with_scan_id(
+    url: str,
+    findings: list[FindingCreate],
+    scan_id: int,
+    media_type: str = JSON_MEDIA_TYPE,
+    content_encoding: str = CONTENT_ENCODING_IDENTITY,
+    idempotency_key: str | None = None,
+) -> requests.Response:
+    """
+    Create the findings of a scan, pass the same idempotency_key when retrying the upload of the same findings
+    to get the result of the first attempt instead of ingesting them again.
+    """
     api_url = f"{url}{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_FINDINGS}"
 
-    findings_json = []
-    for finding in findings:
-        findings_json.append(json.loads(finding.model_dump_json()))
+    body, headers = encode_findings(findings, media_type=media_type, content_encoding=content_encoding)
+    if idempotency_key:
+        headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+    response = requests.post(api_url, data=body, headers=headers, proxies={"http": "", "https": ""}, timeout=10)
+    return response
+
+
+def create_findings_delta_with_scan_id(
+    url: str,
+    scan_id: int,
+    parent_scan_id: int,
+    added: list[FindingCreate],
+    removed: list[str],
+    idempotency_key: str | None = None,
+) -> requests.Response:
+    """
+    Link the findings of the parent scan to an incremental scan, except the removed ones, and create the added ones
+    The removed findings are identified by their long fingerprint:
+    resc_backend.db.model.finding.fingerprint(finding_long_key(finding))
+    """
+    api_url = f"{url}{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}"
+
+    delta = FindingsDelta(parent_scan_id=parent_scan_id, added=added, removed=removed)
+    body = gzip.compress(delta.model_dump_json().encode(), compresslevel=6)
+    headers = {"Content-Type": JSON_MEDIA_TYPE, "Content-Encoding": CONTENT_ENCODING_GZIP}
+    if idempotency_key:
+        headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+    response = requests.post(api_url, data=body, headers=headers, proxies={"http": "", "https": ""}, timeout=10)
+    return response
+
+
+def create_findings_with_scan_id_async(
+    url: str,
+    findings: list[FindingCreate],
+    scan_id: int,
+    media_type: str = JSON_MEDIA_TYPE,
+    content_encoding: str = CONTENT_ENCODING_IDENTITY,
+) -> requests.Response:
+    """
+    Queue the findings of a scan for asynchronous ingestion, the response contains the ingest job
+    Poll get_ingest_job until its status is DONE or FAILED.
+    """
+    api_url = f"{url}{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_INGEST_JOBS}"
+
+    body, headers = encode_findings(findings, media_type=media_type, content_encoding=content_encoding)
+    response = requests.post(api_url, data=body, headers=headers, proxies={"http": "", "https": ""}, timeout=10)
+    return response
+
 
-    response = requests.post(api_url, json=findings_json, proxies={"http": "", "https": ""}, timeout=10)
+def get_ingest_job(url: str, scan_id: int, ingest_job_id: int) -> requests.Response:
+    api_url = f"{url}{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/{scan_id}{RWS_ROUTE_INGEST_JOBS}/{ingest_job_id}"
+    response = requests.get(api_url, proxies={"http": "", "https": ""}, timeout=10)
     return response
@@ -0,0 +1,123 @@
+# Standard Library
+import logging
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+
+@dataclass
+class CallStatistics:
+    calls: int = 0
+    failures: int = 0
+    retries: int = 0
+    duration: float = 0.0
+    max_duration: float = 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        return self.duration / self.calls if self.calls else 0.0
+
+
+class RetriedCall:
+    """
+    Attempts of a single call, deciding whether it is retried and recording its statistics
+    The transport, the sleep and the exceptions are left to the client, see CallRecorder.
+    """
+
+    def __init__(self, name: str, statistics: CallStatistics, attempts: int, backoff_factor: float):
+        self.name = name
+        self.statistics = statistics
+        self.max_attempts = attempts
+        self.backoff_factor = backoff_factor
+        self._start = time.perf_counter()
+
+    def attempts(self) -> Iterator[int]:
+        return iter(range(1, self.max_attempts + 1))
+
+    def backoff(self, attempt: int) -> float:
+        """
+            Count a retry and compute its delay
+        :param attempt:
+            number of the attempt about to be sent, from 2 on
+        :return: float
+            The number of seconds to wait before the attempt, backoff_factor * 2^(n-1) for the n-th retry
+        """
+        self.statistics.retries += 1
+        return self.backoff_factor * 2 ** (attempt - 2)
+
+    def retry_after_error(self, attempt: int, err: Exception) -> bool:
+        """
+            Decide whether an attempt failing with a connection error or a timeout is retried
+        :return: bool
+            True if retried, False if the error is to be raised
+        """
+        if attempt == self.max_attempts:
+            self.statistics.failures += 1
+            return False
+        logger.warning(f"{self.name} attempt {attempt} of {self.max_attempts} failed: {err}")
+        return True
+
+    def retry_after_status(self, attempt: int, status_code: int) -> bool:
+        """
+            Decide whether an attempt answered with the given status is retried
+        :return: bool
+            True if retried, False if the response is to be returned
+        """
+        if status_code in RETRY_STATUSES and attempt < self.max_attempts:
+            logger.warning(f"{self.name} attempt {attempt} of {self.max_attempts} returned {status_code}")
+            return True
+        if status_code >= 400:
+            self.statistics.failures += 1
+        return False
+
+    def finish(self, method: str, path: str) -> None:
+        duration = time.perf_counter() - self._start
+        self.statistics.calls += 1
+        self.statistics.duration += duration
+        self.statistics.max_duration = max(self.statistics.max_duration, duration)
+        logger.debug(f"{self.name} {method} {path} took {duration * 1000:.1f}ms")
+
+
+class CallRecorder:
+    """
+    Retry policy and statistics per call shared by RescWebServiceClient and AsyncRescWebServiceClient
+    Idempotent calls are retried with an exponential backoff after a connection error, a timeout or a status of
+    RETRY_STATUSES, the other calls are sent once.
+    """
+
+    def __init__(self, retries: int, backoff_factor: float):
+        """
+        :param retries:
+            number of retries of an idempotent call
+        :param backoff_factor:
+            the n-th retry waits backoff_factor * 2^(n-1) seconds
+        """
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.statistics: dict[str, CallStatistics] = {}
+
+    def call(self, name: str, idempotent: bool) -> RetriedCall:
+        """
+            Start a call
+        :param name:
+            name of the call the statistics are aggregated by
+        :param idempotent:
+            True if the request can be sent again after a timeout or a retryable status
+        :return: RetriedCall
+            The call, RetriedCall.finish is to be called once done
+        """
+        statistics = self.statistics.setdefault(name, CallStatistics())
+        attempts = self.retries + 1 if idempotent else 1
+        return RetriedCall(name, statistics, attempts=attempts, backoff_factor=self.backoff_factor)
+
+    def log_statistics(self) -> None:
+        for name, statistics in self.statistics.items():
+            logger.info(
+                f"{name}: {statistics.calls} calls, {statistics.failures} failures, {statistics.retries} retries, "
+                f"mean {statistics.mean_duration * 1000:.1f}ms, max {statistics.max_duration * 1000:.1f}ms"
+            )
@@ -46,6 +46,10 @@ INSERT INTO finding (repository_id, rule_name, file_path, line_number, commit_id
    (2, 'github-pat', 'application.txt', 2, 'qwerty3', 'this is commit 1', '2023-01-01 00:00:00.000', 'developer', 'developer@abc.com', NULL, 1, 80, 0), -- 5
    (2, 'github-pat', 'application.txt', 2, 'qwerty4', 'this is commit 2', '2023-01-02 00:00:00.000', 'developer', 'developer@abc.com', NULL, 1, 80, 0); -- 6
 
+UPDATE finding SET
+   long_fingerprint = LOWER(CONVERT(VARCHAR(64), HASHBYTES('SHA2_256', CONCAT(commit_id, '|', rule_name, '|', file_path, '|', line_number, '|', column_start, '|', column_end)), 2)),
+   short_fingerprint = LOWER(CONVERT(VARCHAR(64), HASHBYTES('SHA2_256', CONCAT(rule_name, '|', file_path, '|', line_number, '|', column_start, '|', column_end)), 2));
+
 INSERT INTO scan_finding(scan_id, finding_id) VALUES
    (1, 1),
    (3, 1),
@@ -55,6 +59,9 @@ INSERT INTO scan_finding(scan_id, finding_id) VALUES
    (5, 5),
    (6, 6);
 
-INSERT INTO audit(finding_id, [status], auditor, comment, [timestamp], is_latest) VALUES
-   (1, 'NOT_ANALYZED', 'Anonymous', NULL, '2023-07-20 00:00:00.000', 0), -- 1
-   (1, 'TRUE_POSITIVE', 'Anonymous', 'It is a true positive issue', '2023-07-21 00:00:00.000', 1); -- 2
\ No newline at end of file
+INSERT INTO audit(finding_id, [status], auditor, comment, [timestamp], is_latest, valid_from, valid_to) VALUES
+   (1, 'NOT_ANALYZED', 'Anonymous', NULL, '2023-07-20 00:00:00.000', 0, '2023-07-20 00:00:00.000', '2023-07-21 00:00:00.000'), -- 1
+   (1, 'TRUE_POSITIVE', 'Anonymous', 'It is a true positive issue', '2023-07-21 00:00:00.000', 1, '2023-07-21 00:00:00.000', NULL); -- 2
+UPDATE finding SET
+   current_audit_id = (SELECT MAX(audit.id) FROM audit WHERE audit.finding_id = finding.id AND audit.is_latest = 1),
+   current_status = (SELECT TOP 1 audit.[status] FROM audit WHERE audit.finding_id = finding.id AND audit.is_latest = 1 ORDER BY audit.id DESC);
@@ -1,4 +1,9 @@
 DROP TABLE IF EXISTS [dbo].[alembic_version];
+DROP TABLE IF EXISTS [dbo].[ingest_job];
+DROP TABLE IF EXISTS [dbo].[ingest_request];
+DROP TABLE IF EXISTS [dbo].[audit_weekly_count];
+DROP TABLE IF EXISTS [dbo].[finding_weekly_snapshot];
+DROP TABLE IF EXISTS [dbo].[audit_archive];
 DROP TABLE IF EXISTS [dbo].[audit];
 DROP TABLE IF EXISTS [dbo].[scan_finding];
 DROP TABLE IF EXISTS [dbo].[scan];
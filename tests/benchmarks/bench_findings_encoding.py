@@ -0,0 +1,106 @@
+"""
+Benchmark of the encodings of a findings upload.
+Reports the bytes on the wire, the client encoding time and the server decoding time, decompression and
+validation into FindingCreate objects, of every combination of media type and content encoding.
+
+Usage: python tests/benchmarks/bench_findings_encoding.py [number_of_findings]
+Combinations requiring msgpack or zstandard are skipped when these are not installed.
+"""
+
+# Standard Library
+import gzip
+import json
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+# First Party
+from resc_backend.constants import (
+    CONTENT_ENCODING_GZIP,
+    CONTENT_ENCODING_IDENTITY,
+    CONTENT_ENCODING_ZSTD,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+)
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service_interface.findings import FINDINGS_ADAPTER, encode_findings, msgpack, zstandard
+
+MEDIA_TYPES = [JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE]
+CONTENT_ENCODINGS = [CONTENT_ENCODING_IDENTITY, CONTENT_ENCODING_GZIP, CONTENT_ENCODING_ZSTD]
+
+
+def generate_findings(size: int) -> list[FindingCreate]:
+    # A scan reports many findings per commit and file, the long strings repeat
+    return [
+        FindingCreate(
+            file_path=f"src/main/java/com/example/service/module_{i % 50}/ConfigurationLoader.java",
+            line_number=i,
+            column_start=i % 80,
+            column_end=i % 80 + 40,
+            commit_id=f"{i % 200:040x}",
+            commit_message=f"Merge pull request #{i % 200} from feature/long-branch-name-{i % 200}\n\n" * 3,
+            commit_timestamp=datetime.now(UTC),
+            author=f"Firstname Lastname {i % 20}",
+            email=f"firstname.lastname{i % 20}@example.com",
+            rule_name=f"rule-{i % 30}",
+            repository_id=1,
+        )
+        for i in range(size)
+    ]
+
+
+def decode(body: bytes, media_type: str, content_encoding: str) -> list[FindingCreate]:
+    if content_encoding == CONTENT_ENCODING_GZIP:
+        body = gzip.decompress(body)
+    elif content_encoding == CONTENT_ENCODING_ZSTD:
+        body = zstandard.ZstdDecompressor().decompress(body)
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return FINDINGS_ADAPTER.validate_python(msgpack.unpackb(body))
+    return FINDINGS_ADAPTER.validate_json(body)
+
+
+def timed(function: Callable) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main(size: int):
+    findings = generate_findings(size)
+
+    # previous client serialization, kept as reference
+    encode_time, body = timed(
+        lambda: json.dumps([json.loads(finding.model_dump_json()) for finding in findings]).encode()
+    )
+    decode_time, _ = timed(lambda: decode(body, JSON_MEDIA_TYPE, CONTENT_ENCODING_IDENTITY))
+
+    print(f"{size} findings")
+    print(f"{'encoding':<36} {'bytes':>12} {'ratio':>7} {'encode (ms)':>12} {'decode (ms)':>12}")
+    baseline = len(body)
+    print(
+        f"{'json (double serialization)':<36} {baseline:>12} {1:>7.2f} {encode_time * 1000:>12.1f} "
+        f"{decode_time * 1000:>12.1f}"
+    )
+
+    for media_type in MEDIA_TYPES:
+        for content_encoding in CONTENT_ENCODINGS:
+            if (media_type == MSGPACK_MEDIA_TYPE and msgpack is None) or (
+                content_encoding == CONTENT_ENCODING_ZSTD and zstandard is None
+            ):
+                print(f"{media_type} {content_encoding:<20} skipped, not installed")
+                continue
+            encode_time, (body, _) = timed(
+                lambda: encode_findings(findings, media_type=media_type, content_encoding=content_encoding)
+            )
+            decode_time, decoded = timed(lambda: decode(body, media_type, content_encoding))
+            assert len(decoded) == size
+            name = f"{media_type} {content_encoding}"
+            print(
+                f"{name:<36} {len(body):>12} {baseline / len(body):>7.2f} {encode_time * 1000:>12.1f} "
+                f"{decode_time * 1000:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,118 @@
+"""
+Benchmark of the recomputation of the latest audit of findings, as done after reverting audits.
+Compares the windowed crud.audit.fix_last_audit with the previous implementation transferring the audit ids.
+
+Usage: python tests/benchmarks/bench_fix_last_audit.py [database_url]
+The database defaults to an in-memory SQLite database, pass a SQLAlchemy url to benchmark against another engine.
+The audit table holds 1M audits, AUDITS_PER_FINDING per finding, and none of them is flagged as latest.
+"""
+
+# Standard Library
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from itertools import islice
+
+# Third Party
+from sqlalchemy import Index, create_engine, delete, func, select, update
+from sqlalchemy.orm import Query, Session
+
+# First Party
+from resc_backend.db.model import Base, DBaudit, DBfinding
+from resc_backend.resc_web_service.crud.audit import fix_last_audit, update_current_status
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+
+TOTAL_AUDITS = 1_000_000
+AUDITS_PER_FINDING = 5
+SIZES = [10_000, 100_000]
+
+
+def fix_last_audit_transfer(db_connection: Session, finding_ids: list[int]) -> None:
+    # previous implementation, kept as reference
+    finding_ids_iterator = iter(finding_ids)
+    while chunk := list(islice(finding_ids_iterator, 1000)):
+        max_audit_subquery: Query = select(DBaudit.finding_id, func.max(DBaudit.id_).label("audit_id"))
+        max_audit_subquery = max_audit_subquery.where(DBaudit.finding_id.in_(chunk))
+        max_audit_subquery = max_audit_subquery.group_by(DBaudit.finding_id)
+        max_audit_subquery = max_audit_subquery.subquery()
+
+        latest_audits_query = select(DBaudit.id_)
+        latest_audits_query = latest_audits_query.join(max_audit_subquery, max_audit_subquery.c.audit_id == DBaudit.id_)
+        latest_audits = db_connection.execute(latest_audits_query).scalars().all()
+        query = update(DBaudit).where(DBaudit.id_.in_(latest_audits)).values(is_latest=True)
+        db_connection.execute(query)
+        update_current_status(db_connection, DBfinding.id_.in_(chunk))
+
+
+def populate(db_connection: Session):
+    findings = TOTAL_AUDITS // AUDITS_PER_FINDING
+    timestamp = datetime.now(UTC)
+    db_connection.execute(delete(DBaudit))
+    db_connection.execute(delete(DBfinding))
+    db_connection.execute(
+        DBfinding.__table__.insert(),
+        [
+            {
+                "id": finding_id,
+                "repository_id": 1,
+                "rule_name": "rule",
+                "file_path": f"file_{finding_id}",
+                "line_number": 1,
+                "column_start": 0,
+                "column_end": 0,
+                "commit_timestamp": timestamp,
+                "is_dir_scan": False,
+            }
+            for finding_id in range(1, findings + 1)
+        ],
+    )
+    db_connection.execute(
+        DBaudit.__table__.insert(),
+        [
+            {
+                "finding_id": audit_id % findings + 1,
+                "status": FindingStatus.TRUE_POSITIVE.name,
+                "auditor": "auditor",
+                "timestamp": timestamp,
+                "is_latest": False,
+                "valid_from": timestamp,
+                # the last audits inserted are the latest audit of their finding
+                "valid_to": timestamp if audit_id < TOTAL_AUDITS - findings else None,
+            }
+            for audit_id in range(TOTAL_AUDITS)
+        ],
+    )
+    db_connection.commit()
+
+
+def run(db_connection: Session, size: int, fix: Callable[[Session, list[int]], None]) -> float:
+    db_connection.execute(update(DBaudit).values(is_latest=False))
+    db_connection.commit()
+
+    start = time.perf_counter()
+    fix(db_connection, list(range(1, size + 1)))
+    db_connection.commit()
+    elapsed = time.perf_counter() - start
+
+    assert db_connection.query(DBaudit).where(DBaudit.is_latest == True).count() == size  # noqa: E712
+    return elapsed
+
+
+def main(database_url: str):
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine, tables=[DBfinding.__table__, DBaudit.__table__])
+    # Indexes of the audit table created by the migrations
+    Index("nci_audit_is_latest", DBaudit.is_latest, DBaudit.finding_id, DBaudit.status).create(engine)
+    Index("nci_audit_finding_id", DBaudit.finding_id, DBaudit.id_).create(engine)
+    with Session(bind=engine) as db_connection:
+        populate(db_connection)
+        print(f"{'findings':>10} {'transfer (s)':>14} {'windowed (s)':>14} {'speedup':>9}")
+        for size in SIZES:
+            transfer = run(db_connection, size, fix_last_audit_transfer)
+            windowed = run(db_connection, size, fix_last_audit)
+            print(f"{size:>10} {transfer:>14.3f} {windowed:>14.3f} {transfer / windowed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "sqlite://")
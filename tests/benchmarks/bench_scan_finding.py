@@ -0,0 +1,75 @@
+"""
+Benchmark of the creation of the links between findings and a scan.
+Compares the set based crud.scan_finding.create_scan_findings with the previous per row Session.merge path.
+
+Usage: python tests/benchmarks/bench_scan_finding.py [database_url]
+The database defaults to an in-memory SQLite database, pass a SQLAlchemy url to benchmark against another engine.
+Half of the requested links already exist, like a rescan of a repository where half the findings are known.
+"""
+
+# Standard Library
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+# Third Party
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import Base, DBfinding, DBscanFinding
+from resc_backend.resc_web_service.crud.scan_finding import create_scan_findings
+
+SIZES = [10_000, 100_000]
+SCAN_ID = 1
+
+
+def create_scan_findings_merge(db_connection: Session, scan_findings: list[DBscanFinding]) -> int:
+    # previous implementation, kept as reference
+    _ = db_connection.query(DBscanFinding).where(DBscanFinding.scan_id == SCAN_ID).all()
+    for scan_finding in scan_findings:
+        db_connection.merge(scan_finding)
+    db_connection.commit()
+    return len(scan_findings)
+
+
+def run(db_connection: Session, size: int, create: Callable[[Session, list[DBscanFinding]], int]) -> float:
+    db_connection.execute(delete(DBscanFinding))
+    db_connection.execute(
+        DBscanFinding.__table__.insert(),
+        [{"finding_id": finding_id, "scan_id": SCAN_ID} for finding_id in range(0, size, 2)],
+    )
+    db_connection.commit()
+    db_connection.expunge_all()
+
+    scan_findings = [DBscanFinding(finding_id=finding_id, scan_id=SCAN_ID) for finding_id in range(size)]
+    start = time.perf_counter()
+    create(db_connection, scan_findings)
+    elapsed = time.perf_counter() - start
+
+    assert db_connection.query(DBscanFinding).count() == size
+    db_connection.expunge_all()
+    return elapsed
+
+
+def main(database_url: str):
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine, tables=[DBfinding.__table__, DBscanFinding.__table__])
+    with Session(bind=engine) as db_connection:
+        # the links are created for existing findings only
+        finding = {"repository_id": 1, "rule_name": "rule", "file_path": "file", "commit_timestamp": datetime.now(UTC)}
+        db_connection.execute(
+            DBfinding.__table__.insert(),
+            [{"id": finding_id, "line_number": finding_id, **finding} for finding_id in range(max(SIZES))],
+        )
+        db_connection.commit()
+        print(f"{'links':>10} {'merge (s)':>12} {'set based (s)':>15} {'speedup':>9}")
+        for size in SIZES:
+            merge = run(db_connection, size, create_scan_findings_merge)
+            set_based = run(db_connection, size, create_scan_findings)
+            print(f"{size:>10} {merge:>12.3f} {set_based:>15.3f} {merge / set_based:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "sqlite://")
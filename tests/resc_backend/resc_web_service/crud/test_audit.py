@@ -0,0 +1,758 @@
+# Standard Library
+import unittest
+from datetime import UTC, datetime, timedelta
+
+# Third Party
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import (
+    Base,
+    DBaudit,
+    DBauditArchive,
+    DBfinding,
+    DBrepository,
+    DBrule,
+    DBscan,
+    DBscanFinding,
+    DBVcsInstance,
+)
+from resc_backend.resc_web_service.crud.audit import (
+    _time_period_range,
+    archive_audits,
+    clear_outdated_no_longer_outdated,
+    create_audits,
+    create_audits_from_query,
+    create_automated_audits,
+    create_automated_audits_from_query,
+    fix_last_audit,
+    get_audit_stats_count,
+    get_audits,
+    get_audits_after,
+    get_finding_audits,
+    get_finding_audits_count,
+    get_personal_audit_count,
+    get_personal_audit_counts,
+    revert_last_audit,
+    update_current_status,
+)
+from resc_backend.resc_web_service.crud.finding import (
+    query_findings_from_repo_of_scan_as_dir,
+    query_untriaged_finding_outdated_for_current_scan,
+)
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+from resc_backend.resc_web_service.schema.time_period import TimePeriod
+
+
+class TestCreateAutomatedAuditsFromQuery(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        self.session.add_all(
+            [
+                DBrule(rule_pack="1.0", rule_name="dir_rule", description="dir_rule"),
+                DBrule(rule_pack="1.0", rule_name="rule", description="rule"),
+            ]
+        )
+        self.scan = DBscan(
+            repository_id=1,
+            scan_type="BASE",
+            last_scanned_commit="FAKE_HASH",
+            timestamp=datetime.now(UTC),
+            increment_number=0,
+            rule_pack="1.0",
+            is_latest=True,
+        )
+        self.session.add(self.scan)
+
+        self.findings = {}
+        for name, repository_id, rule_name, is_dir_scan in [
+            ("dir_not_audited", 1, "dir_rule", True),
+            ("dir_audited", 1, "dir_rule", True),
+            ("dir_outdated", 1, "dir_rule", True),
+            ("dir_in_scan", 1, "dir_rule", True),
+            ("dir_other_repository", 2, "dir_rule", True),
+            ("old_rule_not_audited", 1, "old_rule", False),
+            ("old_rule_not_analyzed", 1, "old_rule", False),
+            ("old_rule_audited", 1, "old_rule", False),
+        ]:
+            self.findings[name] = DBfinding(
+                file_path=name,
+                line_number=1,
+                column_start=1,
+                column_end=1,
+                commit_id="commit",
+                commit_message="message",
+                commit_timestamp=datetime.now(UTC),
+                author="author",
+                email="email",
+                rule_name=rule_name,
+                repository_id=repository_id,
+                event_sent_on=None,
+                is_dir_scan=is_dir_scan,
+            )
+        self.session.add_all(self.findings.values())
+        self.session.flush()
+
+        self.session.add(DBscanFinding(finding_id=self.findings["dir_in_scan"].id_, scan_id=self.scan.id_))
+        for name, status in [
+            ("dir_audited", FindingStatus.TRUE_POSITIVE),
+            ("dir_outdated", FindingStatus.OUTDATED),
+            ("old_rule_not_analyzed", FindingStatus.NOT_ANALYZED),
+            ("old_rule_audited", FindingStatus.FALSE_POSITIVE),
+        ]:
+            self.session.add(
+                DBaudit(
+                    finding_id=self.findings[name].id_,
+                    status=status,
+                    auditor="auditor",
+                    comment="",
+                    timestamp=datetime.now(UTC),
+                    is_latest=True,
+                )
+            )
+        self.session.flush()
+        update_current_status(self.session, DBfinding.id_.in_([finding.id_ for finding in self.findings.values()]))
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def latest_audits(self) -> dict[int, DBaudit]:
+        query = select(DBaudit).where(DBaudit.is_latest == True)  # noqa: E712
+        return {audit.finding_id: audit for audit in self.session.execute(query).scalars().all()}
+
+    def assert_outdated(self, names: list[str]):
+        latest_audits = self.latest_audits()
+        for name in names:
+            audit = latest_audits[self.findings[name].id_]
+            assert audit.status == FindingStatus.OUTDATED
+            assert audit.auditor == "resc"
+            assert audit.comment == "automated"
+            assert self.current_status(name) == (FindingStatus.OUTDATED, audit.id_)
+
+    def current_status(self, name: str) -> tuple[FindingStatus | None, int | None]:
+        query = select(DBfinding.current_status, DBfinding.current_audit_id)
+        query = query.where(DBfinding.id_ == self.findings[name].id_)
+        return tuple(self.session.execute(query).one())
+
+    def test_findings_from_repo_of_scan_as_dir(self):
+        query = query_findings_from_repo_of_scan_as_dir(self.scan)
+        expected = set(self.session.execute(query).scalars().all())
+        assert expected == {self.findings["dir_not_audited"].id_, self.findings["dir_audited"].id_}
+
+        created = create_automated_audits_from_query(self.session, query, FindingStatus.OUTDATED)
+
+        assert created == 2
+        self.assert_outdated(["dir_not_audited", "dir_audited"])
+        assert self.latest_audits()[self.findings["dir_outdated"].id_].auditor == "auditor"
+        # exactly one latest audit per audited finding
+        assert self.session.query(DBaudit).where(DBaudit.is_latest == True).count() == 5  # noqa: E712
+        assert self.session.execute(query).scalars().all() == []
+
+    def test_untriaged_finding_outdated_for_current_scan(self):
+        query = query_untriaged_finding_outdated_for_current_scan(self.scan)
+
+        created = create_automated_audits_from_query(self.session, query, FindingStatus.OUTDATED)
+
+        assert created == 2
+        self.assert_outdated(["old_rule_not_audited", "old_rule_not_analyzed"])
+        assert self.latest_audits()[self.findings["old_rule_audited"].id_].status == FindingStatus.FALSE_POSITIVE
+        assert self.session.execute(query).scalars().all() == []
+
+    def test_nothing_to_audit(self):
+        self.session.add(
+            DBscanFinding(finding_id=self.findings["dir_not_audited"].id_, scan_id=self.scan.id_),
+        )
+        self.session.add(
+            DBscanFinding(finding_id=self.findings["dir_audited"].id_, scan_id=self.scan.id_),
+        )
+        query = query_findings_from_repo_of_scan_as_dir(self.scan)
+        assert create_automated_audits_from_query(self.session, query, FindingStatus.OUTDATED) == 0
+
+
+class TestCurrentStatus(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        self.findings = [
+            DBfinding(
+                file_path=f"file_{index}",
+                line_number=1,
+                column_start=1,
+                column_end=1,
+                commit_id="commit",
+                commit_message="message",
+                commit_timestamp=datetime.now(UTC),
+                author="author",
+                email="email",
+                rule_name="rule",
+                repository_id=1,
+                event_sent_on=None,
+            )
+            for index in range(2)
+        ]
+        self.session.add_all(self.findings)
+        self.session.commit()
+        self.finding_ids = [finding.id_ for finding in self.findings]
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def current_statuses(self) -> list[tuple[FindingStatus | None, int | None]]:
+        query = select(DBfinding.current_status, DBfinding.current_audit_id).order_by(DBfinding.id_)
+        return [tuple(row) for row in self.session.execute(query).all()]
+
+    def latest_audit_ids(self) -> list[int]:
+        query = select(DBaudit.id_).where(DBaudit.is_latest == True).order_by(DBaudit.finding_id)  # noqa: E712
+        return self.session.execute(query).scalars().all()
+
+    def validities(self) -> list[tuple[int, bool]]:
+        # The audits are valid from their timestamp until the timestamp of the next audit of their finding
+        query = select(DBaudit).order_by(DBaudit.finding_id, DBaudit.id_)
+        audits = self.session.execute(query.execution_options(populate_existing=True)).scalars().all()
+        for audit, next_audit in zip(audits, audits[1:] + [None]):
+            assert audit.valid_from == audit.timestamp
+            if next_audit is not None and next_audit.finding_id == audit.finding_id:
+                assert audit.valid_to == next_audit.timestamp
+            else:
+                assert audit.valid_to is None
+        return [(audit.finding_id, audit.valid_to is None) for audit in audits]
+
+    def test_not_audited(self):
+        assert self.current_statuses() == [(None, None), (None, None)]
+
+    def test_validity(self):
+        first, second = self.finding_ids
+        create_audits(self.session, {first}, auditor="auditor", status=FindingStatus.TRUE_POSITIVE)
+        create_automated_audits(self.session, [first, second], FindingStatus.OUTDATED)
+        create_audits_from_query(
+            self.session, select(DBfinding.id_), auditor="other", status=FindingStatus.FALSE_POSITIVE
+        )
+        assert self.validities() == [(first, False), (first, False), (first, True), (second, False), (second, True)]
+
+        revert_last_audit(self.session, self.finding_ids, status=FindingStatus.FALSE_POSITIVE)
+        assert self.validities() == [(first, False), (first, True), (second, True)]
+
+        clear_outdated_no_longer_outdated(self.session, self.finding_ids)
+        assert self.validities() == [(first, True)]
+
+    def test_create_audits(self):
+        create_audits(self.session, set(self.finding_ids[:1]), auditor="auditor", status=FindingStatus.TRUE_POSITIVE)
+        create_audits(self.session, set(self.finding_ids), auditor="auditor", status=FindingStatus.FALSE_POSITIVE)
+
+        audit_ids = self.latest_audit_ids()
+        assert self.current_statuses() == [
+            (FindingStatus.FALSE_POSITIVE, audit_ids[0]),
+            (FindingStatus.FALSE_POSITIVE, audit_ids[1]),
+        ]
+
+    def test_revert_last_audit(self):
+        create_audits(self.session, set(self.finding_ids), auditor="auditor", status=FindingStatus.TRUE_POSITIVE)
+        first_audit_ids = self.latest_audit_ids()
+        create_automated_audits(self.session, self.finding_ids[:1], FindingStatus.OUTDATED)
+        assert self.current_statuses()[0][0] == FindingStatus.OUTDATED
+
+        revert_last_audit(self.session, self.finding_ids, status=FindingStatus.OUTDATED)
+
+        assert self.current_statuses() == [
+            (FindingStatus.TRUE_POSITIVE, first_audit_ids[0]),
+            (FindingStatus.TRUE_POSITIVE, first_audit_ids[1]),
+        ]
+
+        revert_last_audit(self.session, self.finding_ids[1:], status=None)
+
+        assert self.current_statuses()[1] == (None, None)
+
+    def test_clear_outdated_no_longer_outdated(self):
+        create_automated_audits(self.session, self.finding_ids, FindingStatus.OUTDATED)
+
+        clear_outdated_no_longer_outdated(self.session, self.finding_ids[:1])
+
+        assert self.current_statuses() == [(None, None), (FindingStatus.OUTDATED, self.latest_audit_ids()[0])]
+
+    def test_create_audits_from_query(self):
+        self.session.add(
+            DBfinding(
+                file_path="file_2",
+                line_number=1,
+                column_start=1,
+                column_end=1,
+                commit_id="commit",
+                commit_message="message",
+                commit_timestamp=datetime.now(UTC),
+                author="author",
+                email="email",
+                rule_name="rule",
+                repository_id=1,
+                event_sent_on=None,
+            )
+        )
+        self.session.commit()
+        create_audits(self.session, set(self.finding_ids[:1]), auditor="auditor", status=FindingStatus.TRUE_POSITIVE)
+
+        # The filter on the current status must not skip findings of the next batches
+        query = select(DBfinding.id_).where(DBfinding.current_status == None)  # noqa: E711
+        assert (
+            create_audits_from_query(
+                self.session, query, auditor="other", status=FindingStatus.FALSE_POSITIVE, comment="<b>", batch_size=1
+            )
+            == 2
+        )
+
+        audit_ids = self.latest_audit_ids()
+        assert self.current_statuses() == [
+            (FindingStatus.TRUE_POSITIVE, audit_ids[0]),
+            (FindingStatus.FALSE_POSITIVE, audit_ids[1]),
+            (FindingStatus.FALSE_POSITIVE, audit_ids[2]),
+        ]
+        audit = self.session.get(DBaudit, audit_ids[2])
+        assert (audit.auditor, audit.comment) == ("other", "&lt;b&gt;")
+        assert create_audits_from_query(self.session, query, auditor="other", status=FindingStatus.FALSE_POSITIVE) == 0
+
+    def test_fix_last_audit(self):
+        for finding_id, is_latest in [
+            (self.finding_ids[0], True),
+            (self.finding_ids[0], True),
+            (self.finding_ids[0], False),
+            (self.finding_ids[1], True),
+        ]:
+            self.session.add(
+                DBaudit(
+                    finding_id=finding_id,
+                    status=FindingStatus.TRUE_POSITIVE,
+                    auditor="auditor",
+                    comment="",
+                    timestamp=datetime.now(UTC),
+                    is_latest=is_latest,
+                )
+            )
+        self.session.flush()
+
+        fix_last_audit(self.session, self.finding_ids)
+
+        assert self.latest_audit_ids() == [3, 4]
+        assert self.current_statuses() == [(FindingStatus.TRUE_POSITIVE, 3), (FindingStatus.TRUE_POSITIVE, 4)]
+
+
+class TestGetAuditStatsCount(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        for auditor, status, count in [
+            ("auditor_1", FindingStatus.TRUE_POSITIVE, 3),
+            ("auditor_1", FindingStatus.FALSE_POSITIVE, 2),
+            ("auditor_1", FindingStatus.OUTDATED, 1),
+            ("auditor_2", FindingStatus.CLARIFICATION_REQUIRED, 1),
+            ("auditor_2", FindingStatus.NOT_ACCESSIBLE, 1),
+            ("auditor_2", FindingStatus.NOT_ANALYZED, 4),
+        ]:
+            self.session.add_all(
+                [
+                    DBaudit(
+                        finding_id=1,
+                        status=status,
+                        auditor=auditor,
+                        comment="",
+                        timestamp=datetime.now(UTC),
+                        is_latest=False,
+                    )
+                    for _ in range(count)
+                ]
+            )
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def test_all_auditors(self):
+        stats = {row.auditor: row._asdict() for row in get_audit_stats_count(self.session, auditor=None)}
+
+        assert stats == {
+            "auditor_1": {
+                "auditor": "auditor_1",
+                "true_positive": 3,
+                "false_positive": 2,
+                "clarification_required": 0,
+                "not_accessible": 0,
+                "outdated": 1,
+                "not_analyzed": 0,
+                "total": 6,
+            },
+            "auditor_2": {
+                "auditor": "auditor_2",
+                "true_positive": 0,
+                "false_positive": 0,
+                "clarification_required": 1,
+                "not_accessible": 1,
+                "outdated": 0,
+                "not_analyzed": 4,
+                "total": 6,
+            },
+        }
+
+    def test_single_auditor(self):
+        stats = get_audit_stats_count(self.session, auditor="auditor_1")
+
+        assert len(stats) == 1
+        assert stats[0].auditor == "auditor_1"
+        assert stats[0].true_positive == 3
+        assert stats[0].total == 6
+
+    def test_unknown_auditor(self):
+        assert get_audit_stats_count(self.session, auditor="unknown") == []
+
+
+class TestPersonalAuditCounts(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        now = datetime.now(UTC)
+        self.timestamps = [
+            now,
+            _time_period_range(TimePeriod.DAY, now)[0],
+            _time_period_range(TimePeriod.WEEK, now)[0],
+            _time_period_range(TimePeriod.LAST_WEEK, now)[0],
+            _time_period_range(TimePeriod.LAST_WEEK, now)[0] - timedelta(seconds=1),
+            _time_period_range(TimePeriod.MONTH, now)[0],
+            _time_period_range(TimePeriod.YEAR, now)[0] - timedelta(seconds=1),
+        ]
+        for auditor in ["auditor", "other_auditor"]:
+            self.session.add_all(
+                [
+                    DBaudit(
+                        finding_id=1,
+                        status=FindingStatus.TRUE_POSITIVE,
+                        auditor=auditor,
+                        comment="",
+                        timestamp=timestamp,
+                        is_latest=False,
+                    )
+                    for timestamp in self.timestamps
+                ]
+            )
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def expected_count(self, time_period: TimePeriod) -> int:
+        start, end = _time_period_range(time_period, datetime.now(UTC))
+        if start is None:
+            return len(self.timestamps)
+        return len([timestamp for timestamp in self.timestamps if start <= timestamp < end])
+
+    def test_time_period_range(self):
+        now = datetime(2024, 12, 31, 15, 30, tzinfo=UTC)
+        assert _time_period_range(TimePeriod.DAY, now) == (
+            datetime(2024, 12, 31, tzinfo=UTC),
+            datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        assert _time_period_range(TimePeriod.WEEK, now) == (
+            datetime(2024, 12, 30, tzinfo=UTC),
+            datetime(2025, 1, 6, tzinfo=UTC),
+        )
+        assert _time_period_range(TimePeriod.LAST_WEEK, now) == (
+            datetime(2024, 12, 23, tzinfo=UTC),
+            datetime(2024, 12, 30, tzinfo=UTC),
+        )
+        assert _time_period_range(TimePeriod.MONTH, now) == (
+            datetime(2024, 12, 1, tzinfo=UTC),
+            datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        assert _time_period_range(TimePeriod.YEAR, now) == (
+            datetime(2024, 1, 1, tzinfo=UTC),
+            datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        assert _time_period_range(TimePeriod.FOREVER, now) == (None, None)
+
+    def test_get_personal_audit_counts(self):
+        counts = get_personal_audit_counts(self.session, auditor="auditor")
+
+        assert counts.today == self.expected_count(TimePeriod.DAY)
+        assert counts.current_week == self.expected_count(TimePeriod.WEEK)
+        assert counts.last_week == self.expected_count(TimePeriod.LAST_WEEK)
+        assert counts.current_month == self.expected_count(TimePeriod.MONTH)
+        assert counts.current_year == self.expected_count(TimePeriod.YEAR)
+        assert counts.forever == len(self.timestamps)
+
+    def test_get_personal_audit_count(self):
+        for time_period in TimePeriod:
+            assert get_personal_audit_count(self.session, "auditor", time_period) == self.expected_count(time_period)
+
+    def test_get_personal_audit_counts_unknown_auditor(self):
+        counts = get_personal_audit_counts(self.session, auditor="unknown")
+
+        assert tuple(counts) == (0, 0, 0, 0, 0, 0)
+
+
+class TestAuditArchive(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        self.finding = DBfinding(
+            file_path="file",
+            line_number=1,
+            column_start=1,
+            column_end=1,
+            commit_id="commit",
+            commit_message="message",
+            commit_timestamp=datetime.now(UTC),
+            author="author",
+            email="email",
+            rule_name="rule",
+            repository_id=1,
+            event_sent_on=None,
+        )
+        self.session.add(self.finding)
+        self.session.flush()
+
+        now = datetime.now(UTC)
+        self.audits = [
+            DBaudit(
+                finding_id=self.finding.id_,
+                status=status,
+                auditor="auditor",
+                comment=status.value,
+                timestamp=timestamp,
+                is_latest=False,
+            )
+            for status, timestamp in [
+                (FindingStatus.NOT_ACCESSIBLE, now - timedelta(days=300)),
+                (FindingStatus.CLARIFICATION_REQUIRED, now - timedelta(days=200)),
+                (FindingStatus.FALSE_POSITIVE, now - timedelta(days=100)),
+                (FindingStatus.TRUE_POSITIVE, now - timedelta(days=50)),
+            ]
+        ]
+        self.session.add_all(self.audits)
+        self.session.commit()
+        fix_last_audit(self.session, [self.finding.id_])
+        self.session.commit()
+        self.audit_ids = [audit.id_ for audit in self.audits]
+        self.older_than = now - timedelta(days=30)
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def hot_audit_ids(self) -> list[int]:
+        return self.session.execute(select(DBaudit.id_).order_by(DBaudit.id_)).scalars().all()
+
+    def archived_audit_ids(self) -> list[int]:
+        return self.session.execute(select(DBauditArchive.id_).order_by(DBauditArchive.id_)).scalars().all()
+
+    def test_archive_audits(self):
+        assert archive_audits(self.session, older_than=datetime.now(UTC) - timedelta(days=150)) == 1
+
+        # the audit of 200 days ago was superseded 100 days ago, it is still valid 150 days ago
+        assert self.hot_audit_ids() == self.audit_ids[1:]
+        assert self.archived_audit_ids() == self.audit_ids[:1]
+        archived = self.session.get(DBauditArchive, self.audit_ids[0])
+        assert (archived.finding_id, archived.status, archived.auditor, archived.comment) == (
+            self.finding.id_,
+            FindingStatus.NOT_ACCESSIBLE,
+            "auditor",
+            FindingStatus.NOT_ACCESSIBLE.value,
+        )
+
+    def test_archive_audits_keeps_latest(self):
+        assert archive_audits(self.session, older_than=self.older_than, batch_size=1) == 3
+
+        assert self.hot_audit_ids() == self.audit_ids[3:]
+        assert self.archived_audit_ids() == self.audit_ids[:3]
+        assert archive_audits(self.session, older_than=self.older_than) == 0
+
+    def test_archive_audits_max_batches(self):
+        assert archive_audits(self.session, older_than=self.older_than, batch_size=1, max_batches=2) == 2
+
+        assert self.archived_audit_ids() == self.audit_ids[:2]
+        assert archive_audits(self.session, older_than=self.older_than, batch_size=1, max_batches=2) == 1
+
+    def test_get_finding_audits(self):
+        archive_audits(self.session, older_than=self.older_than)
+
+        audits = get_finding_audits(self.session, finding_id=self.finding.id_)
+        assert [audit.id_ for audit in audits] == self.audit_ids[::-1]
+        assert [audit.status for audit in audits] == [audit.status for audit in self.audits[::-1]]
+        assert [audit.id_ for audit in get_finding_audits(self.session, self.finding.id_, skip=1, limit=2)] == [
+            self.audit_ids[2],
+            self.audit_ids[1],
+        ]
+        assert get_finding_audits_count(self.session, finding_id=self.finding.id_) == len(self.audit_ids)
+
+    def test_audit_metrics_include_archive(self):
+        archive_audits(self.session, older_than=self.older_than)
+
+        assert get_personal_audit_counts(self.session, auditor="auditor").forever == len(self.audit_ids)
+        stats = get_audit_stats_count(self.session, auditor="auditor")
+        assert stats[0].total == len(self.audit_ids)
+        assert stats[0].not_accessible == 1
+
+    def test_revert_last_audit_restores_archived_audit(self):
+        archive_audits(self.session, older_than=self.older_than)
+
+        revert_last_audit(self.session, [self.finding.id_], status=None)
+
+        latest = self.session.execute(select(DBaudit)).scalars().one()
+        assert latest.is_latest
+        assert latest.status == FindingStatus.FALSE_POSITIVE
+        assert self.archived_audit_ids() == self.audit_ids[:2]
+        assert get_finding_audits_count(self.session, finding_id=self.finding.id_) == 3
+        finding = self.session.get(DBfinding, self.finding.id_)
+        self.session.refresh(finding)
+        assert (finding.current_status, finding.current_audit_id) == (FindingStatus.FALSE_POSITIVE, latest.id_)
+
+    def test_clear_outdated_no_longer_outdated_skips_archived_automated_audits(self):
+        # true positive by the auditor, then not accessible and outdated automatically
+        create_automated_audits(self.session, [self.finding.id_], FindingStatus.NOT_ACCESSIBLE)
+        create_automated_audits(self.session, [self.finding.id_], FindingStatus.OUTDATED)
+        self.session.commit()
+        archive_audits(self.session, older_than=datetime.now(UTC) + timedelta(days=1))
+
+        clear_outdated_no_longer_outdated(self.session, [self.finding.id_])
+
+        latest = self.session.execute(select(DBaudit)).scalars().one()
+        assert latest.is_latest
+        assert latest.status == FindingStatus.TRUE_POSITIVE
+        assert self.archived_audit_ids() == self.audit_ids[:3]
+        finding = self.session.get(DBfinding, self.finding.id_)
+        self.session.refresh(finding)
+        assert (finding.current_status, finding.current_audit_id) == (FindingStatus.TRUE_POSITIVE, latest.id_)
+
+    def test_clear_outdated_no_longer_outdated_restores_archived_audit(self):
+        archive_audits(self.session, older_than=self.older_than)
+        # the finding is marked outdated, then the audit it superseded is archived
+        create_automated_audits(self.session, [self.finding.id_], FindingStatus.OUTDATED)
+        self.session.commit()
+        archive_audits(self.session, older_than=datetime.now(UTC) + timedelta(days=1))
+        assert self.archived_audit_ids() == self.audit_ids
+
+        # the finding is reported again
+        clear_outdated_no_longer_outdated(self.session, [self.finding.id_])
+
+        latest = self.session.execute(select(DBaudit)).scalars().one()
+        assert latest.is_latest
+        assert latest.status == FindingStatus.TRUE_POSITIVE
+        assert self.archived_audit_ids() == self.audit_ids[:3]
+        finding = self.session.get(DBfinding, self.finding.id_)
+        self.session.refresh(finding)
+        assert (finding.current_status, finding.current_audit_id) == (FindingStatus.TRUE_POSITIVE, latest.id_)
+
+
+class TestGetAuditsAfter(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        vcs_instance = DBVcsInstance(
+            name="name",
+            provider_type="AZURE_DEVOPS",
+            scheme="https",
+            hostname="hostname",
+            port=443,
+            organization="organization",
+            scope="",
+            exceptions="",
+        )
+        self.session.add(vcs_instance)
+        self.session.flush()
+        repository = DBrepository(
+            project_key="project_key",
+            repository_id="repository_id",
+            repository_name="repository_name",
+            repository_url="https://fake.repo.com/repository_name",
+            vcs_instance=vcs_instance.id_,
+        )
+        self.session.add(repository)
+        self.session.flush()
+        finding = DBfinding(
+            file_path="file",
+            line_number=1,
+            column_start=1,
+            column_end=1,
+            commit_id="commit",
+            commit_message="message",
+            commit_timestamp=datetime.now(UTC),
+            author="author",
+            email="email",
+            rule_name="rule",
+            repository_id=repository.id_,
+            event_sent_on=None,
+        )
+        self.session.add(finding)
+        self.session.flush()
+
+        # Pairs of audits share their timestamp, the id breaks the tie
+        now = datetime(2024, 5, 6, 7, 8, 9)
+        self.session.add_all(
+            [
+                DBaudit(
+                    finding_id=finding.id_,
+                    status=FindingStatus.TRUE_POSITIVE,
+                    auditor=auditor,
+                    comment="",
+                    timestamp=now - timedelta(minutes=index // 2),
+                    is_latest=False,
+                )
+                for index, auditor in enumerate(["auditor", "auditor", "resc", "auditor", "auditor", "other"])
+            ]
+        )
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def get_audits_after(self, after, limit, auditor=None):
+        return get_audits_after(
+            self.session,
+            after=after,
+            limit=limit,
+            auditor=auditor,
+            from_date=None,
+            to_date=None,
+            status=None,
+            is_latest=None,
+        )
+
+    def test_pages_match_offset_pagination(self):
+        expected = get_audits(
+            self.session, skip=0, limit=10, auditor=None, from_date=None, to_date=None, status=None, is_latest=None
+        )
+        assert [audit.audit_id for audit in expected] == [2, 1, 4, 6, 5]
+
+        audit_ids, after = [], None
+        for _ in range(3):
+            audits, after = self.get_audits_after(after, limit=2)
+            audit_ids.append([audit.audit_id for audit in audits])
+            if after is None:
+                break
+        assert audit_ids == [[2, 1], [4, 6], [5]]
+
+    def test_last_page_is_full(self):
+        audits, after = self.get_audits_after(None, limit=5)
+        assert len(audits) == 5
+        assert after is None
+
+    def test_next_page_key(self):
+        audits, after = self.get_audits_after(None, limit=3)
+        assert after == (audits[-1].timestamp, audits[-1].audit_id)
+
+        audits, after = self.get_audits_after(after, limit=3, auditor="auditor")
+        assert [audit.audit_id for audit in audits] == [5]
+        assert after is None
@@ -0,0 +1,125 @@
+# Standard Library
+import unittest
+from datetime import UTC, date, datetime, timedelta
+
+# Third Party
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import Base, DBaudit, DBauditWeeklyCount, DBfinding
+from resc_backend.resc_web_service.crud.audit import (
+    create_audits,
+    create_automated_audits,
+    revert_last_audit,
+)
+from resc_backend.resc_web_service.crud.audit_weekly_count import (
+    add_audit_count,
+    get_week_start,
+    get_weekly_audit_count,
+    get_weekly_audit_rank,
+    rebuild_audit_weekly_counts,
+)
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+
+
+class TestAuditWeeklyCount(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        self.findings = [
+            DBfinding(
+                file_path=f"file_{index}",
+                line_number=1,
+                column_start=1,
+                column_end=1,
+                commit_id="commit",
+                commit_message="message",
+                commit_timestamp=datetime.now(UTC),
+                author="author",
+                email="email",
+                rule_name="rule",
+                repository_id=1,
+                event_sent_on=None,
+            )
+            for index in range(3)
+        ]
+        self.session.add_all(self.findings)
+        self.session.commit()
+        self.finding_ids = [finding.id_ for finding in self.findings]
+        self.week_start = get_week_start(datetime.now(UTC))
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def weekly_counts(self) -> dict[tuple[date, str], int]:
+        query = select(DBauditWeeklyCount)
+        return {
+            (counter.week_start, counter.auditor): counter.audit_count
+            for counter in self.session.execute(query).scalars()
+        }
+
+    def test_get_week_start(self):
+        assert get_week_start(datetime(2024, 12, 29, 23, 59)) == date(2024, 12, 23)
+        assert get_week_start(datetime(2024, 12, 30, 0, 0)) == date(2024, 12, 30)
+        assert get_week_start(datetime(2025, 1, 1, 12, 0, tzinfo=UTC)) == date(2024, 12, 30)
+
+    def test_audits_are_counted(self):
+        create_audits(self.session, set(self.finding_ids), auditor="auditor", status=FindingStatus.TRUE_POSITIVE)
+        create_audits(self.session, set(self.finding_ids[:1]), auditor="auditor", status=FindingStatus.FALSE_POSITIVE)
+        create_automated_audits(self.session, self.finding_ids[1:], FindingStatus.OUTDATED)
+        self.session.commit()
+
+        assert self.weekly_counts() == {(self.week_start, "auditor"): 4, (self.week_start, "resc"): 2}
+
+        revert_last_audit(self.session, self.finding_ids, status=FindingStatus.OUTDATED)
+        self.session.commit()
+
+        assert self.weekly_counts() == {(self.week_start, "auditor"): 4, (self.week_start, "resc"): 0}
+        assert get_weekly_audit_rank(self.session, auditor="resc", week_start=self.week_start) == 0
+
+    def test_get_weekly_audit_rank(self):
+        for auditor, audit_count in [("b", 2), ("a", 2), ("c", 5), ("d", 1)]:
+            add_audit_count(self.session, auditor, datetime.now(UTC), audit_count)
+        add_audit_count(self.session, "d", datetime.now(UTC) - timedelta(weeks=1), 10)
+        self.session.commit()
+
+        assert get_weekly_audit_count(self.session, auditor="d", week_start=self.week_start) == 1
+        ranks = {
+            auditor: get_weekly_audit_rank(self.session, auditor=auditor, week_start=self.week_start)
+            for auditor in ["a", "b", "c", "d", "unknown"]
+        }
+        assert ranks == {"c": 1, "a": 2, "b": 3, "d": 4, "unknown": 0}
+
+    def test_rebuild_audit_weekly_counts(self):
+        now = datetime.now(UTC)
+        last_week = now - timedelta(weeks=1)
+        self.session.add_all(
+            [
+                DBaudit(
+                    finding_id=self.finding_ids[0],
+                    status=FindingStatus.TRUE_POSITIVE,
+                    auditor=auditor,
+                    comment="",
+                    timestamp=timestamp,
+                    is_latest=False,
+                )
+                for auditor, timestamp in [("a", now), ("a", now), ("b", last_week), ("c", now - timedelta(weeks=3))]
+            ]
+        )
+        add_audit_count(self.session, "a", now, 1)
+        add_audit_count(self.session, "z", last_week, 3)
+        add_audit_count(self.session, "c", now - timedelta(weeks=3), 7)
+        self.session.commit()
+
+        assert rebuild_audit_weekly_counts(self.session, since=last_week) == 3
+
+        assert self.weekly_counts() == {
+            (self.week_start, "a"): 2,
+            (get_week_start(last_week), "b"): 1,
+            (get_week_start(now - timedelta(weeks=3)), "c"): 7,
+        }
+        assert rebuild_audit_weekly_counts(self.session, since=last_week) == 0
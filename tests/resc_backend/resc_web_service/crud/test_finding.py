@@ -0,0 +1,219 @@
+# Standard Library
+import unittest
+from datetime import UTC, datetime, timedelta
+
+# Third Party
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.constants import AZURE_DEVOPS
+from resc_backend.db.model import (
+    Base,
+    DBaudit,
+    DBfinding,
+    DBfindingWeeklySnapshot,
+    DBrepository,
+    DBscan,
+    DBscanFinding,
+    DBVcsInstance,
+)
+from resc_backend.db.model.finding import finding_long_key, finding_short_key, fingerprint
+from resc_backend.resc_web_service.crud.audit import archive_audits, fix_last_audit
+from resc_backend.resc_web_service.crud.finding import (
+    create_findings,
+    create_or_update_findings,
+    get_finding_audit_status_count_over_time,
+    get_untriaged_finding_count_by_vcs_provider_over_time,
+)
+from resc_backend.resc_web_service.crud.finding_weekly_snapshot import (
+    finalize_finding_weekly_snapshots,
+    get_iso_date_now_diff_week,
+)
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+from resc_backend.resc_web_service.schema.scan_type import ScanType
+
+
+def build_finding(num: int, repository_id: int = 1, commit_id: str = "commit") -> FindingCreate:
+    return FindingCreate(
+        file_path=f"file_path_{num}",
+        line_number=num,
+        column_start=num,
+        column_end=num + 1,
+        commit_id=commit_id,
+        commit_message=f"commit_message_{num}",
+        commit_timestamp=datetime.now(UTC),
+        author=f"author_{num}",
+        email=f"email_{num}",
+        rule_name=f"rule_{num}",
+        repository_id=repository_id,
+    )
+
+
+class TestCreateFindings(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def test_fingerprints_are_persisted(self):
+        finding = build_finding(1)
+        created = create_findings(self.session, [finding])
+        assert len(created) == 1
+        db_finding = self.session.get(DBfinding, created[0].id_)
+        assert db_finding.long_fingerprint == fingerprint(finding_long_key(finding))
+        assert db_finding.short_fingerprint == fingerprint(finding_short_key(finding))
+
+    def test_long_key_without_commit_id(self):
+        # rendered like CONCAT renders NULL in SQL, see test_data/database_dummy_data.sql
+        finding = build_finding(1)
+        finding.commit_id = None
+        assert finding_long_key(finding) == "|rule_1|file_path_1|1|1|2"
+
+    def test_create_findings_reuses_known_findings(self):
+        first = create_findings(self.session, [build_finding(1), build_finding(2)])
+        # same findings in another repository are distinct
+        other_repository = create_findings(self.session, [build_finding(1, repository_id=2)])
+
+        second = create_findings(self.session, [build_finding(1), build_finding(2), build_finding(3)])
+
+        assert len(second) == 3
+        assert {finding.id_ for finding in first} < {finding.id_ for finding in second}
+        assert other_repository[0].id_ not in {finding.id_ for finding in second}
+        assert self.session.query(DBfinding).count() == 4
+
+    def test_create_or_update_findings_moves_commit(self):
+        created = create_or_update_findings(self.session, [build_finding(1, commit_id="old")])
+        updated = create_or_update_findings(self.session, [build_finding(1, commit_id="new")])
+
+        assert len(updated) == 1
+        assert updated[0].id_ == created[0].id_
+        assert updated[0].commit_id == "new"
+        assert updated[0].long_fingerprint == fingerprint(finding_long_key(build_finding(1, commit_id="new")))
+
+        # the moved finding is found back through its new long fingerprint
+        again = create_findings(self.session, [build_finding(1, commit_id="new")])
+        assert again[0].id_ == created[0].id_
+        assert self.session.query(DBfinding).count() == 1
+
+
+class TestFindingCountOverTime(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        vcs_instance = DBVcsInstance(
+            name="vcs",
+            provider_type=AZURE_DEVOPS,
+            scheme="https",
+            hostname="host",
+            port=443,
+            organization="org",
+            scope="",
+            exceptions="",
+        )
+        self.session.add(vcs_instance)
+        self.session.flush()
+        repository = DBrepository(
+            project_key="project",
+            repository_id="1",
+            repository_name="repository",
+            repository_url="https://host/repository",
+            vcs_instance=vcs_instance.id_,
+        )
+        self.session.add(repository)
+        self.session.flush()
+        scan = DBscan(
+            repository_id=repository.id_,
+            scan_type=ScanType.BASE,
+            last_scanned_commit="commit",
+            timestamp=self.before_week(5),
+            increment_number=0,
+            rule_pack="1.0.0",
+            is_latest=True,
+        )
+        self.session.add(scan)
+        self.findings = create_findings(
+            self.session, [build_finding(1, repository.id_), build_finding(2, repository.id_)]
+        )
+        self.session.add_all([DBscanFinding(finding_id=finding.id_, scan_id=scan.id_) for finding in self.findings])
+
+        # The first finding is a true positive from week 3 and a false positive from week 1 on
+        for status, week in [(FindingStatus.TRUE_POSITIVE, 3), (FindingStatus.FALSE_POSITIVE, 1)]:
+            self.session.add(
+                DBaudit(
+                    finding_id=self.findings[0].id_,
+                    status=status,
+                    auditor="auditor",
+                    comment="",
+                    timestamp=self.before_week(week),
+                    is_latest=False,
+                )
+            )
+        self.session.flush()
+        fix_last_audit(self.session, [self.findings[0].id_])
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    @staticmethod
+    def before_week(week: int) -> datetime:
+        return get_iso_date_now_diff_week(week) - timedelta(days=1)
+
+    @staticmethod
+    def weekly_counts(rows, weeks: int) -> list[int]:
+        counts = {(row.year, row.week): row.finding_count for row in rows if row.provider_type == AZURE_DEVOPS}
+        return [counts.get(get_iso_date_now_diff_week(week).isocalendar()[:2], 0) for week in range(weeks)]
+
+    def test_get_finding_audit_status_count_over_time(self):
+        finalize_finding_weekly_snapshots(self.session, weeks=6)
+
+        rows = get_finding_audit_status_count_over_time(self.session, FindingStatus.TRUE_POSITIVE, weeks=6)
+        assert self.weekly_counts(rows, weeks=6) == [0, 0, 1, 1, 0, 0]
+
+        rows = get_finding_audit_status_count_over_time(self.session, FindingStatus.FALSE_POSITIVE, weeks=6)
+        assert self.weekly_counts(rows, weeks=6) == [1, 1, 0, 0, 0, 0]
+
+    def test_get_untriaged_finding_count_by_vcs_provider_over_time(self):
+        finalize_finding_weekly_snapshots(self.session, weeks=7)
+
+        rows = get_untriaged_finding_count_by_vcs_provider_over_time(self.session, weeks=7)
+        assert self.weekly_counts(rows, weeks=7) == [1, 1, 1, 1, 2, 2, 0]
+
+    def test_archived_audits_are_not_valid_after_the_archive_date(self):
+        # the true positive audit of week 3 is valid until week 1, it is kept
+        assert archive_audits(self.session, older_than=self.before_week(2)) == 0
+        finalize_finding_weekly_snapshots(self.session, weeks=6)
+        rows = get_finding_audit_status_count_over_time(self.session, FindingStatus.TRUE_POSITIVE, weeks=6)
+        assert self.weekly_counts(rows, weeks=6) == [0, 0, 1, 1, 0, 0]
+
+        assert archive_audits(self.session, older_than=datetime.now(UTC)) == 1
+        rows = get_finding_audit_status_count_over_time(self.session, FindingStatus.FALSE_POSITIVE, weeks=6)
+        assert self.weekly_counts(rows, weeks=6) == [1, 1, 0, 0, 0, 0]
+
+    def test_closed_weeks_are_only_read(self):
+        rows = get_untriaged_finding_count_by_vcs_provider_over_time(self.session, weeks=7)
+        # the weeks over are missing until stored, only the current week is computed
+        assert self.weekly_counts(rows, weeks=7) == [1, 0, 0, 0, 0, 0, 0]
+        assert self.session.query(DBfindingWeeklySnapshot).count() == 0
+
+    def test_closed_weeks_are_stored_once(self):
+        assert finalize_finding_weekly_snapshots(self.session, weeks=7) == 6
+        # a row for every provider type and status of every week
+        assert self.session.query(DBfindingWeeklySnapshot).count() == 6 * 3 * 6
+        assert finalize_finding_weekly_snapshots(self.session, weeks=7) == 0
+        assert finalize_finding_weekly_snapshots(self.session, weeks=8) == 1
+
+        # Only the current week is computed again
+        self.session.execute(delete(DBaudit))
+        self.session.commit()
+        rows = get_finding_audit_status_count_over_time(self.session, FindingStatus.FALSE_POSITIVE, weeks=6)
+        assert self.weekly_counts(rows, weeks=6) == [0, 1, 0, 0, 0, 0]
@@ -0,0 +1,147 @@
+# Standard Library
+import unittest
+from datetime import UTC, datetime, timedelta
+
+# Third Party
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import Base, DBingestJob
+from resc_backend.resc_web_service.crud.ingest_job import (
+    claim_ingest_job,
+    create_ingest_job,
+    fail_ingest_job,
+    finish_ingest_job,
+    get_ingest_job,
+    requeue_abandoned_ingest_jobs,
+    update_ingest_job_progress,
+)
+from resc_backend.resc_web_service.schema.ingest_job_status import IngestJobStatus
+
+
+class TestIngestJob(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def test_create_ingest_job(self):
+        db_ingest_job = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=0)
+        assert db_ingest_job.id_ is not None
+        assert db_ingest_job.status == IngestJobStatus.PENDING
+        assert db_ingest_job.processed_findings == 0
+
+    def test_claim_ingest_job_oldest_first_once(self):
+        first = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=0)
+        second = create_ingest_job(self.session, scan_id=2, payload="[]", total_findings=0)
+
+        claimed = claim_ingest_job(self.session)
+        assert claimed.id_ == first.id_
+        assert claimed.status == IngestJobStatus.RUNNING
+        assert claimed.started_at is not None
+        assert claimed.heartbeat_at is not None
+        assert claim_ingest_job(self.session).id_ == second.id_
+        assert claim_ingest_job(self.session) is None
+
+    def test_requeue_abandoned_ingest_jobs(self):
+        db_ingest_job = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=10)
+        started_at = claim_ingest_job(self.session).started_at
+        update_ingest_job_progress(
+            self.session, ingest_job_id=db_ingest_job.id_, started_at=started_at, processed_findings=5
+        )
+
+        assert requeue_abandoned_ingest_jobs(self.session, heartbeat_before=datetime.now(UTC) - timedelta(hours=1)) == 0
+        assert requeue_abandoned_ingest_jobs(self.session, heartbeat_before=datetime.now(UTC) + timedelta(hours=1)) == 1
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=db_ingest_job.id_)
+        assert db_ingest_job.status == IngestJobStatus.PENDING
+        assert db_ingest_job.processed_findings == 0
+        assert db_ingest_job.heartbeat_at is None
+
+    def test_requeue_abandoned_ingest_jobs_keeps_long_running_jobs(self):
+        db_ingest_job = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=10)
+        claim_ingest_job(self.session)
+        # started long ago, still reporting progress
+        started_at = datetime.now(UTC) - timedelta(hours=2)
+        query = update(DBingestJob).where(DBingestJob.id_ == db_ingest_job.id_)
+        self.session.execute(query.values(started_at=started_at))
+        self.session.commit()
+        heartbeat_before = datetime.now(UTC) - timedelta(minutes=1)
+        assert update_ingest_job_progress(
+            self.session, ingest_job_id=db_ingest_job.id_, started_at=started_at, processed_findings=5
+        )
+
+        assert requeue_abandoned_ingest_jobs(self.session, heartbeat_before=heartbeat_before) == 0
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=db_ingest_job.id_)
+        assert db_ingest_job.status == IngestJobStatus.RUNNING
+        assert db_ingest_job.processed_findings == 5
+
+    def test_finish_ingest_job(self):
+        db_ingest_job = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=10)
+        started_at = claim_ingest_job(self.session).started_at
+        assert finish_ingest_job(
+            self.session, ingest_job_id=db_ingest_job.id_, started_at=started_at, created_findings=8
+        )
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=db_ingest_job.id_)
+        assert db_ingest_job.status == IngestJobStatus.DONE
+        assert db_ingest_job.payload is None
+        assert db_ingest_job.processed_findings == 10
+        assert db_ingest_job.created_findings == 8
+        assert db_ingest_job.finished_at is not None
+
+    def test_fail_ingest_job(self):
+        db_ingest_job = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=10)
+        started_at = claim_ingest_job(self.session).started_at
+        assert fail_ingest_job(self.session, ingest_job_id=db_ingest_job.id_, started_at=started_at, error="x" * 300)
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=db_ingest_job.id_)
+        assert db_ingest_job.status == IngestJobStatus.FAILED
+        assert db_ingest_job.payload == "[]"
+        assert len(db_ingest_job.error) == 255
+
+    def test_ingest_job_requeued_keeps_the_new_claim(self):
+        db_ingest_job = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=10)
+        lost_started_at = claim_ingest_job(self.session).started_at
+        requeue_abandoned_ingest_jobs(self.session, heartbeat_before=datetime.now(UTC) + timedelta(hours=1))
+        query = update(DBingestJob).where(DBingestJob.id_ == db_ingest_job.id_)
+        self.session.execute(query.values(status=IngestJobStatus.RUNNING, started_at=lost_started_at + timedelta(1)))
+        self.session.commit()
+
+        ingest_job_id = db_ingest_job.id_
+        assert not update_ingest_job_progress(
+            self.session, ingest_job_id=ingest_job_id, started_at=lost_started_at, processed_findings=5
+        )
+        assert not finish_ingest_job(
+            self.session, ingest_job_id=ingest_job_id, started_at=lost_started_at, created_findings=8
+        )
+        assert not fail_ingest_job(self.session, ingest_job_id=ingest_job_id, started_at=lost_started_at, error="x")
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=ingest_job_id)
+        assert db_ingest_job.status == IngestJobStatus.RUNNING
+        assert db_ingest_job.processed_findings == 0
+        assert db_ingest_job.payload == "[]"
+        assert db_ingest_job.finished_at is None
+
+    def test_finish_ingest_job_not_running(self):
+        db_ingest_job = create_ingest_job(self.session, scan_id=1, payload="[]", total_findings=10)
+        started_at = claim_ingest_job(self.session).started_at
+        assert fail_ingest_job(self.session, ingest_job_id=db_ingest_job.id_, started_at=started_at, error="x")
+
+        assert not finish_ingest_job(
+            self.session, ingest_job_id=db_ingest_job.id_, started_at=started_at, created_findings=8
+        )
+
+        self.session.expire_all()
+        assert get_ingest_job(self.session, ingest_job_id=db_ingest_job.id_).status == IngestJobStatus.FAILED
@@ -0,0 +1,103 @@
+# Standard Library
+import unittest
+from datetime import UTC, datetime, timedelta
+
+# Third Party
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import Base, DBingestRequest
+from resc_backend.resc_web_service.crud.ingest_request import (
+    complete_ingest_request,
+    delete_expired_ingest_requests,
+    get_ingest_request,
+    release_ingest_request,
+    reserve_ingest_request,
+)
+from resc_backend.resc_web_service.schema.ingest_request_status import IngestRequestStatus
+
+
+class TestIngestRequest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[DBingestRequest.__table__])
+        self.db_connection = Session(bind=engine)
+        self.yesterday = datetime.now(UTC) - timedelta(days=1)
+        self.tomorrow = datetime.now(UTC) + timedelta(days=1)
+
+    def tearDown(self):
+        self.db_connection.close()
+
+    def reserve(self, idempotency_key: str = "upload-1", expired_before=None, abandoned_before=None):
+        return reserve_ingest_request(
+            self.db_connection,
+            idempotency_key=idempotency_key,
+            scan_id=1,
+            request_digest="digest",
+            expired_before=expired_before or self.yesterday,
+            abandoned_before=abandoned_before or self.yesterday,
+        )
+
+    def test_reserve_and_complete_ingest_request(self):
+        db_ingest_request = self.reserve()
+        assert db_ingest_request.status == IngestRequestStatus.IN_PROGRESS
+        assert db_ingest_request.created_findings is None
+
+        assert complete_ingest_request(
+            self.db_connection, ingest_request_id=db_ingest_request.id_, request_digest="digest", created_findings=5
+        )
+        self.db_connection.commit()
+
+        db_ingest_request = get_ingest_request(
+            self.db_connection, idempotency_key="upload-1", created_after=self.yesterday
+        )
+        assert db_ingest_request.status == IngestRequestStatus.DONE
+        assert db_ingest_request.scan_id == 1
+        assert db_ingest_request.request_digest == "digest"
+        assert db_ingest_request.created_findings == 5
+        assert get_ingest_request(self.db_connection, idempotency_key="upload-2", created_after=self.yesterday) is None
+
+    def test_get_ingest_request_expired(self):
+        self.reserve()
+        assert get_ingest_request(self.db_connection, idempotency_key="upload-1", created_after=self.tomorrow) is None
+
+    def test_reserve_ingest_request_reserved_key(self):
+        assert self.reserve() is not None
+        # reserved by a request in progress
+        assert self.reserve() is None
+
+    def test_reserve_ingest_request_abandoned_key(self):
+        abandoned_id = self.reserve().id_
+        # keep SQLite from reusing the id of the deleted reservation
+        self.reserve(idempotency_key="upload-2")
+        db_ingest_request = self.reserve(abandoned_before=self.tomorrow)
+        assert db_ingest_request.id_ != abandoned_id
+        # the result of the abandoned request is not recorded anymore
+        assert not complete_ingest_request(
+            self.db_connection, ingest_request_id=abandoned_id, request_digest="digest", created_findings=5
+        )
+
+    def test_reserve_ingest_request_expired_key(self):
+        db_ingest_request = self.reserve()
+        complete_ingest_request(
+            self.db_connection, ingest_request_id=db_ingest_request.id_, request_digest="digest", created_findings=5
+        )
+        self.db_connection.commit()
+
+        # a request done is not abandoned, its key is reserved until expired
+        assert self.reserve(abandoned_before=self.tomorrow) is None
+        assert self.reserve(expired_before=self.tomorrow) is not None
+
+    def test_release_ingest_request(self):
+        db_ingest_request = self.reserve()
+        release_ingest_request(self.db_connection, ingest_request_id=db_ingest_request.id_)
+        assert get_ingest_request(self.db_connection, idempotency_key="upload-1", created_after=self.yesterday) is None
+        assert self.reserve() is not None
+
+    def test_delete_expired_ingest_requests(self):
+        self.reserve()
+
+        assert delete_expired_ingest_requests(self.db_connection, created_before=self.yesterday) == 0
+        assert delete_expired_ingest_requests(self.db_connection, created_before=self.tomorrow) == 1
+        assert get_ingest_request(self.db_connection, idempotency_key="upload-1", created_after=self.yesterday) is None
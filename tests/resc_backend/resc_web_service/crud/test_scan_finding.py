@@ -0,0 +1,138 @@
+# Standard Library
+import unittest
+from datetime import UTC, datetime
+
+# Third Party
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.db.model import Base, DBfinding, DBscanFinding
+from resc_backend.resc_web_service.crud.scan_finding import (
+    copy_scan_findings,
+    create_scan_findings,
+    delete_scan_findings_by_fingerprint,
+    get_scan_findings_ids,
+)
+
+
+class TestCreateScanFindings(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+        self.session.execute(
+            DBfinding.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "repository_id": 1,
+                    "rule_name": "rule",
+                    "file_path": "file_path",
+                    "line_number": i,
+                    "commit_timestamp": datetime.now(UTC),
+                }
+                for i in range(1, 2502)
+            ],
+        )
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def links(self, scan_id: int) -> set[int]:
+        query = self.session.query(DBscanFinding.finding_id).where(DBscanFinding.scan_id == scan_id)
+        return {finding_id for (finding_id,) in query.all()}
+
+    def test_create_scan_findings_empty(self):
+        assert create_scan_findings(self.session, []) == 0
+
+    def test_create_scan_findings(self):
+        inserted = create_scan_findings(self.session, [DBscanFinding(finding_id=i, scan_id=1) for i in range(1, 4)])
+        assert inserted == 3
+        assert self.links(1) == {1, 2, 3}
+
+    def test_create_scan_findings_skips_existing_and_duplicates(self):
+        create_scan_findings(self.session, [DBscanFinding(finding_id=i, scan_id=1) for i in range(1, 3)])
+        # link 2 exists already, link 3 is requested twice, link 1 of scan 2 is distinct
+        inserted = create_scan_findings(
+            self.session,
+            [
+                DBscanFinding(finding_id=2, scan_id=1),
+                DBscanFinding(finding_id=3, scan_id=1),
+                DBscanFinding(finding_id=3, scan_id=1),
+                DBscanFinding(finding_id=1, scan_id=2),
+            ],
+        )
+        assert inserted == 2
+        assert self.links(1) == {1, 2, 3}
+        assert self.links(2) == {1}
+
+    def test_create_scan_findings_unknown_finding(self):
+        assert create_scan_findings(self.session, [DBscanFinding(finding_id=9999, scan_id=1)]) == 0
+        assert self.links(1) == set()
+
+    def test_create_scan_findings_more_than_chunk_size(self):
+        scan_findings = [DBscanFinding(finding_id=i, scan_id=1) for i in range(1, 2502)]
+        assert create_scan_findings(self.session, scan_findings[:1200]) == 1200
+        assert create_scan_findings(self.session, scan_findings) == 1301
+        assert len(self.links(1)) == 2501
+
+
+class TestCopyScanFindings(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+        self.db_findings = []
+        for i in range(1, 6):
+            self.db_findings.append(
+                DBfinding(
+                    rule_name=f"rule_{i}",
+                    file_path=f"file_path_{i}",
+                    line_number=i,
+                    commit_id=f"commit_id_{i}",
+                    commit_message=f"commit_message_{i}",
+                    commit_timestamp=datetime.now(UTC),
+                    author=f"author_{i}",
+                    email=f"email_{i}",
+                    event_sent_on=None,
+                    repository_id=1 if i < 5 else 2,
+                    column_start=i,
+                    column_end=i,
+                )
+            )
+        self.session.add_all(self.db_findings)
+        self.session.flush()
+        create_scan_findings(self.session, [DBscanFinding(finding_id=i, scan_id=1) for i in range(1, 5)])
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def links(self, scan_id: int) -> set[int]:
+        query = self.session.query(DBscanFinding.finding_id).where(DBscanFinding.scan_id == scan_id)
+        return {finding_id for (finding_id,) in query.all()}
+
+    def test_copy_scan_findings(self):
+        create_scan_findings(self.session, [DBscanFinding(finding_id=2, scan_id=2)])
+        assert copy_scan_findings(self.session, source_scan_id=1, target_scan_id=2) == 3
+        assert self.links(2) == {1, 2, 3, 4}
+        assert self.links(1) == {1, 2, 3, 4}
+        assert sorted(get_scan_findings_ids(self.session, scan_id=2)) == [1, 2, 3, 4]
+
+    def test_delete_scan_findings_by_fingerprint(self):
+        copy_scan_findings(self.session, source_scan_id=1, target_scan_id=2)
+        # finding 5 belongs to another repository and is not linked
+        removed = [self.db_findings[0].long_fingerprint, self.db_findings[2].long_fingerprint]
+        removed.append(self.db_findings[4].long_fingerprint)
+        assert (
+            delete_scan_findings_by_fingerprint(self.session, scan_id=2, repository_id=1, long_fingerprints=removed)
+            == 2
+        )
+        assert self.links(2) == {2, 4}
+        assert self.links(1) == {1, 2, 3, 4}
+
+    def test_delete_scan_findings_by_fingerprint_empty(self):
+        assert delete_scan_findings_by_fingerprint(self.session, scan_id=1, repository_id=1, long_fingerprints=[]) == 0
+        assert sorted(get_scan_findings_ids(self.session, scan_id=1)) == [1, 2, 3, 4]
@@ -1,7 +1,7 @@
 # Standard Library
 import unittest
 from collections.abc import Generator
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import ANY, patch
 
 # Third Party
@@ -12,9 +12,12 @@ from fastapi_cache.backends.inmemory import InMemoryBackend
 
 # First Party
 from resc_backend.constants import (
+    AUDIT_ARCHIVE_AFTER_DAYS,
     CACHE_PREFIX,
     REDIS_CACHE_EXPIRE,
+    RWS_ROUTE_ARCHIVE,
     RWS_ROUTE_AUDITS,
+    RWS_ROUTE_FEED,
     RWS_VERSION_PREFIX,
 )
 from resc_backend.resc_web_service.api import app
@@ -22,6 +25,7 @@ from resc_backend.resc_web_service.cache_manager import CacheManager
 from resc_backend.resc_web_service.dependencies import requires_auth, requires_no_auth
 from resc_backend.resc_web_service.schema.audit import AuditFinding
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+from resc_backend.resc_web_service.schema.pagination_model import decode_cursor, encode_cursor
 
 
 @pytest.fixture(autouse=True)
@@ -106,3 +110,70 @@ class TestDetailedFindings(unittest.TestCase):
         assert response.status_code == 200, response.text
         get_audits.assert_called_once()
         get_total_audits_count.assert_called_once()
+
+    @patch("resc_backend.resc_web_service.crud.audit.archive_audits")
+    def test_archive_audits(self, archive_audits):
+        archive_audits.return_value = 3
+        response = self.client.post(f"{RWS_VERSION_PREFIX}{RWS_ROUTE_AUDITS}{RWS_ROUTE_ARCHIVE}")
+        assert response.status_code == 200, response.text
+        assert response.json() == 3
+        archive_audits.assert_called_once_with(ANY, older_than=ANY, batch_size=1000, max_batches=100)
+        older_than = archive_audits.call_args.kwargs["older_than"]
+        assert older_than < datetime.now(UTC) - timedelta(days=AUDIT_ARCHIVE_AFTER_DAYS - 1)
+
+    @patch("resc_backend.resc_web_service.crud.audit.archive_audits")
+    def test_archive_audits_invalid_batch_size(self, archive_audits):
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_AUDITS}{RWS_ROUTE_ARCHIVE}", params={"batch_size": 1001}
+        )
+        assert response.status_code == 422, response.text
+        archive_audits.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.audit.get_total_audits_count")
+    @patch("resc_backend.resc_web_service.crud.audit.get_audits_after")
+    def test_get_audits_feed(self, get_audits_after, get_total_audits_count):
+        timestamp = datetime(2024, 5, 6, 7, 8, 9)
+        get_audits_after.return_value = (self.audits[:2], (timestamp, 2))
+        response = self.client.get(f"{RWS_VERSION_PREFIX}{RWS_ROUTE_AUDITS}{RWS_ROUTE_FEED}", params={"limit": 2})
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert [audit["audit_id"] for audit in data["data"]] == [1, 2]
+        assert data["limit"] == 2
+        assert data["total"] is None
+        assert decode_cursor(data["next_cursor"]) == (timestamp, 2)
+        get_audits_after.assert_called_once_with(
+            ANY,
+            after=None,
+            limit=2,
+            auditor=None,
+            from_date=None,
+            to_date=None,
+            status=None,
+            is_latest=None,
+        )
+        get_total_audits_count.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.audit.get_total_audits_count")
+    @patch("resc_backend.resc_web_service.crud.audit.get_audits_after")
+    def test_get_audits_feed_last_page(self, get_audits_after, get_total_audits_count):
+        timestamp = datetime(2024, 5, 6, 7, 8, 9)
+        get_audits_after.return_value = (self.audits[2:], None)
+        get_total_audits_count.return_value = 5
+        response = self.client.get(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_AUDITS}{RWS_ROUTE_FEED}",
+            params={"cursor": encode_cursor(timestamp, 2), "include_total": True},
+        )
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert len(data["data"]) == 3
+        assert data["next_cursor"] is None
+        assert data["total"] == 5
+        assert get_audits_after.call_args.kwargs["after"] == (timestamp, 2)
+
+    @patch("resc_backend.resc_web_service.crud.audit.get_audits_after")
+    def test_get_audits_feed_invalid_cursor(self, get_audits_after):
+        response = self.client.get(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_AUDITS}{RWS_ROUTE_FEED}", params={"cursor": "invalid"}
+        )
+        assert response.status_code == 400, response.text
+        get_audits_after.assert_not_called()
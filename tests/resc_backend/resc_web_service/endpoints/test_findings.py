@@ -17,6 +17,7 @@ from resc_backend.constants import (
     CACHE_PREFIX,
     REDIS_CACHE_EXPIRE,
     RWS_ROUTE_AUDIT,
+    RWS_ROUTE_BY_FILTER,
     RWS_ROUTE_BY_RULE,
     RWS_ROUTE_COUNT_BY_TIME,
     RWS_ROUTE_FINDINGS,
@@ -652,6 +653,43 @@ class TestFindings(unittest.TestCase):
         count_findings.assert_called_once_with(ANY, finding_ids={1, 2})
         create_audits.assert_not_called()
 
+    @patch("resc_backend.resc_web_service.crud.detailed_finding.query_detailed_findings_ids")
+    @patch("resc_backend.resc_web_service.crud.audit.create_audits_from_query")
+    @patch("resc_backend.resc_web_service.cache_manager.CacheManager.clear_cache_by_namespace")
+    def test_audit_findings_by_filter(self, clear_cache_by_namespace, create_audits_from_query, query_findings_ids):
+        create_audits_from_query.return_value = 42
+        clear_cache_by_namespace.return_value = None
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_AUDIT}{RWS_ROUTE_BY_FILTER}",
+            json={
+                "findings_filter": {"rule_names": ["rule_1"], "finding_statuses": ["NOT_ANALYZED"]},
+                "status": FindingStatus.FALSE_POSITIVE.value,
+                "comment": "Hello World!",
+            },
+        )
+        assert response.status_code == 201, response.text
+        assert response.json() == 42
+        query_findings_ids.assert_called_once_with(
+            ANY, FindingsFilter(rule_names=["rule_1"], finding_statuses=[FindingStatus.NOT_ANALYZED])
+        )
+        create_audits_from_query.assert_called_once_with(
+            ANY,
+            query_findings_ids.return_value,
+            auditor="Anonymous",
+            status=FindingStatus.FALSE_POSITIVE,
+            comment="Hello World!",
+        )
+        clear_cache_by_namespace.assert_called_once_with(namespace=CACHE_NAMESPACE_FINDING)
+
+    @patch("resc_backend.resc_web_service.crud.audit.create_audits_from_query")
+    def test_audit_findings_by_filter_invalid_status(self, create_audits_from_query):
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_AUDIT}{RWS_ROUTE_BY_FILTER}",
+            json={"findings_filter": {}, "status": "INVALID", "comment": ""},
+        )
+        assert response.status_code == 422, response.text
+        create_audits_from_query.assert_not_called()
+
     def test_get_supported_statuses(self):
         with self.client as client:
             response = client.get(f"{RWS_VERSION_PREFIX}{RWS_ROUTE_FINDINGS}{RWS_ROUTE_SUPPORTED_STATUSES}/")
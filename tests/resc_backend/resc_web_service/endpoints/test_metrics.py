@@ -194,11 +194,9 @@ class TestFindings(unittest.TestCase):
             assert response.json() == cached_response.json()
 
     @patch("resc_backend.resc_web_service.crud.audit.get_audit_stats_count")
-    @patch("resc_backend.resc_web_service.crud.audit.get_audit_count_by_auditor_over_time")
-    @patch("resc_backend.resc_web_service.crud.audit.get_personal_audit_count")
-    def test_get_personal_audit_metrics(
-        self, get_personal_audit_count, get_audit_count_by_auditor_over_time, get_audit_stats_count
-    ):
+    @patch("resc_backend.resc_web_service.crud.audit_weekly_count.get_weekly_audit_rank")
+    @patch("resc_backend.resc_web_service.crud.audit.get_personal_audit_counts")
+    def test_get_personal_audit_metrics(self, get_personal_audit_counts, get_weekly_audit_rank, get_audit_stats_count):
         AuditorMetric = namedtuple(
             "AuditorMetric",
             [
@@ -215,8 +213,11 @@ class TestFindings(unittest.TestCase):
         auditor_results = [
             AuditorMetric._make(["Anonymous", 1, 0, 0, 1, 0, 0, 2]),
         ]
-        get_personal_audit_count.return_value = 2
-        get_audit_count_by_auditor_over_time.return_value = {}
+        PersonalAuditCounts = namedtuple(
+            "PersonalAuditCounts", ["today", "current_week", "last_week", "current_month", "current_year", "forever"]
+        )
+        get_personal_audit_counts.return_value = PersonalAuditCounts._make([2, 2, 2, 2, 2, 2])
+        get_weekly_audit_rank.return_value = 3
         get_audit_stats_count.return_value = auditor_results
         with self.client as client:
             response = client.get(f"{RWS_VERSION_PREFIX}{RWS_ROUTE_METRICS}{RWS_ROUTE_PERSONAL_AUDITS}")
@@ -230,7 +231,7 @@ class TestFindings(unittest.TestCase):
             assert data["current_month"] == 2
             assert data["current_year"] == 2
             assert data["forever"] == 2
-            assert data["rank_current_week"] == 0
+            assert data["rank_current_week"] == 3
             assert data["forever_breakdown"]["auditor"] == "Anonymous"
             assert data["forever_breakdown"]["true_positive"] == 1
             assert data["forever_breakdown"]["false_positive"] == 0
@@ -245,17 +246,12 @@ class TestFindings(unittest.TestCase):
             self.assert_cache(cached_response)
             assert response.json() == cached_response.json()
 
-    @patch("resc_backend.resc_web_service.crud.audit.get_audit_count_by_auditor_over_time")
-    def test_determine_audit_rank_current_week(self, get_audit_count_by_auditor_over_time):
-        get_audit_count_by_auditor_over_time.return_value = [
-            Mock(auditor="Anonymous", audit_count=2),
-            Mock(auditor="Me", audit_count=4),
-        ]
+    @patch("resc_backend.resc_web_service.crud.audit_weekly_count.get_weekly_audit_rank")
+    def test_determine_audit_rank_current_week(self, get_weekly_audit_rank):
+        get_weekly_audit_rank.return_value = 2
         rank = determine_audit_rank_current_week(auditor="Anonymous", db_connection=None)
         assert rank == 2
-
-    @patch("resc_backend.resc_web_service.crud.audit.get_audit_count_by_auditor_over_time")
-    def test_determine_audit_rank_current_week_zero_audits(self, get_audit_count_by_auditor_over_time):
-        get_audit_count_by_auditor_over_time.return_value = []
-        rank = determine_audit_rank_current_week(auditor="Anonymous", db_connection=None)
-        assert rank == 0
+        week_start = get_weekly_audit_rank.call_args.kwargs["week_start"]
+        assert week_start.weekday() == 0
+        assert 0 <= (datetime.now(UTC).date() - week_start).days < 7
+        get_weekly_audit_rank.assert_called_once_with(None, auditor="Anonymous", week_start=week_start)
@@ -1,23 +1,33 @@
 # Standard Library
+import json
 import unittest
 from datetime import UTC, datetime
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, MagicMock, patch
 
 # Third Party
 from fastapi.testclient import TestClient
 
 # First Party
 from resc_backend.constants import (
+    CACHE_NAMESPACE_FINDING,
+    CACHE_NAMESPACE_RULE,
+    CACHE_NAMESPACE_RULE_PACK,
+    IDEMPOTENCY_RETRY_AFTER,
+    RWS_ROUTE_DELTA,
     RWS_ROUTE_DETECTED_RULES,
     RWS_ROUTE_FINDINGS,
+    RWS_ROUTE_INGEST_JOBS,
     RWS_ROUTE_SCANS,
+    RWS_ROUTE_STREAM,
     RWS_VERSION_PREFIX,
 )
-from resc_backend.db.model import DBfinding, DBrepository, DBrule, DBscan
+from resc_backend.db.model import DBfinding, DBingestJob, DBingestRequest, DBrepository, DBrule, DBscan
 from resc_backend.resc_web_service.api import app
 from resc_backend.resc_web_service.dependencies import requires_auth, requires_no_auth
+from resc_backend.resc_web_service.ingestion import RequestDigest
 from resc_backend.resc_web_service.schema.finding import FindingRead
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
+from resc_backend.resc_web_service.schema.ingest_request_status import IngestRequestStatus
 from resc_backend.resc_web_service.schema.scan import ScanCreate
 from resc_backend.resc_web_service.schema.scan_type import ScanType
 
@@ -473,3 +483,413 @@ class TestScans(unittest.TestCase):
         assert data["total"] == 0
         assert data["limit"] == 100
         assert data["skip"] == 0
+
+    def _findings_ndjson(self) -> str:
+        return "".join(
+            json.dumps(
+                {
+                    "file_path": finding.file_path,
+                    "line_number": finding.line_number,
+                    "column_start": finding.column_start,
+                    "column_end": finding.column_end,
+                    "commit_id": finding.commit_id,
+                    "commit_message": finding.commit_message,
+                    "commit_timestamp": finding.commit_timestamp.isoformat(),
+                    "author": finding.author,
+                    "email": finding.email,
+                    "rule_name": finding.rule_name,
+                    "repository_id": finding.repository_id,
+                }
+            )
+            + "\n"
+            for finding in self.db_findings
+        )
+
+    @patch("resc_backend.resc_web_service.cache_manager.CacheManager.clear_cache_by_namespace")
+    @patch("resc_backend.resc_web_service.crud.audit.clear_outdated_no_longer_outdated")
+    @patch("resc_backend.resc_web_service.crud.audit.create_automated_audits_from_query")
+    @patch("resc_backend.resc_web_service.crud.scan_finding.create_scan_findings")
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.rule.get_scan_as_dir_rules_by_scan_id")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_findings_stream(
+        self,
+        get_scan,
+        get_scan_as_dir_rules_by_scan_id,
+        create_findings,
+        create_scan_findings,
+        create_automated_audits_from_query,
+        clear_outdated_no_longer_outdated,
+        clear_cache_by_namespace,
+    ):
+        get_scan.return_value = self.db_scans[0]
+        get_scan_as_dir_rules_by_scan_id.return_value = []
+        create_findings.side_effect = lambda db_connection, findings: self.db_findings[: len(findings)]
+        create_automated_audits_from_query.return_value = 0
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}?chunk_size=2",
+            content=self._findings_ndjson(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 201, response.text
+        # every chunk resolves to the first findings, repeated findings are counted once
+        assert response.json() == 2
+        assert "create_findings;dur=" in response.headers["Server-Timing"]
+        # 5 findings in chunks of 2
+        assert create_findings.call_count == 3
+        assert create_scan_findings.call_count == 3
+        assert create_automated_audits_from_query.call_count == 2
+        clear_outdated_no_longer_outdated.assert_called_once_with(db_connection=ANY, findings_ids=[1, 2])
+
+    @patch("resc_backend.resc_web_service.cache_manager.CacheManager.clear_cache_by_namespace")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.release_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.complete_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.reserve_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.audit.clear_outdated_no_longer_outdated")
+    @patch("resc_backend.resc_web_service.crud.audit.create_automated_audits_from_query")
+    @patch("resc_backend.resc_web_service.crud.scan_finding.create_scan_findings")
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.rule.get_scan_as_dir_rules_by_scan_id")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_findings_stream_idempotency_key(
+        self,
+        get_scan,
+        get_scan_as_dir_rules_by_scan_id,
+        create_findings,
+        create_scan_findings,
+        create_automated_audits_from_query,
+        clear_outdated_no_longer_outdated,
+        reserve_ingest_request,
+        complete_ingest_request,
+        release_ingest_request,
+        clear_cache_by_namespace,
+    ):
+        get_scan.return_value = self.db_scans[0]
+        get_scan_as_dir_rules_by_scan_id.return_value = []
+        create_findings.side_effect = lambda db_connection, findings: self.db_findings[: len(findings)]
+        create_automated_audits_from_query.return_value = 0
+        db_ingest_request = DBingestRequest(idempotency_key="upload-1", scan_id=1, request_digest=None)
+        db_ingest_request.id_ = 1
+        reserve_ingest_request.return_value = db_ingest_request
+        complete_ingest_request.return_value = True
+        content = self._findings_ndjson()
+        request_digest = RequestDigest(scan_id=1)
+        request_digest.update(content.encode())
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}",
+            content=content,
+            headers={"Content-Type": "application/x-ndjson", "Idempotency-Key": "upload-1"},
+        )
+        assert response.status_code == 201, response.text
+        assert response.json() == 5
+        assert "Idempotent-Replayed" not in response.headers
+        reserve_ingest_request.assert_called_once_with(
+            ANY,
+            idempotency_key="upload-1",
+            scan_id=1,
+            request_digest=None,
+            expired_before=ANY,
+            abandoned_before=ANY,
+        )
+        complete_ingest_request.assert_called_once_with(
+            ANY, ingest_request_id=1, request_digest=request_digest.hexdigest(), created_findings=5
+        )
+        release_ingest_request.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.reserve_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.get_ingest_request")
+    def test_create_scan_findings_stream_idempotency_key_replayed(
+        self, get_ingest_request, reserve_ingest_request, create_findings
+    ):
+        content = self._findings_ndjson()
+        request_digest = RequestDigest(scan_id=1)
+        request_digest.update(content.encode())
+        reserve_ingest_request.return_value = None
+        get_ingest_request.return_value = DBingestRequest(
+            idempotency_key="upload-1",
+            scan_id=1,
+            request_digest=request_digest.hexdigest(),
+            status=IngestRequestStatus.DONE,
+            created_findings=5,
+        )
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}",
+            content=content,
+            headers={"Content-Type": "application/x-ndjson", "Idempotency-Key": "upload-1"},
+        )
+        assert response.status_code == 201, response.text
+        assert response.json() == 5
+        assert response.headers["Idempotent-Replayed"] == "true"
+        create_findings.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.reserve_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.get_ingest_request")
+    def test_create_scan_findings_idempotency_key_replayed(
+        self, get_ingest_request, reserve_ingest_request, create_findings
+    ):
+        content = json.dumps([json.loads(self._findings_ndjson().splitlines()[0])])
+        request_digest = RequestDigest(scan_id=1)
+        request_digest.update(content.encode())
+        reserve_ingest_request.return_value = None
+        get_ingest_request.return_value = DBingestRequest(
+            idempotency_key="upload-1",
+            scan_id=1,
+            request_digest=request_digest.hexdigest(),
+            status=IngestRequestStatus.DONE,
+            created_findings=1,
+        )
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}",
+            content=content,
+            headers={"Content-Type": "application/json", "Idempotency-Key": "upload-1"},
+        )
+        assert response.status_code == 201, response.text
+        assert response.json() == 1
+        assert response.headers["Idempotent-Replayed"] == "true"
+        create_findings.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.reserve_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.get_ingest_request")
+    def test_create_scan_findings_idempotency_key_reused(
+        self, get_ingest_request, reserve_ingest_request, create_findings
+    ):
+        reserve_ingest_request.return_value = None
+        get_ingest_request.return_value = DBingestRequest(
+            idempotency_key="upload-1",
+            scan_id=1,
+            request_digest="other request",
+            status=IngestRequestStatus.DONE,
+            created_findings=1,
+        )
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}",
+            content=json.dumps([json.loads(self._findings_ndjson().splitlines()[0])]),
+            headers={"Content-Type": "application/json", "Idempotency-Key": "upload-1"},
+        )
+        assert response.status_code == 422, response.text
+        assert response.json()["detail"] == "Idempotency-Key was already used for another request"
+        create_findings.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.reserve_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.get_ingest_request")
+    def test_create_scan_findings_idempotency_key_in_progress(
+        self, get_ingest_request, reserve_ingest_request, create_findings
+    ):
+        reserve_ingest_request.return_value = None
+        get_ingest_request.return_value = DBingestRequest(idempotency_key="upload-1", scan_id=1, request_digest=None)
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}",
+            content=json.dumps([json.loads(self._findings_ndjson().splitlines()[0])]),
+            headers={"Content-Type": "application/json", "Idempotency-Key": "upload-1"},
+        )
+        assert response.status_code == 409, response.text
+        assert response.json()["detail"] == "A request with the same Idempotency-Key is in progress"
+        assert response.headers["Retry-After"] == str(IDEMPOTENCY_RETRY_AFTER)
+        create_findings.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.release_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.ingest_request.reserve_ingest_request")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_findings_idempotency_key_released_on_failure(
+        self, get_scan, reserve_ingest_request, release_ingest_request, create_findings
+    ):
+        get_scan.return_value = None
+        db_ingest_request = DBingestRequest(idempotency_key="upload-1", scan_id=1, request_digest="digest")
+        db_ingest_request.id_ = 1
+        reserve_ingest_request.return_value = db_ingest_request
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}",
+            content=json.dumps([json.loads(self._findings_ndjson().splitlines()[0])]),
+            headers={"Content-Type": "application/json", "Idempotency-Key": "upload-1"},
+        )
+        assert response.status_code == 404, response.text
+        release_ingest_request.assert_called_once_with(ANY, ingest_request_id=1)
+        create_findings.assert_not_called()
+
+    def test_create_scan_findings_stream_unsupported_media_type(self):
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}",
+            content=self._findings_ndjson(),
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 415, response.text
+
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_findings_stream_non_existing_scan(self, get_scan):
+        get_scan.return_value = None
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_FINDINGS}{RWS_ROUTE_STREAM}",
+            content=self._findings_ndjson(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 404, response.text
+        assert response.json()["detail"] == "Scan not found"
+
+    def _findings_delta(self) -> dict:
+        return {
+            "parent_scan_id": 1,
+            "added": [json.loads(line) for line in self._findings_ndjson().splitlines()[:2]],
+            "removed": [self.db_findings[4].long_fingerprint],
+        }
+
+    @patch("resc_backend.resc_web_service.cache_manager.CacheManager.clear_cache_by_tags")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan_scope")
+    @patch("resc_backend.resc_web_service.crud.scan_finding.get_scan_findings_ids")
+    @patch("resc_backend.resc_web_service.crud.audit.clear_outdated_no_longer_outdated")
+    @patch("resc_backend.resc_web_service.crud.audit.create_automated_audits_from_query")
+    @patch("resc_backend.resc_web_service.crud.scan_finding.create_scan_findings")
+    @patch("resc_backend.resc_web_service.crud.finding.create_findings")
+    @patch("resc_backend.resc_web_service.crud.scan_finding.delete_scan_findings_by_fingerprint")
+    @patch("resc_backend.resc_web_service.crud.scan_finding.copy_scan_findings")
+    @patch("resc_backend.resc_web_service.crud.rule.get_scan_as_dir_rules_by_scan_id")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_findings_delta(
+        self,
+        get_scan,
+        get_scan_as_dir_rules_by_scan_id,
+        copy_scan_findings,
+        delete_scan_findings_by_fingerprint,
+        create_findings,
+        create_scan_findings,
+        create_automated_audits_from_query,
+        clear_outdated_no_longer_outdated,
+        get_scan_findings_ids,
+        get_scan_scope,
+        clear_cache_by_tags,
+    ):
+        db_scan = self.db_scans[1]
+        db_scan.repository_id = 1
+        db_scan.scan_type = ScanType.INCREMENTAL
+        get_scan.side_effect = lambda db_connection, scan_id: self.db_scans[scan_id - 1]
+        get_scan_as_dir_rules_by_scan_id.return_value = []
+        copy_scan_findings.return_value = 4
+        delete_scan_findings_by_fingerprint.return_value = 1
+        create_findings.side_effect = lambda db_connection, findings: self.db_findings[: len(findings)]
+        create_automated_audits_from_query.return_value = 0
+        get_scan_findings_ids.return_value = [1, 2, 3, 4, 5]
+        get_scan_scope.return_value = MagicMock(
+            rule_pack="1.0.0",
+            project_key="project",
+            repository_name="repository",
+            vcs_instance_id=1,
+            provider_type="BITBUCKET",
+        )
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/2{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}",
+            json=self._findings_delta(),
+        )
+        assert response.status_code == 201, response.text
+        assert response.json() == 5
+        assert "copy_parent_links;dur=" in response.headers["Server-Timing"]
+        copy_scan_findings.assert_called_once_with(db_connection=ANY, source_scan_id=1, target_scan_id=2)
+        delete_scan_findings_by_fingerprint.assert_called_once_with(
+            db_connection=ANY, scan_id=2, repository_id=1, long_fingerprints=[self.db_findings[4].long_fingerprint]
+        )
+        create_scan_findings.assert_called_once()
+        # the findings copied from the parent scan are cleared from the outdated status as well
+        clear_outdated_no_longer_outdated.assert_called_once_with(db_connection=ANY, findings_ids=[1, 2, 3, 4, 5])
+        clear_cache_by_tags.assert_called_once_with(
+            namespaces=[CACHE_NAMESPACE_FINDING, CACHE_NAMESPACE_RULE, CACHE_NAMESPACE_RULE_PACK],
+            tags=[
+                "project:project",
+                "repository:repository",
+                "rule-pack:1.0.0",
+                "vcs-instance:1",
+                "vcs-provider:BITBUCKET",
+                "global",
+            ],
+        )
+
+    @patch("resc_backend.resc_web_service.crud.scan_finding.copy_scan_findings")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_findings_delta_base_scan(self, get_scan, copy_scan_findings):
+        get_scan.side_effect = lambda db_connection, scan_id: self.db_scans[scan_id - 1]
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/2{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}",
+            json=self._findings_delta(),
+        )
+        assert response.status_code == 400, response.text
+        assert response.json()["detail"] == "Delta ingestion is only supported for incremental scans"
+        copy_scan_findings.assert_not_called()
+
+    @patch("resc_backend.resc_web_service.crud.scan_finding.copy_scan_findings")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_findings_delta_parent_of_other_repository(self, get_scan, copy_scan_findings):
+        self.db_scans[1].scan_type = ScanType.INCREMENTAL
+        get_scan.side_effect = lambda db_connection, scan_id: self.db_scans[scan_id - 1]
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/2{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}",
+            json=self._findings_delta(),
+        )
+        assert response.status_code == 400, response.text
+        assert response.json()["detail"] == "Parent scan must be another scan of the same repository"
+        copy_scan_findings.assert_not_called()
+
+    def test_create_scan_findings_delta_invalid_fingerprint(self):
+        delta = self._findings_delta()
+        delta["removed"] = ["not a fingerprint"]
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/2{RWS_ROUTE_FINDINGS}{RWS_ROUTE_DELTA}",
+            json=delta,
+        )
+        assert response.status_code == 422, response.text
+
+    @patch("resc_backend.resc_web_service.ingest_worker.IngestWorkerPool.notify")
+    @patch("resc_backend.resc_web_service.crud.ingest_job.create_ingest_job")
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_ingest_job(self, get_scan, create_ingest_job, notify):
+        get_scan.return_value = self.db_scans[0]
+        db_ingest_job = DBingestJob(scan_id=1, payload="[]", total_findings=5)
+        db_ingest_job.id_ = 7
+        create_ingest_job.return_value = db_ingest_job
+
+        response = self.client.post(
+            f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_INGEST_JOBS}",
+            content="[" + self._findings_ndjson().strip().replace("\n", ",") + "]",
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 202, response.text
+        data = response.json()
+        assert data["id_"] == 7
+        assert data["status"] == "PENDING"
+        assert data["total_findings"] == 5
+        assert response.headers["Location"] == f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_INGEST_JOBS}/7"
+        create_ingest_job.assert_called_once_with(ANY, scan_id=1, payload=ANY, total_findings=5)
+        notify.assert_called_once()
+
+    @patch("resc_backend.resc_web_service.crud.scan.get_scan")
+    def test_create_scan_ingest_job_non_existing_scan(self, get_scan):
+        get_scan.return_value = None
+        response = self.client.post(f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_INGEST_JOBS}", json=[])
+        assert response.status_code == 404, response.text
+        assert response.json()["detail"] == "Scan not found"
+
+    @patch("resc_backend.resc_web_service.crud.ingest_job.get_ingest_job")
+    def test_read_scan_ingest_job(self, get_ingest_job):
+        db_ingest_job = DBingestJob(scan_id=1, payload="[]", total_findings=5)
+        db_ingest_job.id_ = 7
+        get_ingest_job.return_value = db_ingest_job
+
+        response = self.client.get(f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/1{RWS_ROUTE_INGEST_JOBS}/7")
+        assert response.status_code == 200, response.text
+        assert response.json()["id_"] == 7
+
+        # the ingest job belongs to another scan
+        response = self.client.get(f"{RWS_VERSION_PREFIX}{RWS_ROUTE_SCANS}/2{RWS_ROUTE_INGEST_JOBS}/7")
+        assert response.status_code == 404, response.text
+        assert response.json()["detail"] == "Ingest job not found"
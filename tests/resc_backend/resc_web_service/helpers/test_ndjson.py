@@ -0,0 +1,76 @@
+# Standard Library
+import json
+
+# Third Party
+import pytest
+from fastapi import HTTPException
+from fastapi.exceptions import RequestValidationError
+
+# First Party
+from resc_backend.constants import NDJSON_MAX_LINE_SIZE
+from resc_backend.resc_web_service.helpers.ndjson import iterate_ndjson_chunks
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+
+
+def finding_line(num: int) -> bytes:
+    finding = {
+        "file_path": f"file_path_{num}",
+        "line_number": num,
+        "column_start": num,
+        "column_end": num,
+        "commit_id": f"commit_id_{num}",
+        "commit_message": f"commit_message_{num}",
+        "commit_timestamp": "2023-05-23T15:52:22.270000",
+        "author": f"author_{num}",
+        "email": f"email_{num}",
+        "rule_name": f"rule_{num}",
+        "repository_id": 1,
+    }
+    return json.dumps(finding).encode() + b"\n"
+
+
+async def byte_stream(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def collect(stream, chunk_size: int) -> list[list[FindingCreate]]:
+    return [chunk async for chunk in iterate_ndjson_chunks(stream, FindingCreate, chunk_size)]
+
+
+@pytest.mark.asyncio
+async def test_iterate_ndjson_chunks():
+    body = b"".join(finding_line(i) for i in range(1, 6))
+    # split the body at arbitrary positions, lines span multiple parts
+    parts = [body[i : i + 37] for i in range(0, len(body), 37)]
+    chunks = await collect(byte_stream(*parts), chunk_size=2)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [finding.line_number for chunk in chunks for finding in chunk] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_iterate_ndjson_chunks_blank_lines_and_no_trailing_separator():
+    body = finding_line(1) + b"\n  \n" + finding_line(2).rstrip(b"\n")
+    chunks = await collect(byte_stream(body), chunk_size=10)
+    assert len(chunks) == 1
+    assert [finding.line_number for finding in chunks[0]] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_iterate_ndjson_chunks_empty_body():
+    assert await collect(byte_stream(b""), chunk_size=10) == []
+
+
+@pytest.mark.asyncio
+async def test_iterate_ndjson_chunks_invalid_line():
+    body = finding_line(1) + b'{"file_path": "no other fields"}\n'
+    with pytest.raises(RequestValidationError) as exc_info:
+        await collect(byte_stream(body), chunk_size=10)
+    assert exc_info.value.errors()[0]["loc"][:2] == ("body", 2)
+
+
+@pytest.mark.asyncio
+async def test_iterate_ndjson_chunks_line_too_long():
+    with pytest.raises(HTTPException) as exc_info:
+        await collect(byte_stream(b"x" * (NDJSON_MAX_LINE_SIZE + 1)), chunk_size=10)
+    assert exc_info.value.status_code == 413
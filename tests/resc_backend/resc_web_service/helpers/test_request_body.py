@@ -0,0 +1,162 @@
+# Standard Library
+import gzip
+import json
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+# Third Party
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.testclient import TestClient
+
+# First Party
+from resc_backend.resc_web_service.helpers import request_body
+from resc_backend.resc_web_service.helpers.request_body import DecodedBodyRoute
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+
+router = APIRouter(route_class=DecodedBodyRoute)
+
+
+@router.post("/findings")
+def create_findings(findings: list[FindingCreate]) -> list[int]:
+    return [finding.line_number for finding in findings]
+
+
+@router.post("/stream")
+async def stream(request: Request) -> int:
+    return sum([len(chunk) async for chunk in request.stream()])
+
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+findings = [
+    FindingCreate(
+        file_path=f"file_path_{i}",
+        line_number=i,
+        column_start=i,
+        column_end=i,
+        commit_id=f"commit_id_{i}",
+        commit_message=f"commit_message_{i}",
+        commit_timestamp=datetime.now(UTC),
+        author=f"author_{i}",
+        email=f"email_{i}",
+        rule_name=f"rule_{i}",
+        repository_id=1,
+    )
+    for i in range(1, 6)
+]
+findings_json = json.dumps([finding.model_dump(mode="json") for finding in findings]).encode()
+
+
+def test_plain_json():
+    response = client.post("/findings", content=findings_json, headers={"Content-Type": "application/json"})
+    assert response.status_code == 200, response.text
+    assert response.json() == [1, 2, 3, 4, 5]
+
+
+def test_gzip_json():
+    response = client.post(
+        "/findings",
+        content=gzip.compress(findings_json),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == [1, 2, 3, 4, 5]
+
+
+def test_gzip_stream():
+    response = client.post("/stream", content=gzip.compress(findings_json), headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 200, response.text
+    assert response.json() == len(findings_json)
+
+
+def test_invalid_gzip():
+    response = client.post(
+        "/findings", content=findings_json, headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Invalid compressed body"
+
+
+def test_truncated_gzip():
+    response = client.post(
+        "/findings",
+        content=gzip.compress(findings_json)[:-10],
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Truncated compressed body"
+
+
+@patch.object(request_body.DecodedBodyRequest, "max_decompressed_size", len(findings_json) - 1)
+def test_gzip_too_large():
+    response = client.post(
+        "/findings",
+        content=gzip.compress(findings_json),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 413, response.text
+
+
+@patch.object(request_body.DecodedBodyRequest, "max_decompressed_size", 1024 * 1024)
+def test_gzip_bomb():
+    response = client.post(
+        "/stream", content=gzip.compress(bytes(100 * 1024 * 1024)), headers={"Content-Encoding": "gzip"}
+    )
+    assert response.status_code == 413, response.text
+
+
+@patch.object(request_body.DecodedBodyRequest, "max_decompressed_size", len(findings_json))
+def test_gzip_at_limit():
+    response = client.post("/stream", content=gzip.compress(findings_json), headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 200, response.text
+    assert response.json() == len(findings_json)
+
+
+def test_unsupported_encoding():
+    response = client.post(
+        "/findings", content=findings_json, headers={"Content-Type": "application/json", "Content-Encoding": "br"}
+    )
+    assert response.status_code == 415, response.text
+
+
+@patch.object(request_body, "msgpack", None)
+def test_msgpack_not_installed():
+    response = client.post("/findings", content=b"\x90", headers={"Content-Type": "application/msgpack"})
+    assert response.status_code == 415, response.text
+
+
+def test_msgpack():
+    msgpack = pytest.importorskip("msgpack")
+    content = msgpack.packb([finding.model_dump(mode="json") for finding in findings])
+    response = client.post(
+        "/findings",
+        content=gzip.compress(content),
+        headers={"Content-Type": "application/msgpack", "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == [1, 2, 3, 4, 5]
+
+
+def test_zstd_json():
+    zstandard = pytest.importorskip("zstandard")
+    response = client.post(
+        "/findings",
+        content=zstandard.ZstdCompressor().compress(findings_json),
+        headers={"Content-Type": "application/json", "Content-Encoding": "zstd"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == [1, 2, 3, 4, 5]
+
+
+@patch.object(request_body.DecodedBodyRequest, "max_decompressed_size", 1024 * 1024)
+def test_zstd_bomb():
+    zstandard = pytest.importorskip("zstandard")
+    response = client.post(
+        "/stream",
+        content=zstandard.ZstdCompressor().compress(bytes(100 * 1024 * 1024)),
+        headers={"Content-Encoding": "zstd"},
+    )
+    assert response.status_code == 413, response.text
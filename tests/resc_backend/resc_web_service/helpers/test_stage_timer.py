@@ -0,0 +1,42 @@
+# Standard Library
+from unittest.mock import patch
+
+# First Party
+from resc_backend.resc_web_service.helpers.stage_timer import StageTimer
+
+
+@patch("resc_backend.resc_web_service.helpers.stage_timer.time.perf_counter")
+def test_stage_timer_accumulates_stages(perf_counter):
+    perf_counter.side_effect = [0.0, 0.010, 1.0, 1.002, 2.0, 2.0035]
+    timer = StageTimer("ingest")
+    for rows in (2, 3):
+        with timer.stage("create_findings") as stage:
+            stage.rows += rows
+    with timer.stage("commit"):
+        pass
+
+    assert list(timer.stages) == ["create_findings", "commit"]
+    assert timer.stages["create_findings"].rows == 5
+    assert timer.server_timing() == 'create_findings;dur=12.0;desc="rows=5", commit;dur=3.5;desc="rows=0"'
+
+
+@patch("resc_backend.resc_web_service.helpers.stage_timer.time.perf_counter")
+def test_stage_timer_records_failing_stage(perf_counter):
+    perf_counter.side_effect = [0.0, 0.5]
+    timer = StageTimer("ingest")
+    try:
+        with timer.stage("create_findings"):
+            raise ValueError()
+    except ValueError:
+        pass
+    assert timer.stages["create_findings"].duration == 0.5
+
+
+@patch("resc_backend.resc_web_service.helpers.stage_timer.logger")
+def test_stage_timer_log(logger):
+    timer = StageTimer("ingest")
+    with timer.stage("commit") as stage:
+        stage.rows = 1
+    timer.log()
+    logger.info.assert_called_once()
+    assert logger.info.call_args.args[0].startswith("ingest stages => commit: ")
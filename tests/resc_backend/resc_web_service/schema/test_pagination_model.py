@@ -8,7 +8,12 @@ from pydantic import ValidationError
 # First Party
 from resc_backend.db.model import DBfinding
 from resc_backend.resc_web_service.schema.finding import FindingRead
-from resc_backend.resc_web_service.schema.pagination_model import PaginationModel
+from resc_backend.resc_web_service.schema.pagination_model import (
+    CursorPaginationModel,
+    PaginationModel,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 def test_pagination_model_int():
@@ -85,3 +90,26 @@ def test_pagination_model_findings():
     assert len(paginated.data) == 5
     for i in range(len(paginated.data)):
         assert paginated.data[i].id_ == i + 1
+
+
+def test_cursor_pagination_model():
+    paginated = CursorPaginationModel[int](data=[1, 2], limit=2, next_cursor="cursor")
+
+    assert paginated.data == [1, 2]
+    assert paginated.next_cursor == "cursor"
+    assert paginated.total is None
+
+
+def test_cursor_round_trip():
+    timestamp = datetime(2024, 5, 6, 7, 8, 9, 123456)
+
+    cursor = encode_cursor(timestamp, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (timestamp, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor(datetime(2024, 5, 6), 1)[:-2], "WzEsMl0"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,63 @@
+# Standard Library
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third Party
+import pytest
+
+# First Party
+from resc_backend.resc_web_service.cache_invalidation import (
+    INVALIDATE_ALL,
+    InvalidationChannel,
+    RedisInvalidationChannel,
+)
+
+
+@pytest.mark.asyncio
+async def test_invalidation_channel():
+    invalidation_channel = InvalidationChannel()
+    failing = MagicMock(side_effect=ValueError("failure"))
+    received = MagicMock()
+    invalidation_channel.subscribe(failing)
+    invalidation_channel.subscribe(received)
+
+    await invalidation_channel.publish({"keys": ["key"]})
+
+    failing.assert_called_once_with({"keys": ["key"]})
+    received.assert_called_once_with({"keys": ["key"]})
+
+
+@pytest.mark.asyncio
+async def test_redis_invalidation_channel():
+    received = asyncio.Event()
+    messages = []
+
+    async def listen():
+        yield {"type": "message", "data": b'{"keys": ["key"]}'}
+        yield {"type": "pmessage", "data": b"{}"}
+        raise ConnectionError("connection lost")
+
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.listen = listen
+    redis = MagicMock()
+    redis.publish = AsyncMock()
+    redis.pubsub.return_value.__aenter__.return_value = pubsub
+
+    def receive(message):
+        messages.append(message)
+        if message == INVALIDATE_ALL:
+            received.set()
+
+    invalidation_channel = RedisInvalidationChannel(redis, channel="channel")
+    invalidation_channel.subscribe(receive)
+    with patch("resc_backend.resc_web_service.cache_invalidation.CACHE_INVALIDATION_RETRY_DELAY", 60):
+        await invalidation_channel.start()
+        await asyncio.wait_for(received.wait(), timeout=1)
+        await invalidation_channel.stop()
+
+    pubsub.subscribe.assert_awaited_once_with("channel")
+    assert messages == [{"keys": ["key"]}, INVALIDATE_ALL]
+
+    await invalidation_channel.publish({"namespace": "ns"})
+    redis.publish.assert_awaited_once_with("channel", '{"namespace": "ns"}')
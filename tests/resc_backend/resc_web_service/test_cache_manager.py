@@ -1,13 +1,23 @@
 # Standard Library
-from unittest.mock import ANY, MagicMock, patch
+import time
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
 
 # Third Party
 import pytest
 from fastapi import Request, Response
+from fastapi_cache.backends.inmemory import InMemoryBackend
 
 # First Party
 from resc_backend.constants import CACHE_PREFIX
-from resc_backend.resc_web_service.cache_manager import CacheManager
+from resc_backend.resc_web_service.cache_generations import NamespaceGenerations
+from resc_backend.resc_web_service.cache_invalidation import InvalidationChannel
+from resc_backend.resc_web_service.cache_manager import (
+    CLEAR_TAGS_SCRIPT,
+    CacheManager,
+    LocalCache,
+    TaggedRedisBackend,
+)
+from resc_backend.resc_web_service.cache_tags import current_cache_tag_keys
 
 
 @pytest.fixture(autouse=True)
@@ -18,6 +28,13 @@ def env_setup(monkeypatch):
     monkeypatch.setenv("REDIS_PASSWORD", "dummy_password")
 
 
+@pytest.fixture(autouse=True)
+def namespace_generations():
+    namespace_generations = NamespaceGenerations()
+    with patch("resc_backend.resc_web_service.cache_manager.namespace_generations", namespace_generations):
+        yield namespace_generations
+
+
 @patch("fastapi_cache.FastAPICache.init")
 @patch("resc_backend.resc_web_service.cache_manager.CacheManager.get_cache_client")
 @patch("resc_backend.resc_web_service.cache_manager.CacheManager.request_key_builder")
@@ -44,16 +61,17 @@ def test_initialize_cache_with_cache_disabled(mock_cache_init):
     mock_cache_init.assert_called_once_with(backend=ANY, enable=False)
 
 
+@pytest.mark.asyncio
 @patch("logging.Logger.debug")
-def test_request_key_builder(mock_debug_log):
+async def test_request_key_builder(mock_debug_log):
     mock_request = MagicMock(spec=Request)
     mock_request.method = "GET"
     mock_request.url.path = "http://example.com/path"
     mock_request.query_params.items.return_value = ["param", "value"]
-    expected_cache_key = "test-namespace:get:http://example.com/path:['param', 'value']"
+    expected_cache_key = "test-namespace:0:get:http://example.com/path:['param', 'value']"
     expected_debug_msg = f"Cache created with key: {expected_cache_key}"
     response = Response()
-    cache_key = CacheManager.request_key_builder(
+    cache_key = await CacheManager.request_key_builder(
         func=None,
         namespace="test-namespace",
         request=mock_request,
@@ -65,17 +83,18 @@ def test_request_key_builder(mock_debug_log):
     mock_debug_log.assert_called_once_with(expected_debug_msg)
 
 
+@pytest.mark.asyncio
 @patch("logging.Logger.debug")
-def test_personalized_key_builder(mock_debug_log):
+async def test_personalized_key_builder(mock_debug_log):
     mock_request = MagicMock(spec=Request)
     mock_request.method = "GET"
     mock_request.url.path = "http://example.com/path"
     mock_request.user = "test-user"
     mock_request.query_params.items.return_value = ["param", "value"]
-    expected_cache_key = "test-namespace:test-user:get:http://example.com/path:['param', 'value']"
+    expected_cache_key = "test-namespace:0:test-user:get:http://example.com/path:['param', 'value']"
     expected_debug_msg = f"Cache created with key: {expected_cache_key}"
     response = Response()
-    cache_key = CacheManager.personalized_key_builder(
+    cache_key = await CacheManager.personalized_key_builder(
         func=None,
         namespace="test-namespace",
         request=mock_request,
@@ -91,14 +110,34 @@ def test_personalized_key_builder(mock_debug_log):
 @patch("fastapi_cache.FastAPICache.get_enable")
 @patch("fastapi_cache.FastAPICache.clear")
 @patch("logging.Logger.debug")
-async def test_clear_cache_by_namespace(mock_debug_log, mock_clear, mock_get_enable):
-    mock_clear.return_value = None
+async def test_clear_cache_by_namespace(mock_debug_log, mock_clear, mock_get_enable, namespace_generations):
     mock_get_enable.return_value = True
     namespace = "test-namespace"
     expected_debug_msg = f"Cache cleared for namespaces: {namespace}"
     await CacheManager.clear_cache_by_namespace(namespace=namespace)
-    mock_clear.assert_called_once_with(namespace=namespace)
+    mock_clear.assert_not_called()
     mock_debug_log.assert_called_once_with(expected_debug_msg)
+    assert await namespace_generations.get(f"{CACHE_PREFIX}:{namespace}") == 1
+
+
+@pytest.mark.asyncio
+@patch("logging.Logger.debug")
+async def test_key_builder_after_clear_cache_by_namespace(mock_debug_log):
+    mock_request = MagicMock(spec=Request)
+    mock_request.method = "GET"
+    mock_request.url.path = "/path"
+    mock_request.query_params.items.return_value = []
+    namespace = f"{CACHE_PREFIX}:test-namespace"
+
+    async def build_key():
+        return await CacheManager.request_key_builder(
+            func=None, namespace=namespace, request=mock_request, response=Response(), args=(), kwargs={}
+        )
+
+    assert await build_key() == f"{namespace}:0:get:/path:[]"
+    with patch("fastapi_cache.FastAPICache.get_enable", return_value=True):
+        await CacheManager.clear_cache_by_namespace(namespace="test-namespace")
+    assert await build_key() == f"{namespace}:1:get:/path:[]"
 
 
 @pytest.mark.asyncio
@@ -112,3 +151,227 @@ async def test_clear_all_cache(mock_debug_log, mock_clear, mock_get_enable):
     await CacheManager.clear_all_cache()
     mock_clear.assert_called_once()
     mock_debug_log.assert_called_once_with(expected_debug_msg)
+
+
+@pytest.mark.asyncio
+@patch("fastapi_cache.FastAPICache.get_enable")
+@patch("fastapi_cache.FastAPICache.clear")
+@patch("resc_backend.resc_web_service.cache_manager.cache_warmer")
+async def test_clear_cache_by_namespace_schedules_warmer(mock_cache_warmer, mock_clear, mock_get_enable):
+    mock_get_enable.return_value = True
+    await CacheManager.clear_cache_by_namespace(namespace="test-namespace")
+    mock_cache_warmer.cancel.assert_called_once_with(f"{CACHE_PREFIX}:test-namespace")
+    mock_cache_warmer.schedule.assert_called_once_with(f"{CACHE_PREFIX}:test-namespace")
+
+
+@pytest.mark.asyncio
+async def test_request_key_builder_sets_tags():
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/path",
+            "query_string": b"rule_pack_version=1.0.0",
+            "path_params": {},
+            "headers": [],
+        }
+    )
+    await CacheManager.request_key_builder(
+        func=None, namespace="test-namespace", request=request, response=Response(), args=(), kwargs={}
+    )
+    assert current_cache_tag_keys.get() == ("test-namespace:tag:rule-pack:1.0.0",)
+
+
+@pytest.mark.asyncio
+async def test_namespace_generations_in_redis():
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=b"4")
+    redis.incr = AsyncMock(return_value=5)
+    namespace_generations = NamespaceGenerations(memo_ttl=60)
+    namespace_generations.start(redis)
+
+    assert await namespace_generations.get("ns") == 4
+    assert await namespace_generations.get("ns") == 4
+    redis.get.assert_awaited_once_with("resc-cache-generation:ns")
+
+    assert await namespace_generations.increment("ns") == 5
+    assert await namespace_generations.get("ns") == 5
+    redis.incr.assert_awaited_once_with("resc-cache-generation:ns")
+    redis.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tagged_redis_backend_set():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis = MagicMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    backend = TaggedRedisBackend(redis)
+
+    current_cache_tag_keys.set(("ns:tag:global", "ns:tag:rule-pack:1.0.0"))
+    await backend.set("ns:key", b"value", expire=60)
+
+    pipe.set.assert_called_once_with("ns:key", b"value", ex=60)
+    pipe.sadd.assert_has_calls([call("ns:tag:global", "ns:key"), call("ns:tag:rule-pack:1.0.0", "ns:key")])
+    pipe.expire.assert_has_calls([call("ns:tag:global", 60), call("ns:tag:rule-pack:1.0.0", 60)])
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tagged_redis_backend_clear_tags():
+    redis = MagicMock()
+    redis.eval = AsyncMock(return_value=[b"ns:key-1", b"ns:key-2"])
+    backend = TaggedRedisBackend(redis)
+
+    assert await backend.clear_tags(["ns:tag:a", "ns:tag:b"]) == ["ns:key-1", "ns:key-2"]
+    redis.eval.assert_awaited_once_with(CLEAR_TAGS_SCRIPT, 2, "ns:tag:a", "ns:tag:b")
+
+
+@pytest.mark.asyncio
+@patch("fastapi_cache.FastAPICache.get_enable")
+@patch("fastapi_cache.FastAPICache.get_backend")
+@patch("resc_backend.resc_web_service.cache_manager.cache_warmer")
+async def test_clear_cache_by_tags(mock_cache_warmer, mock_get_backend, mock_get_enable):
+    mock_get_enable.return_value = True
+    backend = MagicMock(spec=TaggedRedisBackend)
+    backend.clear_tags = AsyncMock(
+        return_value=[f"{CACHE_PREFIX}:namespace-rule:0:key-1", f"{CACHE_PREFIX}:namespace-rule-pack:3:key-2"]
+    )
+    mock_get_backend.return_value = backend
+
+    await CacheManager.clear_cache_by_tags(namespaces=["namespace-rule", "namespace-rule-pack"], tags=["a", "b"])
+
+    backend.clear_tags.assert_awaited_once_with(
+        [
+            f"{CACHE_PREFIX}:namespace-rule:tag:a",
+            f"{CACHE_PREFIX}:namespace-rule:tag:b",
+            f"{CACHE_PREFIX}:namespace-rule-pack:tag:a",
+            f"{CACHE_PREFIX}:namespace-rule-pack:tag:b",
+        ]
+    )
+    mock_cache_warmer.cancel.assert_has_calls(
+        [call(f"{CACHE_PREFIX}:namespace-rule"), call(f"{CACHE_PREFIX}:namespace-rule-pack")]
+    )
+    mock_cache_warmer.schedule.assert_has_calls(
+        [
+            call(f"{CACHE_PREFIX}:namespace-rule", cache_keys=[f"{CACHE_PREFIX}:namespace-rule:key-1"]),
+            call(f"{CACHE_PREFIX}:namespace-rule-pack", cache_keys=[f"{CACHE_PREFIX}:namespace-rule-pack:key-2"]),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+@patch("fastapi_cache.FastAPICache.get_enable")
+@patch("fastapi_cache.FastAPICache.get_backend")
+@patch("resc_backend.resc_web_service.cache_manager.CacheManager.clear_cache_by_namespace")
+async def test_clear_cache_by_tags_without_tagged_backend(
+    mock_clear_cache_by_namespace, mock_get_backend, mock_get_enable
+):
+    mock_get_enable.return_value = True
+    mock_get_backend.return_value = InMemoryBackend()
+
+    await CacheManager.clear_cache_by_tags(namespaces=["namespace-rule", "namespace-rule-pack"], tags=["a"])
+
+    mock_clear_cache_by_namespace.assert_has_calls(
+        [call(namespace="namespace-rule"), call(namespace="namespace-rule-pack")]
+    )
+
+
+def test_local_cache_lru():
+    local_cache = LocalCache(max_entries=2, max_value_size=4, ttl=60)
+    local_cache.set("a", b"1")
+    local_cache.set("b", b"2")
+    assert local_cache.get_with_ttl("a") == (59, b"1")
+    local_cache.set("c", b"3")
+    local_cache.set("large", b"12345")
+
+    assert len(local_cache) == 2
+    assert local_cache.get_with_ttl("b") == (0, None)
+    assert local_cache.get_with_ttl("c")[1] == b"3"
+    assert local_cache.get_with_ttl("large") == (0, None)
+    assert (local_cache.hits, local_cache.misses) == (2, 2)
+
+
+def test_local_cache_ttl():
+    local_cache = LocalCache(ttl=60)
+    local_cache.set("short", b"1", expire=1)
+    local_cache.set("long", b"2", expire=3600)
+    with patch("time.monotonic", return_value=time.monotonic() + 30):
+        assert local_cache.get_with_ttl("short") == (0, None)
+        assert local_cache.get_with_ttl("long")[1] == b"2"
+
+
+def test_local_cache_invalidation():
+    local_cache = LocalCache()
+    for key in ["ns-1:a", "ns-1:b", "ns-2:a"]:
+        local_cache.set(key, b"value")
+
+    local_cache.handle_invalidation({"keys": ["ns-1:a", "unknown"]})
+    local_cache.handle_invalidation({"namespace": "ns-2"})
+    assert len(local_cache) == 2
+    local_cache.handle_invalidation({"prefix": "ns-1:"})
+    assert local_cache.get_with_ttl("ns-2:a")[1] == b"value"
+    assert len(local_cache) == 1
+
+
+def build_local_backend(redis: MagicMock, invalidation_channel: InvalidationChannel) -> TaggedRedisBackend:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    return TaggedRedisBackend(redis, local_cache=LocalCache(), invalidation_channel=invalidation_channel)
+
+
+@pytest.mark.asyncio
+async def test_tagged_redis_backend_with_local_cache():
+    redis = MagicMock()
+    redis.eval = AsyncMock(return_value=[b"ns:key"])
+    invalidation_channel = InvalidationChannel()
+    backend = build_local_backend(redis, invalidation_channel)
+    other_backend = build_local_backend(MagicMock(), invalidation_channel)
+
+    await backend.set("ns:key", b"value", expire=60)
+    await other_backend.set("ns:key", b"value", expire=60)
+    assert await backend.get_with_ttl("ns:key") == (29, b"value")
+    assert backend.local_cache.hits == 1
+    redis.pipeline.return_value.__aenter__.return_value.ttl.assert_not_called()
+
+    assert await backend.clear_tags(["ns:tag:a"]) == ["ns:key"]
+    assert len(backend.local_cache) == 0
+    assert len(other_backend.local_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_tagged_redis_backend_fills_local_cache():
+    redis = MagicMock()
+    backend = build_local_backend(redis, InvalidationChannel())
+    pipe = redis.pipeline.return_value.__aenter__.return_value
+    pipe.ttl.return_value.get.return_value.execute = AsyncMock(return_value=[120, b"value"])
+
+    assert await backend.get_with_ttl("ns:key") == (120, b"value")
+    assert await backend.get_with_ttl("ns:key") == (29, b"value")
+    assert (backend.local_cache.hits, backend.local_cache.misses) == (1, 1)
+
+    async def invalidated_meanwhile():
+        backend.local_cache.handle_invalidation({"keys": ["ns:other"]})
+        return [120, b"value"]
+
+    pipe.ttl.return_value.get.return_value.execute = invalidated_meanwhile
+    assert await backend.get_with_ttl("ns:other") == (120, b"value")
+    assert len(backend.local_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_namespace_generations_invalidation():
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=b"1")
+    redis.incr = AsyncMock(return_value=2)
+    invalidation_channel = InvalidationChannel()
+    namespace_generations = NamespaceGenerations(memo_ttl=60)
+    namespace_generations.start(redis, invalidation_channel=invalidation_channel)
+    other_namespace_generations = NamespaceGenerations(memo_ttl=60)
+    other_namespace_generations.start(redis, invalidation_channel=invalidation_channel)
+
+    assert await other_namespace_generations.get("ns") == 1
+    await namespace_generations.increment("ns")
+    redis.get.return_value = b"2"
+    assert await other_namespace_generations.get("ns") == 2
@@ -0,0 +1,63 @@
+# Third Party
+from fastapi import Request
+
+# First Party
+from resc_backend.resc_web_service.cache_tags import (
+    get_cache_tag_key,
+    get_request_cache_tags,
+    get_scope_cache_tags,
+)
+
+
+def build_request(query_string: str = "", path_params: dict | None = None) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/resc/v1/path",
+            "query_string": query_string.encode(),
+            "path_params": path_params or {},
+            "headers": [],
+        }
+    )
+
+
+def test_get_request_cache_tags_global():
+    assert get_request_cache_tags(build_request()) == ["global"]
+    assert get_request_cache_tags(build_request("skip=0&limit=100&project_name=")) == ["global"]
+
+
+def test_get_request_cache_tags_query_params():
+    request = build_request(
+        "rule_pack_version=1.0.0&rule_pack_version=1.0.1&vcs_provider=AZURE_DEVOPS&project_name=P&repository_name=R"
+    )
+    assert get_request_cache_tags(request) == [
+        "project:P",
+        "repository:R",
+        "rule-pack:1.0.0",
+        "rule-pack:1.0.1",
+        "vcs-provider:AZURE_DEVOPS",
+    ]
+
+
+def test_get_request_cache_tags_path_params():
+    request = build_request(path_params={"rule_pack_version": "1.0.0", "vcs_instance_id": 3})
+    assert get_request_cache_tags(request) == ["rule-pack:1.0.0", "vcs-instance:3"]
+
+
+def test_get_request_cache_tags_detailed_findings_query_string():
+    request = build_request(
+        "query_string=rule_pack_versions%3D%5B%271.0.0%27%5D%26vcs_providers%3D%5B%27BITBUCKET%27%5D"
+        "%26rule_names%3D%5B%27rule%27%5D"
+    )
+    assert get_request_cache_tags(request) == ["rule-pack:1.0.0", "vcs-provider:BITBUCKET"]
+
+
+def test_get_scope_cache_tags():
+    assert get_scope_cache_tags(
+        project_key="P", repository_name="R", rule_pack="1.0.0", vcs_instance_id=3, provider_type="BITBUCKET"
+    ) == ["project:P", "repository:R", "rule-pack:1.0.0", "vcs-instance:3", "vcs-provider:BITBUCKET", "global"]
+
+
+def test_get_cache_tag_key():
+    assert get_cache_tag_key("resc-cache:namespace-finding", "global") == "resc-cache:namespace-finding:tag:global"
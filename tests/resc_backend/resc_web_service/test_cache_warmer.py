@@ -0,0 +1,163 @@
+# Standard Library
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third Party
+import pytest
+from fastapi import Request
+from fastapi_cache.coder import JsonCoder
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.constants import REDIS_CACHE_EXPIRE
+from resc_backend.resc_web_service.cache_generations import NamespaceGenerations
+from resc_backend.resc_web_service.cache_tags import current_cache_tag_keys
+from resc_backend.resc_web_service.cache_warmer import CacheWarmer
+
+NAMESPACE = "resc-cache:namespace-finding"
+
+
+@pytest.fixture
+def backend():
+    backend = AsyncMock()
+    with (
+        patch("fastapi_cache.FastAPICache.get_backend", return_value=backend),
+        patch("fastapi_cache.FastAPICache.get_coder", return_value=JsonCoder),
+    ):
+        yield backend
+
+
+@pytest.fixture(autouse=True)
+def namespace_generations():
+    namespace_generations = NamespaceGenerations()
+    with patch("resc_backend.resc_web_service.cache_warmer.namespace_generations", namespace_generations):
+        yield namespace_generations
+
+
+@pytest.fixture
+def session():
+    return MagicMock(spec=Session)
+
+
+def build_warmer(session, min_hits: int = 2) -> CacheWarmer:
+    warmer = CacheWarmer(debounce=0, concurrency=1, min_hits=min_hits, max_keys=2)
+    warmer.start(session_factory=lambda: session)
+    return warmer
+
+
+def record(warmer: CacheWarmer, cache_key: str, hits: int, func=None, namespace: str = NAMESPACE, **kwargs):
+    for _ in range(hits):
+        warmer.record(namespace, cache_key, func or MagicMock(), kwargs)
+
+
+@pytest.mark.asyncio
+async def test_hot_keys(session):
+    warmer = build_warmer(session)
+    record(warmer, "a", hits=2)
+    record(warmer, "b", hits=3)
+    record(warmer, "c", hits=1)
+    record(warmer, "d", hits=4, namespace="resc-cache:namespace-rule")
+    record(warmer, "e", hits=5, request=MagicMock(spec=Request))
+    record(warmer, "f", hits=2)
+
+    assert warmer.hot_keys(NAMESPACE) == ["b", "a"]
+    assert warmer.hot_keys("resc-cache:namespace-rule") == ["d"]
+
+
+@pytest.mark.asyncio
+async def test_hot_keys_are_recomputed(backend, session, namespace_generations):
+    warmer = build_warmer(session)
+
+    def endpoint(db_connection: Session, skip: int):
+        assert db_connection is session
+        return {"skip": skip}
+
+    async def async_endpoint(db_connection: Session):
+        return [1, 2]
+
+    record(warmer, f"{NAMESPACE}:sync", hits=2, func=endpoint, db_connection=MagicMock(spec=Session), skip=10)
+    record(warmer, f"{NAMESPACE}:async", hits=2, func=async_endpoint, db_connection=MagicMock(spec=Session))
+    record(warmer, f"{NAMESPACE}:cold", hits=1, func=endpoint, db_connection=MagicMock(spec=Session), skip=0)
+
+    await namespace_generations.increment(NAMESPACE)
+    warmer.schedule(NAMESPACE)
+    await warmer._tasks[NAMESPACE]
+
+    assert sorted(call.args for call in backend.set.await_args_list) == [
+        (f"{NAMESPACE}:1:async", JsonCoder.encode([1, 2]), REDIS_CACHE_EXPIRE),
+        (f"{NAMESPACE}:1:sync", JsonCoder.encode({"skip": 10}), REDIS_CACHE_EXPIRE),
+    ]
+    assert session.close.call_count == 2
+    await warmer.stop()
+
+
+@pytest.mark.asyncio
+async def test_invalidations_are_debounced(backend, session):
+    warmer = CacheWarmer(debounce=0.05, concurrency=1, min_hits=1, max_keys=2)
+    warmer.start(session_factory=lambda: session)
+    endpoint = MagicMock(return_value={})
+    record(warmer, "key", hits=1, func=endpoint)
+
+    warmer.schedule(NAMESPACE)
+    await asyncio.sleep(0.01)
+    warmer.schedule(NAMESPACE)
+    await warmer._tasks[NAMESPACE]
+
+    endpoint.assert_called_once()
+    backend.set.assert_awaited_once()
+    await warmer.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_recomputation(backend, session):
+    warmer = build_warmer(session, min_hits=1)
+    endpoint = MagicMock(return_value={})
+    record(warmer, "key", hits=1, func=endpoint)
+
+    warmer.schedule(NAMESPACE)
+    task = warmer._tasks[NAMESPACE]
+    warmer.cancel(NAMESPACE)
+    await asyncio.gather(task, return_exceptions=True)
+
+    endpoint.assert_not_called()
+    backend.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failing_recomputation_is_skipped(backend, session):
+    warmer = build_warmer(session, min_hits=1)
+    record(warmer, f"{NAMESPACE}:failing", hits=1, func=MagicMock(side_effect=ValueError("failure")))
+    record(warmer, f"{NAMESPACE}:working", hits=1, func=MagicMock(return_value={}))
+
+    warmer.schedule(NAMESPACE)
+    await warmer._tasks[NAMESPACE]
+
+    backend.set.assert_awaited_once_with(f"{NAMESPACE}:0:working", JsonCoder.encode({}), REDIS_CACHE_EXPIRE)
+
+
+@pytest.mark.asyncio
+async def test_only_cleared_keys_are_recomputed(backend, session):
+    warmer = CacheWarmer(debounce=0.05, concurrency=1, min_hits=1, max_keys=3)
+    warmer.start(session_factory=lambda: session)
+    tag_keys = {}
+
+    async def set_value(cache_key, value, expire):
+        tag_keys[cache_key] = current_cache_tag_keys.get()
+
+    backend.set.side_effect = set_value
+    for key in ["a", "b", "c"]:
+        warmer.record(NAMESPACE, f"{NAMESPACE}:{key}", MagicMock(return_value={}), {}, (f"{NAMESPACE}:tag:{key}",))
+
+    warmer.schedule(NAMESPACE, cache_keys=[f"{NAMESPACE}:a"])
+    await asyncio.sleep(0.01)
+    warmer.schedule(NAMESPACE, cache_keys=[f"{NAMESPACE}:b", f"{NAMESPACE}:unknown"])
+    await warmer._tasks[NAMESPACE]
+
+    assert tag_keys == {f"{NAMESPACE}:0:a": (f"{NAMESPACE}:tag:a",), f"{NAMESPACE}:0:b": (f"{NAMESPACE}:tag:b",)}
+    await warmer.stop()
+
+
+def test_not_started_warmer_records_nothing(session):
+    warmer = CacheWarmer(min_hits=1)
+    record(warmer, "key", hits=3)
+    assert warmer.hot_keys(NAMESPACE) == []
@@ -0,0 +1,129 @@
+# Standard Library
+import os
+import tempfile
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import ANY, call, patch
+
+# Third Party
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# First Party
+from resc_backend.constants import FINDING_WEEKLY_SNAPSHOT_WEEKS
+from resc_backend.db.model import Base, DBfinding, DBscan, DBscanFinding
+from resc_backend.resc_web_service.crud.ingest_job import create_ingest_job, get_ingest_job
+from resc_backend.resc_web_service.ingest_worker import FINDINGS_ADAPTER, IngestJobClaimLostError, IngestWorkerPool
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service.schema.ingest_job_status import IngestJobStatus
+
+
+def build_finding(num: int) -> FindingCreate:
+    return FindingCreate(
+        file_path=f"file_path_{num}",
+        line_number=num,
+        column_start=num,
+        column_end=num,
+        commit_id=f"commit_id_{num}",
+        commit_message=f"commit_message_{num}",
+        commit_timestamp=datetime.now(UTC),
+        author=f"author_{num}",
+        email=f"email_{num}",
+        rule_name=f"rule_{num}",
+        repository_id=1,
+    )
+
+
+@patch("resc_backend.resc_web_service.ingest_worker.IngestWorkerPool._report_progress")
+class TestIngestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        # The ingestion and the ingest job are handled by distinct sessions, they need a shared database
+        handle, self.database_file = tempfile.mkstemp(suffix=".sqlite")
+        os.close(handle)
+        self.engine = create_engine(f"sqlite:///{self.database_file}")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+
+        db_scan = DBscan(
+            repository_id=1,
+            scan_type="BASE",
+            last_scanned_commit="FAKE_HASH",
+            timestamp=datetime.now(UTC),
+            increment_number=0,
+            rule_pack="1.0",
+            is_latest=True,
+        )
+        self.session.add(db_scan)
+        self.session.commit()
+        self.scan_id = db_scan.id_
+
+        self.pool = IngestWorkerPool()
+        self.pool.start(workers=0, session_factory=lambda: Session(bind=self.engine))
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+        os.remove(self.database_file)
+
+    def queue(self, scan_id: int, findings: list[FindingCreate]) -> int:
+        payload = FINDINGS_ADAPTER.dump_json(findings).decode()
+        return create_ingest_job(self.session, scan_id=scan_id, payload=payload, total_findings=len(findings)).id_
+
+    def test_process_next_job(self, report_progress):
+        ingest_job_id = self.queue(self.scan_id, [build_finding(i) for i in range(1, 4)])
+
+        assert self.pool.process_next_job() is True
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=ingest_job_id)
+        assert db_ingest_job.status == IngestJobStatus.DONE
+        assert db_ingest_job.created_findings == 3
+        assert db_ingest_job.payload is None
+        assert self.session.query(DBfinding).count() == 3
+        assert self.session.query(DBscanFinding).where(DBscanFinding.scan_id == self.scan_id).count() == 3
+        # after the single chunk, before marking the outdated findings and before the commit
+        assert report_progress.call_args_list == [call(ingest_job_id, ANY, processed_findings=3)] * 3
+
+        assert self.pool.process_next_job() is False
+
+    def test_process_next_job_requeued(self, report_progress):
+        ingest_job_id = self.queue(self.scan_id, [build_finding(i) for i in range(1, 4)])
+
+        # the job was queued again and taken over by another worker, the heartbeat after the first chunk notices it
+        report_progress.side_effect = IngestJobClaimLostError(f"Ingest job {ingest_job_id} was queued again")
+
+        assert self.pool.process_next_job() is True
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=ingest_job_id)
+        assert db_ingest_job.status == IngestJobStatus.RUNNING
+        assert db_ingest_job.payload is not None
+        assert self.session.query(DBfinding).count() == 0
+        report_progress.assert_called_once()
+
+    def test_process_next_job_unknown_scan(self, report_progress):
+        ingest_job_id = self.queue(self.scan_id + 1, [build_finding(1)])
+
+        assert self.pool.process_next_job() is True
+
+        self.session.expire_all()
+        db_ingest_job = get_ingest_job(self.session, ingest_job_id=ingest_job_id)
+        assert db_ingest_job.status == IngestJobStatus.FAILED
+        assert db_ingest_job.error == f"Scan {self.scan_id + 1} not found"
+        assert self.session.query(DBfinding).count() == 0
+
+    @patch("resc_backend.resc_web_service.ingestion.delete_expired_ingest_requests")
+    def test_delete_expired_ingest_requests(self, delete_expired_ingest_requests, report_progress):
+        self.pool.delete_expired_ingest_requests()
+        # throttled until the next cleanup interval
+        self.pool.delete_expired_ingest_requests()
+
+        delete_expired_ingest_requests.assert_called_once()
+
+    @patch("resc_backend.resc_web_service.crud.finding_weekly_snapshot.finalize_finding_weekly_snapshots")
+    def test_finalize_finding_weekly_snapshots(self, finalize_finding_weekly_snapshots, report_progress):
+        self.pool.finalize_finding_weekly_snapshots()
+        # throttled until the next interval
+        self.pool.finalize_finding_weekly_snapshots()
+
+        finalize_finding_weekly_snapshots.assert_called_once_with(ANY, weeks=FINDING_WEEKLY_SNAPSHOT_WEEKS)
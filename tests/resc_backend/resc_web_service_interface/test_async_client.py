@@ -0,0 +1,133 @@
+# Standard Library
+import asyncio
+import json
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+# Third Party
+import httpx
+import pytest
+
+# First Party
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service.schema.repository import Repository
+from resc_backend.resc_web_service.schema.scan import ScanCreate
+from resc_backend.resc_web_service.schema.scan_type import ScanType
+from resc_backend.resc_web_service_interface.async_client import AsyncRescWebServiceClient
+
+findings: list[FindingCreate] = []
+for i in range(1, 6):
+    findings.append(
+        FindingCreate(
+            file_path=f"file_path_{i}",
+            line_number=i,
+            column_start=i,
+            column_end=i,
+            commit_id=f"commit_id_{i}",
+            commit_message=f"commit_message_{i}",
+            commit_timestamp=datetime.now(UTC),
+            author=f"author_{i}",
+            email=f"email_{i}",
+            rule_name=f"rule_{i}",
+            repository_id=1,
+        )
+    )
+
+repositories = [
+    Repository(
+        project_key="project_key",
+        repository_id=str(i),
+        repository_name=f"repo_{i}",
+        repository_url=f"https://fake-host.com/repo_{i}",
+        vcs_instance=1,
+    )
+    for i in range(1, 21)
+]
+
+
+@pytest.mark.asyncio
+async def test_create_repositories_concurrency_limit():
+    in_flight = 0
+    max_in_flight = 0
+    urls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        urls.append(str(request.url))
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(201, json=json.loads(request.content))
+
+    async with AsyncRescWebServiceClient(
+        "https://fake-host.com", max_concurrency=3, transport=httpx.MockTransport(handler)
+    ) as client:
+        responses = await client.create_repositories(repositories)
+
+    assert [response.json()["repository_id"] for response in responses] == [str(i) for i in range(1, 21)]
+    assert set(urls) == {"https://fake-host.com/resc/v1/repositories"}
+    assert 1 < max_in_flight <= 3
+    assert client.statistics["create_repository"].calls == 20
+
+
+@pytest.mark.asyncio
+async def test_create_scans_returns_exceptions():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["repository_id"] == 2:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(201)
+
+    scans = [
+        ScanCreate(
+            scan_type=ScanType.BASE,
+            last_scanned_commit="FAKE_HASH",
+            timestamp=datetime.now(UTC),
+            repository_id=i,
+            increment_number=0,
+            rule_pack="1.0.0",
+        )
+        for i in range(1, 4)
+    ]
+    async with AsyncRescWebServiceClient("https://fake-host.com", transport=httpx.MockTransport(handler)) as client:
+        results = await client.create_scans(scans)
+
+    assert results[0].status_code == 201
+    assert isinstance(results[1], httpx.ConnectError)
+    assert results[2].status_code == 201
+    # creating a scan is not idempotent, it is not retried
+    assert client.statistics["create_scan"].retries == 0
+    assert client.statistics["create_scan"].failures == 1
+
+
+@pytest.mark.asyncio
+@patch("asyncio.sleep")
+async def test_create_findings_for_scans_single_request_and_retries(sleep):
+    attempts: dict[str, int] = {}
+    sent_findings: dict[str, list] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/x-ndjson"
+        assert request.url.params["chunk_size"] == "2"
+        key = request.headers["Idempotency-Key"]
+        attempts[key] = attempts.get(key, 0) + 1
+        if attempts[key] == 1 and request.url.path == "/resc/v1/scans/2/findings/stream":
+            return httpx.Response(503)
+        lines = request.content.decode().splitlines()
+        sent_findings.setdefault(request.url.path, []).extend(json.loads(line) for line in lines)
+        return httpx.Response(201, json=len(lines))
+
+    async with AsyncRescWebServiceClient(
+        "https://fake-host.com", findings_batch_size=2, transport=httpx.MockTransport(handler)
+    ) as client:
+        results = await client.create_findings_for_scans({1: findings, 2: findings[:2]})
+
+    assert results[1].json() == 5
+    assert results[2].json() == 2
+    # a single upload per scan, the retry carries the same Idempotency-Key
+    assert sorted(attempts.values()) == [1, 2]
+    assert len(sent_findings["/resc/v1/scans/1/findings/stream"]) == 5
+    assert len(sent_findings["/resc/v1/scans/2/findings/stream"]) == 2
+    assert client.statistics["create_findings_with_scan_id"].calls == 2
+    assert client.statistics["create_findings_with_scan_id"].retries == 1
+    sleep.assert_called_once_with(0.5)
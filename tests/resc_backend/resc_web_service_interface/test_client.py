@@ -0,0 +1,133 @@
+# Standard Library
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+# Third Party
+import pytest
+import requests
+
+# First Party
+from resc_backend.resc_web_service.schema.finding import FindingCreate
+from resc_backend.resc_web_service.schema.scan import ScanCreate
+from resc_backend.resc_web_service.schema.scan_type import ScanType
+from resc_backend.resc_web_service_interface.client import RescWebServiceClient
+
+findings: list[FindingCreate] = []
+for i in range(1, 6):
+    findings.append(
+        FindingCreate(
+            file_path=f"file_path_{i}",
+            line_number=i,
+            column_start=i,
+            column_end=i,
+            commit_id=f"commit_id_{i}",
+            commit_message=f"commit_message_{i}",
+            commit_timestamp=datetime.now(UTC),
+            author=f"author_{i}",
+            email=f"email_{i}",
+            rule_name=f"rule_{i}",
+            repository_id=1,
+        )
+    )
+
+
+def response(status_code: int) -> MagicMock:
+    mocked_response = MagicMock(spec=requests.Response)
+    mocked_response.status_code = status_code
+    return mocked_response
+
+
+def test_client_pooled_adapter():
+    client = RescWebServiceClient("https://fake-host.com", pool_connections=2, pool_maxsize=20, retries=4)
+    adapter = client.session.get_adapter("https://fake-host.com")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 20
+    # the retries are only done by the client
+    assert adapter.max_retries.total == 0
+
+
+@patch("requests.Session.request")
+def test_create_findings_with_scan_id_single_request(request):
+    request.return_value = response(201)
+    client = RescWebServiceClient("https://fake-host.com", findings_batch_size=2)
+
+    result = client.create_findings_with_scan_id(findings, scan_id=1)
+    assert result.status_code == 201
+    request.assert_called_once()
+
+    args, kwargs = request.call_args
+    assert args == ("POST", "https://fake-host.com/resc/v1/scans/1/findings/stream")
+    assert kwargs["params"] == {"chunk_size": 2}
+    assert kwargs["headers"]["Content-Type"] == "application/x-ndjson"
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert kwargs["headers"]["Idempotency-Key"]
+    sent_findings = [json.loads(line) for line in kwargs["data"].splitlines()]
+    assert sent_findings == [json.loads(finding.model_dump_json()) for finding in findings]
+
+    statistics = client.statistics["create_findings_with_scan_id"]
+    assert statistics.calls == 1
+    assert statistics.failures == 0
+    assert statistics.retries == 0
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_create_findings_with_scan_id_retried(request, sleep):
+    request.side_effect = [requests.Timeout(), response(201)]
+    client = RescWebServiceClient("https://fake-host.com")
+
+    result = client.create_findings_with_scan_id(findings, scan_id=1)
+    assert result.status_code == 201
+    assert request.call_count == 2
+    # the retry carries the same body and Idempotency-Key
+    first, retry = request.call_args_list
+    assert first.kwargs["data"] == retry.kwargs["data"]
+    assert first.kwargs["headers"]["Idempotency-Key"] == retry.kwargs["headers"]["Idempotency-Key"]
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_idempotent_call_retried(request, sleep):
+    request.side_effect = [requests.Timeout(), response(503), response(200)]
+    client = RescWebServiceClient("https://fake-host.com", retries=3, backoff_factor=0.5)
+
+    result = client.get_last_scan_for_repository(repository_id=1)
+    assert result.status_code == 200
+    assert request.call_count == 3
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+    assert client.statistics["get_last_scan_for_repository"].retries == 2
+    assert client.statistics["get_last_scan_for_repository"].calls == 1
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_idempotent_call_retries_exhausted(request, sleep):
+    request.side_effect = requests.ConnectionError()
+    client = RescWebServiceClient("https://fake-host.com", retries=2)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get_ingest_job(scan_id=1, ingest_job_id=2)
+    assert request.call_count == 3
+    assert client.statistics["get_ingest_job"].failures == 1
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_non_idempotent_call_not_retried(request, sleep):
+    request.return_value = response(503)
+    client = RescWebServiceClient("https://fake-host.com")
+
+    scan = ScanCreate(
+        scan_type=ScanType.BASE,
+        last_scanned_commit="FAKE_HASH",
+        timestamp=datetime.now(UTC),
+        repository_id=1,
+        increment_number=0,
+        rule_pack="1.0.0",
+    )
+    result = client.create_scan(scan)
+    assert result.status_code == 503
+    request.assert_called_once()
+    sleep.assert_not_called()
+    assert client.statistics["create_scan"].failures == 1
@@ -1,12 +1,24 @@
 # Standard Library
+import gzip
 import json
 from datetime import UTC, datetime
 from unittest.mock import patch
 
+# Third Party
+import pytest
+
 # First Party
 from resc_backend.resc_web_service.schema.finding import FindingCreate
 from resc_backend.resc_web_service.schema.finding_status import FindingStatus
-from resc_backend.resc_web_service_interface.findings import create_findings
+from resc_backend.resc_web_service_interface.findings import (
+    create_findings,
+    create_findings_delta_with_scan_id,
+    create_findings_with_scan_id,
+    create_findings_with_scan_id_async,
+    encode_findings,
+    encode_findings_ndjson,
+    get_ingest_job,
+)
 
 findings: list[FindingCreate] = []
 for i in range(1, 6):
@@ -41,4 +53,87 @@ def test_create_findings(post):
 
     _ = create_findings(url, findings)
     post.assert_called_once()
-    post.assert_called_with(expected_url, json=findings_json, proxies={"http": "", "https": ""}, timeout=10)
+    args, kwargs = post.call_args
+    assert args == (expected_url,)
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
+    assert json.loads(kwargs["data"]) == findings_json
+    assert kwargs["proxies"] == {"http": "", "https": ""}
+    assert kwargs["timeout"] == 10
+
+
+@patch("requests.post")
+def test_create_findings_with_scan_id_idempotency_key(post):
+    expected_url = "https://fake-host.com/resc/v1/scans/1/findings"
+    url = "https://fake-host.com"
+
+    _ = create_findings_with_scan_id(url, findings, scan_id=1, idempotency_key="upload-1")
+    post.assert_called_once()
+    args, kwargs = post.call_args
+    assert args == (expected_url,)
+    assert kwargs["headers"]["Idempotency-Key"] == "upload-1"
+
+
+@patch("requests.post")
+def test_create_findings_delta_with_scan_id(post):
+    expected_url = "https://fake-host.com/resc/v1/scans/2/findings/delta"
+    url = "https://fake-host.com"
+    removed = ["0" * 64]
+
+    _ = create_findings_delta_with_scan_id(url, scan_id=2, parent_scan_id=1, added=findings, removed=removed)
+    post.assert_called_once()
+    args, kwargs = post.call_args
+    assert args == (expected_url,)
+    assert kwargs["headers"] == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    delta = json.loads(gzip.decompress(kwargs["data"]))
+    assert delta["parent_scan_id"] == 1
+    assert delta["added"] == [json.loads(finding.model_dump_json()) for finding in findings]
+    assert delta["removed"] == removed
+
+
+@patch("requests.post")
+def test_create_findings_with_scan_id_async(post):
+    expected_url = "https://fake-host.com/resc/v1/scans/1/ingest-jobs"
+    url = "https://fake-host.com"
+
+    findings_json = []
+    for finding in findings:
+        findings_json.append(json.loads(finding.model_dump_json()))
+
+    _ = create_findings_with_scan_id_async(url, findings, scan_id=1, content_encoding="gzip")
+    post.assert_called_once()
+    args, kwargs = post.call_args
+    assert args == (expected_url,)
+    assert kwargs["headers"] == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    assert json.loads(gzip.decompress(kwargs["data"])) == findings_json
+    assert kwargs["proxies"] == {"http": "", "https": ""}
+    assert kwargs["timeout"] == 10
+
+
+def test_encode_findings_identity():
+    body, headers = encode_findings(findings, content_encoding="identity")
+    assert headers == {"Content-Type": "application/json"}
+    assert json.loads(body) == [json.loads(finding.model_dump_json()) for finding in findings]
+
+
+def test_encode_findings_ndjson():
+    body, headers = encode_findings_ndjson(findings, content_encoding="gzip")
+    assert headers == {"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"}
+    lines = gzip.decompress(body).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [json.loads(finding.model_dump_json()) for finding in findings]
+
+
+def test_encode_findings_unsupported():
+    with pytest.raises(ValueError):
+        encode_findings(findings, content_encoding="br")
+    with pytest.raises(ValueError):
+        encode_findings(findings, media_type="text/plain")
+
+
+@patch("requests.get")
+def test_get_ingest_job(get):
+    expected_url = "https://fake-host.com/resc/v1/scans/1/ingest-jobs/2"
+    url = "https://fake-host.com"
+
+    _ = get_ingest_job(url, scan_id=1, ingest_job_id=2)
+    get.assert_called_once()
+    get.assert_called_with(expected_url, proxies={"http": "", "https": ""}, timeout=10)
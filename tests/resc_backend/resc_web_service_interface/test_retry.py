@@ -0,0 +1,47 @@
+# Standard Library
+import logging
+
+# First Party
+from resc_backend.resc_web_service_interface.retry import CallRecorder
+
+
+def test_idempotent_call_retried():
+    recorder = CallRecorder(retries=2, backoff_factor=0.5)
+    call = recorder.call("get_scan", idempotent=True)
+
+    assert list(call.attempts()) == [1, 2, 3]
+    assert call.retry_after_error(1, ConnectionError()) is True
+    assert call.backoff(2) == 0.5
+    assert call.retry_after_status(2, 503) is True
+    assert call.backoff(3) == 1.0
+    # the last attempt is returned whatever its status
+    assert call.retry_after_status(3, 503) is False
+    call.finish("GET", "/scans/1")
+
+    statistics = recorder.statistics["get_scan"]
+    assert statistics.calls == 1
+    assert statistics.retries == 2
+    assert statistics.failures == 1
+
+
+def test_non_idempotent_call_not_retried():
+    recorder = CallRecorder(retries=2, backoff_factor=0.5)
+    call = recorder.call("create_scan", idempotent=False)
+
+    assert list(call.attempts()) == [1]
+    assert call.retry_after_error(1, ConnectionError()) is False
+    call.finish("POST", "/scans")
+
+    assert recorder.statistics["create_scan"].failures == 1
+    assert recorder.statistics["create_scan"].retries == 0
+
+
+def test_log_statistics(caplog):
+    recorder = CallRecorder(retries=0, backoff_factor=0.5)
+    call = recorder.call("get_scan", idempotent=True)
+    assert call.retry_after_status(1, 200) is False
+    call.finish("GET", "/scans/1")
+
+    with caplog.at_level(logging.INFO):
+        recorder.log_statistics()
+    assert "get_scan: 1 calls, 0 failures, 0 retries" in caplog.text